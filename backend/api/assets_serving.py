@@ -10,12 +10,13 @@ can play voice clone previews without NotSupportedError.
 import os
 from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
 from loguru import logger
 from typing import Dict, Any
 
 from middleware.auth_middleware import get_current_user_with_query_token
 from api.story_writer.utils.auth import require_authenticated_user
+from utils.media_blob_store import get_media_blob_store
+from utils.media_serving import IMMUTABLE_CACHE_CONTROL, MediaFileResponse
 from utils.storage_paths import get_repo_root, sanitize_user_id
 
 router = APIRouter(prefix="/api/assets", tags=["Assets Serving"])
@@ -85,11 +86,11 @@ async def serve_avatar(
         alt_path = _resolve_asset_path(user_id, "images", safe_filename)
         if alt_path.exists():
             media_type = _get_media_type(safe_filename)
-            return FileResponse(alt_path, media_type=media_type)
+            return MediaFileResponse(alt_path, media_type=media_type)
         raise HTTPException(status_code=404, detail="Asset not found")
 
     media_type = _get_media_type(safe_filename)
-    return FileResponse(file_path, media_type=media_type)
+    return MediaFileResponse(file_path, media_type=media_type)
 
 
 @router.get("/{user_id}/voice_samples/{filename}")
@@ -117,7 +118,7 @@ async def serve_voice_sample(
     media_type = _get_media_type(safe_filename)
     file_size = file_path.stat().st_size
     logger.warning(f"[Assets] Serving voice sample: {safe_filename} ({media_type}, {file_size} bytes)")
-    return FileResponse(file_path, media_type=media_type)
+    return MediaFileResponse(file_path, media_type=media_type)
 
 
 @router.get("/{user_id}/images/{filename}")
@@ -137,4 +138,36 @@ async def serve_image(
         raise HTTPException(status_code=404, detail="Asset not found")
 
     media_type = _get_media_type(safe_filename)
-    return FileResponse(file_path, media_type=media_type)
\ No newline at end of file
+    return MediaFileResponse(file_path, media_type=media_type)
+
+@router.get("/{user_id}/blobs/{digest}")
+async def serve_blob(
+    user_id: str,
+    digest: str,
+    current_user: Dict[str, Any] = Depends(get_current_user_with_query_token),
+):
+    """Serve content-addressed media by SHA-256.
+
+    Responses carry a strong ETag (the digest), answer If-None-Match with 304 and
+    support Range requests, so players can seek and browsers never re-download.
+    Only blobs referenced by the user's own asset library entries are served.
+    """
+    require_authenticated_user(current_user)
+    _verify_ownership(user_id, current_user)
+
+    digest = digest.lower()
+    if len(digest) != 64 or any(c not in "0123456789abcdef" for c in digest):
+        raise HTTPException(status_code=404, detail="Asset not found")
+
+    store = get_media_blob_store()
+    raw_user_id = str(current_user.get("id") or current_user.get("user_id") or current_user.get("clerk_user_id"))
+    blob = store.get(digest)
+    if blob is None or not store.is_owned_by(digest, raw_user_id):
+        raise HTTPException(status_code=404, detail="Asset not found")
+
+    return MediaFileResponse(
+        blob.path,
+        media_type=blob.mime_type or "application/octet-stream",
+        etag=blob.etag,
+        cache_control=IMMUTABLE_CACHE_CONTROL,
+    )
@@ -347,10 +347,10 @@ async def start_research(
 
 
 @router.get("/research/status/{task_id}")
-async def get_research_status(task_id: str) -> Dict[str, Any]:
-    """Get the status of a research operation."""
+async def get_research_status(task_id: str, since: Optional[int] = None, wait: float = 0) -> Dict[str, Any]:
+    """Get the status of a research operation (long-polls with since/wait)."""
     try:
-        status = await task_manager.get_task_status(task_id)
+        status = await task_manager.get_task_status(task_id, since=since, wait=wait)
         if status is None:
             raise HTTPException(status_code=404, detail="Task not found")
         
@@ -422,7 +422,7 @@ async def start_outline_generation(
         if not user_id:
             raise HTTPException(status_code=401, detail="User ID not found in authentication token")
         
-        task_id = task_manager.start_outline_task(request, user_id)
+        task_id = await task_manager.start_outline_task(request, user_id)
         return {"task_id": task_id, "status": "started"}
     except Exception as e:
         logger.error(f"Failed to start outline generation: {e}")
@@ -430,10 +430,10 @@ async def start_outline_generation(
 
 
 @router.get("/outline/status/{task_id}")
-async def get_outline_status(task_id: str) -> Dict[str, Any]:
-    """Get the status of an outline generation operation."""
+async def get_outline_status(task_id: str, since: Optional[int] = None, wait: float = 0) -> Dict[str, Any]:
+    """Get the status of an outline generation operation (long-polls with since/wait)."""
     try:
-        status = await task_manager.get_task_status(task_id)
+        status = await task_manager.get_task_status(task_id, since=since, wait=wait)
         if status is None:
             raise HTTPException(status_code=404, detail="Task not found")
         
@@ -569,7 +569,7 @@ async def start_content_generation(
             globalTargetWords=request.get("globalTargetWords", 1000),
             researchKeywords=request.get("researchKeywords") or request.get("keywords"),
         )
-        task_id = task_manager.start_content_generation_task(req, user_id)
+        task_id = await task_manager.start_content_generation_task(req, user_id)
         return {"task_id": task_id, "status": "started"}
     except Exception as e:
         logger.error(f"Failed to start content generation: {e}")
@@ -579,12 +579,14 @@ async def start_content_generation(
 @router.get("/content/status/{task_id}")
 async def content_generation_status(
     task_id: str,
+    since: Optional[int] = None,
+    wait: float = 0,
     current_user: Optional[Dict[str, Any]] = Depends(get_current_user),
     db: Session = Depends(get_db)
 ) -> Dict[str, Any]:
-    """Poll status for content generation task."""
+    """Poll status for content generation task (long-polls with since/wait)."""
     try:
-        status = await task_manager.get_task_status(task_id)
+        status = await task_manager.get_task_status(task_id, since=since, wait=wait)
         if status is None:
             raise HTTPException(status_code=404, detail="Task not found")
         
@@ -909,7 +911,7 @@ async def start_medium_generation(
         if (request.globalTargetWords or 1000) > 1000:
             raise HTTPException(status_code=400, detail="Global target words exceed 1000; use per-section generation")
 
-        task_id = task_manager.start_medium_generation_task(request, user_id)
+        task_id = await task_manager.start_medium_generation_task(request, user_id)
         return {"task_id": task_id, "status": "started"}
     except HTTPException:
         raise
@@ -921,12 +923,14 @@ async def start_medium_generation(
 @router.get("/generate/medium/status/{task_id}")
 async def medium_generation_status(
     task_id: str,
+    since: Optional[int] = None,
+    wait: float = 0,
     current_user: Optional[Dict[str, Any]] = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Poll status for medium blog generation task."""
+    """Poll status for medium blog generation task (long-polls with since/wait)."""
     try:
-        status = await task_manager.get_task_status(task_id)
+        status = await task_manager.get_task_status(task_id, since=since, wait=wait)
         if status is None:
             raise HTTPException(status_code=404, detail="Task not found")
         
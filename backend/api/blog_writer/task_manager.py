@@ -3,13 +3,13 @@ Task Management System for Blog Writer API
 
 Handles background task execution, status tracking, and progress updates
 for research and outline generation operations.
-Now uses database-backed persistence for reliability and recovery.
+Task state is persisted (utils.task_state_store) so it survives restarts and
+is visible to every worker.
 """
 
 import asyncio
-import uuid
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from fastapi import HTTPException
 from loguru import logger
 from sqlalchemy.orm import Session
@@ -23,80 +23,85 @@ from models.blog_models import (
 )
 from services.blog_writer.blog_service import BlogWriterService
 from services.blog_writer.database_task_manager import DatabaseTaskManager
+from utils.task_state_store import get_task_state_store, iso_timestamp
 from utils.text_asset_tracker import save_and_track_text_content
 
+TASK_NAMESPACE = "blog_writer"
+# Upper bound for a long-polling status request
+MAX_STATUS_WAIT_SECONDS = 30.0
+
 
 class TaskManager:
     """Manages background tasks for research and outline generation."""
     
     def __init__(self, db_connection=None):
-        # Fallback to in-memory storage if no database connection
+        # Fallback to the shared task state store if no database connection
         if db_connection:
             self.db_manager = DatabaseTaskManager(db_connection)
             self.use_database = True
         else:
-            self.task_storage: Dict[str, Dict[str, Any]] = {}
+            self.store = get_task_state_store()
             self.service = BlogWriterService()
             self.use_database = False
-            logger.warning("No database connection provided, using in-memory task storage")
     
     def cleanup_old_tasks(self):
-        """Remove tasks older than 1 hour to prevent memory leaks."""
-        current_time = datetime.now()
-        tasks_to_remove = []
-        
-        for task_id, task_data in self.task_storage.items():
-            if (current_time - task_data["created_at"]).total_seconds() > 3600:  # 1 hour
-                tasks_to_remove.append(task_id)
-        
-        for task_id in tasks_to_remove:
-            del self.task_storage[task_id]
+        """Remove finished tasks older than 1 hour."""
+        self.store.cleanup(max_age_seconds=3600, namespace=TASK_NAMESPACE)
     
-    def create_task(self, task_type: str = "general") -> str:
+    async def create_task(self, task_type: str = "general", user_id: Optional[str] = None) -> str:
         """Create a new task and return its ID."""
-        task_id = str(uuid.uuid4())
-        
-        self.task_storage[task_id] = {
-            "status": "pending",
-            "created_at": datetime.now(),
-            "result": None,
-            "error": None,
-            "progress_messages": [],
-            "task_type": task_type
-        }
-        
-        return task_id
+        # Store calls are blocking SQLite transactions; keep them off the event loop
+        await asyncio.to_thread(self.cleanup_old_tasks)
+        return await asyncio.to_thread(self.store.create, TASK_NAMESPACE, task_type=task_type, owner=user_id)
+
+    async def _set(self, task_id: str, **fields):
+        """Write task fields (status, result, error, error_status, error_data) in one update."""
+        await asyncio.to_thread(self.store.update, task_id, **fields)
     
-    async def get_task_status(self, task_id: str) -> Dict[str, Any]:
-        """Get the status of a task."""
+    async def get_task_status(self, task_id: str, since: Optional[int] = None, wait: float = 0) -> Dict[str, Any]:
+        """Get the status of a task.
+
+        With `since` (a version from an earlier response) and `wait` seconds, waits
+        until the task has changed, or returns the unchanged status after `wait`.
+        """
         if self.use_database:
             return await self.db_manager.get_task_status(task_id)
         else:
-            self.cleanup_old_tasks()
-            
-            if task_id not in self.task_storage:
+            if since is not None and wait > 0:
+                task = await self.store.wait_for_change(task_id, since, min(wait, MAX_STATUS_WAIT_SECONDS))
+            else:
+                task = await asyncio.to_thread(self.store.get, task_id)
+            if task is None:
                 return None
             
-            task = self.task_storage[task_id]
             response = {
                 "task_id": task_id,
                 "status": task["status"],
-                "created_at": task["created_at"].isoformat(),
-                "progress_messages": task.get("progress_messages", [])
+                "created_at": iso_timestamp(task["created_at"]),
+                "progress_messages": task["messages"],
+                "version": task["version"],
             }
             
             if task["status"] == "completed":
                 response["result"] = task["result"]
+            elif task["status"] == "running" and task["extra"].get("partial_sections"):
+                # Sections that finished so far, in outline order
+                partial = task["extra"]["partial_sections"]
+                response["partial_result"] = {
+                    "sections": [partial[i] for i in sorted(partial, key=int)],
+                    "completed": len(partial),
+                    "total": task["extra"].get("section_count"),
+                }
             elif task["status"] == "failed":
                 response["error"] = task["error"]
-                if "error_status" in task:
+                if task.get("error_status") is not None:
                     response["error_status"] = task["error_status"]
                     logger.info(f"[TaskManager] get_task_status for {task_id}: Including error_status={task['error_status']} in response")
-                if "error_data" in task:
+                if task.get("error_data") is not None:
                     response["error_data"] = task["error_data"]
                     logger.info(f"[TaskManager] get_task_status for {task_id}: Including error_data with keys: {list(task['error_data'].keys()) if isinstance(task['error_data'], dict) else 'not-dict'}")
                 else:
-                    logger.warning(f"[TaskManager] get_task_status for {task_id}: Task failed but no error_data found. Task keys: {list(task.keys())}")
+                    logger.warning(f"[TaskManager] get_task_status for {task_id}: Task failed but no error_data found")
             
             return response
     
@@ -105,20 +110,15 @@ class TaskManager:
         if self.use_database:
             await self.db_manager.update_progress(task_id, message, percentage)
         else:
-            if task_id in self.task_storage:
-                if "progress_messages" not in self.task_storage[task_id]:
-                    self.task_storage[task_id]["progress_messages"] = []
-                
-                progress_entry = {
-                    "timestamp": datetime.now().isoformat(),
-                    "message": message
-                }
-                self.task_storage[task_id]["progress_messages"].append(progress_entry)
-                
-                # Keep only last 10 progress messages to prevent memory bloat
-                if len(self.task_storage[task_id]["progress_messages"]) > 10:
-                    self.task_storage[task_id]["progress_messages"] = self.task_storage[task_id]["progress_messages"][-10:]
-                
+            progress_entry = {
+                "timestamp": datetime.now().isoformat(),
+                "message": message
+            }
+            # Keep only last 10 progress messages
+            version = await asyncio.to_thread(
+                self.store.update, task_id, message=progress_entry, progress=percentage, max_messages=10
+            )
+            if version is not None:
                 logger.info(f"Progress update for task {task_id}: {message}")
     
     async def start_research_task(self, request: BlogResearchRequest, user_id: str) -> str:
@@ -126,49 +126,47 @@ class TaskManager:
         if self.use_database:
             return await self.db_manager.start_research_task(request, user_id)
         else:
-            task_id = self.create_task("research")
             # Store user_id in task for subscription checks
-            if task_id in self.task_storage:
-                self.task_storage[task_id]["user_id"] = user_id
+            task_id = await self.create_task("research", user_id=user_id)
             # Start the research operation in the background
             asyncio.create_task(self._run_research_task(task_id, request, user_id))
             return task_id
     
-    def start_outline_task(self, request: BlogOutlineRequest, user_id: str) -> str:
+    async def start_outline_task(self, request: BlogOutlineRequest, user_id: str) -> str:
         """Start an outline generation operation and return a task ID."""
-        task_id = self.create_task("outline")
+        task_id = await self.create_task("outline", user_id=user_id)
         
         # Start the outline generation operation in the background
         asyncio.create_task(self._run_outline_generation_task(task_id, request, user_id))
         
         return task_id
 
-    def start_medium_generation_task(self, request: MediumBlogGenerateRequest, user_id: str) -> str:
+    async def start_medium_generation_task(self, request: MediumBlogGenerateRequest, user_id: str) -> str:
         """Start a medium (≤1000 words) full-blog generation task."""
-        task_id = self.create_task("medium_generation")
+        task_id = await self.create_task("medium_generation", user_id=user_id)
         asyncio.create_task(self._run_medium_generation_task(task_id, request, user_id))
         return task_id
 
-    def start_content_generation_task(self, request: MediumBlogGenerateRequest, user_id: str) -> str:
+    async def start_content_generation_task(self, request: MediumBlogGenerateRequest, user_id: str) -> str:
         """Start content generation (full blog via sections) with provider parity.
 
-        Internally reuses medium generator pipeline for now but tracked under
-        distinct task_type 'content_generation' and same polling contract.
+        Sections are written concurrently, one LLM call each; finished sections
+        appear under 'partial_result' in the task status while it runs. Same
+        polling contract and result shape as medium generation.
         
         Args:
             request: Content generation request
             user_id: User ID (required for subscription checks and usage tracking)
         """
-        task_id = self.create_task("content_generation")
-        asyncio.create_task(self._run_medium_generation_task(task_id, request, user_id))
+        task_id = await self.create_task("content_generation", user_id=user_id)
+        asyncio.create_task(self._run_content_generation_task(task_id, request, user_id))
         return task_id
     
     async def _run_research_task(self, task_id: str, request: BlogResearchRequest, user_id: str):
         """Background task to run research and update status with progress messages."""
         try:
             # Update status to running
-            self.task_storage[task_id]["status"] = "running"
-            self.task_storage[task_id]["progress_messages"] = []
+            await self._set(task_id, status="running")
             
             # Send initial progress message
             await self.update_progress(task_id, "🔍 Starting research operation...")
@@ -182,46 +180,61 @@ class TaskManager:
             # Check if research failed gracefully
             if not result.success:
                 await self.update_progress(task_id, f"❌ Research failed: {result.error_message or 'Unknown error'}")
-                self.task_storage[task_id]["status"] = "failed"
-                self.task_storage[task_id]["error"] = result.error_message or "Research failed"
+                await self._set(
+                    task_id,
+                    status="failed",
+                    error=result.error_message or "Research failed",
+                )
             else:
                 await self.update_progress(task_id, f"✅ Research completed successfully! Found {len(result.sources)} sources and {len(result.search_queries or [])} search queries.")
                 # Update status to completed
-                self.task_storage[task_id]["status"] = "completed"
-                self.task_storage[task_id]["result"] = result.dict()
+                await self._set(
+                    task_id,
+                    status="completed",
+                    result=result.dict(),
+                )
             
         except HTTPException as http_error:
             # Handle HTTPException (e.g., 429 subscription limit) - preserve error details for frontend
             error_detail = http_error.detail
             error_message = error_detail.get('message', str(error_detail)) if isinstance(error_detail, dict) else str(error_detail)
             await self.update_progress(task_id, f"❌ {error_message}")
-            self.task_storage[task_id]["status"] = "failed"
-            self.task_storage[task_id]["error"] = error_message
             # Store HTTP error details for frontend modal
-            self.task_storage[task_id]["error_status"] = http_error.status_code
-            self.task_storage[task_id]["error_data"] = error_detail if isinstance(error_detail, dict) else {"error": str(error_detail)}
+            await self._set(
+                task_id,
+                status="failed",
+                error=error_message,
+                error_status=http_error.status_code,
+                error_data=error_detail if isinstance(error_detail, dict) else {"error": str(error_detail)},
+            )
         except Exception as e:
             await self.update_progress(task_id, f"❌ Research failed with error: {str(e)}")
             # Update status to failed
-            self.task_storage[task_id]["status"] = "failed"
-            self.task_storage[task_id]["error"] = str(e)
+            await self._set(
+                task_id,
+                status="failed",
+                error=str(e),
+            )
         
         # Ensure we always send a final completion message
         finally:
-            if task_id in self.task_storage:
-                current_status = self.task_storage[task_id]["status"]
+            task = await asyncio.to_thread(self.store.get, task_id)
+            if task is not None:
+                current_status = task["status"]
                 if current_status not in ["completed", "failed"]:
                     # Force completion if somehow we didn't set a final status
                     await self.update_progress(task_id, "⚠️ Research operation completed with unknown status")
-                    self.task_storage[task_id]["status"] = "failed"
-                    self.task_storage[task_id]["error"] = "Research completed with unknown status"
+                    await self._set(
+                        task_id,
+                        status="failed",
+                        error="Research completed with unknown status",
+                    )
     
     async def _run_outline_generation_task(self, task_id: str, request: BlogOutlineRequest, user_id: str):
         """Background task to run outline generation and update status with progress messages."""
         try:
             # Update status to running
-            self.task_storage[task_id]["status"] = "running"
-            self.task_storage[task_id]["progress_messages"] = []
+            await self._set(task_id, status="running")
             
             # Send initial progress message
             await self.update_progress(task_id, "🧩 Starting outline generation...")
@@ -231,30 +244,86 @@ class TaskManager:
             
             # Update status to completed
             await self.update_progress(task_id, f"✅ Outline generated successfully! Created {len(result.outline)} sections with {len(result.title_options)} title options.")
-            self.task_storage[task_id]["status"] = "completed"
-            self.task_storage[task_id]["result"] = result.dict()
+            await self._set(
+                task_id,
+                status="completed",
+                result=result.dict(),
+            )
             
         except HTTPException as http_error:
             # Handle HTTPException (e.g., 429 subscription limit) - preserve error details for frontend
             error_detail = http_error.detail
             error_message = error_detail.get('message', str(error_detail)) if isinstance(error_detail, dict) else str(error_detail)
             await self.update_progress(task_id, f"❌ {error_message}")
-            self.task_storage[task_id]["status"] = "failed"
-            self.task_storage[task_id]["error"] = error_message
             # Store HTTP error details for frontend modal
-            self.task_storage[task_id]["error_status"] = http_error.status_code
-            self.task_storage[task_id]["error_data"] = error_detail if isinstance(error_detail, dict) else {"error": str(error_detail)}
+            await self._set(
+                task_id,
+                status="failed",
+                error=error_message,
+                error_status=http_error.status_code,
+                error_data=error_detail if isinstance(error_detail, dict) else {"error": str(error_detail)},
+            )
         except Exception as e:
             await self.update_progress(task_id, f"❌ Outline generation failed: {str(e)}")
             # Update status to failed
-            self.task_storage[task_id]["status"] = "failed"
-            self.task_storage[task_id]["error"] = str(e)
+            await self._set(
+                task_id,
+                status="failed",
+                error=str(e),
+            )
+
+    async def _run_content_generation_task(self, task_id: str, request: MediumBlogGenerateRequest, user_id: str):
+        """Background task to generate a blog section by section, all sections concurrently."""
+        partial: Dict[str, Any] = {}
+        section_count = len(request.sections)
+        try:
+            await self._set(task_id, status="running", extra={"section_count": section_count})
+
+            await self.update_progress(task_id, f"📝 Writing {section_count} sections in parallel...")
+
+            async def on_section(index: int, section):
+                partial[str(index)] = section.dict()
+                await self._set(task_id, extra={"partial_sections": dict(partial)})
+                await self.update_progress(
+                    task_id,
+                    f"✍️ Section ready: {section.heading} ({len(partial)}/{section_count})"
+                )
+
+            result: MediumBlogGenerateResult = await self.service.generate_blog_by_sections(request, user_id, on_section=on_section)
+
+            if getattr(result, "cache_hit", False):
+                await self.update_progress(task_id, "⚡ Found existing content in cache — no need to regenerate!")
+            else:
+                await self.update_progress(task_id, "✨ Smoothed transitions between sections.")
+
+            await self._set(task_id, status="completed", result=result.dict(), extra={"partial_sections": None})
+            total_words = sum(getattr(s, 'wordCount', 0) or 0 for s in result.sections)
+            await self.update_progress(
+                task_id,
+                f"✅ Content generation complete! {len(result.sections)} sections written ({total_words} words). "
+                "Next up: SEO Analysis to optimize your blog for search engines."
+            )
+        except HTTPException as http_error:
+            # Preserve subscription/limit details (e.g., 429) for the frontend modal
+            error_detail = http_error.detail
+            error_message = error_detail.get('message', str(error_detail)) if isinstance(error_detail, dict) else str(error_detail)
+            await self.update_progress(task_id, f"❌ {error_message}")
+            await self._set(
+                task_id,
+                status="failed",
+                error=error_message,
+                error_status=http_error.status_code,
+                error_data=error_detail if isinstance(error_detail, dict) else {"error": str(error_detail)},
+                extra={"partial_sections": None},
+            )
+        except Exception as e:
+            await self.update_progress(task_id, f"❌ Content generation failed: {str(e)}")
+            await self._set(task_id, status="failed", error=str(e), extra={"partial_sections": None})
 
     async def _run_medium_generation_task(self, task_id: str, request: MediumBlogGenerateRequest, user_id: str):
         """Background task to generate a medium blog using a single structured JSON call."""
         try:
-            self.task_storage[task_id]["status"] = "running"
-            self.task_storage[task_id]["progress_messages"] = []
+            await self._set(task_id, status="running")
 
             await self.update_progress(task_id, "📝 Alwrity is preparing your blog content — this usually takes 20–40 seconds.")
             await self.update_progress(task_id, "📦 Packaging your outline sections and research data...")
@@ -288,8 +357,11 @@ class TaskManager:
                 await self.update_progress(task_id, "✨ Polishing content — improving structure, readability, and transitions...")
 
             # Mark completed
-            self.task_storage[task_id]["status"] = "completed"
-            self.task_storage[task_id]["result"] = result.dict()
+            await self._set(
+                task_id,
+                status="completed",
+                result=result.dict(),
+            )
             section_count = len(result.sections)
             total_words = sum(getattr(s, 'wordCount', 0) or 0 for s in result.sections)
             await self.update_progress(
@@ -307,11 +379,14 @@ class TaskManager:
             error_detail = http_error.detail
             error_message = error_detail.get('message', str(error_detail)) if isinstance(error_detail, dict) else str(error_detail)
             await self.update_progress(task_id, f"❌ {error_message}")
-            self.task_storage[task_id]["status"] = "failed"
-            self.task_storage[task_id]["error"] = error_message
             # Store HTTP error details for frontend modal
-            self.task_storage[task_id]["error_status"] = http_error.status_code
-            self.task_storage[task_id]["error_data"] = error_detail if isinstance(error_detail, dict) else {"error": str(error_detail)}
+            await self._set(
+                task_id,
+                status="failed",
+                error=error_message,
+                error_status=http_error.status_code,
+                error_data=error_detail if isinstance(error_detail, dict) else {"error": str(error_detail)},
+            )
             logger.info(f"[TaskManager] Stored error_status={http_error.status_code} and error_data keys: {list(error_detail.keys()) if isinstance(error_detail, dict) else 'not-dict'}")
         except Exception as e:
             # Check if this is an HTTPException that got wrapped (can happen in async tasks)
@@ -323,17 +398,23 @@ class TaskManager:
                 error_detail = e.detail
                 error_message = error_detail.get('message', str(error_detail)) if isinstance(error_detail, dict) else str(error_detail)
                 await self.update_progress(task_id, f"❌ {error_message}")
-                self.task_storage[task_id]["status"] = "failed"
-                self.task_storage[task_id]["error"] = error_message
                 # Store HTTP error details for frontend modal
-                self.task_storage[task_id]["error_status"] = e.status_code
-                self.task_storage[task_id]["error_data"] = error_detail if isinstance(error_detail, dict) else {"error": str(error_detail)}
+                await self._set(
+                    task_id,
+                    status="failed",
+                    error=error_message,
+                    error_status=e.status_code,
+                    error_data=error_detail if isinstance(error_detail, dict) else {"error": str(error_detail)},
+                )
                 logger.info(f"[TaskManager] Stored error_status={e.status_code} and error_data keys: {list(error_detail.keys()) if isinstance(error_detail, dict) else 'not-dict'}")
             else:
                 await self.update_progress(task_id, f"❌ Medium generation failed: {str(e)}")
-                self.task_storage[task_id]["status"] = "failed"
-                self.task_storage[task_id]["error"] = str(e)
-                self.task_storage[task_id]["error_data"] = {"error_message": str(e), "error_type": type(e).__name__}
+                await self._set(
+                    task_id,
+                    status="failed",
+                    error=str(e),
+                    error_data={"error_message": str(e), "error_type": type(e).__name__},
+                )
 
 
 # Global task manager instance
@@ -9,7 +9,7 @@ from pathlib import Path
 from sqlalchemy.orm import Session
 
 from fastapi import APIRouter, HTTPException, Depends, Request
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse
 from pydantic import BaseModel, Field
 
 from services.llm_providers.main_image_generation import generate_image
@@ -1053,7 +1053,7 @@ async def serve_image_studio_image(
         if not image_path.exists():
             raise HTTPException(status_code=404, detail="Image not found")
         
-        return FileResponse(
+        return MediaFileResponse(
             path=str(image_path),
             media_type="image/png",
             filename=image_path.name
@@ -5,7 +5,7 @@ Audio generation, combining, and serving endpoints.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse
 from sqlalchemy.orm import Session
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -678,5 +678,5 @@ async def serve_podcast_audio(
     audio_path = _resolve_podcast_media_file(filename, "audio", user_id)
     logger.debug(f"[Podcast] Resolved audio path: {audio_path}")
     
-    return FileResponse(audio_path, media_type="audio/mpeg")
+    return MediaFileResponse(audio_path, media_type="audio/mpeg")
 
@@ -8,7 +8,7 @@ from pathlib import Path
 from urllib.parse import urlparse
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse
 from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 from pathlib import Path
@@ -264,7 +264,7 @@ async def generate_broll_scene(
         logger.info(f"[Broll] B-roll scene request for scene: {request.scene_id}")
 
         # Scene rendering can be expensive, so use task manager/background execution.
-        task_id = task_manager.create_task(
+        task_id = await task_manager.create_task(
             "podcast_broll_scene_generation",
             metadata={"owner_user_id": user_id, "scene_id": request.scene_id},
         )
@@ -364,7 +364,7 @@ async def serve_chart_preview(
     if not str(file_path.resolve()).startswith(str(charts_dir.resolve())):
         raise HTTPException(status_code=403, detail="Access denied")
     
-    return FileResponse(
+    return MediaFileResponse(
         path=str(file_path),
         media_type="image/png",
         filename=filename,
@@ -385,7 +385,7 @@ async def serve_final_broll(
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Video not found")
     
-    return FileResponse(
+    return MediaFileResponse(
         path=str(file_path),
         media_type="video/mp4",
         filename=filename,
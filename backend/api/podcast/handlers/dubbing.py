@@ -6,7 +6,7 @@ Supports both low-quality (DeepL) and high-quality (WaveSpeed) dubbing with voic
 """
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse
 from sqlalchemy.orm import Session
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -230,7 +230,7 @@ async def create_audio_dubbing_task(
     """
     user_id = require_authenticated_user(current_user)
     
-    task_id = task_manager.create_task(
+    task_id = await task_manager.create_task(
         "audio_dubbing",
         metadata={"owner_user_id": user_id},
     )
@@ -270,7 +270,7 @@ async def get_dubbing_result(
     """
     user_id = require_authenticated_user(current_user)
     
-    task_status = task_manager.get_task_status(task_id, requester_user_id=user_id)
+    task_status = await task_manager.poll_task_status(task_id, requester_user_id=user_id)
     
     if not task_status:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -333,7 +333,7 @@ async def serve_dubbed_audio(
     
     audio_path = _resolve_dubbed_audio_file(filename, user_id)
     
-    return FileResponse(
+    return MediaFileResponse(
         path=audio_path,
         media_type="audio/mpeg",
         filename=filename,
@@ -429,7 +429,7 @@ async def create_voice_clone_task(
     """
     user_id = require_authenticated_user(current_user)
     
-    task_id = task_manager.create_task(
+    task_id = await task_manager.create_task(
         "voice_clone",
         metadata={"owner_user_id": user_id},
     )
@@ -463,7 +463,7 @@ async def get_voice_clone_result(
     """
     user_id = require_authenticated_user(current_user)
     
-    task_status = task_manager.get_task_status(task_id, requester_user_id=user_id)
+    task_status = await task_manager.poll_task_status(task_id, requester_user_id=user_id)
     
     if not task_status:
         raise HTTPException(status_code=404, detail="Task not found")
@@ -515,7 +515,7 @@ async def serve_voice_audio(
             raise HTTPException(status_code=404, detail="Voice audio file not found") from exc
         raise
     
-    return FileResponse(
+    return MediaFileResponse(
         path=audio_path,
         media_type="audio/mpeg",
         filename=filename,
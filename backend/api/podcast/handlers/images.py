@@ -5,7 +5,7 @@ Image generation and serving endpoints.
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse
 from sqlalchemy.orm import Session
 from typing import Dict, Any
 from pathlib import Path
@@ -486,5 +486,5 @@ async def serve_podcast_image(
     if not image_path.exists():
         raise HTTPException(status_code=404, detail="Image not found")
     
-    return FileResponse(image_path, media_type="image/png")
+    return MediaFileResponse(image_path, media_type="image/png")
 
@@ -5,7 +5,7 @@ Video generation and serving endpoints.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse
 from sqlalchemy.orm import Session
 from typing import Dict, Any, Optional
 from pathlib import Path
@@ -361,7 +361,7 @@ async def generate_podcast_video(
         logger.warning(f"[Podcast] Failed to extract auth token from headers: {e}")
 
     # Create async task
-    task_id = task_manager.create_task(
+    task_id = await task_manager.create_task(
         "podcast_video_generation",
         metadata={"owner_user_id": user_id},
     )
@@ -417,7 +417,7 @@ async def serve_podcast_video(
     if not video_path:
         raise HTTPException(status_code=404, detail="Video file not found")
     
-    return FileResponse(video_path, media_type="video/mp4")
+    return MediaFileResponse(video_path, media_type="video/mp4")
 
 
 @router.get("/videos")
@@ -494,7 +494,7 @@ async def combine_podcast_videos(
         raise HTTPException(status_code=400, detail="No scene videos provided")
     
     # Create async task
-    task_id = task_manager.create_task(
+    task_id = await task_manager.create_task(
         "podcast_combine_videos",
         metadata={"owner_user_id": user_id},
     )
@@ -671,7 +671,7 @@ async def serve_final_podcast_video(
     if ".." in filename or "/" in filename or "\\" in filename:
         raise HTTPException(status_code=400, detail="Invalid filename")
     
-    return FileResponse(
+    return MediaFileResponse(
         path=str(video_path),
         media_type="video/mp4",
         filename=filename,
@@ -5,7 +5,7 @@ Main router that imports and registers all handler modules.
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from middleware.auth_middleware import get_current_user
 from api.story_writer.utils.auth import require_authenticated_user
@@ -33,10 +33,18 @@ router.include_router(tavily_category_research.router)
 
 
 @router.get("/task/{task_id}/status")
-async def podcast_task_status(task_id: str, current_user: Dict[str, Any] = Depends(get_current_user)):
-    """Expose task status under podcast namespace (reuses shared task manager)."""
+async def podcast_task_status(
+    task_id: str,
+    since: Optional[int] = None,
+    wait: float = 0,
+    current_user: Dict[str, Any] = Depends(get_current_user),
+):
+    """Expose task status under podcast namespace (reuses shared task manager).
+
+    Long-polls until the task changes when `since` (last seen version) and `wait` are given.
+    """
     user_id = require_authenticated_user(current_user)
-    task_status = task_manager.get_task_status(task_id, requester_user_id=user_id)
+    task_status = await task_manager.poll_task_status(task_id, since=since, wait=wait, requester_user_id=user_id)
     if not task_status:
         raise HTTPException(status_code=404, detail="Task not found")
     return task_status
@@ -11,7 +11,7 @@ import asyncio
 
 from services.database import get_db
 from services.research.core import (
-    ResearchEngine,
+    ParameterOptimizer,
     ResearchContext,
     ResearchPersonalizationContext,
     ResearchGoal,
@@ -28,6 +28,8 @@ from services.research.intent import (
     ResearchIntentInference,
     IntentQueryGenerator,
     IntentAwareAnalyzer,
+    IntentResearchExecutor,
+    ResearchResultAccumulator,
 )
 from ..models import (
     AnalyzeIntentRequest,
@@ -212,7 +214,7 @@ async def execute_intent_driven_research(
     This is the main endpoint for intent-driven research. It:
     1. Uses the confirmed intent (or infers from user_input if not provided)
     2. Generates targeted queries for each expected deliverable
-    3. Executes research using Exa/Tavily/Google
+    3. Executes all queries concurrently across Exa/Tavily/Google
     4. Analyzes results through the lens of user intent
     5. Returns exactly what the user needs
     
@@ -275,9 +277,6 @@ async def execute_intent_driven_research(
                 )
                 queries = query_result.get("queries", [])
             
-            # Execute research using the Research Engine
-            engine = ResearchEngine(db_session=db)
-            
             # Build context from intent
             personalization = ResearchPersonalizationContext(
                 creator_id=user_id,
@@ -285,15 +284,15 @@ async def execute_intent_driven_research(
                 target_audience=research_persona.default_target_audience if research_persona else None,
             )
             
-            # Use the highest priority query for the main search
-            # (In a more advanced version, we could run multiple queries and merge)
-            primary_query = queries[0] if queries else ResearchQuery(
-                query=request.user_input,
-                purpose=ExpectedDeliverable.KEY_STATISTICS,
-                provider="exa",
-                priority=5,
-                expected_results="General research results",
-            )
+            if not queries:
+                queries = [ResearchQuery(
+                    query=request.user_input,
+                    purpose=ExpectedDeliverable.KEY_STATISTICS,
+                    provider="exa",
+                    priority=5,
+                    expected_results="General research results",
+                )]
+            primary_query = queries[0]
             
             context = ResearchContext(
                 query=primary_query.query,
@@ -306,9 +305,7 @@ async def execute_intent_driven_research(
                 include_domains=request.include_domains,
                 exclude_domains=request.exclude_domains,
             )
-            
-            # Execute research and trends in parallel
-            research_task = asyncio.create_task(engine.research(context))
+            _, config = ParameterOptimizer().optimize(context)
             
             # Execute Google Trends analysis in parallel (if enabled)
             trends_task = None
@@ -325,8 +322,33 @@ async def execute_intent_driven_research(
                     )
                 )
             
-            # Wait for research to complete
-            raw_result = await research_task
+            # Run every query concurrently and merge results as each one completes
+            accumulator = ResearchResultAccumulator()
+            try:
+                async for outcome in IntentResearchExecutor().stream(
+                    queries,
+                    config=config,
+                    user_id=user_id,
+                    industry=personalization.industry or "",
+                    target_audience=personalization.target_audience or "",
+                ):
+                    accumulator.add(outcome)
+            except BaseException:
+                if trends_task:
+                    trends_task.cancel()
+                raise
+            raw_results = accumulator.raw_results()
+            logger.info(
+                f"[Intent API] {len(raw_results['queries_executed'])}/{len(queries)} queries succeeded, "
+                f"{len(raw_results['sources'])} unique sources"
+            )
+            if not raw_results["queries_executed"]:
+                if trends_task:
+                    trends_task.cancel()
+                raise RuntimeError(
+                    "All research queries failed: "
+                    + "; ".join(f['error'] for f in raw_results["failed_queries"])
+                )
             
             # Wait for trends if it was started
             if trends_task:
@@ -340,11 +362,7 @@ async def execute_intent_driven_research(
             # Analyze results using intent-aware analyzer
             analyzer = IntentAwareAnalyzer()
             analyzed_result = await analyzer.analyze(
-                raw_results={
-                    "content": raw_result.raw_content or "",
-                    "sources": raw_result.sources,
-                    "grounding_metadata": raw_result.grounding_metadata,
-                },
+                raw_results=raw_results,
                 intent=intent,
                 research_persona=research_persona,
                 user_id=user_id,  # Required for subscription checking
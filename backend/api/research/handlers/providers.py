@@ -4,7 +4,7 @@ Provider Status Handler
 Handles provider availability and status endpoints.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 from loguru import logger
 
 from services.research.core import ResearchEngine
@@ -31,3 +31,19 @@ async def get_provider_status():
             tavily={"available": False, "error": str(e)},
             google={"available": False, "error": str(e)},
         )
+
+
+@router.get("/providers/cache-stats")
+async def get_search_cache_stats():
+    """
+    Get shared search result cache statistics.
+    
+    Returns per-provider hit rate, API calls and dollars saved for Exa, Tavily
+    and Google searches, plus storage usage of the cache.
+    """
+    try:
+        from services.cache.search_cache import search_cache
+        return search_cache.get_stats()
+    except Exception as e:
+        logger.error(f"[Search Cache Stats] Failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
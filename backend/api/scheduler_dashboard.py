@@ -615,6 +615,8 @@ async def get_scheduler_dashboard(
                 'active_strategies_count': active_strategies,
                 'last_interval_adjustment': stats.get('last_interval_adjustment'),
                 'registered_types': stats.get('registered_types', []),
+                'task_leases': stats.get('task_leases', {}),  # Lease counts and contention
+                'dispatch_queue': stats.get('dispatch', {}),  # Queue, caps and wait-time histograms
                 # Cumulative/historical stats (from database)
                 'cumulative_total_check_cycles': cumulative_stats.get('total_check_cycles', 0),
                 'cumulative_tasks_found': cumulative_stats.get('cumulative_tasks_found', 0),
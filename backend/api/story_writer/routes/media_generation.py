@@ -1,7 +1,7 @@
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse
 from loguru import logger
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
@@ -187,7 +187,7 @@ async def serve_scene_image(
     try:
         require_authenticated_user(current_user)
         image_path = resolve_media_file(image_service.output_dir, image_filename)
-        return FileResponse(path=str(image_path), media_type="image/png", filename=image_filename)
+        return MediaFileResponse(path=str(image_path), media_type="image/png", filename=image_filename)
 
     except HTTPException:
         raise
@@ -350,7 +350,7 @@ async def serve_scene_audio(
     try:
         require_authenticated_user(current_user)
         audio_path = resolve_media_file(audio_service.output_dir, audio_filename)
-        return FileResponse(path=str(audio_path), media_type="audio/mpeg", filename=audio_filename)
+        return MediaFileResponse(path=str(audio_path), media_type="audio/mpeg", filename=audio_filename)
 
     except HTTPException:
         raise
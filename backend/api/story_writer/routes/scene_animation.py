@@ -106,28 +106,25 @@ async def animate_scene_preview(
     finally:
         db.close()
 
+    ai_video_dir = get_story_media_write_dir("video", user_id=user_id)
+    (ai_video_dir / AI_VIDEO_SUBDIR).mkdir(parents=True, exist_ok=True)
+    video_service = StoryVideoGenerationService(output_dir=str(ai_video_dir / AI_VIDEO_SUBDIR))
+    video_path = video_service.new_scene_video_path(request.scene_number, user_id)
+
+    # The result video is streamed from WaveSpeed straight into the workspace file
     animation_result = animate_scene_image(
         image_bytes=image_bytes,
         scene_data=request.scene_data,
         story_context=request.story_context,
         user_id=user_id,
         duration=duration,
+        output_path=str(video_path),
     )
 
-    ai_video_dir = get_story_media_write_dir("video", user_id=user_id)
-    (ai_video_dir / AI_VIDEO_SUBDIR).mkdir(parents=True, exist_ok=True)
-
     # Save video asset to library
     db = next(get_db())
     try:
-        video_service = StoryVideoGenerationService(output_dir=str(ai_video_dir / AI_VIDEO_SUBDIR))
-    
-        save_result = video_service.save_scene_video(
-            video_bytes=animation_result["video_bytes"],
-            scene_number=request.scene_number,
-            user_id=user_id,
-            db=db
-        )
+        save_result = video_service.describe_scene_video(video_path)
         video_filename = save_result["video_filename"]
         video_url = _build_authenticated_media_url(
             request_obj, f"/api/story/videos/ai/{video_filename}"
@@ -138,7 +135,7 @@ async def animate_scene_preview(
             provider=animation_result["provider"],
             model_name=animation_result["model_name"],
             prompt=animation_result["prompt"],
-            video_bytes=animation_result["video_bytes"],
+            video_size=animation_result["file_size"],
             cost_override=animation_result["cost"],
         )
     except Exception as e:
@@ -177,7 +174,7 @@ async def animate_scene_preview(
             filename=video_filename,
             file_url=video_url,
             file_path=str(ai_video_dir / AI_VIDEO_SUBDIR / video_filename),
-            file_size=len(animation_result["video_bytes"]),
+            file_size=animation_result["file_size"],
             mime_type="video/mp4",
             title=f"Scene {request.scene_number} Animation",
             description=f"Animated scene {request.scene_number} from story",
@@ -227,21 +224,19 @@ async def resume_scene_animation_endpoint(
         request.prediction_id,
     )
 
-    animation_result = resume_scene_animation(
-        prediction_id=request.prediction_id,
-        duration=request.duration or 5,
-        user_id=user_id,
-    )
-
     ai_video_dir = get_story_media_write_dir("video", user_id=user_id)
     (ai_video_dir / AI_VIDEO_SUBDIR).mkdir(parents=True, exist_ok=True)
     video_service = StoryVideoGenerationService(output_dir=str(ai_video_dir / AI_VIDEO_SUBDIR))
+    video_path = video_service.new_scene_video_path(request.scene_number, user_id)
 
-    save_result = video_service.save_scene_video(
-        video_bytes=animation_result["video_bytes"],
-        scene_number=request.scene_number,
+    animation_result = resume_scene_animation(
+        prediction_id=request.prediction_id,
+        duration=request.duration or 5,
         user_id=user_id,
+        output_path=str(video_path),
     )
+
+    save_result = video_service.describe_scene_video(video_path)
     video_filename = save_result["video_filename"]
     video_url = _build_authenticated_media_url(
         request_obj, f"/api/story/videos/ai/{video_filename}"
@@ -252,7 +247,7 @@ async def resume_scene_animation_endpoint(
         provider=animation_result["provider"],
         model_name=animation_result["model_name"],
         prompt=animation_result["prompt"],
-        video_bytes=animation_result["video_bytes"],
+        video_size=animation_result["file_size"],
         cost_override=animation_result["cost"],
     )
     if usage_info:
@@ -334,7 +329,7 @@ async def animate_scene_voiceover_endpoint(
         auth_token = auth_header.replace("Bearer ", "").strip()
 
     # Create async task
-    task_id = task_manager.create_task("scene_voiceover_animation")
+    task_id = await task_manager.create_task("scene_voiceover_animation")
     background_tasks.add_task(
         _execute_voiceover_animation_task,
         task_id=task_id,
@@ -366,6 +361,11 @@ def _execute_voiceover_animation_task(
             task_id, "processing", progress=5.0, message="Submitting to WaveSpeed InfiniteTalk..."
         )
 
+        ai_video_dir = get_story_media_write_dir("video", user_id=user_id)
+        (ai_video_dir / AI_VIDEO_SUBDIR).mkdir(parents=True, exist_ok=True)
+        video_service = StoryVideoGenerationService(output_dir=str(ai_video_dir / AI_VIDEO_SUBDIR))
+        video_path = video_service.new_scene_video_path(request.scene_number, user_id)
+
         animation_result = animate_scene_with_voiceover(
             image_bytes=image_bytes,
             audio_bytes=audio_bytes,
@@ -376,21 +376,14 @@ def _execute_voiceover_animation_task(
             prompt_override=request.prompt,
             image_mime=_guess_mime_from_url(request.image_url, "image/png"),
             audio_mime=_guess_mime_from_url(request.audio_url, "audio/mpeg"),
+            output_path=str(video_path),
         )
 
         task_manager.update_task_status(
             task_id, "processing", progress=80.0, message="Saving video file..."
         )
 
-        ai_video_dir = get_story_media_write_dir("video", user_id=user_id)
-        (ai_video_dir / AI_VIDEO_SUBDIR).mkdir(parents=True, exist_ok=True)
-        video_service = StoryVideoGenerationService(output_dir=str(ai_video_dir / AI_VIDEO_SUBDIR))
-
-        save_result = video_service.save_scene_video(
-            video_bytes=animation_result["video_bytes"],
-            scene_number=request.scene_number,
-            user_id=user_id,
-        )
+        save_result = video_service.describe_scene_video(video_path)
         video_filename = save_result["video_filename"]
         # Build authenticated URL if token provided, otherwise return plain URL
         video_url = f"/api/story/videos/ai/{video_filename}"
@@ -402,7 +395,7 @@ def _execute_voiceover_animation_task(
             provider=animation_result["provider"],
             model_name=animation_result["model_name"],
             prompt=animation_result["prompt"],
-            video_bytes=animation_result["video_bytes"],
+            video_size=animation_result["file_size"],
             cost_override=animation_result["cost"],
         )
         if usage_info:
@@ -435,7 +428,7 @@ def _execute_voiceover_animation_task(
                 filename=video_filename,
                 file_url=video_url,
                 file_path=str(ai_video_dir / AI_VIDEO_SUBDIR / video_filename),
-                file_size=len(animation_result["video_bytes"]),
+                file_size=animation_result["file_size"],
                 mime_type="video/mp4",
                 title=f"Scene {request.scene_number} Animation (Voiceover)",
                 description=f"Animated scene {request.scene_number} with voiceover from story",
@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from loguru import logger
@@ -34,7 +34,7 @@ async def generate_full_story(
         cached_result = cache_manager.get_cached_result(cache_key)
         if cached_result:
             logger.info(f"[StoryWriter] Returning cached result for user {user_id}")
-            task_id = task_manager.create_task("story_generation")
+            task_id = await task_manager.create_task("story_generation")
             task_manager.update_task_status(
                 task_id,
                 "completed",
@@ -44,7 +44,7 @@ async def generate_full_story(
             )
             return {"task_id": task_id, "cached": True}
 
-        task_id = task_manager.create_task("story_generation")
+        task_id = await task_manager.create_task("story_generation")
         request_data = request.dict()
         request_data["max_iterations"] = max_iterations
 
@@ -72,13 +72,19 @@ async def generate_full_story(
 @router.get("/task/{task_id}/status", response_model=TaskStatus)
 async def get_task_status(
     task_id: str,
+    since: Optional[int] = None,
+    wait: float = 0,
     current_user: Dict[str, Any] = Depends(get_current_user),
 ) -> TaskStatus:
-    """Get the status of a story generation task."""
+    """Get the status of a story generation task.
+
+    Pass the last seen `version` as `since` and a `wait` in seconds to long-poll
+    until the task changes.
+    """
     try:
         require_authenticated_user(current_user)
 
-        task_status = task_manager.get_task_status(task_id)
+        task_status = await task_manager.poll_task_status(task_id, since=since, wait=wait)
         if not task_status:
             raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
 
@@ -100,7 +106,7 @@ async def get_task_result(
     try:
         require_authenticated_user(current_user)
 
-        task_status = task_manager.get_task_status(task_id)
+        task_status = await task_manager.poll_task_status(task_id)
         if not task_status:
             raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
         if task_status["status"] != "completed":
@@ -3,7 +3,7 @@ from concurrent.futures import ThreadPoolExecutor
 import json
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse
 from loguru import logger
 from pydantic import BaseModel
 
@@ -18,6 +18,7 @@ from models.story_models import (
 from services.story_writer.video_generation_service import StoryVideoGenerationService
 from services.story_writer.image_generation_service import StoryImageGenerationService
 from services.story_writer.audio_generation_service import StoryAudioGenerationService
+from services.story_writer.scene_media_engine import StorySceneMediaEngine
 from services.story_writer.story_service import StoryWriterService
 
 from ..task_manager import task_manager
@@ -33,6 +34,9 @@ router = APIRouter()
 video_service = StoryVideoGenerationService()
 image_service = StoryImageGenerationService()
 audio_service = StoryAudioGenerationService()
+media_engine = StorySceneMediaEngine(
+    audio_service=audio_service, image_service=image_service, video_service=video_service
+)
 story_service = StoryWriterService()
 
 
@@ -216,7 +220,7 @@ async def generate_story_video_async(
                 detail="Number of scenes, image URLs, and audio URLs must match",
             )
 
-        task_id = task_manager.create_task("story_video_generation")
+        task_id = await task_manager.create_task("story_video_generation")
         background_tasks.add_task(
             _execute_video_generation_task,
             task_id=task_id,
@@ -333,7 +337,7 @@ async def generate_complete_story_video(
         user_id = require_authenticated_user(current_user)
         logger.info(f"[StoryWriter] Starting complete video generation for user {user_id}")
 
-        task_id = task_manager.create_task("complete_video_generation")
+        task_id = await task_manager.create_task("complete_video_generation")
         background_tasks.add_task(
             execute_complete_video_generation,
             task_id=task_id,
@@ -418,37 +422,32 @@ def execute_complete_video_generation(
         if not isinstance(outline_scenes, list):
             raise RuntimeError("Failed to generate structured outline")
 
-        task_manager.update_task_status(task_id, "processing", progress=30.0, message="Generating images for scenes...")
-
-        def image_progress_callback(sub_progress: float, message: str):
-            overall_progress = 30.0 + (sub_progress * 0.2)
-            task_manager.update_task_status(task_id, "processing", progress=overall_progress, message=message)
-
-        image_results = image_service.generate_scene_images(
-            scenes=outline_scenes,
-            user_id=user_id,
-            provider=request_data.get("image_provider"),
-            width=request_data.get("image_width", 1024),
-            height=request_data.get("image_height", 1024),
-            model=request_data.get("image_model"),
-            progress_callback=image_progress_callback,
-            anime_bible=anime_bible,
+        task_manager.update_task_status(
+            task_id, "processing", progress=30.0, message="Generating images and narration for scenes..."
         )
 
-        task_manager.update_task_status(task_id, "processing", progress=50.0, message="Generating audio narration for scenes...")
-
-        def audio_progress_callback(sub_progress: float, message: str):
-            overall_progress = 50.0 + (sub_progress * 0.2)
+        def media_progress_callback(sub_progress: float, message: str):
+            overall_progress = 30.0 + (sub_progress * 0.4)
             task_manager.update_task_status(task_id, "processing", progress=overall_progress, message=message)
 
-        audio_results = audio_service.generate_scene_audio_list(
+        # Images and narration for all scenes run concurrently within per-provider limits
+        image_results, audio_results = media_engine.generate_scene_assets(
             scenes=outline_scenes,
             user_id=user_id,
-            provider=request_data.get("audio_provider", "gtts"),
-            lang=request_data.get("audio_lang", "en"),
-            slow=request_data.get("audio_slow", False),
-            rate=request_data.get("audio_rate", 150),
-            progress_callback=audio_progress_callback,
+            image_options={
+                "provider": request_data.get("image_provider"),
+                "width": request_data.get("image_width", 1024),
+                "height": request_data.get("image_height", 1024),
+                "model": request_data.get("image_model"),
+                "anime_bible": anime_bible,
+            },
+            audio_options={
+                "provider": request_data.get("audio_provider", "gtts"),
+                "lang": request_data.get("audio_lang", "en"),
+                "slow": request_data.get("audio_slow", False),
+                "rate": request_data.get("audio_rate", 150),
+            },
+            progress_callback=media_progress_callback,
         )
 
         task_manager.update_task_status(task_id, "processing", progress=70.0, message="Preparing video assets...")
@@ -484,15 +483,25 @@ def execute_complete_video_generation(
             overall_progress = 75.0 + (sub_progress * 0.2)
             task_manager.update_task_status(task_id, "processing", progress=overall_progress, message=message)
 
-        video_result = video_service.generate_story_video(
+        # Scene clips render concurrently, then are joined (stream copy: they share one encoding profile)
+        scene_videos = media_engine.generate_scene_videos(
             scenes=valid_scenes,
             image_paths=image_paths,
             audio_paths=audio_paths,
             user_id=user_id,
+            fps=request_data.get("video_fps", 24),
+            progress_callback=lambda sub_progress, message: video_progress_callback(sub_progress * 0.9, message),
+        )
+        scene_video_paths = [v["video_path"] for v in scene_videos if v.get("video_path")]
+        if not scene_video_paths:
+            raise RuntimeError("No scene videos were rendered")
+
+        video_result = video_service.combine_scene_videos(
+            video_paths=scene_video_paths,
+            user_id=user_id,
             story_title=request_data.get("story_setting", "Story")[:50],
             fps=request_data.get("video_fps", 24),
-            transition_duration=request_data.get("video_transition_duration", 0.5),
-            progress_callback=video_progress_callback,
+            progress_callback=lambda sub_progress, message: video_progress_callback(90.0 + sub_progress * 0.1, message),
         )
 
         result = {
@@ -534,7 +543,7 @@ async def serve_story_video(
     try:
         user_id = require_authenticated_user(current_user)
         video_path = resolve_story_media_path(video_filename, "video", user_id)
-        return FileResponse(path=str(video_path), media_type="video/mp4", filename=video_filename)
+        return MediaFileResponse(path=str(video_path), media_type="video/mp4", filename=video_filename)
     except HTTPException:
         raise
     except Exception as exc:
@@ -553,7 +562,7 @@ async def serve_ai_story_video(
 
         video_path = resolve_story_media_path(video_filename, "video", user_id, extra_subdir="AI_Videos")
 
-        return FileResponse(
+        return MediaFileResponse(
             path=str(video_path),
             media_type="video/mp4",
             filename=video_filename
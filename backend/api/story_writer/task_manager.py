@@ -2,74 +2,89 @@
 Task Management System for Story Writer API
 
 Handles background task execution, status tracking, and progress updates
-for story generation operations.
+for story generation operations. Also used by the podcast and video studio routers.
 """
 
 import asyncio
-import uuid
-from datetime import datetime
 from typing import Any, Dict, Optional
 from loguru import logger
 
+from utils.task_state_store import get_task_state_store, iso_timestamp
+
+# Story, podcast and video studio tasks share this namespace in the task state store
+TASK_NAMESPACE = "story"
+# Upper bound for a long-polling status request
+MAX_STATUS_WAIT_SECONDS = 30.0
+
 
 class TaskManager:
-    """Manages background tasks for story generation."""
+    """Manages background tasks for story generation.
+
+    Task state lives in the shared task state store (utils.task_state_store), so any
+    worker can report on a task and a worker restart does not lose it.
+    """
     
     def __init__(self):
         """Initialize the task manager."""
-        self.task_storage: Dict[str, Dict[str, Any]] = {}
+        self.store = get_task_state_store()
         logger.info("[StoryWriter] TaskManager initialized")
     
     def cleanup_old_tasks(self):
-        """Remove tasks older than 1 hour to prevent memory leaks."""
-        current_time = datetime.now()
-        tasks_to_remove = []
-        
-        for task_id, task_data in self.task_storage.items():
-            created_at = task_data.get("created_at")
-            if created_at and (current_time - created_at).total_seconds() > 3600:  # 1 hour
-                tasks_to_remove.append(task_id)
-        
-        for task_id in tasks_to_remove:
-            del self.task_storage[task_id]
-            logger.debug(f"[StoryWriter] Cleaned up old task: {task_id}")
+        """Remove finished tasks older than 1 hour."""
+        removed = self.store.cleanup(max_age_seconds=3600, namespace=TASK_NAMESPACE)
+        if removed:
+            logger.debug(f"[StoryWriter] Cleaned up {removed} old tasks")
     
-    def create_task(
+    async def create_task(
         self,
         task_type: str = "story_generation",
         metadata: Optional[Dict[str, Any]] = None,
     ) -> str:
         """Create a new task and return its ID."""
-        task_id = str(uuid.uuid4())
+        # Store calls are blocking SQLite transactions; keep them off the event loop
+        await asyncio.to_thread(self.cleanup_old_tasks)
         task_metadata = metadata or {}
-        
-        self.task_storage[task_id] = {
-            "status": "pending",
-            "created_at": datetime.now(),
-            "result": None,
-            "error": None,
-            "progress_messages": [],
-            "task_type": task_type,
-            "progress": 0.0,
-            "metadata": task_metadata,
-        }
+        task_id = await asyncio.to_thread(
+            self.store.create,
+            TASK_NAMESPACE,
+            task_type=task_type,
+            owner=task_metadata.get("owner_user_id"),
+            metadata=task_metadata,
+        )
         
         logger.info(f"[StoryWriter] Created task: {task_id} (type: {task_type})")
         return task_id
     
     def get_task_status(self, task_id: str, requester_user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """Get the status of a task."""
-        self.cleanup_old_tasks()
-        
-        if task_id not in self.task_storage:
+        """Get the status of a task (blocking; async callers use poll_task_status)."""
+        return self._to_status(self.store.get(task_id), requester_user_id)
+
+    async def poll_task_status(
+        self,
+        task_id: str,
+        since: Optional[int] = None,
+        wait: float = 0,
+        requester_user_id: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Get the status of a task, long-polling when since/wait are given.
+
+        With `since` (a version from an earlier response) and `wait` seconds, returns
+        as soon as the task has changed, or with the unchanged status after `wait`.
+        """
+        if since is None or wait <= 0:
+            return await asyncio.to_thread(self.get_task_status, task_id, requester_user_id)
+        task = await self.store.wait_for_change(task_id, since, min(wait, MAX_STATUS_WAIT_SECONDS))
+        return self._to_status(task, requester_user_id)
+
+    def _to_status(self, task: Optional[Dict[str, Any]], requester_user_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        if task is None:
             # Log at DEBUG level - task not found is expected when tasks expire or are cleaned up
             # This prevents log spam from frontend polling for expired/completed tasks
-            logger.debug(f"[StoryWriter] Task not found: {task_id} (may have expired or been cleaned up)")
+            logger.debug("[StoryWriter] Task not found (may have expired or been cleaned up)")
             return None
         
-        task = self.task_storage[task_id]
-        metadata = task.get("metadata", {}) or {}
-        owner_user_id = metadata.get("owner_user_id")
+        task_id = task["task_id"]
+        owner_user_id = task["metadata"].get("owner_user_id")
 
         if requester_user_id is not None and owner_user_id is not None and requester_user_id != owner_user_id:
             logger.warning(
@@ -80,10 +95,11 @@ class TaskManager:
         response = {
             "task_id": task_id,
             "status": task["status"],
-            "progress": task.get("progress", 0.0),
-            "message": task.get("progress_messages", [])[-1] if task.get("progress_messages") else None,
-            "created_at": task["created_at"].isoformat() if task.get("created_at") else None,
-            "updated_at": task.get("updated_at", task.get("created_at")).isoformat() if task.get("updated_at") or task.get("created_at") else None,
+            "progress": task.get("progress") or 0.0,
+            "message": task["messages"][-1] if task["messages"] else None,
+            "created_at": iso_timestamp(task["created_at"]),
+            "updated_at": iso_timestamp(task["updated_at"]),
+            "version": task["version"],
         }
         
         if task["status"] == "completed" and task.get("result"):
@@ -110,33 +126,25 @@ class TaskManager:
         error_data: Optional[Dict[str, Any]] = None,
     ):
         """Update the status of a task."""
-        if task_id not in self.task_storage:
+        changes: Dict[str, Any] = {}
+        if result is not None:
+            changes["result"] = result
+        if error is not None:
+            changes["error"] = error
+        if error_status is not None:
+            changes["error_status"] = error_status
+        if error_data is not None:
+            changes["error_data"] = error_data
+
+        version = self.store.update(task_id, status=status, progress=progress, message=message or None, **changes)
+        if version is None:
             logger.warning(f"[StoryWriter] Cannot update non-existent task: {task_id}")
             return
         
-        task = self.task_storage[task_id]
-        task["status"] = status
-        task["updated_at"] = datetime.now()
-        
-        if progress is not None:
-            task["progress"] = progress
-        
         if message:
-            if "progress_messages" not in task:
-                task["progress_messages"] = []
-            task["progress_messages"].append(message)
             logger.info(f"[StoryWriter] Task {task_id}: {message} (progress: {progress}%)")
-        
-        if result is not None:
-            task["result"] = result
-        
         if error is not None:
-            task["error"] = error
             logger.error(f"[StoryWriter] Task {task_id} error: {error}")
-        if error_status is not None:
-            task["error_status"] = error_status
-        if error_data is not None:
-            task["error_data"] = error_data
     
     async def execute_story_generation_task(
         self,
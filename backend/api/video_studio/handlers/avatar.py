@@ -1,5 +1,6 @@
 from fastapi import APIRouter, UploadFile, File, Form, BackgroundTasks, HTTPException, Depends
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse, cached_media_lookup
+import os
 import shutil
 from pathlib import Path
 from services.wavespeed.infinitetalk import animate_scene_with_voiceover
@@ -172,23 +173,30 @@ async def get_task_status(task_id: str, current_user: dict = Depends(get_current
 
 @router.get("/download/{filename}")
 async def download_video(filename: str):
-    candidate_paths = []
+    filename = os.path.basename(filename)
 
-    workspace_root = get_workspace_root()
-    candidate_paths.extend([
-        workspace_root / f"workspace_*" / "media" / "video_studio" / "videos" / filename,
-        workspace_root / f"workspace_*" / "media" / "video_studio" / "uploads" / filename,
-    ])
+    def find_video():
+        workspace_root = get_workspace_root()
+        candidate_paths = [
+            workspace_root / f"workspace_*" / "media" / "video_studio" / "videos" / filename,
+            workspace_root / f"workspace_*" / "media" / "video_studio" / "uploads" / filename,
+        ]
 
-    for legacy_dir in get_legacy_video_studio_upload_dirs():
-        candidate_paths.append(legacy_dir / filename)
+        for legacy_dir in get_legacy_video_studio_upload_dirs():
+            candidate_paths.append(legacy_dir / filename)
 
-    for candidate in candidate_paths:
-        if "*" in str(candidate):
-            for matched in workspace_root.glob(str(candidate.relative_to(workspace_root))):
-                if matched.exists() and matched.is_file():
-                    return FileResponse(matched)
-        elif candidate.exists() and candidate.is_file():
-            return FileResponse(candidate)
+        for candidate in candidate_paths:
+            if "*" in str(candidate):
+                for matched in workspace_root.glob(str(candidate.relative_to(workspace_root))):
+                    if matched.is_file():
+                        return matched
+            elif candidate.is_file():
+                return candidate
+        return None
+
+    # Players seek with many Range requests; search the workspaces only once
+    video_path = cached_media_lookup(("video_studio_download", filename), find_video) if filename else None
+    if video_path is not None:
+        return MediaFileResponse(video_path)
 
     raise HTTPException(status_code=404, detail="File not found")
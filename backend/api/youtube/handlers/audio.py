@@ -1,7 +1,7 @@
 """YouTube Creator scene audio generation handlers."""
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse
 from sqlalchemy.orm import Session
 from typing import Dict, Any, Optional
 from pydantic import BaseModel
@@ -459,5 +459,5 @@ async def serve_youtube_audio(
     if not audio_path.exists():
         raise HTTPException(status_code=404, detail="Audio file not found")
     
-    return FileResponse(audio_path, media_type="audio/mpeg")
+    return MediaFileResponse(audio_path, media_type="audio/mpeg")
 
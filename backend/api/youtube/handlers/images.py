@@ -6,7 +6,7 @@ import uuid
 from concurrent.futures import ThreadPoolExecutor
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -121,7 +121,7 @@ async def generate_youtube_scene_image(
         )
 
         # Verify task was created
-        initial_status = task_manager.get_task_status(task_id)
+        initial_status = await task_manager.poll_task_status(task_id)
         if not initial_status:
             logger.error(f"[YouTube] Failed to create task {task_id} - task not found immediately after creation")
             return YouTubeImageTaskResponse(
@@ -395,7 +395,7 @@ async def get_image_generation_status(
     require_authenticated_user(current_user)
 
     logger.info(f"[YouTubeAPI] Getting image generation status for task: {task_id}")
-    task_status = task_manager.get_task_status(task_id)
+    task_status = await task_manager.poll_task_status(task_id)
     if task_status:
         logger.info(f"[YouTubeAPI] Task {task_id} status: {task_status.get('status', 'unknown')}, progress: {task_status.get('progress', 0)}, has_result: {'result' in task_status}")
     if not task_status:
@@ -439,7 +439,7 @@ async def serve_youtube_image(
     if not image_path.exists() or not image_path.is_file():
         raise HTTPException(status_code=404, detail="Image not found")
 
-    return FileResponse(
+    return MediaFileResponse(
         path=str(image_path),
         media_type="image/png",
         filename=filename,
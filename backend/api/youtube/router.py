@@ -7,7 +7,7 @@ Handles video planning, scene building, and rendering endpoints.
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse
 from pydantic import BaseModel, Field
 from loguru import logger
 from sqlalchemy.orm import Session
@@ -17,6 +17,7 @@ from services.database import get_db
 from services.youtube.planner import YouTubePlannerService
 from services.youtube.scene_builder import YouTubeSceneBuilderService
 from services.youtube.renderer import YouTubeVideoRendererService
+from services.youtube.scene_pipeline import SceneRenderCancelled, YouTubeScenePipeline
 from services.persona_data_service import PersonaDataService
 from services.subscription import PricingService
 from services.subscription.preflight_validator import validate_scene_animation_operation
@@ -515,7 +516,7 @@ async def start_video_render(
         )
         
         # Verify task was created
-        initial_status = task_manager.get_task_status(task_id)
+        initial_status = await task_manager.poll_task_status(task_id)
         if not initial_status:
             logger.error(f"[YouTubeAPI] Failed to create task {task_id} - task not found immediately after creation")
             return VideoRenderResponse(
@@ -621,7 +622,7 @@ async def render_single_scene_video(
             f"[YouTubeAPI] Created single-scene render task {task_id} for user {user_id}, scene={scene_num}, resolution={request.resolution}"
         )
 
-        initial_status = task_manager.get_task_status(task_id)
+        initial_status = await task_manager.poll_task_status(task_id)
         if not initial_status:
             logger.error(f"[YouTubeAPI] Failed to create task {task_id} - task not found immediately after creation")
             return SceneVideoRenderResponse(
@@ -681,6 +682,8 @@ async def render_single_scene_video(
 @router.get("/render/{task_id}")
 async def get_render_status(
     task_id: str,
+    since: Optional[int] = None,
+    wait: float = 0,
     current_user: Dict[str, Any] = Depends(get_current_user),
 ) -> Optional[Dict[str, Any]]:
     """
@@ -688,20 +691,18 @@ async def get_render_status(
     
     Returns current progress, status, and result when complete.
     Returns None if task not found (matches podcast pattern for graceful handling).
+    With `since` (the last seen version) and `wait` seconds, waits until the task changes.
     """
     try:
         require_authenticated_user(current_user)
         
         logger.debug(f"[YouTubeAPI] Getting render status for task: {task_id}")
-        task_status = task_manager.get_task_status(task_id)
+        task_status = await task_manager.poll_task_status(task_id, since=since, wait=wait)
         if not task_status:
             # Log at DEBUG level - null is expected when tasks expire or server restarts
             # This prevents log spam from frontend polling for expired/completed tasks
             # Return None instead of raising 404 to match podcast pattern for graceful frontend handling
-            logger.debug(
-                f"[YouTubeAPI] Task {task_id} not found (may have expired or been cleaned up). "
-                f"Available tasks: {len(task_manager.task_storage)}"
-            )
+            logger.debug(f"[YouTubeAPI] Task {task_id} not found (may have expired or been cleaned up)")
             return None
         
         return task_status
@@ -714,6 +715,35 @@ async def get_render_status(
         )
 
 
+def _classify_scene_error(scene_error: BaseException) -> tuple:
+    """Return (user-facing message, error type) for a failed scene render."""
+    error_msg = str(scene_error)
+    scene_error_type = "unknown"
+    
+    if isinstance(scene_error, HTTPException):
+        error_detail = scene_error.detail
+        if isinstance(error_detail, dict):
+            error_msg = error_detail.get("message", error_detail.get("error", str(error_detail)))
+            scene_error_type = error_detail.get("error", "http_error")
+        else:
+            error_msg = str(error_detail)
+        # Check if it's a timeout or critical error that should fail fast
+        if scene_error.status_code == 504:  # Timeout
+            scene_error_type = "timeout"
+        elif scene_error.status_code >= 500:  # Server errors
+            scene_error_type = "server_error"
+    elif isinstance(scene_error, SceneRenderCancelled):
+        scene_error_type = "cancelled"
+    else:
+        # Check error type from exception
+        if "timeout" in str(scene_error).lower():
+            scene_error_type = "timeout"
+        elif "connection" in str(scene_error).lower():
+            scene_error_type = "connection_error"
+    
+    return error_msg, scene_error_type
+
+
 def _execute_video_render_task(
     task_id: str,
     scenes: List[Dict[str, Any]],
@@ -795,163 +825,152 @@ def _execute_video_render_task(
             )
             return
         
-        # Render each scene
-        for idx, scene in enumerate(scenes):
-            scene_num = scene.get("scene_number", idx + 1)
-            progress = 5.0 + (idx / total_scenes) * 85.0
-            
-            task_manager.update_task_status(
-                task_id,
-                "processing",
-                progress=progress,
-                message=f"Rendering scene {scene_num}/{total_scenes}..."
-            )
+        # Render scenes concurrently within the user's budget. Finished scenes are
+        # checkpointed, so retrying a failed render only re-renders the failed scenes.
+        pipeline = YouTubeScenePipeline(
+            renderer=renderer,
+            user_id=user_id,
+            video_plan=video_plan,
+            resolution=resolution,
+            voice_id=voice_id,
+            db=db,
+        )
+        failed_so_far: List[str] = []
+        fail_fast: Dict[str, Any] = {}
+        
+        def on_scene_complete(outcome, completed: int, total: int):
+            scene = outcome.scene
+            scene_num = outcome.scene_number
+            progress = 5.0 + (completed / total) * 80.0
             
-            try:
-                scene_result = renderer.render_scene_video(
-                    scene=scene,
-                    video_plan=video_plan,
-                    user_id=user_id,
-                    resolution=resolution,
-                    generate_audio_enabled=True,
-                    voice_id=voice_id,
-                    db=db,
-                )
-                
-                scene_results.append(scene_result)
-                total_cost += scene_result["cost"]
-                
-                # Save to asset library
-                try:
-                    save_asset_to_library(
-                        db=db,
-                        user_id=user_id,
-                        asset_type="video",
-                        source_module="youtube_creator",
-                        filename=scene_result["video_filename"],
-                        file_url=scene_result["video_url"],
-                        file_path=scene_result["video_path"],
-                        file_size=scene_result["file_size"],
-                        mime_type="video/mp4",
-                        title=f"YouTube Scene {scene_num}: {scene.get('title', 'Untitled')}",
-                        description=f"Scene {scene_num} from YouTube video",
-                        prompt=scene.get("visual_prompt", ""),
-                        tags=["youtube_creator", "video", "scene", f"scene_{scene_num}", resolution],
-                        provider="wavespeed",
-                        model="alibaba/wan-2.5/text-to-video",
-                        cost=scene_result["cost"],
-                        asset_metadata={
-                            "scene_number": scene_num,
-                            "duration": scene_result["duration"],
-                            "resolution": resolution,
-                            "status": "completed"
-                        }
-                    )
-                except Exception as e:
-                    logger.warning(f"[YouTubeRenderer] Failed to save scene to library: {e}")
-                
-            except Exception as scene_error:
-                error_msg = str(scene_error)
-                scene_error_type = "unknown"
-                
-                if isinstance(scene_error, HTTPException):
-                    error_detail = scene_error.detail
-                    if isinstance(error_detail, dict):
-                        error_msg = error_detail.get("message", error_detail.get("error", str(error_detail)))
-                        scene_error_type = error_detail.get("error", "http_error")
-                    else:
-                        error_msg = str(error_detail)
-                    # Check if it's a timeout or critical error that should fail fast
-                    if scene_error.status_code == 504:  # Timeout
-                        scene_error_type = "timeout"
-                    elif scene_error.status_code >= 500:  # Server errors
-                        scene_error_type = "server_error"
-                else:
-                    # Check error type from exception
-                    if "timeout" in str(scene_error).lower():
-                        scene_error_type = "timeout"
-                    elif "connection" in str(scene_error).lower():
-                        scene_error_type = "connection_error"
-                
-                logger.error(
-                    f"[YouTubeRenderer] Scene {scene_num} failed: {error_msg} (type: {scene_error_type})",
-                    exc_info=True
-                )
-                
-                # Track failed scene for user retry
-                failed_scene_result = {
-                    "scene_number": scene_num,
-                    "status": "failed",
-                    "error": error_msg,
-                    "error_type": scene_error_type,
-                    "scene_data": scene,
-                }
-                scene_results.append(failed_scene_result)
-                
-                # Update task status immediately to reflect failure
-                successful_count = len([r for r in scene_results if r.get("status") != "failed"])
-                failed_count = len([r for r in scene_results if r.get("status") == "failed"])
+            if outcome.ok:
+                scene_result = outcome.result
+                # Checkpointed scenes were saved to the library when they were first rendered
+                if not outcome.from_checkpoint:
+                    try:
+                        save_asset_to_library(
+                            db=db,
+                            user_id=user_id,
+                            asset_type="video",
+                            source_module="youtube_creator",
+                            filename=scene_result["video_filename"],
+                            file_url=scene_result["video_url"],
+                            file_path=scene_result["video_path"],
+                            file_size=scene_result["file_size"],
+                            mime_type="video/mp4",
+                            title=f"YouTube Scene {scene_num}: {scene.get('title', 'Untitled')}",
+                            description=f"Scene {scene_num} from YouTube video",
+                            prompt=scene.get("visual_prompt", ""),
+                            tags=["youtube_creator", "video", "scene", f"scene_{scene_num}", resolution],
+                            provider="wavespeed",
+                            model="alibaba/wan-2.5/text-to-video",
+                            cost=scene_result["cost"],
+                            asset_metadata={
+                                "scene_number": scene_num,
+                                "duration": scene_result["duration"],
+                                "resolution": resolution,
+                                "status": "completed"
+                            }
+                        )
+                    except Exception as e:
+                        logger.warning(f"[YouTubeRenderer] Failed to save scene to library: {e}")
                 
-                # Fail fast for critical errors (timeouts, server errors) if it's the first scene
-                # or if multiple consecutive failures occur
-                should_fail_fast = (
-                    scene_error_type in ["timeout", "server_error", "connection_error"] and
-                    (failed_count == 1 or failed_count >= 3)  # Fail fast on first timeout or 3+ failures
-                )
-                
-                if should_fail_fast:
-                    logger.error(
-                        f"[YouTubeRenderer] Failing fast due to {scene_error_type} error. "
-                        f"Scene {scene_num} failed, total failures: {failed_count}"
-                    )
-                    # Mark task as failed immediately
-                    task_manager.update_task_status(
-                        task_id,
-                        "failed",
-                        error=f"Render failed fast: Scene {scene_num} failed with {scene_error_type}",
-                        message=f"Video rendering stopped early due to {scene_error_type}. "
-                               f"{successful_count} scene(s) completed, {failed_count} scene(s) failed. "
-                               f"Failed scene: {error_msg}",
-                    )
-                    # Update result with current state
-                    successful_scenes = [r for r in scene_results if r.get("status") != "failed"]
-                    failed_scenes = [r for r in scene_results if r.get("status") == "failed"]
-                    result = {
-                        "scene_results": successful_scenes,
-                        "failed_scenes": failed_scenes,
-                        "total_cost": total_cost,
-                        "final_video_url": successful_scenes[0]["video_url"] if successful_scenes else None,
-                        "num_scenes": len(successful_scenes),
-                        "num_failed": len(failed_scenes),
-                        "resolution": resolution,
-                        "partial_success": len(failed_scenes) > 0 and len(successful_scenes) > 0,
-                        "fail_fast": True,
-                        "fail_reason": f"Scene {scene_num} failed with {scene_error_type}",
-                    }
-                    task_manager.update_task_status(
-                        task_id,
-                        "failed",
-                        error=f"Render failed fast: {scene_error_type}",
-                        message=f"Rendering stopped early. {successful_count} completed, {failed_count} failed.",
-                        result=result
-                    )
-                    return  # Exit immediately
-                
-                # For non-critical errors, update progress but continue
                 task_manager.update_task_status(
                     task_id,
                     "processing",
                     progress=progress,
-                    message=f"Scene {scene_num} failed, continuing with remaining scenes... "
-                           f"({successful_count} successful, {failed_count} failed)"
+                    message=f"Scene {scene_num} rendered ({completed}/{total} complete)..."
                 )
-                # Continue with other scenes - let user retry failed ones
+                return
+            
+            if isinstance(outcome.error, SceneRenderCancelled):
+                return
+            
+            error_msg, scene_error_type = _classify_scene_error(outcome.error)
+            logger.error(
+                f"[YouTubeRenderer] Scene {scene_num} failed: {error_msg} (type: {scene_error_type})"
+            )
+            failed_so_far.append(scene_error_type)
+            failed_count = len(failed_so_far)
+            
+            # Fail fast for critical errors (timeouts, server errors) on the first failure
+            # or once 3+ scenes have failed: scenes not yet started are not submitted
+            should_fail_fast = (
+                scene_error_type in ["timeout", "server_error", "connection_error"] and
+                (failed_count == 1 or failed_count >= 3)
+            )
+            if should_fail_fast and not fail_fast:
+                logger.error(
+                    f"[YouTubeRenderer] Failing fast due to {scene_error_type} error. "
+                    f"Scene {scene_num} failed, total failures: {failed_count}"
+                )
+                fail_fast.update(scene_num=scene_num, error_type=scene_error_type)
+                pipeline.cancel()
+            
+            task_manager.update_task_status(
+                task_id,
+                "processing",
+                progress=progress,
+                message=f"Scene {scene_num} failed, continuing with remaining scenes... "
+                       f"({completed - failed_count} finished, {failed_count} failed)"
+            )
+        
+        task_manager.update_task_status(
+            task_id,
+            "processing",
+            progress=5.0,
+            message=f"Rendering {total_scenes} scenes..."
+        )
+        run = pipeline.run(
+            scenes,
+            combine=combine_scenes,
+            title=video_plan.get("video_summary", "YouTube Video")[:50],
+            on_scene_complete=on_scene_complete,
+        )
+        
+        for outcome in run["outcomes"]:
+            if outcome.ok:
+                scene_results.append(outcome.result)
+                if not outcome.from_checkpoint:
+                    total_cost += outcome.result["cost"]
                 continue
+            error_msg, scene_error_type = _classify_scene_error(outcome.error)
+            # Track failed scene for user retry
+            scene_results.append({
+                "scene_number": outcome.scene_number,
+                "status": "failed",
+                "error": error_msg,
+                "error_type": scene_error_type,
+                "scene_data": outcome.scene,
+            })
         
         # Separate successful and failed scenes
         successful_scenes = [r for r in scene_results if r.get("status") != "failed"]
         failed_scenes = [r for r in scene_results if r.get("status") == "failed"]
         
+        if fail_fast:
+            scene_error_type = fail_fast["error_type"]
+            result = {
+                "scene_results": successful_scenes,
+                "failed_scenes": failed_scenes,
+                "total_cost": total_cost,
+                "final_video_url": successful_scenes[0]["video_url"] if successful_scenes else None,
+                "num_scenes": len(successful_scenes),
+                "num_failed": len(failed_scenes),
+                "resolution": resolution,
+                "partial_success": len(failed_scenes) > 0 and len(successful_scenes) > 0,
+                "fail_fast": True,
+                "fail_reason": f"Scene {fail_fast['scene_num']} failed with {scene_error_type}",
+            }
+            task_manager.update_task_status(
+                task_id,
+                "failed",
+                error=f"Render failed fast: {scene_error_type}",
+                message=f"Rendering stopped early. {len(successful_scenes)} completed, {len(failed_scenes)} failed.",
+                result=result
+            )
+            return
+        
         if not successful_scenes:
             # All scenes failed - mark as failed immediately
             error_msg = f"All {len(failed_scenes)} scene(s) failed to render"
@@ -974,25 +993,8 @@ def _execute_video_render_task(
             )
             return
         
-        # Combine scenes if requested (only if we have successful scenes)
-        final_video_url = None
-        if combine_scenes and len(successful_scenes) > 1:
-            task_manager.update_task_status(
-                task_id, "processing", progress=90.0, message="Combining scenes..."
-            )
-            
-            # Use renderer to combine
-            combined_result = renderer.render_full_video(
-                scenes=scenes,
-                video_plan=video_plan,
-                user_id=user_id,
-                resolution=resolution,
-                combine_scenes=True,
-                voice_id=voice_id,
-                db=db,
-            )
-            
-            final_video_url = combined_result.get("final_video_url")
+        # Scenes were stitched in order as they finished; the pipeline returns the joined video
+        final_video_url = run["final_video"]["video_url"] if run["final_video"] else None
         
         # Final result (successful_scenes and failed_scenes already separated above)
         result = {
@@ -1226,7 +1228,7 @@ async def combine_scene_videos(
             f"[YouTubeAPI] Created combine task {task_id} for user {user_id}, videos={len(request.scene_video_urls)}, resolution={request.resolution}"
         )
 
-        initial_status = task_manager.get_task_status(task_id)
+        initial_status = await task_manager.poll_task_status(task_id)
         if not initial_status:
             logger.error(f"[YouTubeAPI] Failed to create combine task {task_id} - task not found immediately after creation")
             return CombineVideosResponse(
@@ -1397,17 +1399,14 @@ def _execute_combine_video_task(
 
         # Use user video directory for output
         video_service = StoryVideoGenerationService(output_dir=str(user_video_dir))
-        combined_result = video_service.generate_story_video(
-            scenes=[
-                {"scene_number": idx + 1, "title": f"Scene {idx + 1}"}
-                for idx in range(len(video_paths))
-            ],
-            image_paths=[None] * len(video_paths),
-            audio_paths=[],
+        combined_result = video_service.combine_scene_videos(
             video_paths=[str(p) for p in video_paths],
             user_id=user_id,
             story_title=title or "YouTube Video",
             fps=24,
+            progress_callback=lambda progress, message: task_manager.update_task_status(
+                task_id, "processing", progress=25.0 + progress * 0.6, message=message
+            ),
         )
 
         task_manager.update_task_status(
@@ -1537,7 +1536,7 @@ async def estimate_render_cost(
 async def serve_youtube_video(
     video_filename: str,
     current_user: Dict[str, Any] = Depends(get_current_user),
-) -> FileResponse:
+) -> MediaFileResponse:
     """
     Serve YouTube video files.
     
@@ -1561,7 +1560,7 @@ async def serve_youtube_video(
         
         logger.debug(f"[YouTubeAPI] Serving video: {video_filename}")
         
-        return FileResponse(
+        return MediaFileResponse(
             path=str(video_path),
             media_type="video/mp4",
             filename=video_filename,
@@ -809,6 +809,15 @@ async def startup_event():
             except Exception as e:
                 logger.warning(f"[STARTUP] YouTube task recovery skipped: {e}")
 
+        # Fail blog/story/podcast tasks whose worker died; tasks of live workers are kept
+        try:
+            from utils.task_state_store import get_task_state_store
+            task_store = get_task_state_store()
+            for namespace in ("blog_writer", "story", "youtube"):
+                task_store.mark_interrupted(namespace)
+        except Exception as e:
+            logger.warning(f"[STARTUP] Task state recovery skipped: {e}")
+
         # Check Wix configuration (OAuth-based, API key optional)
         wix_api_key = os.getenv('WIX_API_KEY')
         if wix_api_key:
@@ -59,6 +59,7 @@ class AdvertoolsTask(Base):
         Index('idx_advertools_tasks_user_site', 'user_id', 'website_url'),
         Index('idx_advertools_tasks_next_execution', 'next_execution'),
         Index('idx_advertools_tasks_status', 'status'),
+        Index('idx_advertools_tasks_status_due', 'status', 'next_execution'),
     )
     
     def __repr__(self):
@@ -205,6 +205,8 @@ class BlogOutlineResponse(BaseModel):
     source_mapping_stats: Optional[SourceMappingStats] = None
     grounding_insights: Optional[GroundingInsights] = None
     research_coverage: Optional[ResearchCoverage] = None
+    # Set when served from cache: {'type': 'exact'|'similar', 'score': float, ...}
+    cache_match: Optional[Dict[str, Any]] = None
 
 
 class BlogOutlineRefineRequest(BaseModel):
@@ -355,4 +357,6 @@ class MediumBlogGenerateResult(BaseModel):
     sections: List[MediumGeneratedSection]
     model: Optional[str] = None
     generation_time_ms: Optional[int] = None
-    safety_flags: Optional[Dict[str, Any]] = None
\ No newline at end of file
+    safety_flags: Optional[Dict[str, Any]] = None
+    # Set when served from cache: {'type': 'exact'|'similar', 'score': float, ...}
+    cache_match: Optional[Dict[str, Any]] = None
\ No newline at end of file
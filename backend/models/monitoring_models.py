@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, JSON, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -42,6 +42,10 @@ class MonitoringTask(Base):
     strategy = relationship("EnhancedContentStrategy", back_populates="monitoring_tasks")
     execution_logs = relationship("TaskExecutionLog", back_populates="task", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index('idx_monitoring_tasks_status_due', 'status', 'next_execution'),
+    )
+
 class TaskExecutionLog(Base):
     """Model for storing task execution logs"""
     __tablename__ = "task_execution_logs"
@@ -56,6 +56,7 @@ class OAuthTokenMonitoringTask(Base):
         Index('idx_oauth_token_tasks_user_platform', 'user_id', 'platform'),
         Index('idx_oauth_token_tasks_next_check', 'next_check'),
         Index('idx_oauth_token_tasks_status', 'status'),
+        Index('idx_oauth_token_tasks_status_due', 'status', 'next_check'),
     )
     
     def __repr__(self):
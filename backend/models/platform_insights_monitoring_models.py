@@ -58,6 +58,7 @@ class PlatformInsightsTask(Base):
         Index('idx_platform_insights_user_platform', 'user_id', 'platform'),
         Index('idx_platform_insights_next_check', 'next_check'),
         Index('idx_platform_insights_status', 'status'),
+        Index('idx_platform_insights_status_due', 'status', 'next_check'),
     )
     
     def __repr__(self):
@@ -334,6 +334,7 @@ class TaskStatus(BaseModel):
     error: Optional[str] = Field(None, description="Error message if failed")
     created_at: Optional[str] = Field(None, description="Task creation timestamp")
     updated_at: Optional[str] = Field(None, description="Task last update timestamp")
+    version: Optional[int] = Field(None, description="Increases on every change; pass as 'since' to long-poll")
 
 
 class StoryImageGenerationRequest(BaseModel):
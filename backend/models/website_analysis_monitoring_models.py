@@ -62,6 +62,7 @@ class WebsiteAnalysisTask(Base):
         Index('idx_website_analysis_tasks_user_task_type', 'user_id', 'task_type'),
         Index('idx_website_analysis_tasks_next_check', 'next_check'),
         Index('idx_website_analysis_tasks_status', 'status'),
+        Index('idx_website_analysis_tasks_status_due', 'status', 'next_check'),
         Index('idx_website_analysis_tasks_task_type', 'task_type'),
     )
     
@@ -143,6 +144,7 @@ class OnboardingFullWebsiteAnalysisTask(Base):
         Index('idx_onboarding_full_website_analysis_tasks_user_site', 'user_id', 'website_url'),
         Index('idx_onboarding_full_website_analysis_tasks_next_execution', 'next_execution'),
         Index('idx_onboarding_full_website_analysis_tasks_status', 'status'),
+        Index('idx_onboarding_full_website_analysis_tasks_status_due', 'status', 'next_execution'),
     )
 
     def __repr__(self):
@@ -211,6 +213,7 @@ class DeepCompetitorAnalysisTask(Base):
         Index('idx_deep_competitor_analysis_tasks_user_site', 'user_id', 'website_url'),
         Index('idx_deep_competitor_analysis_tasks_next_execution', 'next_execution'),
         Index('idx_deep_competitor_analysis_tasks_status', 'status'),
+        Index('idx_deep_competitor_analysis_tasks_status_due', 'status', 'next_execution'),
     )
 
     def __repr__(self):
@@ -279,6 +282,7 @@ class DeepWebsiteCrawlTask(Base):
         Index('idx_deep_website_crawl_tasks_user_site', 'user_id', 'website_url'),
         Index('idx_deep_website_crawl_tasks_next_execution', 'next_execution'),
         Index('idx_deep_website_crawl_tasks_status', 'status'),
+        Index('idx_deep_website_crawl_tasks_status_due', 'status', 'next_execution'),
     )
 
     def __repr__(self):
@@ -349,6 +353,7 @@ class SIFIndexingTask(Base):
         Index('idx_sif_indexing_tasks_user_only', 'user_id'),
         Index('idx_sif_indexing_tasks_next_execution', 'next_execution'),
         Index('idx_sif_indexing_tasks_status', 'status'),
+        Index('idx_sif_indexing_tasks_status_due', 'status', 'next_execution'),
     )
 
     def __repr__(self):
@@ -419,6 +424,7 @@ class MarketTrendsTask(Base):
         Index("idx_market_trends_tasks_user_only", "user_id"),
         Index("idx_market_trends_tasks_next_execution", "next_execution"),
         Index("idx_market_trends_tasks_status", "status"),
+        Index("idx_market_trends_tasks_status_due", "status", "next_execution"),
     )
 
     def __repr__(self):
@@ -1,7 +1,8 @@
 """Compression Studio endpoints."""
 
-from typing import Dict, Any
-from fastapi import APIRouter, Depends, HTTPException
+import os
+from typing import Dict, Any, Optional
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
 
 from .models import (
     CompressImageRequest, CompressImageResponse,
@@ -9,7 +10,7 @@ from .models import (
     CompressionEstimateRequest, CompressionEstimateResponse,
     CompressionFormatsResponse, CompressionPresetsResponse,
 )
-from .deps import get_studio_manager, _require_user_id
+from .deps import get_studio_manager, _require_user_id, read_image_upload, binary_image_response
 from services.image_studio import ImageStudioManager
 from middleware.auth_middleware import get_current_user
 from utils.logger_utils import get_service_logger
@@ -62,6 +63,63 @@ async def compress_image(
         raise HTTPException(status_code=500, detail=f"Image compression failed: {e}")
 
 
+@router.post("/compress/upload", summary="Compress an uploaded image (binary in, binary out)")
+async def compress_image_upload(
+    file: UploadFile = File(..., description="Image to compress"),
+    quality: int = Form(85, ge=1, le=100, description="Compression quality (1-100)"),
+    format: str = Form("jpeg", description="Output format: jpeg, png, webp"),
+    target_size_kb: Optional[int] = Form(None, ge=10, description="Target file size in KB"),
+    strip_metadata: bool = Form(True, description="Remove EXIF metadata"),
+    progressive: bool = Form(True, description="Progressive JPEG encoding"),
+    optimize: bool = Form(True, description="Optimize encoding"),
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    studio_manager: ImageStudioManager = Depends(get_studio_manager),
+):
+    """
+    Compress a multipart upload and return the compressed image bytes directly.
+
+    Avoids the ~33% base64 overhead of /compress in both directions. Result details
+    are returned in X-Image-* response headers.
+    """
+    user_id = _require_user_id(current_user, "image compression")
+    image_bytes = await read_image_upload(file)
+    try:
+        from services.image_studio.compression_service import CompressionRequest as ServiceRequest
+
+        compression_request = ServiceRequest(
+            image_base64="",
+            quality=quality,
+            format=format,
+            target_size_kb=target_size_kb,
+            strip_metadata=strip_metadata,
+            progressive=progressive,
+            optimize=optimize,
+        )
+        data, result = await studio_manager.compress_image_bytes(image_bytes, compression_request, user_id=user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"[Compression] ❌ Upload error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Image compression failed: {e}")
+
+    stem = os.path.splitext(os.path.basename(file.filename or "image"))[0] or "image"
+    extension = "jpg" if result.format in ("jpeg", "jpg") else result.format
+    return binary_image_response(
+        data,
+        media_type=studio_manager.compression_service.mime_type(result.format),
+        filename=f"{stem}_compressed.{extension}",
+        headers={
+            "Original-Size-KB": result.original_size_kb,
+            "Compressed-Size-KB": result.compressed_size_kb,
+            "Compression-Ratio": result.compression_ratio,
+            "Width": result.width,
+            "Height": result.height,
+            "Quality-Used": result.quality_used,
+            "Metadata-Stripped": str(result.metadata_stripped).lower(),
+        },
+    )
+
+
 @router.post("/compress/batch", response_model=CompressBatchResponse, summary="Compress multiple images")
 async def compress_batch(
     request: CompressBatchRequest,
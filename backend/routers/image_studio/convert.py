@@ -1,14 +1,15 @@
 """Format Converter endpoints."""
 
-from typing import Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+import os
+from typing import Dict, Any, Optional
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
 
 from .models import (
     ConvertFormatRequest, ConvertFormatResponse,
     ConvertFormatBatchRequest, ConvertFormatBatchResponse,
     SupportedFormatsResponse, FormatRecommendationsResponse,
 )
-from .deps import get_studio_manager, _require_user_id
+from .deps import get_studio_manager, _require_user_id, read_image_upload, binary_image_response
 from services.image_studio import ImageStudioManager
 from middleware.auth_middleware import get_current_user
 from utils.logger_utils import get_service_logger
@@ -63,6 +64,66 @@ async def convert_format(
         raise HTTPException(status_code=500, detail=f"Format conversion failed: {e}")
 
 
+@router.post("/convert-format/upload", summary="Convert an uploaded image (binary in, binary out)")
+async def convert_format_upload(
+    file: UploadFile = File(..., description="Image to convert"),
+    target_format: str = Form(..., description="Target format: png, jpeg, jpg, webp, gif, bmp, tiff"),
+    preserve_transparency: bool = Form(True, description="Preserve transparency when possible"),
+    quality: Optional[int] = Form(None, ge=1, le=100, description="Quality for lossy formats (1-100)"),
+    color_space: Optional[str] = Form(None, description="Color space: sRGB, Adobe RGB"),
+    strip_metadata: bool = Form(False, description="Remove EXIF metadata"),
+    optimize: bool = Form(True, description="Optimize encoding"),
+    progressive: bool = Form(True, description="Progressive JPEG encoding"),
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    studio_manager: ImageStudioManager = Depends(get_studio_manager),
+):
+    """
+    Convert a multipart upload and return the converted image bytes directly.
+
+    Avoids the ~33% base64 overhead of /convert-format in both directions. Result
+    details are returned in X-Image-* response headers.
+    """
+    user_id = _require_user_id(current_user, "format conversion")
+    image_bytes = await read_image_upload(file)
+    try:
+        from services.image_studio.format_converter_service import FormatConversionRequest as ServiceRequest
+
+        conversion_request = ServiceRequest(
+            image_base64="",
+            target_format=target_format,
+            preserve_transparency=preserve_transparency,
+            quality=quality,
+            color_space=color_space,
+            strip_metadata=strip_metadata,
+            optimize=optimize,
+            progressive=progressive,
+        )
+        data, result = await studio_manager.convert_format_bytes(image_bytes, conversion_request, user_id=user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"[Format Converter] ❌ Upload error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Format conversion failed: {e}")
+
+    formats = studio_manager.format_converter_service.SUPPORTED_FORMATS
+    stem = os.path.splitext(os.path.basename(file.filename or "image"))[0] or "image"
+    return binary_image_response(
+        data,
+        media_type=formats[result.target_format]["mime_type"],
+        filename=f"{stem}.{result.target_format}",
+        headers={
+            "Original-Format": result.original_format,
+            "Original-Size-KB": result.original_size_kb,
+            "Converted-Size-KB": result.converted_size_kb,
+            "Width": result.width,
+            "Height": result.height,
+            "Transparency-Preserved": str(result.transparency_preserved).lower(),
+            "Metadata-Preserved": str(result.metadata_preserved).lower(),
+            "Color-Space": result.color_space,
+        },
+    )
+
+
 @router.post("/convert-format/batch", response_model=ConvertFormatBatchResponse, summary="Convert multiple images")
 async def convert_format_batch(
     request: ConvertFormatBatchRequest,
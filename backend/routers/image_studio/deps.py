@@ -1,7 +1,11 @@
 """Shared dependencies for Image Studio API endpoints."""
 
+import os
+import re
+import unicodedata
 from typing import Dict, Any
-from fastapi import Depends, HTTPException, status
+from urllib.parse import quote
+from fastapi import Depends, HTTPException, Response, UploadFile, status
 
 from services.image_studio import ImageStudioManager
 from middleware.auth_middleware import get_current_user
@@ -33,3 +37,47 @@ def _require_user_id(current_user: Dict[str, Any], operation: str) -> str:
             detail="Authenticated user required for image operations.",
         )
     return user_id
+
+
+MAX_UPLOAD_BYTES = int(os.getenv("ALWRITY_IMAGE_UPLOAD_MAX_MB", "50")) * 1024 * 1024
+
+
+async def read_image_upload(file: UploadFile) -> bytes:
+    """Read a multipart image upload, enforcing the size limit."""
+    image_bytes = await file.read(MAX_UPLOAD_BYTES + 1)
+    if not image_bytes:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Uploaded image is empty.")
+    if len(image_bytes) > MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Image exceeds the {MAX_UPLOAD_BYTES // (1024 * 1024)} MB upload limit.",
+        )
+    return image_bytes
+
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._ -]+")
+
+
+def inline_content_disposition(filename: str) -> str:
+    """
+    Content-Disposition for a download name taken from an upload.
+
+    Header values must be latin-1, so `filename=` carries an ASCII-only fallback and
+    the real name goes in the RFC 5987 `filename*` parameter.
+    """
+    stem, extension = os.path.splitext(filename)
+    ascii_stem = unicodedata.normalize("NFKD", stem).encode("ascii", "ignore").decode("ascii")
+    ascii_stem = _UNSAFE_FILENAME_CHARS.sub("_", ascii_stem).strip(" ._") or "image"
+    ascii_extension = _UNSAFE_FILENAME_CHARS.sub("", extension)
+    return f'inline; filename="{ascii_stem}{ascii_extension}"; filename*=UTF-8\'\'{quote(filename, safe="")}'
+
+
+def binary_image_response(data: bytes, media_type: str, filename: str, headers: Dict[str, Any]) -> Response:
+    """Raw image bytes with result details in X-Image-* headers (no base64 inflation)."""
+    response_headers = {f"X-Image-{key}": str(value) for key, value in headers.items() if value is not None}
+    response_headers["Content-Disposition"] = inline_content_disposition(filename)
+    # Browsers only show cross-origin scripts the headers listed here
+    response_headers["Access-Control-Expose-Headers"] = ", ".join(
+        [name for name in response_headers if name.startswith("X-Image-")] + ["Content-Disposition"]
+    )
+    return Response(content=data, media_type=media_type, headers=response_headers)
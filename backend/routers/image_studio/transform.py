@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse
 
 from .models import (
     TransformImageToVideoRequestModel, TalkingAvatarRequestModel,
@@ -145,7 +145,7 @@ async def serve_transform_video(
         if not resolved_video_path.exists():
             raise HTTPException(status_code=404, detail="Video not found")
 
-        return FileResponse(
+        return MediaFileResponse(
             path=str(resolved_video_path),
             media_type="video/mp4",
             filename=video_filename
@@ -152,7 +152,8 @@ async def get_analytics_data(
                 'date_range': data.date_range,
                 'last_updated': data.last_updated,
                 'status': data.status,
-                'error_message': data.error_message
+                'error_message': data.error_message,
+                'metadata': data.metadata
             }
         
         return AnalyticsResponse(
@@ -216,7 +217,8 @@ async def get_analytics_data_post(
                 'date_range': data.date_range,
                 'last_updated': data.last_updated,
                 'status': data.status,
-                'error_message': data.error_message
+                'error_message': data.error_message,
+                'metadata': data.metadata
             }
         
         return AnalyticsResponse(
@@ -6,7 +6,7 @@ Includes intelligent logging, exception handling, and structured responses.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, UploadFile, File
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, HttpUrl, Field, validator
 from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
@@ -33,6 +33,8 @@ from services.seo_tools.gsc_analyzer_service import GSCAnalyzerService
 from services.seo_tools.gsc_strategy_insights_service import GSCStrategyInsightsService
 from services.seo_tools.content_strategy_service import ContentStrategyService
 from services.seo_tools.llm_insights_service import LLMInsightsService
+from services.seo_analyzer.site_audit import SiteAuditEngine
+from services.seo_analyzer.service import SEOAnalysisService
 from services.database import get_session_for_user
 from api.content_planning.services.content_strategy.onboarding import OnboardingDataIntegrationService
 from middleware.logging_middleware import log_api_call, save_to_file
@@ -92,6 +94,13 @@ class SitemapAnalysisRequest(BaseModel):
     analyze_content_trends: bool = Field(default=True, description="Analyze content trends")
     analyze_publishing_patterns: bool = Field(default=True, description="Analyze publishing patterns")
 
+class SiteAuditRequest(BaseModel):
+    """Request model for a bulk site audit"""
+    sitemap_url: Optional[HttpUrl] = Field(None, description="Sitemap whose pages are audited")
+    urls: Optional[List[HttpUrl]] = Field(None, description="Explicit page URLs (instead of a sitemap)")
+    target_keywords: Optional[List[str]] = Field(None, description="Target keywords checked on every page")
+    max_pages: int = Field(default=10000, ge=1, le=10000, description="Maximum pages to audit")
+
 class ImageAltRequest(BaseModel):
     """Request model for image alt text generation"""
     image_url: Optional[HttpUrl] = Field(None, description="URL of image to analyze")
@@ -407,6 +416,58 @@ async def analyze_sitemap(
     except Exception as e:
         return await handle_seo_tool_exception("analyze_sitemap", e, request.dict())
 
+@router.post("/site-audit")
+async def run_site_audit(
+    request: SiteAuditRequest,
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    Audit every page of a sitemap (or a URL list) and stream the results
+    
+    Server-sent events: `started`, one `page` event per audited page as it
+    completes, then a `rollup` with site-level findings (duplicate titles and
+    meta descriptions, orphan pages, broken links). Page results and the rollup
+    are stored as they arrive under one SEO analysis session.
+    """
+    if not request.sitemap_url and not request.urls:
+        raise HTTPException(status_code=400, detail="Provide sitemap_url or urls")
+    user_id = str(current_user.get("id")) if current_user else None
+
+    async def event_stream():
+        db = get_session_for_user(user_id) if user_id else None
+        service = SEOAnalysisService(db) if db else None
+        engine = SiteAuditEngine(max_pages=request.max_pages)
+        try:
+            if request.urls:
+                events = engine.audit_urls(
+                    [str(u) for u in request.urls],
+                    target_keywords=request.target_keywords,
+                    service=service,
+                    user_id=user_id
+                )
+            else:
+                events = engine.audit_sitemap(
+                    str(request.sitemap_url),
+                    target_keywords=request.target_keywords,
+                    service=service,
+                    user_id=user_id
+                )
+            async for event in events:
+                yield f"event: {event['type']}\ndata: {json.dumps(event, default=str)}\n\n"
+        except Exception as e:
+            logger.error(f"Site audit failed: {e}")
+            yield f"event: error\ndata: {json.dumps({'message': str(e)})}\n\n"
+        finally:
+            if db:
+                db.close()
+
+    headers = {
+        "Cache-Control": "no-cache",
+        "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",
+    }
+    return StreamingResponse(event_stream(), media_type="text/event-stream", headers=headers)
+
 @router.post("/image-alt-text", response_model=BaseResponse)
 @log_api_call
 async def generate_image_alt_text(
@@ -185,7 +185,7 @@ async def create_avatar_async(
                 mask_image_base64 = f"data:{mask_mime};base64,{mask_base64}"
         
         # Create task
-        task_id = task_manager.create_task("avatar_generation")
+        task_id = await task_manager.create_task("avatar_generation")
         
         # Validate model
         if model not in ["infinitetalk", "hunyuan-avatar"]:
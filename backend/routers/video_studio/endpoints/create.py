@@ -262,7 +262,7 @@ async def generate_video_async(
                 raise HTTPException(status_code=400, detail="Image file is empty")
         
         # Create task
-        task_id = task_manager.create_task("video_generation")
+        task_id = await task_manager.create_task("video_generation")
         
         # Prepare kwargs
         kwargs = {
@@ -3,9 +3,10 @@ Video serving endpoints.
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from utils.media_serving import MediaFileResponse
 from typing import Dict, Any
 from pathlib import Path
+from stat import S_ISREG
 
 from ...utils.auth import get_current_user, require_authenticated_user
 from ...utils.logger_utils import get_service_logger
@@ -20,7 +21,7 @@ async def serve_video_studio_video(
     user_id: str,
     video_filename: str,
     current_user: Dict[str, Any] = Depends(get_current_user),
-) -> FileResponse:
+) -> MediaFileResponse:
     """
     Serve a generated Video Studio video file.
     
@@ -44,7 +45,7 @@ async def serve_video_studio_video(
         try:
             resolved_path = video_path.resolve()
             resolved_base = video_studio_videos_dir.resolve()
-            if not str(resolved_path).startswith(str(resolved_base)):
+            if resolved_base not in resolved_path.parents:
                 raise HTTPException(
                     status_code=403,
                     detail="Invalid video path"
@@ -53,18 +54,23 @@ async def serve_video_studio_video(
             logger.error(f"[VideoStudio] Path resolution error: {e}")
             raise HTTPException(status_code=403, detail="Invalid video path")
         
-        # Check if file exists
-        if not video_path.exists() or not video_path.is_file():
+        # Check if file exists (one stat, reused for the response headers)
+        try:
+            stat_result = resolved_path.stat()
+        except OSError:
+            stat_result = None
+        if stat_result is None or not S_ISREG(stat_result.st_mode):
             raise HTTPException(
                 status_code=404,
                 detail=f"Video not found: {video_filename}"
             )
         
-        logger.info(f"[VideoStudio] Serving video: {video_path}")
-        return FileResponse(
-            path=str(video_path),
+        logger.info(f"[VideoStudio] Serving video: {resolved_path}")
+        return MediaFileResponse(
+            path=str(resolved_path),
             media_type="video/mp4",
             filename=video_filename,
+            stat_result=stat_result,
         )
         
     except HTTPException:
@@ -3,7 +3,7 @@ Async task status endpoints.
 """
 
 from fastapi import APIRouter, Depends, HTTPException
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ...utils.auth import get_current_user, require_authenticated_user
 from ...utils.logger_utils import get_service_logger
@@ -17,17 +17,20 @@ router = APIRouter()
 @router.get("/task/{task_id}/status")
 async def get_task_status(
     task_id: str,
+    since: Optional[int] = None,
+    wait: float = 0,
     current_user: Dict[str, Any] = Depends(get_current_user),
 ) -> Dict[str, Any]:
     """
     Poll for video generation task status.
     
-    Returns task status, progress, and result when complete.
+    Returns task status, progress, and result when complete. With `since` (the
+    last seen version) and `wait` seconds, waits until the task changes.
     """
     try:
         require_authenticated_user(current_user)
         
-        status = task_manager.get_task_status(task_id)
+        status = await task_manager.poll_task_status(task_id, since=since, wait=wait)
         if not status:
             raise HTTPException(status_code=404, detail="Task not found or expired")
         
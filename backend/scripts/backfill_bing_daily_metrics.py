@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Backfill Bing daily metrics from stored raw query stats.
+Regenerates every day in the requested range with one aggregate pass per site,
+and makes sure the (user_id, site_url, query_date) index exists on older databases.
+"""
+
+import sys
+import argparse
+from datetime import datetime, timedelta
+from pathlib import Path
+from loguru import logger
+
+# Add the backend directory to the Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import distinct
+
+from models.bing_analytics_models import BingQueryStats
+from services.database import get_engine_for_user, get_session_for_user
+from services.bing_analytics_storage_service import BingAnalyticsStorageService
+
+
+def ensure_query_date_index(user_id):
+    """Create the composite query-date index if the table predates it."""
+    engine = get_engine_for_user(user_id)
+    for index in BingQueryStats.__table__.indexes:
+        if index.name == 'idx_user_site_date':
+            index.create(bind=engine, checkfirst=True)
+            logger.info(f"✅ Index {index.name} present for user {user_id}")
+
+
+def get_site_urls(user_id):
+    """List every site with stored query stats for the user."""
+    db = get_session_for_user(user_id)
+    try:
+        rows = db.query(distinct(BingQueryStats.site_url)).filter(BingQueryStats.user_id == user_id).all()
+        return [row[0] for row in rows]
+    finally:
+        db.close()
+
+
+def backfill(user_id, site_url=None, days=90, start=None, end=None):
+    """Regenerate daily metrics for one site (or all of the user's sites)."""
+    end_date = datetime.strptime(end, '%Y-%m-%d') + timedelta(days=1) if end else datetime.now()
+    start_date = datetime.strptime(start, '%Y-%m-%d') if start else end_date - timedelta(days=days)
+
+    ensure_query_date_index(user_id)
+
+    storage_service = BingAnalyticsStorageService()
+    site_urls = [site_url] if site_url else get_site_urls(user_id)
+    if not site_urls:
+        logger.warning(f"No Bing query stats found for user {user_id}")
+        return True
+
+    success = True
+    for url in site_urls:
+        generated = storage_service.backfill_daily_metrics(user_id, url, start_date, end_date)
+        if generated < 0:
+            logger.error(f"❌ Backfill failed for {url}")
+            success = False
+        else:
+            logger.info(f"✅ {url}: {generated} day(s) regenerated ({start_date.date()} → {end_date.date()})")
+    return success
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill Bing daily metrics from raw query stats.")
+    parser.add_argument("--user_id", required=True, help="Target user ID")
+    parser.add_argument("--site_url", help="Only backfill this site (defaults to all sites with data)")
+    parser.add_argument("--days", type=int, default=90, help="Days back from --end to regenerate (default 90)")
+    parser.add_argument("--start", help="First day to regenerate (YYYY-MM-DD), overrides --days")
+    parser.add_argument("--end", help="Last day to regenerate (YYYY-MM-DD), defaults to today")
+    args = parser.parse_args()
+
+    logger.info("🔧 Backfilling Bing daily metrics...")
+    if backfill(args.user_id, args.site_url, args.days, args.start, args.end):
+        logger.info("✅ Backfill complete")
+        sys.exit(0)
+    else:
+        logger.error("❌ Backfill finished with errors")
+        sys.exit(1)
@@ -0,0 +1,153 @@
+"""
+Benchmark workspace media serving under concurrent Range requests.
+
+Creates a large file (500 MB by default), serves it from an in-process uvicorn
+server through both Starlette's FileResponse and utils.media_serving.MediaFileResponse,
+and fires concurrent random-offset Range requests at each, the way video players
+seek. Also measures repeat views (If-None-Match) which should cost a 304 and no body.
+
+Usage:
+    python scripts/benchmark_media_serving.py [--size-mb 500] [--concurrency 32] [--requests 400]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import FileResponse
+from loguru import logger
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.media_serving import MediaFileResponse
+
+
+def build_app(path: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/plain")
+    async def plain():
+        return FileResponse(path, media_type="video/mp4")
+
+    @app.get("/media")
+    async def media():
+        return MediaFileResponse(path, media_type="video/mp4")
+
+    return app
+
+
+def make_file(directory: str, size_mb: int) -> str:
+    path = os.path.join(directory, "benchmark.mp4")
+    block = os.urandom(1024 * 1024)
+    with open(path, "wb") as f:
+        for _ in range(size_mb):
+            f.write(block)
+    return path
+
+
+async def run_ranges(client: httpx.AsyncClient, url: str, size: int, total: int, concurrency: int, range_mb: int) -> Dict[str, Any]:
+    """Fire `total` Range requests, `concurrency` at a time, at random offsets."""
+    rng = random.Random(42)
+    span = range_mb * 1024 * 1024
+    offsets = [rng.randrange(0, size - span) for _ in range(total)]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    received = 0
+
+    async def one(offset: int) -> None:
+        nonlocal received
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.get(url, headers={"Range": f"bytes={offset}-{offset + span - 1}"})
+            assert response.status_code == 206 and len(response.content) == span
+            latencies.append(time.perf_counter() - start)
+            received += len(response.content)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(offset) for offset in offsets))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": total,
+        "seconds": round(elapsed, 2),
+        "MB/s": round(received / elapsed / 1024 / 1024, 1),
+        "p50 ms": round(statistics.median(latencies) * 1000, 1),
+        "p95 ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1),
+    }
+
+
+async def run_repeat_views(client: httpx.AsyncClient, url: str, total: int, concurrency: int) -> Dict[str, Any]:
+    """Repeat views revalidate with If-None-Match."""
+    first = await client.head(url)
+    etag = first.headers.get("etag")
+    semaphore = asyncio.Semaphore(concurrency)
+    statuses: Dict[int, int] = {}
+    received = 0
+
+    async def one() -> None:
+        nonlocal received
+        async with semaphore:
+            response = await client.get(url, headers={"If-None-Match": etag} if etag else {})
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            received += len(response.content)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return {
+        "requests": total,
+        "seconds": round(time.perf_counter() - start, 2),
+        "statuses": statuses,
+        "MB received": round(received / 1024 / 1024, 1),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        logger.info(f"Creating {args.size_mb} MB test file...")
+        path = make_file(directory, args.size_mb)
+        size = os.path.getsize(path)
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        server = uvicorn.Server(uvicorn.Config(build_app(path), port=port, log_level="warning"))
+        server_task = asyncio.create_task(server.serve())
+        while not server.started:
+            await asyncio.sleep(0.05)
+
+        rows = []
+        limits = httpx.Limits(max_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=120) as client:
+            for name in ("plain", "media"):
+                url = f"/{name}"
+                ranges = await run_ranges(client, url, size, args.requests, args.concurrency, args.range_mb)
+                rows.append({"endpoint": f"{name} ranges ({args.range_mb} MB)", **ranges})
+                repeat = await run_repeat_views(client, url, args.repeat_views, args.concurrency)
+                rows.append({"endpoint": f"{name} repeat views", **repeat})
+
+        server.should_exit = True
+        await server_task
+
+    for row in rows:
+        print("  ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--range-mb", type=int, default=2)
+    parser.add_argument("--repeat-views", type=int, default=20)
+    asyncio.run(main(parser.parse_args()))
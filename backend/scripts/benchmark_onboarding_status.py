@@ -0,0 +1,113 @@
+"""
+Benchmark the onboarding status lookups of the scheduler check cycle.
+
+Every check cycle asks OnboardingProgressService.get_onboarding_status() for each
+user. This creates one SQLite database per user (like the per-user workspaces), with
+an onboarding session in it, and times repeated cycles two ways:
+
+- uncached: ALWRITY_ONBOARDING_STATUS_CACHE_DISABLED=true, a query per user per cycle
+- cached: the onboarding status snapshot cache; the first cycle loads every user and
+  later cycles are dictionary lookups
+
+Between cycles a few users advance a step through update_step(), so the cached run
+also exercises the write-through path, and its statuses are checked against the
+uncached ones.
+
+Usage:
+    python scripts/benchmark_onboarding_status.py [--users 200] [--cycles 10] [--writes-per-cycle 5]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.onboarding import OnboardingSession
+from services.onboarding import progress_service
+from services.onboarding.status_cache import onboarding_status_cache
+
+
+def create_user_databases(directory: str, count: int) -> Dict[str, sessionmaker]:
+    rng = random.Random(7)
+    makers = {}
+    for i in range(count):
+        user_id = f"user_{i:04d}"
+        engine = create_engine(f"sqlite:///{os.path.join(directory, user_id + '.db')}")
+        OnboardingSession.__table__.create(engine)
+        maker = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        db = maker()
+        step = rng.randint(1, 6)
+        db.add(OnboardingSession(
+            user_id=user_id, current_step=step, progress=min(100.0, step * 20.0),
+            started_at=datetime.utcnow(), updated_at=datetime.utcnow(),
+        ))
+        db.commit()
+        db.close()
+        makers[user_id] = maker
+    return makers
+
+
+def run(cycles: int, writes_per_cycle: int, user_ids: List[str], cached: bool) -> List[float]:
+    if cached:
+        os.environ.pop("ALWRITY_ONBOARDING_STATUS_CACHE_DISABLED", None)
+    else:
+        os.environ["ALWRITY_ONBOARDING_STATUS_CACHE_DISABLED"] = "true"
+    onboarding_status_cache.clear()
+    rng = random.Random(11)
+    service = progress_service.OnboardingProgressService()
+    timings = []
+    for _ in range(cycles):
+        start = time.perf_counter()
+        for user_id in user_ids:
+            service.get_onboarding_status(user_id)
+        timings.append((time.perf_counter() - start) * 1000)
+        for user_id in rng.sample(user_ids, min(writes_per_cycle, len(user_ids))):
+            current = service.get_onboarding_status(user_id)["current_step"]
+            service.update_step(user_id, current % 6 + 1)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--writes-per-cycle", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        makers = create_user_databases(directory, args.users)
+        progress_service.get_session_for_user = lambda user_id: makers[user_id]()
+        user_ids = sorted(makers)
+
+        results = {}
+        for label, cached in (("uncached", False), ("cached", True)):
+            timings = run(args.cycles, args.writes_per_cycle, user_ids, cached)
+            results[label] = timings
+
+        os.environ["ALWRITY_ONBOARDING_STATUS_CACHE_DISABLED"] = "true"
+        service = progress_service.OnboardingProgressService()
+        expected = {user_id: service.get_onboarding_status(user_id) for user_id in user_ids}
+        os.environ.pop("ALWRITY_ONBOARDING_STATUS_CACHE_DISABLED")
+        mismatches = [u for u in user_ids if service.get_onboarding_status(u) != expected[u]]
+
+    print(f"{args.users} users, {args.cycles} cycles, {args.writes_per_cycle} step updates between cycles")
+    print(f"{'':10} {'first cycle':>12} {'later (median)':>15} {'per user':>10}")
+    for label, timings in results.items():
+        later = statistics.median(timings[1:]) if len(timings) > 1 else timings[0]
+        print(f"{label:10} {timings[0]:>10.1f}ms {later:>13.2f}ms {later / args.users * 1000:>8.1f}us")
+    print(f"cached statuses matching the database: {args.users - len(mismatches)}/{args.users}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Benchmark the SEO analyzer's shared page model on a corpus of saved HTML pages.
+
+For every page, times the HTML analyzers (meta, content, keywords, technical,
+accessibility, UX) two ways:
+
+- per-analyzer: each analyzer parses the HTML itself with html.parser, the way the
+  analyzers worked before ParsedPage
+- shared: the page is parsed once (lxml when installed) and every analyzer reads the
+  same ParsedPage and its indexes
+
+Network checks are stubbed out (robots.txt/sitemap), so only parsing and analysis are
+measured. Without --corpus a synthetic corpus of generated pages is used.
+
+Usage:
+    python scripts/benchmark_seo_page_model.py [--corpus DIR_OF_HTML] [--repeat 5]
+"""
+
+import argparse
+import glob
+import os
+import random
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+# Add project root to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.seo_analyzer.analyzers import (
+    AccessibilityAnalyzer,
+    ContentAnalyzer,
+    KeywordAnalyzer,
+    MetaDataAnalyzer,
+    TechnicalSEOAnalyzer,
+    UserExperienceAnalyzer,
+)
+from services.seo_analyzer.page import ParsedPage, default_parser
+
+KEYWORDS = ["content marketing", "seo"]
+
+
+def synthetic_corpus(count: int = 20) -> List[Tuple[str, str]]:
+    """Generated pages of increasing size, shaped like blog posts."""
+    rng = random.Random(7)
+    words = "content marketing seo search ranking audience strategy article blog writer".split()
+    pages = []
+    for i in range(count):
+        sections = []
+        for s in range(5 + i * 3):
+            text = " ".join(rng.choice(words) for _ in range(120))
+            alt = " alt='figure'" if s % 2 else ""
+            links = "".join(f"<li><a href='/post/{s}-{k}'>Related {k}</a></li>" for k in range(6))
+            sections.append(
+                f"<h2>Section {s}</h2><p style='margin:0'>{text}</p>"
+                f"<img src='/img/{s}.png'{alt}><ul>{links}</ul>"
+            )
+        html = (
+            "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+            f"<title>Synthetic page {i} about content marketing and seo</title>"
+            "<meta name='description' content='A generated page used to benchmark the SEO analyzer'>"
+            "<meta name='viewport' content='width=device-width'><link rel='canonical' href='https://example.com/'>"
+            "</head><body><nav><a href='/'>Home</a></nav><h1>Synthetic</h1>"
+            + "".join(sections)
+            + "<form><label for='q'>Search</label><input id='q'></form></body></html>"
+        )
+        pages.append((f"synthetic-{i:02d}.html", html))
+    return pages
+
+
+def load_corpus(directory: str) -> List[Tuple[str, str]]:
+    pages = []
+    for path in sorted(glob.glob(os.path.join(directory, "**", "*.htm*"), recursive=True)):
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            pages.append((os.path.relpath(path, directory), f.read()))
+    return pages
+
+
+def build_analyzers() -> Dict[str, object]:
+    technical = TechnicalSEOAnalyzer()
+    technical.session = SimpleNamespace(get=lambda *a, **k: SimpleNamespace(status_code=200))
+    return {
+        "meta": MetaDataAnalyzer(),
+        "content": ContentAnalyzer(),
+        "keywords": KeywordAnalyzer(),
+        "technical": technical,
+        "accessibility": AccessibilityAnalyzer(),
+        "ux": UserExperienceAnalyzer(),
+    }
+
+
+def run_all(analyzers: Dict[str, object], page_for, url: str) -> None:
+    """Run every HTML analyzer; page_for() supplies each one's input."""
+    analyzers["meta"].analyze(page_for(), url)
+    analyzers["content"].analyze(page_for(), url)
+    analyzers["keywords"].analyze(page_for(), KEYWORDS)
+    analyzers["technical"].analyze(page_for(), url)
+    analyzers["accessibility"].analyze(page_for())
+    analyzers["ux"].analyze(page_for(), url)
+
+
+def time_page(html: str, url: str, repeat: int, analyzers: Dict[str, object]) -> Tuple[float, float]:
+    per_analyzer, shared = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run_all(analyzers, lambda: ParsedPage.from_html(html, url, parser="html.parser"), url)
+        per_analyzer.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        page = ParsedPage.from_html(html, url)
+        run_all(analyzers, lambda: page, url)
+        shared.append(time.perf_counter() - start)
+    return statistics.median(per_analyzer), statistics.median(shared)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", help="Directory of saved .html pages (default: synthetic corpus)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per page; the median is reported")
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus) if args.corpus else synthetic_corpus()
+    if not pages:
+        print(f"No .html files found in {args.corpus}")
+        return 1
+
+    analyzers = build_analyzers()
+    print(f"Shared page parser: {default_parser()}   pages: {len(pages)}   repeat: {args.repeat}\n")
+    print(f"{'page':40} {'KB':>7} {'per-analyzer ms':>16} {'shared ms':>10} {'speedup':>8}")
+
+    totals = [0.0, 0.0]
+    for name, html in pages:
+        before, after = time_page(html, "https://example.com/" + name, args.repeat, analyzers)
+        totals[0] += before
+        totals[1] += after
+        print(f"{name[:40]:40} {len(html.encode()) / 1024:7.1f} {before * 1000:16.1f} {after * 1000:10.1f} {before / after:7.1f}x")
+
+    print(f"\n{'total':40} {'':7} {totals[0] * 1000:16.1f} {totals[1] * 1000:10.1f} {totals[0] / totals[1]:7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
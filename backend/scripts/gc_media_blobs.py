@@ -0,0 +1,33 @@
+"""
+Garbage-collect the content-addressed media blob store.
+
+Deletes blobs that no asset references and no user file links to any more.
+
+Usage:
+    python scripts/gc_media_blobs.py [--grace SECONDS]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add the backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from utils.media_blob_store import get_media_blob_store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Garbage-collect unreferenced media blobs")
+    parser.add_argument("--grace", type=float, default=None, help="Keep blobs touched within this many seconds")
+    args = parser.parse_args()
+
+    store = get_media_blob_store()
+    result = store.collect_garbage(grace_seconds=args.grace)
+    print(f"GC: {result}")
+    print(f"Store: {store.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ Analytics Data Models
 Core data structures for analytics data across all platforms.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 
 
@@ -17,6 +17,7 @@ class AnalyticsData:
     last_updated: str
     status: str  # 'success', 'error', 'partial'
     error_message: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)  # e.g. latency_ms, timed_out
     
     def is_successful(self) -> bool:
         """Check if the analytics data was successfully retrieved"""
@@ -4,7 +4,9 @@ Platform Analytics Service (Refactored)
 Streamlined orchestrator service for platform analytics with modular architecture.
 """
 
-from typing import Dict, Any, List, Optional
+import asyncio
+import time
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
 
 from .models.analytics_data import AnalyticsData
@@ -28,7 +30,16 @@ class PlatformAnalyticsService:
     comprehensive analytics summaries.
     """
     
-    def __init__(self):
+    # Per-platform handler timeouts (seconds); a slow platform yields an error entry
+    # for that platform instead of holding back the whole dashboard response.
+    DEFAULT_PLATFORM_TIMEOUTS = {
+        PlatformType.GSC: 30.0,
+        PlatformType.BING: 30.0,
+        PlatformType.WORDPRESS: 20.0,
+        PlatformType.WIX: 20.0,
+    }
+    
+    def __init__(self, platform_timeouts: Optional[Dict[PlatformType, float]] = None):
         # Initialize platform handlers
         self.handlers = {
             PlatformType.GSC: GSCAnalyticsHandler(),
@@ -36,16 +47,25 @@ class PlatformAnalyticsService:
             PlatformType.WORDPRESS: WordPressAnalyticsHandler(),
             PlatformType.WIX: WixAnalyticsHandler()
         }
+        self.platform_timeouts = {**self.DEFAULT_PLATFORM_TIMEOUTS, **(platform_timeouts or {})}
         
         # Initialize managers
         self.connection_manager = PlatformConnectionManager()
         self.summary_generator = AnalyticsSummaryGenerator()
         self.cache_manager = AnalyticsCacheManager()
+        
+        # Single-flight registry: identical concurrent requests share one fan-out
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
     
     async def get_comprehensive_analytics(self, user_id: str, platforms: List[str] = None, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, AnalyticsData]:
         """
         Get analytics data from all connected platforms
         
+        Platforms are fetched concurrently with per-platform timeouts; a failed or
+        timed-out platform is reported as an error entry while the others still return.
+        Concurrent calls for the same user, platforms and date range share one fetch.
+        Each AnalyticsData carries ``metadata['latency_ms']`` for its platform.
+        
         Args:
             user_id: User ID to get analytics for
             platforms: List of platforms to get data from (None = all available)
@@ -56,13 +76,45 @@ class PlatformAnalyticsService:
         if platforms is None:
             platforms = [p.value for p in DEFAULT_PLATFORMS]
         
+        # Futures are bound to their event loop (background jobs use asyncio.run)
+        key = (id(asyncio.get_running_loop()), user_id, tuple(platforms), start_date, end_date)
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(
+                self._fetch_comprehensive_analytics(user_id, platforms, start_date, end_date)
+            )
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.info(f"Joining in-flight analytics request for user {user_id}, platforms: {platforms}")
+        
+        # Shield so one caller's cancellation does not cancel the shared fetch
+        return dict(await asyncio.shield(inflight))
+    
+    async def _fetch_comprehensive_analytics(self, user_id: str, platforms: List[str], start_date: Optional[str], end_date: Optional[str]) -> Dict[str, AnalyticsData]:
+        """Fan out to all requested platform handlers concurrently"""
         logger.info(f"Getting comprehensive analytics for user {user_id}, platforms: {platforms}")
-        analytics_data = {}
         
-        # Determine target URL from Wix/WP for GSC site selection
+        # Only GSC and Bing need the primary site URL, so Wix/WordPress start right away
+        target_url_task = None
+        if PlatformType.GSC.value in platforms or PlatformType.BING.value in platforms:
+            target_url_task = asyncio.ensure_future(self._get_target_url(user_id))
+        
+        results = await asyncio.gather(*[
+            self._fetch_platform(user_id, platform_name, target_url_task, start_date, end_date)
+            for platform_name in platforms
+        ])
+        
+        return dict(zip(platforms, results))
+    
+    async def _get_target_url(self, user_id: str) -> Optional[str]:
+        """Determine target URL from Wix/WP for GSC site selection"""
         target_url = None
         try:
-            status = await self.get_platform_connection_status(user_id)
+            # Connection checks call blocking platform clients; keep them off the event loop
+            status = await asyncio.to_thread(
+                asyncio.run, self.connection_manager.get_platform_connection_status(user_id)
+            )
             
             # Check Wix
             if status.get('wix', {}).get('connected'):
@@ -85,38 +137,56 @@ class PlatformAnalyticsService:
         except Exception as e:
             logger.warning(f"Failed to determine target URL for GSC: {e}")
         
-        for platform_name in platforms:
-            try:
-                # Convert string to PlatformType enum
-                platform_type = PlatformType(platform_name)
-                handler = self.handlers.get(platform_type)
+        return target_url
+    
+    async def _fetch_platform(self, user_id: str, platform_name: str, target_url_task: Optional[asyncio.Future], start_date: Optional[str], end_date: Optional[str]) -> AnalyticsData:
+        """Fetch one platform's analytics with its timeout and record its latency"""
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            # Convert string to PlatformType enum
+            platform_type = PlatformType(platform_name)
+            handler = self.handlers.get(platform_type)
+            
+            if handler:
+                kwargs = {'start_date': start_date, 'end_date': end_date}
+                if target_url_task and platform_type in (PlatformType.GSC, PlatformType.BING):
+                    kwargs['target_url'] = await asyncio.shield(target_url_task)
                 
-                if handler:
-                    if platform_type == PlatformType.GSC or platform_type == PlatformType.BING:
-                        analytics_data[platform_name] = await handler.get_analytics(
-                            user_id,
-                            target_url=target_url,
-                            start_date=start_date,
-                            end_date=end_date
-                        )
-                    else:
-                        analytics_data[platform_name] = await handler.get_analytics(
-                            user_id,
-                            start_date=start_date,
-                            end_date=end_date
-                        )
-                else:
-                    logger.warning(f"Unknown platform: {platform_name}")
-                    analytics_data[platform_name] = self._create_error_response(platform_name, f"Unknown platform: {platform_name}")
-                    
-            except ValueError:
-                logger.warning(f"Invalid platform name: {platform_name}")
-                analytics_data[platform_name] = self._create_error_response(platform_name, f"Invalid platform name: {platform_name}")
-            except Exception as e:
-                logger.error(f"Failed to get analytics for {platform_name}: {e}")
-                analytics_data[platform_name] = self._create_error_response(platform_name, str(e))
+                timeout = self.platform_timeouts.get(platform_type)
+                try:
+                    result = await asyncio.wait_for(self._run_handler(handler, user_id, kwargs), timeout=timeout)
+                except asyncio.TimeoutError:
+                    timed_out = True
+                    logger.warning(f"Analytics for {platform_name} timed out after {timeout}s for user {user_id}")
+                    result = self._create_error_response(platform_name, f"Timed out after {timeout}s")
+            else:
+                logger.warning(f"Unknown platform: {platform_name}")
+                result = self._create_error_response(platform_name, f"Unknown platform: {platform_name}")
+                
+        except ValueError:
+            logger.warning(f"Invalid platform name: {platform_name}")
+            result = self._create_error_response(platform_name, f"Invalid platform name: {platform_name}")
+        except Exception as e:
+            logger.error(f"Failed to get analytics for {platform_name}: {e}")
+            result = self._create_error_response(platform_name, str(e))
         
-        return analytics_data
+        # Assign a fresh dict: handlers may share metadata with cached payloads
+        result.metadata = {
+            **(result.metadata or {}),
+            'latency_ms': round((time.perf_counter() - started) * 1000, 1),
+            'timed_out': timed_out,
+        }
+        return result
+    
+    async def _run_handler(self, handler: Any, user_id: str, kwargs: Dict[str, Any]) -> AnalyticsData:
+        """
+        Run a handler's get_analytics in a worker thread.
+        
+        The handlers are declared async but call blocking Google/Bing/Wix/WordPress
+        clients, so awaiting them directly would serialize the fan-out on the event loop.
+        """
+        return await asyncio.to_thread(asyncio.run, handler.get_analytics(user_id, **kwargs))
     
     async def get_platform_connection_status(self, user_id: str) -> Dict[str, Dict[str, Any]]:
         """
@@ -9,7 +9,7 @@ import json
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
-from sqlalchemy import create_engine, func, desc, and_, or_
+from sqlalchemy import create_engine, func, desc, and_, or_, case
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -131,98 +131,121 @@ class BingAnalyticsStorageService:
         Returns:
             bool: True if successful, False otherwise
         """
-        try:
-            if target_date is None:
-                target_date = datetime.now() - timedelta(days=1)
-            
-            # Get date range for the day
-            start_date = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-            end_date = start_date + timedelta(days=1)
+        if target_date is None:
+            target_date = datetime.now() - timedelta(days=1)
+        
+        start_date = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        generated = self.backfill_daily_metrics(user_id, site_url, start_date, start_date + timedelta(days=1))
+        
+        if generated == 0:
+            logger.warning(f"No query data found for {site_url} on {target_date.date()}")
+            return False
+        
+        logger.info(f"Successfully generated daily metrics for {site_url} on {target_date.date()}")
+        return True
+    
+    def backfill_daily_metrics(self, user_id: str, site_url: str, start_date: datetime, end_date: datetime) -> int:
+        """
+        Regenerate daily metrics for every day in a date range in one pass
+        
+        Totals are computed with a single GROUP BY over the (user_id, site_url, query_date)
+        index and the per-day top-10 lists with ROW_NUMBER() window queries, so no raw
+        query rows are loaded into Python.
+        
+        Args:
+            user_id: User identifier
+            site_url: Site URL
+            start_date: First day to generate (inclusive)
+            end_date: Last day to generate (exclusive)
             
+        Returns:
+            int: Number of days for which metrics were written (-1 on error)
+        """
+        db = None
+        try:
+            start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
             db = self._get_db_session(user_id)
             
-            # Get raw data for the day
-            daily_queries = db.query(BingQueryStats).filter(
-                and_(
-                    BingQueryStats.user_id == user_id,
-                    BingQueryStats.site_url == site_url,
-                    BingQueryStats.query_date >= start_date,
-                    BingQueryStats.query_date < end_date
-                )
-            ).all()
-            
-            if not daily_queries:
-                logger.warning(f"No query data found for {site_url} on {target_date.date()}")
-                db.close()
-                return False
-            
-            # Calculate aggregated metrics
-            total_clicks = sum(q.clicks for q in daily_queries)
-            total_impressions = sum(q.impressions for q in daily_queries)
-            total_queries = len(daily_queries)
-            avg_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
-            avg_position = sum(q.avg_click_position for q in daily_queries if q.avg_click_position > 0) / len([q for q in daily_queries if q.avg_click_position > 0]) if any(q.avg_click_position > 0 for q in daily_queries) else 0
-            
-            # Get top performing queries
-            top_queries = sorted(daily_queries, key=lambda x: x.clicks, reverse=True)[:10]
-            top_clicks = [{'query': q.query, 'clicks': q.clicks, 'impressions': q.impressions, 'ctr': q.ctr} for q in top_queries]
-            top_impressions = sorted(daily_queries, key=lambda x: x.impressions, reverse=True)[:10]
-            top_impressions_data = [{'query': q.query, 'clicks': q.clicks, 'impressions': q.impressions, 'ctr': q.ctr} for q in top_impressions]
-            
-            # Calculate changes from previous day
-            prev_day_metrics = self._get_previous_day_metrics(db, user_id, site_url, target_date)
-            clicks_change = self._calculate_percentage_change(total_clicks, prev_day_metrics.get('total_clicks', 0))
-            impressions_change = self._calculate_percentage_change(total_impressions, prev_day_metrics.get('total_impressions', 0))
-            ctr_change = self._calculate_percentage_change(avg_ctr, prev_day_metrics.get('avg_ctr', 0))
-            
-            # Create daily metrics record
-            daily_metrics = BingDailyMetrics(
-                user_id=user_id,
-                site_url=site_url,
-                metric_date=start_date,
-                total_clicks=total_clicks,
-                total_impressions=total_impressions,
-                total_queries=total_queries,
-                avg_ctr=avg_ctr,
-                avg_position=avg_position,
-                top_queries=json.dumps(top_clicks),
-                top_clicks=json.dumps(top_clicks),
-                top_impressions=json.dumps(top_impressions_data),
-                clicks_change=clicks_change,
-                impressions_change=impressions_change,
-                ctr_change=ctr_change
+            filters = (
+                BingQueryStats.user_id == user_id,
+                BingQueryStats.site_url == site_url,
+                BingQueryStats.query_date >= start_date,
+                BingQueryStats.query_date < end_date,
             )
-            
-            # Check if record already exists and update or create
-            existing = db.query(BingDailyMetrics).filter(
-                and_(
+            day = func.date(BingQueryStats.query_date)
+            
+            daily_totals = db.query(
+                day.label('day'),
+                func.sum(BingQueryStats.clicks).label('total_clicks'),
+                func.sum(BingQueryStats.impressions).label('total_impressions'),
+                func.count(BingQueryStats.id).label('total_queries'),
+                func.avg(
+                    case((BingQueryStats.avg_click_position > 0, BingQueryStats.avg_click_position))
+                ).label('avg_position'),
+            ).filter(*filters).group_by(day).order_by(day).all()
+            
+            if not daily_totals:
+                return 0
+            
+            top_clicks_by_day = self._get_top_queries_by_day(db, filters, BingQueryStats.clicks)
+            top_impressions_by_day = self._get_top_queries_by_day(db, filters, BingQueryStats.impressions)
+            
+            # Existing rows (including the day before the range) for upserts and day-over-day changes
+            existing_metrics = {
+                self._to_day(metric.metric_date): metric
+                for metric in db.query(BingDailyMetrics).filter(
                     BingDailyMetrics.user_id == user_id,
                     BingDailyMetrics.site_url == site_url,
-                    BingDailyMetrics.metric_date == start_date
-                )
-            ).first()
-            
-            if existing:
-                # Update existing record
-                for key, value in daily_metrics.__dict__.items():
-                    if not key.startswith('_') and key != 'id':
-                        setattr(existing, key, value)
-            else:
-                # Create new record
-                db.add(daily_metrics)
+                    BingDailyMetrics.metric_date >= start_date - timedelta(days=1),
+                    BingDailyMetrics.metric_date < end_date,
+                ).all()
+            }
             
-            db.commit()
-            db.close()
+            for row in daily_totals:
+                metric_date = self._to_day(row.day)
+                total_clicks = int(row.total_clicks or 0)
+                total_impressions = int(row.total_impressions or 0)
+                avg_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
+                top_clicks = top_clicks_by_day.get(metric_date, [])
+                
+                previous = existing_metrics.get(metric_date - timedelta(days=1))
+                values = {
+                    'total_clicks': total_clicks,
+                    'total_impressions': total_impressions,
+                    'total_queries': int(row.total_queries or 0),
+                    'avg_ctr': avg_ctr,
+                    'avg_position': float(row.avg_position or 0),
+                    'top_queries': json.dumps(top_clicks),
+                    'top_clicks': json.dumps(top_clicks),
+                    'top_impressions': json.dumps(top_impressions_by_day.get(metric_date, [])),
+                    'clicks_change': self._calculate_percentage_change(
+                        total_clicks, previous.total_clicks if previous else 0),
+                    'impressions_change': self._calculate_percentage_change(
+                        total_impressions, previous.total_impressions if previous else 0),
+                    'ctr_change': self._calculate_percentage_change(
+                        avg_ctr, previous.avg_ctr if previous else 0),
+                }
+                
+                metric = existing_metrics.get(metric_date)
+                if metric is None:
+                    metric = BingDailyMetrics(user_id=user_id, site_url=site_url, metric_date=metric_date)
+                    db.add(metric)
+                    existing_metrics[metric_date] = metric
+                for key, value in values.items():
+                    setattr(metric, key, value)
             
-            logger.info(f"Successfully generated daily metrics for {site_url} on {target_date.date()}")
-            return True
+            db.commit()
+            logger.info(f"Generated daily metrics for {len(daily_totals)} day(s) for {site_url}")
+            return len(daily_totals)
             
         except Exception as e:
             logger.error(f"Error generating daily metrics: {e}")
-            if 'db' in locals():
+            if db:
                 db.rollback()
+            return -1
+        finally:
+            if db:
                 db.close()
-            return False
     
     def get_analytics_summary(self, user_id: str, site_url: str, days: int = 30) -> Dict[str, Any]:
         """
@@ -243,58 +266,64 @@ class BingAnalyticsStorageService:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
             
-            # Get daily metrics for the period
-            daily_metrics = db.query(BingDailyMetrics).filter(
-                and_(
-                    BingDailyMetrics.user_id == user_id,
-                    BingDailyMetrics.site_url == site_url,
-                    BingDailyMetrics.metric_date >= start_date,
-                    BingDailyMetrics.metric_date <= end_date
-                )
-            ).order_by(BingDailyMetrics.metric_date).all()
-            
-            if not daily_metrics:
+            # Rank days newest-first so the recent/older CTR windows are plain aggregates
+            recency = func.row_number().over(order_by=BingDailyMetrics.metric_date.desc()).label('recency')
+            ranked = db.query(
+                BingDailyMetrics.total_clicks,
+                BingDailyMetrics.total_impressions,
+                BingDailyMetrics.total_queries,
+                BingDailyMetrics.avg_ctr,
+                recency,
+            ).filter(
+                BingDailyMetrics.user_id == user_id,
+                BingDailyMetrics.site_url == site_url,
+                BingDailyMetrics.metric_date >= start_date,
+                BingDailyMetrics.metric_date <= end_date
+            ).subquery()
+            
+            totals = db.query(
+                func.count().label('days'),
+                func.sum(ranked.c.total_clicks).label('total_clicks'),
+                func.sum(ranked.c.total_impressions).label('total_impressions'),
+                func.sum(ranked.c.total_queries).label('total_queries'),
+                func.avg(ranked.c.avg_ctr).label('avg_ctr_all'),
+                func.avg(case((ranked.c.recency <= 7, ranked.c.avg_ctr))).label('avg_ctr_recent'),
+                func.avg(case((ranked.c.recency > 7, ranked.c.avg_ctr))).label('avg_ctr_older'),
+            ).one()
+            
+            if not totals.days:
+                db.close()
                 return {'error': 'No analytics data found for the specified period'}
             
             # Calculate summary statistics
-            total_clicks = sum(m.total_clicks for m in daily_metrics)
-            total_impressions = sum(m.total_impressions for m in daily_metrics)
-            total_queries = sum(m.total_queries for m in daily_metrics)
+            total_clicks = int(totals.total_clicks or 0)
+            total_impressions = int(totals.total_impressions or 0)
+            total_queries = int(totals.total_queries or 0)
             avg_ctr = (total_clicks / total_impressions * 100) if total_impressions > 0 else 0
             
-            # Get top performing queries for the period
-            top_queries = []
-            for metric in daily_metrics:
-                if metric.top_queries:
-                    try:
-                        queries = json.loads(metric.top_queries)
-                        top_queries.extend(queries)
-                    except:
-                        continue
-            
-            # Aggregate and sort top queries
-            query_aggregates = {}
-            for query in top_queries:
-                q = query['query']
-                if q not in query_aggregates:
-                    query_aggregates[q] = {'clicks': 0, 'impressions': 0, 'count': 0}
-                query_aggregates[q]['clicks'] += query['clicks']
-                query_aggregates[q]['impressions'] += query['impressions']
-                query_aggregates[q]['count'] += 1
-            
-            # Sort by clicks and get top 10
-            top_performing = sorted(
-                [{'query': k, **v} for k, v in query_aggregates.items()],
-                key=lambda x: x['clicks'],
-                reverse=True
-            )[:10]
-            
-            # Calculate trends
-            recent_metrics = daily_metrics[-7:] if len(daily_metrics) >= 7 else daily_metrics
-            older_metrics = daily_metrics[:-7] if len(daily_metrics) >= 14 else daily_metrics
-            
-            recent_avg_ctr = sum(m.avg_ctr for m in recent_metrics) / len(recent_metrics) if recent_metrics else 0
-            older_avg_ctr = sum(m.avg_ctr for m in older_metrics) / len(older_metrics) if older_metrics else 0
+            # Top performing queries for the period, aggregated over the raw query table
+            clicks_sum = func.sum(BingQueryStats.clicks)
+            top_rows = db.query(
+                BingQueryStats.query,
+                clicks_sum.label('clicks'),
+                func.sum(BingQueryStats.impressions).label('impressions'),
+                func.count(func.distinct(func.date(BingQueryStats.query_date))).label('count'),
+            ).filter(
+                BingQueryStats.user_id == user_id,
+                BingQueryStats.site_url == site_url,
+                BingQueryStats.query_date >= start_date,
+                BingQueryStats.query_date <= end_date
+            ).group_by(BingQueryStats.query).order_by(clicks_sum.desc()).limit(10).all()
+            
+            top_performing = [
+                {'query': row.query, 'clicks': int(row.clicks or 0),
+                 'impressions': int(row.impressions or 0), 'count': row.count}
+                for row in top_rows
+            ]
+            
+            # Calculate trends (last 7 days vs the rest, or vs all days when history is short)
+            recent_avg_ctr = totals.avg_ctr_recent or 0
+            older_avg_ctr = (totals.avg_ctr_older if totals.days >= 14 else totals.avg_ctr_all) or 0
             ctr_trend = self._calculate_percentage_change(recent_avg_ctr, older_avg_ctr)
             
             db.close()
@@ -307,8 +336,8 @@ class BingAnalyticsStorageService:
                 'avg_ctr': round(avg_ctr, 2),
                 'ctr_trend': round(ctr_trend, 2),
                 'top_queries': top_performing,
-                'daily_metrics_count': len(daily_metrics),
-                'data_quality': 'good' if len(daily_metrics) >= days * 0.8 else 'partial'
+                'daily_metrics_count': totals.days,
+                'data_quality': 'good' if totals.days >= days * 0.8 else 'partial'
             }
             
         except Exception as e:
@@ -337,8 +366,15 @@ class BingAnalyticsStorageService:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
             
-            # Query top queries from the database
-            query_stats = db.query(BingQueryStats).filter(
+            # Select only the reported columns; the sort and limit run in SQL
+            query_stats = db.query(
+                BingQueryStats.query,
+                BingQueryStats.clicks,
+                BingQueryStats.impressions,
+                BingQueryStats.ctr,
+                BingQueryStats.avg_click_position,
+                BingQueryStats.query_date,
+            ).filter(
                 BingQueryStats.user_id == user_id,
                 BingQueryStats.site_url == site_url,
                 BingQueryStats.query_date >= start_date,
@@ -346,16 +382,17 @@ class BingAnalyticsStorageService:
             ).order_by(BingQueryStats.clicks.desc()).limit(limit).all()
             
             # Convert to list of dictionaries
-            top_queries = []
-            for stat in query_stats:
-                top_queries.append({
+            top_queries = [
+                {
                     'query': stat.query,
                     'clicks': stat.clicks,
                     'impressions': stat.impressions,
                     'ctr': stat.ctr,
                     'position': stat.avg_click_position,
                     'date': stat.query_date.isoformat()
-                })
+                }
+                for stat in query_stats
+            ]
             
             db.close()
             return top_queries
@@ -376,16 +413,26 @@ class BingAnalyticsStorageService:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=days)
             
-            daily_metrics = db.query(BingDailyMetrics).filter(
+            # Skip the JSON top-query columns; they are not part of this response
+            daily_metrics = db.query(
+                BingDailyMetrics.metric_date,
+                BingDailyMetrics.total_clicks,
+                BingDailyMetrics.total_impressions,
+                BingDailyMetrics.total_queries,
+                BingDailyMetrics.avg_ctr,
+                BingDailyMetrics.avg_position,
+                BingDailyMetrics.clicks_change,
+                BingDailyMetrics.impressions_change,
+                BingDailyMetrics.ctr_change,
+            ).filter(
                 BingDailyMetrics.user_id == user_id,
                 BingDailyMetrics.site_url == site_url,
                 BingDailyMetrics.metric_date >= start_date,
                 BingDailyMetrics.metric_date <= end_date
             ).order_by(BingDailyMetrics.metric_date.desc()).all()
             
-            metrics_list = []
-            for metric in daily_metrics:
-                metrics_list.append({
+            metrics_list = [
+                {
                     'date': metric.metric_date.isoformat(),
                     'total_clicks': metric.total_clicks,
                     'total_impressions': metric.total_impressions,
@@ -395,7 +442,9 @@ class BingAnalyticsStorageService:
                     'clicks_change': metric.clicks_change,
                     'impressions_change': metric.impressions_change,
                     'ctr_change': metric.ctr_change
-                })
+                }
+                for metric in daily_metrics
+            ]
             
             db.close()
             return metrics_list
@@ -447,12 +496,9 @@ class BingAnalyticsStorageService:
                 logger.error("Failed to store raw query data")
                 return False
             
-            # Generate daily metrics for each day
-            current_date = start_date
-            while current_date < end_date:
-                if not self.generate_daily_metrics(user_id, site_url, current_date):
-                    logger.warning(f"Failed to generate daily metrics for {current_date.date()}")
-                current_date += timedelta(days=1)
+            # Generate daily metrics for the whole range in one pass
+            if self.backfill_daily_metrics(user_id, site_url, start_date, end_date) < 0:
+                logger.warning(f"Failed to generate daily metrics for {site_url}")
             
             logger.info(f"Successfully collected and stored Bing data for {site_url}")
             return True
@@ -522,28 +568,38 @@ class BingAnalyticsStorageService:
             logger.error(f"Error extracting queries from response: {e}")
             return []
     
-    def _get_previous_day_metrics(self, db: Session, user_id: str, site_url: str, current_date: datetime) -> Dict[str, float]:
-        """Get metrics from the previous day for comparison"""
-        try:
-            prev_date = current_date - timedelta(days=1)
-            prev_metrics = db.query(BingDailyMetrics).filter(
-                and_(
-                    BingDailyMetrics.user_id == user_id,
-                    BingDailyMetrics.site_url == site_url,
-                    BingDailyMetrics.metric_date == prev_date.replace(hour=0, minute=0, second=0, microsecond=0)
-                )
-            ).first()
-            
-            if prev_metrics:
-                return {
-                    'total_clicks': prev_metrics.total_clicks,
-                    'total_impressions': prev_metrics.total_impressions,
-                    'avg_ctr': prev_metrics.avg_ctr
-                }
-            return {}
-        except Exception as e:
-            logger.error(f"Error getting previous day metrics: {e}")
-            return {}
+    def _get_top_queries_by_day(self, db: Session, filters: Tuple, order_column, limit: int = 10) -> Dict[datetime, List[Dict[str, Any]]]:
+        """Get the top queries per day ranked by a column using a window query"""
+        day = func.date(BingQueryStats.query_date)
+        rank = func.row_number().over(
+            partition_by=day,
+            order_by=(order_column.desc(), BingQueryStats.id)
+        ).label('rank')
+        ranked = db.query(
+            day.label('day'),
+            BingQueryStats.query,
+            BingQueryStats.clicks,
+            BingQueryStats.impressions,
+            BingQueryStats.ctr,
+            rank,
+        ).filter(*filters).subquery()
+        
+        rows = db.query(ranked).filter(ranked.c.rank <= limit).order_by(ranked.c.day, ranked.c.rank).all()
+        
+        top_by_day: Dict[datetime, List[Dict[str, Any]]] = {}
+        for row in rows:
+            top_by_day.setdefault(self._to_day(row.day), []).append(
+                {'query': row.query, 'clicks': row.clicks, 'impressions': row.impressions, 'ctr': row.ctr}
+            )
+        return top_by_day
+    
+    def _to_day(self, value: Any) -> datetime:
+        """Normalize a SQL date value (string on SQLite, date/datetime elsewhere) to midnight"""
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        elif not isinstance(value, datetime):
+            value = datetime(value.year, value.month, value.day)
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
     
     def _calculate_percentage_change(self, current: float, previous: float) -> float:
         """Calculate percentage change between two values"""
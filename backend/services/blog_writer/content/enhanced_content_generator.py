@@ -24,31 +24,11 @@ class EnhancedContentGenerator:
 
     async def generate_section(self, section: Any, research: Any = None, mode: str = "polished", user_id: str = None, competitive_advantage: str = "") -> Dict[str, Any]:
         prev_summary = self.memory.build_previous_sections_summary(limit=2)
-        research_context, section_sources = self._build_research_context(section)
-        urls = self.url_manager.pick_relevant_urls(section, research) if not research_context else []
-        global_research_context = self._build_global_research_context(research, competitive_advantage)
-        prompt = self._build_prompt(section, prev_summary, research_context, urls, global_research_context)
-        content_text: str = ""
         try:
-            ai_resp = llm_text_gen(
-                prompt=prompt,
-                json_struct=None,
-                system_prompt=None,
-                user_id=user_id
-            )
-            if isinstance(ai_resp, dict) and ai_resp.get("text"):
-                content_text = ai_resp.get("text", "")
-            elif isinstance(ai_resp, str):
-                content_text = ai_resp
-            else:
-                content_text = str(ai_resp or "")
+            result = self.write_section(section, research, prev_summary, user_id, competitive_advantage)
         except Exception as e:
-            content_text = ""
+            result = {"content": "", "sources": self._build_research_context(section)[1]}
 
-        result = {
-            "content": content_text,
-            "sources": section_sources,
-        }
         previous_text = prev_summary
         current_text = result.get("content", "")
         transition = self.transitioner.generate_transition(previous_text, getattr(section, 'heading', 'This section'), use_llm=True)
@@ -57,14 +37,52 @@ class EnhancedContentGenerator:
             self.memory.update_with_section(getattr(section, 'id', 'unknown'), current_text, use_llm=True)
         result["transition"] = transition
         result["continuity_metrics"] = metrics
+        self.record_continuity(getattr(section, 'id', 'unknown'), metrics)
+        return result
+
+    async def generate_sections(self, sections: List[Any], research: Any = None, mode: str = "polished", user_id: str = None, competitive_advantage: str = "", on_section=None) -> List[Dict[str, Any]]:
+        """Generate all sections of a fixed outline concurrently (see SectionGenerationScheduler)."""
+        from .section_scheduler import SectionGenerationScheduler
+        return await SectionGenerationScheduler(self).generate_sections(
+            sections,
+            research=research,
+            mode=mode,
+            user_id=user_id,
+            competitive_advantage=competitive_advantage,
+            on_section=on_section,
+        )
+
+    def write_section(self, section: Any, research: Any, prev_summary: str, user_id: str = None, competitive_advantage: str = "") -> Dict[str, Any]:
+        """Blocking single LLM call for one section. Returns {content, sources}; raises on provider errors."""
+        research_context, section_sources = self._build_research_context(section)
+        urls = self.url_manager.pick_relevant_urls(section, research) if not research_context else []
+        global_research_context = self._build_global_research_context(research, competitive_advantage)
+        prompt = self._build_prompt(section, prev_summary, research_context, urls, global_research_context)
+        ai_resp = llm_text_gen(
+            prompt=prompt,
+            json_struct=None,
+            system_prompt=None,
+            user_id=user_id
+        )
+        if isinstance(ai_resp, dict) and ai_resp.get("text"):
+            content_text = ai_resp.get("text", "")
+        elif isinstance(ai_resp, str):
+            content_text = ai_resp
+        else:
+            content_text = str(ai_resp or "")
+        return {
+            "content": content_text,
+            "sources": section_sources,
+        }
+
+    def record_continuity(self, section_id: str, metrics: Dict[str, float]) -> None:
+        """Keep the latest continuity metrics per section for the continuity endpoint."""
         try:
-            sid = getattr(section, 'id', 'unknown')
             if not hasattr(self, "_last_continuity"):
                 self._last_continuity = {}
-            self._last_continuity[sid] = metrics
+            self._last_continuity[section_id] = metrics
         except Exception:
             pass
-        return result
 
     def _build_research_context(self, section: Any) -> tuple:
         """Build a rich research context block from the section's mapped sources.
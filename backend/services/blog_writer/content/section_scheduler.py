@@ -0,0 +1,204 @@
+"""
+SectionGenerationScheduler - concurrent generation of the sections of a fixed outline.
+
+Once the outline is fixed, a section's prompt only needs the outline of the sections
+before it, not their generated text. All sections are therefore written concurrently:
+
+- Each section's "previous sections" context is built from the outline (headings and
+  key points of the preceding sections) instead of from generated text.
+- Every LLM call holds a per-user slot and a per-provider slot, so one blog cannot
+  monopolise a provider and one user cannot crowd out the others. Slots are taken on
+  the event loop before a call is handed to a worker thread, so sections waiting
+  for a slot never occupy the default executor.
+- Completed sections are reported through `on_section` as they finish, in whatever
+  order they finish; the returned list is always in outline order.
+- Continuity smoothing (transitions, flow metrics, context memory) runs afterwards,
+  once the real text of every section is known.
+
+Configuration (environment):
+    ALWRITY_BLOG_SECTION_USER_CONCURRENCY       concurrent section calls per user (default 4)
+    ALWRITY_BLOG_SECTION_PROVIDER_CONCURRENCY   concurrent section calls per LLM provider (default 8)
+"""
+
+import asyncio
+import inspect
+import os
+import threading
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from fastapi import HTTPException
+from loguru import logger
+
+SectionCallback = Callable[[int, Dict[str, Any]], Union[None, Awaitable[None]]]
+
+_DEFAULT_LIMITS = {"user": 4, "provider": 8}
+
+# Per event loop: asyncio semaphores belong to the loop they are first used on
+_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, str], asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+_slots_lock = threading.Lock()
+
+
+def _limit_for(kind: str) -> int:
+    return max(1, int(os.getenv(f"ALWRITY_BLOG_SECTION_{kind.upper()}_CONCURRENCY", _DEFAULT_LIMITS[kind])))
+
+
+def section_slot(kind: str, name: Optional[str]) -> asyncio.Semaphore:
+    """Limiter for section calls of one user ('user') or LLM provider ('provider') on the running loop."""
+    key = (kind, name or "default")
+    loop = asyncio.get_running_loop()
+    with _slots_lock:
+        slots = _slots.setdefault(loop, {})
+        slot = slots.get(key)
+        if slot is None:
+            slot = asyncio.Semaphore(_limit_for(kind))
+            slots[key] = slot
+        return slot
+
+
+def current_text_provider() -> str:
+    """Primary text provider as configured for llm_text_gen (GPT_PROVIDER), or 'auto'."""
+    configured = os.getenv("GPT_PROVIDER", "").split(",")[0].strip().lower()
+    return configured or "auto"
+
+
+def outline_context(sections: List[Any], index: int, limit: int = 2) -> str:
+    """Describe the preceding sections from the outline alone, for the section prompt."""
+    parts = []
+    for section in sections[max(0, index - limit):index]:
+        heading = getattr(section, "heading", "") or "Section"
+        key_points = getattr(section, "key_points", None) or getattr(section, "keyPoints", None) or []
+        line = f"'{heading}'"
+        if key_points:
+            line += f" covers: {'; '.join(str(p) for p in key_points[:4])}"
+        parts.append(line)
+    if not parts:
+        return ""
+    return "Earlier sections of this blog (outline): " + " | ".join(parts)
+
+
+class SectionGenerationScheduler:
+    """Fans out outline-fixed sections to the LLM concurrently and stitches them back in order."""
+
+    def __init__(self, generator):
+        """
+        Args:
+            generator: EnhancedContentGenerator (provides write_section, transitioner,
+                flow, memory and record_continuity)
+        """
+        self.generator = generator
+
+    async def generate_sections(
+        self,
+        sections: List[Any],
+        research: Any = None,
+        mode: str = "polished",
+        user_id: Optional[str] = None,
+        competitive_advantage: str = "",
+        on_section: Optional[SectionCallback] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate every section concurrently, then smooth continuity in outline order.
+
+        Args:
+            sections: Outline sections (BlogOutlineSection-like objects)
+            research: Optional BlogResearchResponse for global research context
+            mode: Generation mode (kept for parity with generate_section)
+            user_id: User ID (required for subscription checks and usage tracking)
+            competitive_advantage: Differentiator to emphasise
+            on_section: Called with (index, result) as each section finishes, before smoothing
+
+        Returns:
+            One result dict per section, in outline order, each with content, sources,
+            transition and continuity_metrics
+
+        Raises:
+            HTTPException: A provider or subscription error (e.g. 429); unfinished
+                sections are cancelled
+        """
+        if not sections:
+            return []
+
+        provider = current_text_provider()
+        logger.info(
+            f"[SectionScheduler] Generating {len(sections)} sections concurrently "
+            f"(user={user_id}, provider={provider})"
+        )
+
+        async def run(index: int) -> Tuple[int, Dict[str, Any]]:
+            prev_summary = outline_context(sections, index)
+            async with section_slot("user", user_id), section_slot("provider", provider):
+                result = await asyncio.to_thread(
+                    self._write_section, sections[index], research, prev_summary, user_id, competitive_advantage
+                )
+            return index, result
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(sections)
+        tasks = [asyncio.create_task(run(i)) for i in range(len(sections))]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result = await next_done
+                results[index] = result
+                if on_section is not None:
+                    try:
+                        outcome = on_section(index, result)
+                        if inspect.isawaitable(outcome):
+                            await outcome
+                    except Exception as e:
+                        logger.warning(f"[SectionScheduler] on_section callback failed: {e}")
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        await self._smooth_continuity(sections, results, user_id)
+        return results
+
+    def _write_section(
+        self,
+        section: Any,
+        research: Any,
+        prev_summary: str,
+        user_id: Optional[str],
+        competitive_advantage: str,
+    ) -> Dict[str, Any]:
+        try:
+            return self.generator.write_section(section, research, prev_summary, user_id, competitive_advantage)
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"[SectionScheduler] Section '{getattr(section, 'heading', '')}' failed: {e}")
+            return {"content": "", "sources": self.generator._build_research_context(section)[1]}
+
+    async def _smooth_continuity(self, sections: List[Any], results: List[Dict[str, Any]], user_id: Optional[str]) -> None:
+        """Add transitions and flow metrics between consecutive sections, and refresh context memory."""
+
+        def smooth(index: int) -> None:
+            section, result = sections[index], results[index]
+            previous_text = results[index - 1].get("content", "") if index > 0 else ""
+            current_text = result.get("content", "")
+            try:
+                result["transition"] = self.generator.transitioner.generate_transition(
+                    previous_text, getattr(section, "heading", "This section"), use_llm=True
+                )
+                result["continuity_metrics"] = self.generator.flow.assess_flow(previous_text, current_text, use_llm=True)
+            except Exception as e:
+                logger.warning(f"[SectionScheduler] Continuity smoothing failed for section {index}: {e}")
+                result.setdefault("transition", "")
+                result.setdefault("continuity_metrics", None)
+
+        async def smooth_in_slot(index: int) -> None:
+            async with section_slot("user", user_id):
+                await asyncio.to_thread(smooth, index)
+
+        # Each pair of neighbours is independent once all text exists
+        await asyncio.gather(*(smooth_in_slot(i) for i in range(len(sections))))
+
+        for section, result in zip(sections, results):
+            section_id = getattr(section, "id", "unknown")
+            if result.get("content"):
+                # Local summaries: an LLM summary per section would serialise the batch again
+                self.generator.memory.update_with_section(section_id, result["content"], use_llm=False)
+            self.generator.record_continuity(section_id, result.get("continuity_metrics"))
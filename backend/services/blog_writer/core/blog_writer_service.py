@@ -5,6 +5,7 @@ Coordinates research, outline generation, content creation, and optimization.
 """
 
 from typing import Dict, Any, List
+import inspect
 import time
 import uuid
 from loguru import logger
@@ -368,6 +369,91 @@ class BlogWriterService:
             raise ValueError("user_id is required for medium blog generation (subscription checks and usage tracking)")
         return await self.medium_blog_generator.generate_medium_blog_with_progress(req, task_id, user_id, db)
 
+    async def generate_blog_by_sections(self, req: MediumBlogGenerateRequest, user_id: str, on_section=None) -> MediumBlogGenerateResult:
+        """Generate a full blog one LLM call per section, with all sections in flight at once.
+
+        Args:
+            req: Blog generation request (outline sections are treated as fixed)
+            user_id: User ID (required for subscription checks and usage tracking)
+            on_section: Called with (index, MediumGeneratedSection) as each section finishes
+        """
+        if not user_id:
+            raise ValueError("user_id is required for content generation (subscription checks and usage tracking)")
+        start = time.time()
+
+        sections_for_cache = [{
+            "id": s.id,
+            "heading": s.heading,
+            "keyPoints": s.keyPoints,
+            "subheadings": s.subheadings,
+            "keywords": s.keywords,
+            "targetWords": s.targetWords,
+        } for s in req.sections]
+        cache_args = dict(
+            keywords=req.researchKeywords or [],
+            sections=sections_for_cache,
+            global_target_words=req.globalTargetWords or 1000,
+            persona_data=req.persona.dict() if req.persona else None,
+        )
+        cached_result = persistent_content_cache.get_cached_content(tone=req.tone, audience=req.audience, **cache_args)
+        if cached_result:
+            logger.info(f"Using cached content for keywords: {req.researchKeywords}")
+            cached_result['generation_time_ms'] = 0
+            cached_result['cache_hit'] = True
+            return MediumBlogGenerateResult(**cached_result)
+
+        outline = [
+            BlogOutlineSection(
+                id=s.id,
+                heading=s.heading,
+                subheadings=s.subheadings,
+                key_points=s.keyPoints,
+                references=s.references,
+                target_words=s.targetWords,
+                keywords=s.keywords,
+            )
+            for s in req.sections
+        ]
+
+        def to_generated(index: int, result: Dict[str, Any]) -> MediumGeneratedSection:
+            content = result.get("content") or ""
+            return MediumGeneratedSection(
+                id=outline[index].id,
+                heading=outline[index].heading,
+                content=content,
+                wordCount=len(content.split()),
+                sources=[ResearchSource(title=src.get("title", ""), url=src.get("url", "")) for src in result.get("sources") or []] or None,
+            )
+
+        async def report(index: int, result: Dict[str, Any]) -> None:
+            if on_section is not None:
+                outcome = on_section(index, to_generated(index, result))
+                if inspect.isawaitable(outcome):
+                    await outcome
+
+        results = await self.content_generator.generate_sections(outline, user_id=user_id, on_section=report)
+        out_sections = [to_generated(i, r) for i, r in enumerate(results)]
+        if not any(s.content for s in out_sections):
+            raise Exception("AI generation failed: every section came back empty")
+
+        result = MediumBlogGenerateResult(
+            success=True,
+            title=req.title,
+            sections=out_sections,
+            generation_time_ms=int((time.time() - start) * 1000),
+        )
+        if all(s.content for s in out_sections):
+            try:
+                persistent_content_cache.cache_content(
+                    tone=req.tone or "professional",
+                    audience=req.audience or "general",
+                    result=result.dict(),
+                    **cache_args,
+                )
+            except Exception as cache_error:
+                logger.warning(f"Failed to cache content result: {cache_error}")
+        return result
+
     async def analyze_flow_basic(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze flow metrics for entire blog using single AI call (cost-effective)."""
         try:
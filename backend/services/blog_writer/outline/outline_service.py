@@ -109,7 +109,11 @@ class OutlineService:
             logger.info(f"Using cached outline for keywords: {keywords} (with progress updates)")
             # Update progress to show cache hit
             from api.blog_writer.task_manager import task_manager
-            await task_manager.update_progress(task_id, "✅ Using cached outline (saved generation time!)")
+            match = cached_result.get('cache_match') or {}
+            if match.get('type') == 'similar':
+                await task_manager.update_progress(task_id, f"✅ Reusing a near-identical cached outline (match score {match.get('score', 0):.2f})")
+            else:
+                await task_manager.update_progress(task_id, "✅ Using cached outline (saved generation time!)")
             return BlogOutlineResponse(**cached_result)
         
         # Generate new outline if not cached
@@ -2,6 +2,7 @@
 Exa Research Provider
 
 Neural search implementation using Exa API for high-quality, citation-rich research.
+Searches go through the shared search result cache (services.cache.search_cache).
 """
 
 from exa_py import Exa
@@ -13,6 +14,7 @@ from typing import List, Dict, Any
 from loguru import logger
 from models.subscription_models import APIProvider
 from fastapi import HTTPException
+from services.cache.search_cache import search_cache
 from .base_provider import ResearchProvider as BaseProvider
 
 
@@ -86,6 +88,30 @@ class ExaResearchProvider(BaseProvider):
         
         logger.info(f"[Exa Research] Executing search: {query}")
         
+        # Every exa_* setting shapes the request, so all of them are part of the cache key
+        cache_options = {k: v for k, v in vars(config).items() if k.startswith('exa_')}
+        cache_options.update(num_results=num_results, category=category, topic=topic)
+        fetched = False
+        
+        async def fetch() -> Dict[str, Any]:
+            nonlocal fetched
+            fetched = True
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, lambda: self._search_and_transform(query, topic, category, num_results, config)
+            )
+        
+        result = await search_cache.get_or_fetch(
+            "exa", query, fetch, options=cache_options, cost=0.005,
+            freshness='recent' if getattr(config, 'exa_date_filter', None) else None,
+        )
+        if not fetched:
+            # Served from cache: no API call was made, so there is nothing to bill
+            result = {**result, 'cost': {'total': 0.0}, 'cached': True}
+        return result
+    
+    def _search_and_transform(self, query, topic, category, num_results, config) -> Dict[str, Any]:
+        """Call Exa search_and_contents (falling back to plain search) and standardize the results."""
         # Execute Exa search - pass contents parameters directly, not nested
         try:
             # Build optional parameters dict
@@ -228,10 +254,11 @@ class ExaResearchProvider(BaseProvider):
         user_id: str = None,
         include_domains: List[str] = None,
         exclude_domains: List[str] = None,
+        cache: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Simple Exa search for fact-checking and writing assistance.
-        Handles subscription preflight check and usage tracking.
+        Handles subscription preflight check, usage tracking and the shared search cache.
         
         Args:
             query: Search query string
@@ -239,6 +266,7 @@ class ExaResearchProvider(BaseProvider):
             user_id: Optional user ID for subscription checking
             include_domains: Only return results from these domains (for internal links)
             exclude_domains: Exclude results from these domains (for external-only links)
+            cache: Use the shared search result cache (callers with their own caching pass False)
             
         Returns:
             List of source dicts with title, url, text, publishedDate, author, score keys
@@ -292,48 +320,55 @@ class ExaResearchProvider(BaseProvider):
         if exclude_domains:
             search_kwargs["exclude_domains"] = exclude_domains
         
-        try:
-            loop = asyncio.get_running_loop()
-            results = await loop.run_in_executor(
-                None,
-                lambda: self.exa.search_and_contents(query, **search_kwargs),
-            )
-        except Exception as e:
-            logger.error(f"[Exa simple_search] API call failed: {e}")
-            # Retry with simpler parameters
-            retry_kwargs = {"type": "auto", "num_results": num_results, "text": True}
-            if include_domains:
-                retry_kwargs["include_domains"] = include_domains
-            if exclude_domains:
-                retry_kwargs["exclude_domains"] = exclude_domains
+        async def fetch() -> List[Dict[str, Any]]:
             try:
-                logger.info("[Exa simple_search] Retrying with simplified parameters")
+                loop = asyncio.get_running_loop()
                 results = await loop.run_in_executor(
                     None,
-                    lambda: self.exa.search_and_contents(query, **retry_kwargs),
+                    lambda: self.exa.search_and_contents(query, **search_kwargs),
                 )
-            except Exception as retry_error:
-                logger.error(f"[Exa simple_search] Retry also failed: {retry_error}")
-                raise RuntimeError(f"Exa search failed: {str(retry_error)}") from retry_error
-        
-        sources = []
-        for result in results.results:
-            sources.append({
-                'title': getattr(result, 'title', 'Untitled'),
-                'url': getattr(result, 'url', ''),
-                'text': getattr(result, 'text', ''),
-                'publishedDate': getattr(result, 'publishedDate', ''),
-                'author': getattr(result, 'author', ''),
-                'score': (lambda v: v if v is not None else 0.5)(getattr(result, 'score', 0.5)),
-            })
-        
-        # Track usage
-        if user_id:
-            cost = 0.005  # ~0.5 cents per search
-            try:
-                self.track_exa_usage(user_id, cost)
             except Exception as e:
-                logger.warning(f"[Exa simple_search] Failed to track usage: {e}")
+                logger.error(f"[Exa simple_search] API call failed: {e}")
+                # Retry with simpler parameters
+                retry_kwargs = {"type": "auto", "num_results": num_results, "text": True}
+                if include_domains:
+                    retry_kwargs["include_domains"] = include_domains
+                if exclude_domains:
+                    retry_kwargs["exclude_domains"] = exclude_domains
+                try:
+                    logger.info("[Exa simple_search] Retrying with simplified parameters")
+                    results = await loop.run_in_executor(
+                        None,
+                        lambda: self.exa.search_and_contents(query, **retry_kwargs),
+                    )
+                except Exception as retry_error:
+                    logger.error(f"[Exa simple_search] Retry also failed: {retry_error}")
+                    raise RuntimeError(f"Exa search failed: {str(retry_error)}") from retry_error
+            
+            sources = []
+            for result in results.results:
+                sources.append({
+                    'title': getattr(result, 'title', 'Untitled'),
+                    'url': getattr(result, 'url', ''),
+                    'text': getattr(result, 'text', ''),
+                    'publishedDate': getattr(result, 'publishedDate', ''),
+                    'author': getattr(result, 'author', ''),
+                    'score': (lambda v: v if v is not None else 0.5)(getattr(result, 'score', 0.5)),
+                })
+            
+            # Track usage (only searches that reach the API; cache hits are free)
+            if user_id:
+                cost = 0.005  # ~0.5 cents per search
+                try:
+                    self.track_exa_usage(user_id, cost)
+                except Exception as e:
+                    logger.warning(f"[Exa simple_search] Failed to track usage: {e}")
+            return sources
+        
+        if cache:
+            sources = await search_cache.get_or_fetch("exa", query, fetch, options=search_kwargs, cost=0.005)
+        else:
+            sources = await fetch()
         
         logger.info(f"[Exa simple_search] Found {len(sources)} sources for query: {query[:80]}...")
         return sources
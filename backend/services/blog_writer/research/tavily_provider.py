@@ -61,6 +61,8 @@ class TavilyResearchProvider(BaseProvider):
         
         # Calculate cost (basic = 1 credit, advanced = 2 credits)
         cost = 0.001 if search_depth == "basic" else 0.002  # Estimate cost per search
+        if result.get("cached"):
+            cost = 0.0  # Served from the shared search cache, no credits used
         
         logger.info(f"[Tavily Research] Search completed: {len(sources)} sources, depth: {search_depth}")
         
@@ -3,74 +3,41 @@ Persistent Content Cache Service
 
 Provides database-backed caching for blog content generation results to survive server restarts
 and provide better cache management across multiple instances.
+
+Storage, expiry and eviction are handled by the shared tiered cache
+(services.cache.tiered_cache); this class is the 'content' namespace on top of it.
 """
 
 import hashlib
 import json
-import sqlite3
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
-from pathlib import Path
 from loguru import logger
 
+from .similarity_index import SimilarityIndex, persona_hash
+from .tiered_cache import TieredCache, blog_writer_cache
+
 
 class PersistentContentCache:
     """Database-backed cache for blog content generation results with exact parameter matching."""
     
-    def __init__(self, db_path: str = None, max_cache_size: int = 300, cache_ttl_hours: int = 72):
+    def __init__(self, db_path: str = None, max_cache_size: int = 300, cache_ttl_hours: int = 72,
+                 similarity_threshold: float = None):
         """
         Initialize the persistent content cache.
         
         Args:
-            db_path: Path to SQLite database file. Defaults to 'data/cache/content_cache.db' in project root.
+            db_path: Path to a dedicated SQLite database file. Defaults to the shared blog writer cache.
             max_cache_size: Maximum number of cached entries
             cache_ttl_hours: Time-to-live for cache entries in hours (longer than research cache since content is expensive)
+            similarity_threshold: Minimum score for near-duplicate reuse (defaults to ALWRITY_CACHE_SIMILARITY_THRESHOLD)
         """
-        if db_path is None:
-            # Default to root/data/cache/content_cache.db
-            root_dir = Path(__file__).parent.parent.parent.parent
-            cache_dir = root_dir / "data" / "cache"
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            db_path = str(cache_dir / "content_cache.db")
-
-        self.db_path = db_path
         self.max_cache_size = max_cache_size
-        self.cache_ttl = timedelta(hours=cache_ttl_hours)
-        
-        # Ensure database directory exists
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-        
-        # Initialize database
-        self._init_database()
-    
-    def _init_database(self):
-        """Initialize the SQLite database with required tables."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS content_cache (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    cache_key TEXT UNIQUE NOT NULL,
-                    title TEXT NOT NULL,
-                    sections_hash TEXT NOT NULL,
-                    global_target_words INTEGER NOT NULL,
-                    persona_data TEXT,
-                    tone TEXT,
-                    audience TEXT,
-                    result_data TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    expires_at TIMESTAMP NOT NULL,
-                    access_count INTEGER DEFAULT 0,
-                    last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # Create indexes for better performance
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_content_cache_key ON content_cache(cache_key)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_content_expires_at ON content_cache(expires_at)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_content_created_at ON content_cache(created_at)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_content_title ON content_cache(title)")
-            
-            conn.commit()
+        self.cache_ttl_hours = cache_ttl_hours
+        store = TieredCache(db_path) if db_path else blog_writer_cache
+        self.namespace = store.namespace(
+            "content", ttl_seconds=cache_ttl_hours * 3600, max_entries=max_cache_size
+        )
+        self.similarity = SimilarityIndex(store, "content", threshold=similarity_threshold)
     
     def _generate_sections_hash(self, sections: List[Dict[str, Any]]) -> str:
         """
@@ -139,42 +106,29 @@ class PersistentContentCache:
         # Generate MD5 hash
         return hashlib.md5(cache_string.encode('utf-8')).hexdigest()
     
-    def _cleanup_expired_entries(self):
-        """Remove expired cache entries from database."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "DELETE FROM content_cache WHERE expires_at < ?",
-                (datetime.now().isoformat(),)
-            )
-            deleted_count = cursor.rowcount
-            if deleted_count > 0:
-                logger.debug(f"Removed {deleted_count} expired content cache entries")
-            conn.commit()
+    def _similarity_terms(self, keywords: List[str], sections: List[Dict[str, Any]]) -> List[str]:
+        """Keywords plus section headings: the token set compared for near-matches."""
+        return list(keywords or []) + [str(section.get('heading', '')) for section in sections]
     
-    def _evict_oldest_entries(self, num_to_evict: int):
-        """Evict the oldest cache entries when cache is full."""
-        with sqlite3.connect(self.db_path) as conn:
-            # Get oldest entries by creation time
-            cursor = conn.execute("""
-                SELECT id FROM content_cache 
-                ORDER BY created_at ASC 
-                LIMIT ?
-            """, (num_to_evict,))
-            
-            old_ids = [row[0] for row in cursor.fetchall()]
-            
-            if old_ids:
-                placeholders = ','.join(['?' for _ in old_ids])
-                conn.execute(f"DELETE FROM content_cache WHERE id IN ({placeholders})", old_ids)
-                logger.debug(f"Evicted {len(old_ids)} oldest content cache entries")
-            
-            conn.commit()
+    def _similarity_context(self, sections: List[Dict[str, Any]], global_target_words: int,
+                            tone: str = None, audience: str = None, persona_data: Dict = None) -> Dict[str, Any]:
+        """Parameters a near-match must share exactly (same section count, 250-word buckets, same persona)."""
+        return {
+            'section_count': len(sections),
+            'words_bucket': round((global_target_words or 0) / 250),
+            'tone': tone or "professional",
+            'audience': audience or "general",
+            'persona': persona_hash(persona_data),
+        }
     
     def get_cached_content(self, keywords: List[str], sections: List[Dict[str, Any]], 
                           global_target_words: int, persona_data: Dict = None, 
-                          tone: str = None, audience: str = None) -> Optional[Dict[str, Any]]:
+                          tone: str = None, audience: str = None,
+                          allow_similar: bool = True) -> Optional[Dict[str, Any]]:
         """
-        Get cached content result for exact parameter match.
+        Get cached content result for exact parameter match, falling back to a near-duplicate
+        request (similar keywords and section headings) when ``allow_similar`` is set.
+        The returned dict carries ``cache_match`` with the match type and score.
         
         Args:
             keywords: Original research keywords (primary cache key)
@@ -183,42 +137,32 @@ class PersistentContentCache:
             persona_data: Persona information
             tone: Content tone
             audience: Target audience
+            allow_similar: Whether near-duplicate cached content may be returned
             
         Returns:
             Cached content result if found and valid, None otherwise
         """
         cache_key = self._generate_cache_key(keywords, sections, global_target_words, persona_data, tone, audience)
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT result_data, expires_at FROM content_cache 
-                WHERE cache_key = ? AND expires_at > ?
-            """, (cache_key, datetime.now().isoformat()))
-            
-            row = cursor.fetchone()
-            
-            if row is None:
-                logger.debug(f"Content cache miss for keywords: {keywords}, sections: {len(sections)}")
-                return None
-            
-            # Update access statistics
-            conn.execute("""
-                UPDATE content_cache 
-                SET access_count = access_count + 1, last_accessed = CURRENT_TIMESTAMP
-                WHERE cache_key = ?
-            """, (cache_key,))
-            conn.commit()
-            
-            try:
-                result_data = json.loads(row[0])
-                logger.info(f"Content cache hit for keywords: {keywords} (saved expensive generation)")
-                return result_data
-            except json.JSONDecodeError:
-                logger.error(f"Invalid JSON in content cache for keywords: {keywords}")
-                # Remove invalid entry
-                conn.execute("DELETE FROM content_cache WHERE cache_key = ?", (cache_key,))
-                conn.commit()
-                return None
+        result = self.namespace.get(cache_key)
+        if result is not None:
+            logger.info(f"Content cache hit for keywords: {keywords} (saved expensive generation)")
+            result['cache_match'] = {'type': 'exact', 'score': 1.0}
+            return result
+        
+        if allow_similar:
+            context = self._similarity_context(sections, global_target_words, tone, audience, persona_data)
+            match = self.similarity.find(self._similarity_terms(keywords, sections), context)
+            if match:
+                result = self.namespace.get(match.cache_key)
+                if result is not None:
+                    logger.info(f"Content cache near-match for keywords: {keywords} (score {match.score:.2f})")
+                    result['cache_match'] = match.to_dict()
+                    return result
+                self.similarity.remove(match.cache_key)
+        
+        logger.debug(f"Content cache miss for keywords: {keywords}, sections: {len(sections)}")
+        return None
     
     def cache_content(self, keywords: List[str], sections: List[Dict[str, Any]], 
                      global_target_words: int, persona_data: Dict, tone: str, 
@@ -236,116 +180,73 @@ class PersistentContentCache:
             result: Content result to cache
         """
         cache_key = self._generate_cache_key(keywords, sections, global_target_words, persona_data, tone, audience)
-        sections_hash = self._generate_sections_hash(sections)
-        
-        # Cleanup expired entries first
-        self._cleanup_expired_entries()
+        title = json.dumps(keywords)  # Keywords are stored as the entry title
+        result = {k: v for k, v in result.items() if k != 'cache_match'}
         
-        # Check if cache is full and evict if necessary
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM content_cache")
-            current_count = cursor.fetchone()[0]
-            
-            if current_count >= self.max_cache_size:
-                num_to_evict = current_count - self.max_cache_size + 1
-                self._evict_oldest_entries(num_to_evict)
-        
-        # Store the result
-        expires_at = datetime.now() + self.cache_ttl
-        
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO content_cache 
-                (cache_key, title, sections_hash, global_target_words, persona_data, tone, audience, result_data, expires_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cache_key,
-                json.dumps(keywords),  # Store keywords as JSON
-                sections_hash,
-                global_target_words,
-                json.dumps(persona_data) if persona_data else "",
-                tone or "",
-                audience or "",
-                json.dumps(result),
-                expires_at.isoformat()
-            ))
-            conn.commit()
+        self.namespace.set(
+            cache_key,
+            result,
+            tag=title.lower().strip(),
+            metadata={
+                'title': title,
+                'sections_hash': self._generate_sections_hash(sections),
+                'global_target_words': global_target_words,
+                'tone': tone or "",
+                'audience': audience or "",
+            }
+        )
+        self.similarity.add(
+            cache_key,
+            self._similarity_terms(keywords, sections),
+            self._similarity_context(sections, global_target_words, tone, audience, persona_data)
+        )
         
         logger.info(f"Cached content result for keywords: {keywords}, {len(sections)} sections")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        self._cleanup_expired_entries()
-        
-        with sqlite3.connect(self.db_path) as conn:
-            # Get basic stats
-            cursor = conn.execute("SELECT COUNT(*) FROM content_cache")
-            total_entries = cursor.fetchone()[0]
-            
-            cursor = conn.execute("SELECT COUNT(*) FROM content_cache WHERE expires_at > ?", (datetime.now().isoformat(),))
-            valid_entries = cursor.fetchone()[0]
-            
-            # Get most accessed entries
-            cursor = conn.execute("""
-                SELECT title, global_target_words, access_count, created_at
-                FROM content_cache 
-                ORDER BY access_count DESC 
-                LIMIT 10
-            """)
-            top_entries = [
-                {
-                    'title': row[0],
-                    'global_target_words': row[1],
-                    'access_count': row[2],
-                    'created_at': row[3]
-                }
-                for row in cursor.fetchall()
-            ]
-            
-            # Get database size
-            cursor = conn.execute("SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()")
-            db_size_bytes = cursor.fetchone()[0]
-            db_size_mb = db_size_bytes / (1024 * 1024)
+        stats = self.namespace.stats()
+        top_entries = [
+            {
+                'title': entry.get('title'),
+                'global_target_words': entry.get('global_target_words'),
+                'access_count': entry['access_count'],
+                'created_at': entry['created_at']
+            }
+            for entry in self.namespace.entries(limit=10, order_by="access_count")
+        ]
         
         return {
-            'total_entries': total_entries,
-            'valid_entries': valid_entries,
-            'expired_entries': total_entries - valid_entries,
+            'total_entries': stats['total_entries'],
+            'valid_entries': stats['valid_entries'],
+            'expired_entries': stats['expired_entries'],
             'max_size': self.max_cache_size,
-            'ttl_hours': self.cache_ttl.total_seconds() / 3600,
-            'database_size_mb': round(db_size_mb, 2),
-            'top_accessed_entries': top_entries
+            'ttl_hours': self.cache_ttl_hours,
+            'database_size_mb': stats['database_size_mb'],
+            'top_accessed_entries': top_entries,
+            'metrics': stats['metrics']
         }
     
     def clear_cache(self):
         """Clear all cached entries."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("DELETE FROM content_cache")
-            conn.commit()
+        self.namespace.clear()
+        self.similarity.clear()
         logger.info("Content cache cleared")
     
     def get_cache_entries(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get recent cache entries for debugging."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("""
-                SELECT title, global_target_words, tone, audience, created_at, expires_at, access_count
-                FROM content_cache 
-                ORDER BY created_at DESC 
-                LIMIT ?
-            """, (limit,))
-            
-            return [
-                {
-                    'title': row[0],
-                    'global_target_words': row[1],
-                    'tone': row[2],
-                    'audience': row[3],
-                    'created_at': row[4],
-                    'expires_at': row[5],
-                    'access_count': row[6]
-                }
-                for row in cursor.fetchall()
-            ]
+        return [
+            {
+                'title': entry.get('title'),
+                'global_target_words': entry.get('global_target_words'),
+                'tone': entry.get('tone'),
+                'audience': entry.get('audience'),
+                'created_at': entry['created_at'],
+                'expires_at': entry['expires_at'],
+                'access_count': entry['access_count']
+            }
+            for entry in self.namespace.entries(limit=limit)
+        ]
     
     def invalidate_cache_for_title(self, title: str):
         """
@@ -355,12 +256,7 @@ class PersistentContentCache:
         Args:
             title: Title to invalidate cache for
         """
-        normalized_title = title.lower().strip()
-        
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute("DELETE FROM content_cache WHERE LOWER(title) = ?", (normalized_title,))
-            deleted_count = cursor.rowcount
-            conn.commit()
+        deleted_count = self.namespace.delete_by_tag(title.lower().strip())
         
         if deleted_count > 0:
             logger.info(f"Invalidated {deleted_count} content cache entries for title: {title}")
@@ -3,29 +3,35 @@ Research Cache Service
 
 Provides intelligent caching for Google grounded research results to reduce API costs.
 Only returns cached results for exact keyword matches to ensure accuracy.
+
+Backed by the shared tiered cache (services.cache.tiered_cache): this in-memory view and
+PersistentResearchCache share the same 'research' namespace, so a hit in either serves both.
 """
 
 import hashlib
-import json
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
 from loguru import logger
 
+from .tiered_cache import TieredCache, blog_writer_cache
+
 
 class ResearchCache:
     """Cache for research results with exact keyword matching."""
     
-    def __init__(self, max_cache_size: int = 100, cache_ttl_hours: int = 24):
+    def __init__(self, max_cache_size: int = 100, cache_ttl_hours: int = 24, store: TieredCache = None):
         """
         Initialize the research cache.
         
         Args:
             max_cache_size: Maximum number of cached entries
             cache_ttl_hours: Time-to-live for cache entries in hours
+            store: Tiered cache to use (defaults to the shared blog writer cache)
         """
-        self.cache: Dict[str, Dict[str, Any]] = {}
         self.max_cache_size = max_cache_size
-        self.cache_ttl = timedelta(hours=cache_ttl_hours)
+        self.cache_ttl_hours = cache_ttl_hours
+        self.namespace = (store or blog_writer_cache).namespace(
+            "research", ttl_seconds=cache_ttl_hours * 3600, max_entries=max_cache_size
+        )
     
     def _generate_cache_key(self, keywords: List[str], industry: str, target_audience: str) -> str:
         """
@@ -50,39 +56,6 @@ class ResearchCache:
         # Generate MD5 hash
         return hashlib.md5(cache_string.encode('utf-8')).hexdigest()
     
-    def _is_cache_entry_valid(self, entry: Dict[str, Any]) -> bool:
-        """Check if a cache entry is still valid (not expired)."""
-        if 'created_at' not in entry:
-            return False
-        
-        created_at = datetime.fromisoformat(entry['created_at'])
-        return datetime.now() - created_at < self.cache_ttl
-    
-    def _cleanup_expired_entries(self):
-        """Remove expired cache entries."""
-        expired_keys = []
-        for key, entry in self.cache.items():
-            if not self._is_cache_entry_valid(entry):
-                expired_keys.append(key)
-        
-        for key in expired_keys:
-            del self.cache[key]
-            logger.debug(f"Removed expired cache entry: {key}")
-    
-    def _evict_oldest_entries(self, num_to_evict: int):
-        """Evict the oldest cache entries when cache is full."""
-        # Sort by creation time and remove oldest entries
-        sorted_entries = sorted(
-            self.cache.items(),
-            key=lambda x: x[1].get('created_at', ''),
-            reverse=False
-        )
-        
-        for i in range(min(num_to_evict, len(sorted_entries))):
-            key = sorted_entries[i][0]
-            del self.cache[key]
-            logger.debug(f"Evicted oldest cache entry: {key}")
-    
     def get_cached_result(self, keywords: List[str], industry: str, target_audience: str) -> Optional[Dict[str, Any]]:
         """
         Get cached research result for exact keyword match.
@@ -95,22 +68,13 @@ class ResearchCache:
         Returns:
             Cached research result if found and valid, None otherwise
         """
-        cache_key = self._generate_cache_key(keywords, industry, target_audience)
-        
-        if cache_key not in self.cache:
+        result = self.namespace.get(self._generate_cache_key(keywords, industry, target_audience))
+        if result is None:
             logger.debug(f"Cache miss for keywords: {keywords}")
             return None
         
-        entry = self.cache[cache_key]
-        
-        # Check if entry is still valid
-        if not self._is_cache_entry_valid(entry):
-            del self.cache[cache_key]
-            logger.debug(f"Cache entry expired for keywords: {keywords}")
-            return None
-        
         logger.info(f"Cache hit for keywords: {keywords} (saved API call)")
-        return entry.get('result')
+        return result
     
     def cache_result(self, keywords: List[str], industry: str, target_audience: str, result: Dict[str, Any]):
         """
@@ -122,49 +86,35 @@ class ResearchCache:
             target_audience: Target audience context
             result: Research result to cache
         """
-        cache_key = self._generate_cache_key(keywords, industry, target_audience)
-        
-        # Cleanup expired entries first
-        self._cleanup_expired_entries()
-        
-        # Check if cache is full and evict if necessary
-        if len(self.cache) >= self.max_cache_size:
-            num_to_evict = len(self.cache) - self.max_cache_size + 1
-            self._evict_oldest_entries(num_to_evict)
-        
-        # Store the result
-        self.cache[cache_key] = {
-            'result': result,
-            'created_at': datetime.now().isoformat(),
-            'keywords': keywords,
-            'industry': industry,
-            'target_audience': target_audience
-        }
-        
+        self.namespace.set(
+            self._generate_cache_key(keywords, industry, target_audience),
+            result,
+            metadata={'keywords': keywords, 'industry': industry, 'target_audience': target_audience}
+        )
         logger.info(f"Cached research result for keywords: {keywords}")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
-        self._cleanup_expired_entries()
-        
+        stats = self.namespace.stats()
         return {
-            'total_entries': len(self.cache),
+            'total_entries': stats['valid_entries'],
             'max_size': self.max_cache_size,
-            'ttl_hours': self.cache_ttl.total_seconds() / 3600,
+            'ttl_hours': self.cache_ttl_hours,
             'entries': [
                 {
-                    'keywords': entry['keywords'],
-                    'industry': entry['industry'],
-                    'target_audience': entry['target_audience'],
+                    'keywords': entry.get('keywords'),
+                    'industry': entry.get('industry'),
+                    'target_audience': entry.get('target_audience'),
                     'created_at': entry['created_at']
                 }
-                for entry in self.cache.values()
-            ]
+                for entry in self.namespace.entries(limit=self.max_cache_size)
+            ],
+            'metrics': stats['metrics']
         }
     
     def clear_cache(self):
         """Clear all cached entries."""
-        self.cache.clear()
+        self.namespace.clear()
         logger.info("Research cache cleared")
 
 
@@ -0,0 +1,243 @@
+"""
+Search Result Cache
+
+Provider-agnostic cache for external search APIs (Exa, Tavily, Google Custom Search).
+Results live in the 'search' namespace of the shared tiered cache (in-memory LRU over
+the local SQLite store), keyed on provider, normalized query and normalized options.
+
+- TTL by freshness class: 'realtime' (news topics, day ranges, "today"/"latest" queries),
+  'recent' (week/month ranges, date filters, trend or year queries) and 'evergreen'
+- Identical in-flight searches are coalesced: one API call, every caller gets the result
+- Failed and empty results are not cached
+- Hits, misses, coalesced calls and dollars saved are tracked per provider
+
+Configuration (environment):
+    ALWRITY_SEARCH_CACHE_TTL_REALTIME    seconds (default 3600)
+    ALWRITY_SEARCH_CACHE_TTL_RECENT      seconds (default 21600)
+    ALWRITY_SEARCH_CACHE_TTL_EVERGREEN   seconds (default 604800)
+    ALWRITY_SEARCH_CACHE_MAX_ENTRIES     cached searches (default 20000)
+    ALWRITY_SEARCH_CACHE_DISABLED        "true" bypasses the cache
+"""
+
+import asyncio
+import concurrent.futures
+import copy
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from loguru import logger
+
+from .tiered_cache import TieredCache, blog_writer_cache
+
+FRESHNESS_TTLS = {
+    'realtime': 3600,
+    'recent': 6 * 3600,
+    'evergreen': 7 * 24 * 3600,
+}
+
+_REALTIME_TERMS = re.compile(r"\b(today|tonight|yesterday|breaking|live|right now|this week|latest)\b")
+_RECENT_TERMS = re.compile(r"\b(news|trends?|trending|recent|recently|update[sd]?|new|current|20\d\d)\b")
+_DAY_RANGES = {'day', 'd'}
+_RECENT_RANGES = {'week', 'w', 'month', 'm'}
+_DATE_FILTERS = ('start_date', 'start_published_date', 'start_crawl_date')
+
+
+def normalize_query(query: str) -> str:
+    """Case-, width- and whitespace-insensitive form of a search query."""
+    return re.sub(r"\s+", " ", unicodedata.normalize('NFKC', query or '').casefold()).strip()
+
+
+def _normalize_option(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {str(k): _normalize_option(v) for k, v in value.items() if v not in (None, '', [], {})}
+    if isinstance(value, (list, tuple, set)):
+        items = [_normalize_option(v) for v in value]
+        # Domain and text filters are sets; their order does not change the results
+        if all(isinstance(v, str) for v in items):
+            return sorted({v.strip().lower() for v in items})
+        return items
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def freshness_class(query: str, options: Optional[Dict[str, Any]] = None) -> str:
+    """Classify how quickly results for a search go stale."""
+    options = options or {}
+    text = normalize_query(query)
+    topic = str(options.get('topic') or '').lower()
+    time_range = str(options.get('time_range') or options.get('dateRestrict') or '').lower()
+    range_unit = time_range.rstrip('0123456789')
+
+    if topic == 'news' or range_unit in _DAY_RANGES or _REALTIME_TERMS.search(text):
+        return 'realtime'
+    if (topic == 'finance' or range_unit in _RECENT_RANGES
+            or any(options.get(name) for name in _DATE_FILTERS) or _RECENT_TERMS.search(text)):
+        return 'recent'
+    return 'evergreen'
+
+
+def _ttl(freshness: str) -> float:
+    default = FRESHNESS_TTLS.get(freshness, FRESHNESS_TTLS['evergreen'])
+    try:
+        return float(os.getenv(f"ALWRITY_SEARCH_CACHE_TTL_{freshness.upper()}", default))
+    except ValueError:
+        return default
+
+
+def _is_cacheable(value: Any) -> bool:
+    if not value:
+        return False
+    if isinstance(value, dict):
+        if value.get('success') is False:
+            return False
+        if 'results' in value and not value['results']:
+            return False
+    return True
+
+
+class SearchResultCache:
+    """Shared persistent cache with request coalescing for search API calls."""
+
+    def __init__(self, store: TieredCache = None, max_entries: int = None):
+        self.store = store or blog_writer_cache
+        if max_entries is None:
+            max_entries = int(os.getenv("ALWRITY_SEARCH_CACHE_MAX_ENTRIES", "20000"))
+        self.namespace = self.store.namespace(
+            "search", ttl_seconds=_ttl('evergreen'), max_entries=max_entries
+        )
+        # key -> future of the search currently being made for it (any event loop or thread)
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def make_key(provider: str, query: str, options: Optional[Dict[str, Any]] = None) -> str:
+        material = json.dumps(
+            [provider.lower(), normalize_query(query), _normalize_option(options or {})],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _record(self, provider: str, outcome: str, cost: float):
+        with self._lock:
+            stats = self._stats.setdefault(provider, {
+                'hits': 0, 'coalesced': 0, 'misses': 0, 'dollars_spent': 0.0, 'dollars_saved': 0.0,
+            })
+            stats[outcome] += 1
+            stats['dollars_spent' if outcome == 'misses' else 'dollars_saved'] += cost
+
+    async def get_or_fetch(
+        self,
+        provider: str,
+        query: str,
+        fetch: Callable[[], Awaitable[Any]],
+        options: Optional[Dict[str, Any]] = None,
+        cost: float = 0.0,
+        freshness: Optional[str] = None,
+        cacheable: Callable[[Any], bool] = _is_cacheable,
+    ) -> Any:
+        """
+        Return the cached result of a search, or run ``fetch()`` once and cache it.
+
+        Args:
+            provider: Search API name ('exa', 'tavily', 'google_cse', ...)
+            query: The search query
+            fetch: Coroutine function making the API call on a miss
+            options: Request options that change the results (never credentials)
+            cost: Estimated dollars of one API call, counted as saved on every hit
+            freshness: Freshness class; inferred from the query and options when omitted
+            cacheable: Whether a fetched result may be stored
+        """
+        if os.getenv("ALWRITY_SEARCH_CACHE_DISABLED", "").lower() in ("1", "true", "yes"):
+            return await fetch()
+
+        key = self.make_key(provider, query, options)
+        try:
+            cached = self.namespace.get(key)
+        except Exception as e:
+            logger.warning(f"Search cache read failed, searching directly: {e}")
+            return await fetch()
+        if cached is not None:
+            self._record(provider, 'hits', cost)
+            logger.info(f"[SearchCache] {provider} hit for: {query[:80]}")
+            return cached
+
+        with self._lock:
+            pending = self._inflight.get(key)
+            if pending is None:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+        if pending is not None:
+            try:
+                value = await asyncio.wrap_future(pending)
+                self._record(provider, 'coalesced', cost)
+                return copy.deepcopy(value)
+            except concurrent.futures.CancelledError:
+                # The first caller went away before its search finished; search ourselves
+                return await self.get_or_fetch(provider, query, fetch, options, cost, freshness, cacheable)
+
+        try:
+            value = await fetch()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+            raise
+
+        self._record(provider, 'misses', cost)
+        if cacheable(value):
+            freshness = freshness or freshness_class(query, options)
+            try:
+                self.store.set(
+                    self.namespace.name, key, value, tag=provider,
+                    metadata={'provider': provider, 'query': query[:200], 'freshness': freshness,
+                              'cached_at': time.time()},
+                    ttl_seconds=_ttl(freshness)
+                )
+            except Exception as e:
+                logger.warning(f"Search cache write failed for {provider}: {e}")
+        with self._lock:
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return value
+
+    def invalidate_provider(self, provider: str) -> int:
+        return self.namespace.delete_by_tag(provider)
+
+    def clear(self):
+        self.namespace.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-provider hit rate, API calls and dollars saved, plus storage stats."""
+        with self._lock:
+            snapshot = {provider: dict(stats) for provider, stats in self._stats.items()}
+        providers = {}
+        for provider, stats in snapshot.items():
+            served = stats['hits'] + stats['coalesced']
+            lookups = served + stats['misses']
+            providers[provider] = {
+                'hits': int(stats['hits']),
+                'coalesced': int(stats['coalesced']),
+                'api_calls': int(stats['misses']),
+                'hit_rate': round(served / lookups, 4) if lookups else 0.0,
+                'dollars_spent': round(stats['dollars_spent'], 4),
+                'dollars_saved': round(stats['dollars_saved'], 4),
+            }
+        return {
+            'providers': providers,
+            'dollars_saved': round(sum(p['dollars_saved'] for p in providers.values()), 4),
+            'storage': self.namespace.stats(),
+        }
+
+
+search_cache = SearchResultCache()
@@ -0,0 +1,232 @@
+"""
+Cache Similarity Index
+
+Optional near-duplicate lookup tier for the outline and content caches. Exact cache keys
+miss on trivially different requests (one extra synonym, "tools" vs "tool", a reworded
+keyword), so each cached entry is also indexed by its normalized keyword token set and,
+when sentence-transformers is available and enabled, an embedding vector. A lookup
+returns the best cached entry with the same request context whose similarity score
+clears the configured threshold, together with that score. The request context includes
+a hash of the persona, so an entry generated for one persona (or user) is never served
+to another.
+
+Configuration (environment):
+    ALWRITY_CACHE_SIMILARITY_ENABLED     "true"/"false" (default "false")
+    ALWRITY_CACHE_SIMILARITY_THRESHOLD   minimum score 0-1 (default 0.8)
+    ALWRITY_CACHE_SIMILARITY_EMBEDDINGS  "true" to blend in embedding cosine similarity (default "false")
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, Optional, List, FrozenSet
+from loguru import logger
+
+from .tiered_cache import TieredCache
+
+_STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in", "is",
+    "it", "of", "on", "or", "the", "to", "vs", "what", "with", "your", "best", "top",
+})
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _env_flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).strip().lower() in ("true", "1", "yes")
+
+
+def normalize_keyword_tokens(texts: List[str]) -> FrozenSet[str]:
+    """Lowercase, tokenize, drop stopwords and fold simple plurals ("tools" -> "tool")."""
+    tokens = set()
+    for text in texts or []:
+        for token in _TOKEN_RE.findall(str(text).lower()):
+            if token in _STOPWORDS:
+                continue
+            if len(token) > 3 and token.endswith("ies"):
+                token = token[:-3] + "y"
+            elif len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+                token = token[:-1]
+            tokens.add(token)
+    return frozenset(tokens)
+
+
+def context_hash(context: Dict[str, Any]) -> str:
+    """Hash of the request parameters that must match exactly for a near-match to be reusable."""
+    normalized = {k: (str(v).lower().strip() if v is not None else "") for k, v in context.items()}
+    return hashlib.md5(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def persona_hash(persona_data: Optional[Dict[str, Any]]) -> str:
+    """Hash of the persona a cached entry was generated for ("" when there is none)."""
+    if not persona_data:
+        return ""
+    return hashlib.md5(json.dumps(persona_data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SimilarMatch:
+    """A cached entry that nearly matches the request."""
+    cache_key: str
+    score: float
+    keyword_score: float
+    embedding_score: Optional[float] = None
+    matched_keywords: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'type': 'similar',
+            'score': round(self.score, 4),
+            'keyword_score': round(self.keyword_score, 4),
+            'embedding_score': round(self.embedding_score, 4) if self.embedding_score is not None else None,
+            'matched_keywords': self.matched_keywords,
+        }
+
+
+class SimilarityIndex:
+    """Near-duplicate index for one namespace of a TieredCache."""
+
+    _embedding_model = None  # class-level cache for sentence-transformers
+    _embedding_unavailable = False
+
+    def __init__(self, store: TieredCache, namespace: str, threshold: float = None,
+                 enabled: bool = None, use_embeddings: bool = None, max_candidates: int = 200):
+        """
+        Args:
+            store: Tiered cache holding the entries this index points at
+            namespace: Cache namespace (e.g. 'outline', 'content')
+            threshold: Minimum similarity score (0-1) for a near-match
+            enabled: Turn the similarity tier on/off
+            use_embeddings: Blend embedding cosine similarity into the score
+            max_candidates: Most recent same-context entries scored per lookup
+        """
+        self.store = store
+        self.namespace = namespace
+        self.threshold = threshold if threshold is not None else float(
+            os.getenv("ALWRITY_CACHE_SIMILARITY_THRESHOLD", "0.8"))
+        self.enabled = enabled if enabled is not None else _env_flag("ALWRITY_CACHE_SIMILARITY_ENABLED", "false")
+        self.use_embeddings = use_embeddings if use_embeddings is not None else _env_flag(
+            "ALWRITY_CACHE_SIMILARITY_EMBEDDINGS", "false")
+        self.max_candidates = max_candidates
+        self._table_ready = False
+        store.add_sweep_hook(self._prune_orphans)
+
+    def _conn(self):
+        conn = self.store.connection()
+        if not self._table_ready:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_similarity (
+                    namespace TEXT NOT NULL,
+                    cache_key TEXT NOT NULL,
+                    context_hash TEXT NOT NULL,
+                    tokens TEXT NOT NULL,
+                    embedding BLOB,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, cache_key)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_similarity_context ON cache_similarity(namespace, context_hash, created_at)")
+            self._table_ready = True
+        return conn
+
+    def _embed(self, text: str):
+        """Embed text with all-MiniLM-L6-v2, or return None when unavailable/disabled."""
+        if not self.use_embeddings or not text or SimilarityIndex._embedding_unavailable:
+            return None
+        try:
+            import numpy as np
+            from sentence_transformers import SentenceTransformer
+
+            model = SimilarityIndex._embedding_model
+            if model is None:
+                logger.info("Loading semantic embedding model (all-MiniLM-L6-v2) for cache similarity...")
+                model = SentenceTransformer("all-MiniLM-L6-v2", device="cpu")
+                SimilarityIndex._embedding_model = model
+
+            vector = model.encode([text], show_progress_bar=False, convert_to_numpy=True)[0].astype(np.float32)
+            norm = float(np.linalg.norm(vector))
+            return vector / norm if norm else vector
+        except Exception as e:
+            logger.warning(f"Cache similarity embeddings unavailable, using keyword sets only: {e}")
+            SimilarityIndex._embedding_unavailable = True
+            return None
+
+    def add(self, cache_key: str, keywords: List[str], context: Dict[str, Any]):
+        """Index a freshly cached entry."""
+        if not self.enabled:
+            return
+        try:
+            tokens = normalize_keyword_tokens(keywords)
+            vector = self._embed(" ".join(keywords or []))
+            self._conn().execute(
+                "INSERT OR REPLACE INTO cache_similarity (namespace, cache_key, context_hash, tokens, embedding, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.namespace, cache_key, context_hash(context), json.dumps(sorted(tokens)),
+                 vector.tobytes() if vector is not None else None, time.time())
+            )
+        except Exception as e:
+            logger.warning(f"Failed to index {self.namespace} cache entry for similarity lookup: {e}")
+
+    def find(self, keywords: List[str], context: Dict[str, Any]) -> Optional[SimilarMatch]:
+        """Return the best same-context entry scoring at least the threshold, if any."""
+        if not self.enabled:
+            return None
+        try:
+            tokens = normalize_keyword_tokens(keywords)
+            if not tokens:
+                return None
+            rows = self._conn().execute(
+                "SELECT cache_key, tokens, embedding FROM cache_similarity "
+                "WHERE namespace = ? AND context_hash = ? ORDER BY created_at DESC LIMIT ?",
+                (self.namespace, context_hash(context), self.max_candidates)
+            ).fetchall()
+            if not rows:
+                return None
+
+            query_vector = None
+            best: Optional[SimilarMatch] = None
+            for cache_key, token_json, embedding in rows:
+                candidate = frozenset(json.loads(token_json))
+                overlap = tokens & candidate
+                if not overlap:
+                    continue
+                keyword_score = len(overlap) / len(tokens | candidate)
+
+                embedding_score = None
+                score = keyword_score
+                if embedding is not None and self.use_embeddings:
+                    if query_vector is None:
+                        query_vector = self._embed(" ".join(keywords))
+                    if query_vector is not None:
+                        import numpy as np
+                        embedding_score = float(np.dot(query_vector, np.frombuffer(embedding, dtype=np.float32)))
+                        score = 0.4 * keyword_score + 0.6 * embedding_score
+
+                if score >= self.threshold and (best is None or score > best.score):
+                    best = SimilarMatch(cache_key, score, keyword_score, embedding_score, sorted(candidate))
+            return best
+        except Exception as e:
+            logger.warning(f"{self.namespace} cache similarity lookup failed: {e}")
+            return None
+
+    def remove(self, cache_key: str):
+        self._conn().execute(
+            "DELETE FROM cache_similarity WHERE namespace = ? AND cache_key = ?", (self.namespace, cache_key)
+        )
+
+    def clear(self):
+        self._conn().execute("DELETE FROM cache_similarity WHERE namespace = ?", (self.namespace,))
+
+    def _prune_orphans(self, conn):
+        """Drop index rows whose cache entries have expired or been evicted (runs in the sweep)."""
+        if not self._table_ready:
+            return
+        conn.execute("""
+            DELETE FROM cache_similarity
+            WHERE namespace = ? AND NOT EXISTS (
+                SELECT 1 FROM cache_entries e
+                WHERE e.namespace = cache_similarity.namespace AND e.cache_key = cache_similarity.cache_key
+            )
+        """, (self.namespace,))
@@ -0,0 +1,508 @@
+"""
+Tiered Cache Service
+
+Shared two-tier cache for the AI Blog Writer caches: an in-memory LRU layer in front
+of a single SQLite store. Each cache (research, outline, content) is a namespace on
+top of the same store instead of its own database file.
+
+- Persistent tier: one WAL-mode database with a reused connection per thread
+- Expired rows are removed by a background sweeper, never inline on reads or writes
+- Eviction is size-bounded (entries per namespace, total bytes) by last access
+- Payloads above a small threshold are zlib-compressed
+- Hit/miss/latency metrics are kept per namespace
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Any, Optional, List, Tuple
+from loguru import logger
+
+
+def _default_db_path() -> str:
+    """Default to root/data/cache/blog_writer_cache.db (same folder as the legacy caches)."""
+    root_dir = Path(__file__).parent.parent.parent.parent
+    return str(root_dir / "data" / "cache" / "blog_writer_cache.db")
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp else None
+
+
+class TieredCache:
+    """In-memory LRU over a single persistent SQLite store, partitioned by namespace."""
+
+    def __init__(self, db_path: str = None, memory_max_entries: int = 256,
+                 max_total_bytes: int = 256 * 1024 * 1024, compress_min_bytes: int = 1024,
+                 sweep_interval_seconds: int = 300):
+        """
+        Initialize the tiered cache. The database is opened lazily on first use.
+
+        Args:
+            db_path: Path to SQLite database file. Defaults to 'data/cache/blog_writer_cache.db' in project root.
+            memory_max_entries: Maximum number of entries held in the in-memory LRU tier
+            max_total_bytes: Maximum stored (compressed) payload bytes across all namespaces
+            compress_min_bytes: Payloads at least this large are zlib-compressed
+            sweep_interval_seconds: Interval of the background expiry/eviction sweep
+        """
+        self.db_path = db_path or _default_db_path()
+        self.memory_max_entries = memory_max_entries
+        self.max_total_bytes = max_total_bytes
+        self.compress_min_bytes = compress_min_bytes
+        self.sweep_interval_seconds = sweep_interval_seconds
+
+        # (namespace, key) -> (json payload, expires_at); payloads are decoded per hit so
+        # callers can never mutate the cached copy
+        self._memory: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._memory_lock = threading.Lock()
+
+        # Access bookkeeping is buffered and flushed by the sweeper instead of writing on every hit
+        self._pending_touches: Dict[Tuple[str, str], Tuple[int, float]] = {}
+
+        self._namespaces: Dict[str, Dict[str, Any]] = {}
+        self._metrics: Dict[str, Dict[str, float]] = {}
+        self._metrics_lock = threading.Lock()
+
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+        self._sweeper: Optional[threading.Thread] = None
+        self._sweep_hooks: List[Callable[[sqlite3.Connection], None]] = []
+
+    # ------------------------------------------------------------------
+    # Connection management
+    # ------------------------------------------------------------------
+
+    def _connection(self) -> sqlite3.Connection:
+        """Return this thread's pooled connection, creating the store on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        self._ensure_initialized()
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=30000")
+        self._local.conn = conn
+        return conn
+
+    def connection(self) -> sqlite3.Connection:
+        """Pooled connection for companion tables stored alongside the cache entries."""
+        return self._connection()
+
+    def add_sweep_hook(self, hook: Callable[[sqlite3.Connection], None]):
+        """Run ``hook(connection)`` at the end of every sweep (e.g. to prune orphaned rows)."""
+        self._sweep_hooks.append(hook)
+
+    def _ensure_initialized(self):
+        if self._initialized:
+            return
+        with self._init_lock:
+            if self._initialized:
+                return
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS cache_entries (
+                        namespace TEXT NOT NULL,
+                        cache_key TEXT NOT NULL,
+                        tag TEXT,
+                        metadata TEXT,
+                        payload BLOB NOT NULL,
+                        compressed INTEGER NOT NULL DEFAULT 0,
+                        size_bytes INTEGER NOT NULL,
+                        created_at REAL NOT NULL,
+                        expires_at REAL NOT NULL,
+                        last_accessed REAL NOT NULL,
+                        access_count INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (namespace, cache_key)
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_lru ON cache_entries(namespace, last_accessed)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_expires ON cache_entries(expires_at)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_entries_tag ON cache_entries(namespace, tag)")
+                conn.commit()
+            finally:
+                conn.close()
+            self._initialized = True
+            self._start_sweeper()
+
+    def _start_sweeper(self):
+        if self.sweep_interval_seconds <= 0:
+            return
+
+        def sweep_worker():
+            """Background worker to expire and evict cache entries"""
+            while True:
+                time.sleep(self.sweep_interval_seconds)
+                try:
+                    self.sweep()
+                except Exception as e:
+                    logger.error(f"Tiered cache sweep error: {e}")
+
+        self._sweeper = threading.Thread(target=sweep_worker, daemon=True, name="tiered-cache-sweeper")
+        self._sweeper.start()
+        logger.info(f"Tiered cache sweeper started for {self.db_path}")
+
+    # ------------------------------------------------------------------
+    # Namespaces and metrics
+    # ------------------------------------------------------------------
+
+    def namespace(self, name: str, ttl_seconds: float, max_entries: int) -> "CacheNamespace":
+        """
+        Register a namespace and return a handle to it.
+
+        A namespace shared by several views (e.g. the in-memory and persistent research
+        caches) keeps the most generous TTL and entry limit among them.
+        """
+        existing = self._namespaces.get(name)
+        if existing:
+            ttl_seconds = max(ttl_seconds, existing['ttl_seconds'])
+            max_entries = max(max_entries, existing['max_entries'])
+        self._namespaces[name] = {'ttl_seconds': ttl_seconds, 'max_entries': max_entries}
+        with self._metrics_lock:
+            self._metrics.setdefault(name, {
+                'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'sets': 0,
+                'evictions': 0, 'expired': 0, 'get_time_ms': 0.0, 'set_time_ms': 0.0,
+            })
+        return CacheNamespace(self, name)
+
+    def _record(self, namespace: str, **increments: float):
+        with self._metrics_lock:
+            metrics = self._metrics.get(namespace)
+            if metrics is None:
+                return
+            for key, value in increments.items():
+                metrics[key] = metrics.get(key, 0) + value
+
+    def metrics(self, namespace: str) -> Dict[str, Any]:
+        """Hit/miss/latency metrics for a namespace."""
+        with self._metrics_lock:
+            m = dict(self._metrics.get(namespace, {}))
+        hits = m.get('memory_hits', 0) + m.get('disk_hits', 0)
+        lookups = hits + m.get('misses', 0)
+        return {
+            'hits': hits,
+            'memory_hits': m.get('memory_hits', 0),
+            'disk_hits': m.get('disk_hits', 0),
+            'misses': m.get('misses', 0),
+            'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+            'sets': m.get('sets', 0),
+            'evictions': m.get('evictions', 0),
+            'expired': m.get('expired', 0),
+            'avg_get_ms': round(m.get('get_time_ms', 0.0) / lookups, 3) if lookups else 0.0,
+            'avg_set_ms': round(m.get('set_time_ms', 0.0) / m['sets'], 3) if m.get('sets') else 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Core operations
+    # ------------------------------------------------------------------
+
+    def _memory_put(self, slot: Tuple[str, str], payload: str, expires_at: float):
+        with self._memory_lock:
+            self._memory[slot] = (payload, expires_at)
+            self._memory.move_to_end(slot)
+            while len(self._memory) > self.memory_max_entries:
+                self._memory.popitem(last=False)
+
+    def _memory_drop(self, namespace: str, keys: Optional[List[str]] = None):
+        with self._memory_lock:
+            if keys is None:
+                for slot in [s for s in self._memory if s[0] == namespace]:
+                    del self._memory[slot]
+            else:
+                for key in keys:
+                    self._memory.pop((namespace, key), None)
+
+    def _touch(self, slot: Tuple[str, str], now: float):
+        with self._memory_lock:
+            count, _ = self._pending_touches.get(slot, (0, now))
+            self._pending_touches[slot] = (count + 1, now)
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Get a cached value (memory tier first, then the persistent store)."""
+        started = time.perf_counter()
+        now = time.time()
+        slot = (namespace, key)
+
+        payload = None
+        with self._memory_lock:
+            entry = self._memory.get(slot)
+            if entry is not None:
+                if entry[1] > now:
+                    self._memory.move_to_end(slot)
+                    payload = entry[0]
+                else:
+                    del self._memory[slot]
+
+        if payload is not None:
+            self._touch(slot, now)
+            self._record(namespace, memory_hits=1, get_time_ms=(time.perf_counter() - started) * 1000)
+            return json.loads(payload)
+
+        row = self._connection().execute(
+            "SELECT payload, compressed, expires_at FROM cache_entries "
+            "WHERE namespace = ? AND cache_key = ? AND expires_at > ?",
+            (namespace, key, now)
+        ).fetchone()
+
+        if row is None:
+            self._record(namespace, misses=1, get_time_ms=(time.perf_counter() - started) * 1000)
+            return None
+
+        try:
+            raw = zlib.decompress(row[0]) if row[1] else row[0]
+            payload = raw.decode('utf-8') if isinstance(raw, bytes) else raw
+            value = json.loads(payload)
+        except (zlib.error, UnicodeDecodeError, json.JSONDecodeError):
+            logger.error(f"Invalid payload in {namespace} cache, removing entry")
+            self.delete(namespace, key)
+            self._record(namespace, misses=1, get_time_ms=(time.perf_counter() - started) * 1000)
+            return None
+
+        self._memory_put(slot, payload, row[2])
+        self._touch(slot, now)
+        self._record(namespace, disk_hits=1, get_time_ms=(time.perf_counter() - started) * 1000)
+        return value
+
+    def set(self, namespace: str, key: str, value: Any, tag: str = None,
+            metadata: Dict[str, Any] = None, ttl_seconds: float = None):
+        """Store a value in both tiers and enforce the namespace entry bound."""
+        started = time.perf_counter()
+        config = self._namespaces.get(namespace, {})
+        ttl = ttl_seconds if ttl_seconds is not None else config.get('ttl_seconds', 24 * 3600)
+        now = time.time()
+        expires_at = now + ttl
+
+        payload = json.dumps(value)
+        data = payload.encode('utf-8')
+        compressed = len(data) >= self.compress_min_bytes
+        if compressed:
+            data = zlib.compress(data, 6)
+
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries "
+            "(namespace, cache_key, tag, metadata, payload, compressed, size_bytes, created_at, expires_at, last_accessed, access_count) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)",
+            (namespace, key, tag, json.dumps(metadata or {}, default=str), sqlite3.Binary(data),
+             int(compressed), len(data), now, expires_at, now)
+        )
+        self._memory_put((namespace, key), payload, expires_at)
+
+        max_entries = config.get('max_entries')
+        if max_entries:
+            count = conn.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?", (namespace,)
+            ).fetchone()[0]
+            if count > max_entries:
+                self._evict_lru(namespace, count - max_entries)
+
+        self._record(namespace, sets=1, set_time_ms=(time.perf_counter() - started) * 1000)
+
+    def delete(self, namespace: str, key: str):
+        self._connection().execute(
+            "DELETE FROM cache_entries WHERE namespace = ? AND cache_key = ?", (namespace, key)
+        )
+        self._memory_drop(namespace, [key])
+
+    def delete_by_tag(self, namespace: str, tag: str) -> int:
+        """Delete every entry of a namespace with the given tag; returns the count."""
+        conn = self._connection()
+        keys = [row[0] for row in conn.execute(
+            "SELECT cache_key FROM cache_entries WHERE namespace = ? AND tag = ?", (namespace, tag)
+        ).fetchall()]
+        if keys:
+            conn.execute("DELETE FROM cache_entries WHERE namespace = ? AND tag = ?", (namespace, tag))
+            self._memory_drop(namespace, keys)
+        return len(keys)
+
+    def clear(self, namespace: str):
+        self._connection().execute("DELETE FROM cache_entries WHERE namespace = ?", (namespace,))
+        self._memory_drop(namespace)
+        with self._memory_lock:
+            self._pending_touches = {s: t for s, t in self._pending_touches.items() if s[0] != namespace}
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _flush_touches(self):
+        with self._memory_lock:
+            touches, self._pending_touches = self._pending_touches, {}
+        if not touches:
+            return
+        conn = self._connection()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "UPDATE cache_entries SET access_count = access_count + ?, last_accessed = MAX(last_accessed, ?) "
+                "WHERE namespace = ? AND cache_key = ?",
+                [(count, accessed, ns, key) for (ns, key), (count, accessed) in touches.items()]
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict_lru(self, namespace: Optional[str], num_to_evict: int) -> int:
+        """Evict the least recently accessed entries (of one namespace or overall)."""
+        self._flush_touches()
+        conn = self._connection()
+        if namespace is not None:
+            rows = conn.execute(
+                "SELECT namespace, cache_key FROM cache_entries WHERE namespace = ? "
+                "ORDER BY last_accessed ASC LIMIT ?", (namespace, num_to_evict)
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT namespace, cache_key FROM cache_entries ORDER BY last_accessed ASC LIMIT ?",
+                (num_to_evict,)
+            ).fetchall()
+        if not rows:
+            return 0
+
+        conn.executemany("DELETE FROM cache_entries WHERE namespace = ? AND cache_key = ?", rows)
+        with self._memory_lock:
+            for slot in rows:
+                self._memory.pop(tuple(slot), None)
+        for ns, _ in rows:
+            self._record(ns, evictions=1)
+        logger.debug(f"Evicted {len(rows)} least recently used cache entries")
+        return len(rows)
+
+    def sweep(self) -> Dict[str, int]:
+        """Flush access bookkeeping, drop expired rows and enforce the total byte bound."""
+        self._flush_touches()
+        conn = self._connection()
+        now = time.time()
+
+        expired = conn.execute(
+            "SELECT namespace, COUNT(*) FROM cache_entries WHERE expires_at <= ? GROUP BY namespace", (now,)
+        ).fetchall()
+        if expired:
+            conn.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+            for ns, count in expired:
+                self._record(ns, expired=count)
+        with self._memory_lock:
+            for slot in [s for s, (_, expires_at) in self._memory.items() if expires_at <= now]:
+                del self._memory[slot]
+
+        evicted = 0
+        total_bytes = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries").fetchone()[0]
+        while total_bytes > self.max_total_bytes:
+            # Evict in batches of ~10% until under the byte budget
+            count = conn.execute("SELECT COUNT(*) FROM cache_entries").fetchone()[0]
+            batch = self._evict_lru(None, max(1, count // 10))
+            if not batch:
+                break
+            evicted += batch
+            total_bytes = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries").fetchone()[0]
+
+        for hook in self._sweep_hooks:
+            try:
+                hook(conn)
+            except Exception as e:
+                logger.warning(f"Tiered cache sweep hook failed: {e}")
+
+        removed = sum(count for _, count in expired)
+        if removed or evicted:
+            logger.debug(f"Tiered cache sweep removed {removed} expired and evicted {evicted} entries")
+        return {'expired': removed, 'evicted': evicted}
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def entries(self, namespace: str, limit: int = 50, order_by: str = "created_at") -> List[Dict[str, Any]]:
+        """Entry metadata for a namespace, newest (or most accessed) first."""
+        self._flush_touches()
+        column = "access_count" if order_by == "access_count" else "created_at"
+        rows = self._connection().execute(
+            f"SELECT metadata, created_at, expires_at, access_count, last_accessed, size_bytes "
+            f"FROM cache_entries WHERE namespace = ? ORDER BY {column} DESC LIMIT ?",
+            (namespace, limit)
+        ).fetchall()
+        return [
+            {
+                **json.loads(row[0] or "{}"),
+                'created_at': _iso(row[1]),
+                'expires_at': _iso(row[2]),
+                'access_count': row[3],
+                'last_accessed': _iso(row[4]),
+                'size_bytes': row[5],
+            }
+            for row in rows
+        ]
+
+    def namespace_stats(self, namespace: str) -> Dict[str, Any]:
+        """Entry counts, stored bytes, database size and metrics for a namespace."""
+        conn = self._connection()
+        total, valid, stored_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(expires_at > ?), 0), COALESCE(SUM(size_bytes), 0) "
+            "FROM cache_entries WHERE namespace = ?",
+            (time.time(), namespace)
+        ).fetchone()
+        db_size_bytes = conn.execute(
+            "SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()"
+        ).fetchone()[0]
+        with self._memory_lock:
+            memory_entries = sum(1 for slot in self._memory if slot[0] == namespace)
+        return {
+            'total_entries': total,
+            'valid_entries': valid,
+            'expired_entries': total - valid,
+            'stored_bytes': stored_bytes,
+            'memory_entries': memory_entries,
+            'database_size_mb': round(db_size_bytes / (1024 * 1024), 2),
+            'metrics': self.metrics(namespace),
+        }
+
+
+class CacheNamespace:
+    """Handle for one namespace of a TieredCache."""
+
+    def __init__(self, cache: TieredCache, name: str):
+        self.cache = cache
+        self.name = name
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self.cache._namespaces[self.name]['ttl_seconds']
+
+    @property
+    def max_entries(self) -> int:
+        return self.cache._namespaces[self.name]['max_entries']
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.cache.get(self.name, key)
+
+    def set(self, key: str, value: Any, tag: str = None, metadata: Dict[str, Any] = None):
+        self.cache.set(self.name, key, value, tag=tag, metadata=metadata)
+
+    def delete(self, key: str):
+        self.cache.delete(self.name, key)
+
+    def delete_by_tag(self, tag: str) -> int:
+        return self.cache.delete_by_tag(self.name, tag)
+
+    def clear(self):
+        self.cache.clear(self.name)
+
+    def entries(self, limit: int = 50, order_by: str = "created_at") -> List[Dict[str, Any]]:
+        return self.cache.entries(self.name, limit, order_by)
+
+    def stats(self) -> Dict[str, Any]:
+        return self.cache.namespace_stats(self.name)
+
+
+# Global tiered cache shared by the blog writer caches
+blog_writer_cache = TieredCache()
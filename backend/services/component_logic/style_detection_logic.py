@@ -21,7 +21,7 @@ from ..seo_analyzer.analyzers import (
     AccessibilityAnalyzer,
     UserExperienceAnalyzer
 )
-from bs4 import BeautifulSoup
+from ..seo_analyzer.page import ParsedPage
 
 # Add the backend directory to Python path for absolute imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
@@ -495,7 +495,8 @@ class StyleDetectionLogic:
             logger.warning("No HTML content available for SEO audit")
             return audit_results
             
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Parse once and share the page between the analyzers
+        page = ParsedPage.from_html(html_content, url)
         
         # Helper to run analyzer safely
         def run_analyzer(analyzer_class, *analyze_args):
@@ -507,13 +508,13 @@ class StyleDetectionLogic:
                 return {'score': 0, 'issues': [f"Analysis failed: {str(e)}"], 'warnings': []}
 
         # 1. Meta Data Analysis
-        audit_results['meta'] = run_analyzer(MetaDataAnalyzer, html_content, url)
+        audit_results['meta'] = run_analyzer(MetaDataAnalyzer, page, url)
         
         # 2. Technical Analysis (Requires URL)
-        audit_results['technical'] = run_analyzer(TechnicalSEOAnalyzer, html_content, url)
+        audit_results['technical'] = run_analyzer(TechnicalSEOAnalyzer, page, url)
         
         # 3. Content Analysis
-        audit_results['content_health'] = run_analyzer(ContentAnalyzer, html_content, url)
+        audit_results['content_health'] = run_analyzer(ContentAnalyzer, page, url)
         
         # 4. Performance Analysis (Requires URL)
         audit_results['performance'] = run_analyzer(PerformanceAnalyzer, url)
@@ -522,10 +523,10 @@ class StyleDetectionLogic:
         audit_results['url_structure'] = run_analyzer(URLStructureAnalyzer, url)
         
         # 6. Accessibility
-        audit_results['accessibility'] = run_analyzer(AccessibilityAnalyzer, html_content)
+        audit_results['accessibility'] = run_analyzer(AccessibilityAnalyzer, page)
         
         # 7. User Experience
-        audit_results['ux'] = run_analyzer(UserExperienceAnalyzer, html_content, url)
+        audit_results['ux'] = run_analyzer(UserExperienceAnalyzer, page, url)
         
         # Calculate summary metrics
         total_score = 0
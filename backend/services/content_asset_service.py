@@ -13,6 +13,7 @@ from models.content_asset_models import (
     AssetType,
     AssetSource
 )
+from utils.media_blob_store import get_media_blob_store
 import logging
 
 logger = logging.getLogger(__name__)
@@ -239,6 +240,7 @@ class ContentAssetService:
             
             self.db.delete(asset)
             self.db.commit()
+            self._release_blob(asset_id)
             return True
             
         except Exception as e:
@@ -246,6 +248,14 @@ class ContentAssetService:
             logger.error(f"Error deleting asset: {str(e)}", exc_info=True)
             return False
     
+    @staticmethod
+    def _release_blob(asset_id: int):
+        """Drop the asset's reference on its content blob so GC can reclaim it."""
+        try:
+            get_media_blob_store().release_ref(f"asset:{asset_id}")
+        except Exception as e:
+            logger.warning(f"Failed to release blob reference for asset {asset_id}: {e}")
+    
     def update_asset(
         self,
         asset_id: int,
@@ -416,7 +416,8 @@ def get_session_for_user(user_id: str) -> Optional[Session]:
     if not engine:
         return None
         
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # info["user_id"] lets session hooks (e.g. the scheduler's wakeup queue) tell whose database it is
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine, info={"user_id": user_id})
     return SessionLocal()
 
 def get_db_session(user_id: Optional[str] = None) -> Optional[Session]:
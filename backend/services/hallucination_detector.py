@@ -4,19 +4,38 @@ Hallucination Detector Service
 Implements fact-checking using Exa.ai for evidence search and the
 configured LLM provider (via GPT_PROVIDER) for claim extraction and assessment.
 Respects GPT_PROVIDER env var: google, wavespeed, openai, huggingface.
+
+Every extracted claim is verified. Evidence searches run concurrently, paced by a
+shared token bucket that backs off when Exa answers 429, and their results are
+kept per normalized claim in the shared search result cache across requests.
+Assessment prompts pack as many claims (with their own sources) as fit a token
+budget and run concurrently.
+
+Configuration (environment):
+    ALWRITY_EXA_SEARCH_RATE / _BURST        Exa searches per second / burst (default 5 / 5)
+    ALWRITY_FACT_CHECK_PROMPT_TOKENS        token budget per assessment prompt (default 6000)
+    ALWRITY_FACT_CHECK_LLM_CONCURRENCY      concurrent assessment prompts per request (default 4)
 """
 
 import json
 import logging
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import re
+import unicodedata
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, replace
 from datetime import datetime
 import os
 import asyncio
 import concurrent.futures
 
+from services.cache.search_cache import search_cache
+from utils.token_bucket import get_token_bucket
+
 logger = logging.getLogger(__name__)
 
+# Characters of each source's text included in assessment prompts
+SOURCE_TEXT_CHARS = 1000
+
 @dataclass
 class Claim:
     """Represents a single verifiable claim extracted from text."""
@@ -39,6 +58,32 @@ class HallucinationResult:
     timestamp: str
 
 
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def normalize_claim(claim: str) -> str:
+    """Cache key for a claim: case-, width- and whitespace-insensitive, without surrounding punctuation."""
+    text = unicodedata.normalize('NFKC', claim or '').casefold()
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip(' "\'.,;:!?-\u2018\u2019\u201c\u201d')
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def _is_provider_rate_limit(error: Exception) -> bool:
+    """A 429 from the search API itself (retryable), not a subscription limit (HTTPException)."""
+    if getattr(error, 'status_code', None) is not None:
+        return False
+    message = str(error).lower()
+    return '429' in message or 'rate limit' in message or 'too many requests' in message
+
+
 def _get_llm_provider_info() -> Dict[str, str]:
     """Determine the LLM provider from GPT_PROVIDER env var."""
     provider_env = os.getenv('GPT_PROVIDER', 'google').lower().strip()
@@ -245,37 +290,80 @@ class HallucinationDetector:
             raise Exception(f"Failed to extract claims: {str(e)}")
 
     async def _verify_claims_batch(self, claims: List[str], user_id: str = None) -> List[Claim]:
-        """Verify multiple claims in batch to reduce API calls."""
+        """
+        Verify every claim.
+
+        Evidence is searched for each distinct claim concurrently (paced by the Exa token
+        bucket, served from the evidence cache when possible). As searches complete,
+        claims are packed into assessment prompts up to the token budget, and each full
+        prompt is sent right away, so searching and assessing overlap.
+        """
+        search_tasks: List[asyncio.Future] = []
+        assess_tasks: List[asyncio.Future] = []
         try:
             logger.info(f"Starting batch verification of {len(claims)} claims")
-            max_claims = min(len(claims), 3)
-            claims_to_verify = claims[:max_claims]
-
-            if len(claims) > max_claims:
-                logger.warning(f"Limited verification to {max_claims} claims to prevent API rate limits")
-
-            # Step 1: Search for evidence
-            all_sources = await self._search_evidence_batch(claims_to_verify, user_id=user_id)
-
-            # Step 2: Assess claims against sources
-            verified_claims = await self._assess_claims_batch(claims_to_verify, all_sources, user_id=user_id)
-
-            # Add remaining claims as insufficient information
-            for i in range(max_claims, len(claims)):
-                verified_claims.append(Claim(
-                    text=claims[i],
-                    confidence=0.0,
-                    assessment="insufficient_information",
-                    supporting_sources=[],
-                    refuting_sources=[],
-                    reasoning="Not verified due to API rate limit protection"
-                ))
-
-            logger.info(f"Batch verification completed for {len(verified_claims)} claims")
-            return verified_claims
+            verified: List[Optional[Claim]] = [None] * len(claims)
+
+            # Identical claims (after normalization) share one search and one assessment
+            groups: Dict[str, List[int]] = {}
+            for i, claim in enumerate(claims):
+                groups.setdefault(normalize_claim(claim), []).append(i)
+
+            async def search(key: str):
+                claim = claims[groups[key][0]]
+                try:
+                    return key, await self._search_evidence(claim, user_id=user_id), None
+                except Exception as e:
+                    if getattr(e, 'status_code', None) == 429:
+                        raise  # subscription limit: stop verifying
+                    return key, [], str(e)
+
+            budget = max(500, _env_int('ALWRITY_FACT_CHECK_PROMPT_TOKENS', 6000))
+            llm_slots = asyncio.Semaphore(max(1, _env_int('ALWRITY_FACT_CHECK_LLM_CONCURRENCY', 4)))
+            batch: List[Tuple[str, str, List[Dict[str, Any]]]] = []
+            batch_tokens = 0
+
+            search_tasks = [asyncio.ensure_future(search(key)) for key in groups]
+            for next_done in asyncio.as_completed(search_tasks):
+                key, sources, error = await next_done
+                claim = claims[groups[key][0]]
+                if not sources:
+                    for i in groups[key]:
+                        verified[i] = Claim(
+                            text=claims[i],
+                            confidence=0.5,
+                            assessment="insufficient_information",
+                            supporting_sources=[],
+                            refuting_sources=[],
+                            reasoning="No sources found for verification" if not error or "No search results" in error
+                            else f"Evidence search failed: {error}"
+                        )
+                    continue
+
+                tokens = _estimate_tokens(self._format_claim_block(0, claim, sources))
+                if batch and batch_tokens + tokens > budget:
+                    assess_tasks.append(asyncio.ensure_future(self._assess_claims_batch(batch, llm_slots, user_id=user_id)))
+                    batch, batch_tokens = [], 0
+                batch.append((key, claim, sources))
+                batch_tokens += tokens
+            if batch:
+                assess_tasks.append(asyncio.ensure_future(self._assess_claims_batch(batch, llm_slots, user_id=user_id)))
+
+            for assessed in await asyncio.gather(*assess_tasks):
+                for key, claim_result in assessed.items():
+                    for i in groups[key]:
+                        verified[i] = replace(claim_result, text=claims[i])
+
+            logger.info(
+                f"Batch verification completed for {len(claims)} claims "
+                f"({len(groups)} distinct, {len(assess_tasks)} assessment prompts)"
+            )
+            return verified
 
         except Exception as e:
             logger.error(f"Error in batch verification: {str(e)}")
+            for task in search_tasks + assess_tasks:
+                task.cancel()
             return [
                 Claim(
                     text=claim,
@@ -325,24 +413,6 @@ class HallucinationDetector:
                 reasoning=f"Error during verification: {str(e)}"
             )
 
-    async def _search_evidence_batch(self, claims: List[str], user_id: str = None) -> List[Dict[str, Any]]:
-        """Search for evidence for multiple claims in one API call."""
-        try:
-            combined_query = " ".join(claims[:2])
-            logger.info(f"Searching for evidence for {len(claims)} claims with combined query")
-            sources = await self._search_evidence(combined_query, user_id=user_id)
-
-            max_sources = 5
-            if len(sources) > max_sources:
-                sources = sources[:max_sources]
-                logger.info(f"Limited sources to {max_sources} to prevent API rate limits")
-
-            return sources
-
-        except Exception as e:
-            logger.error(f"Error in batch evidence search: {str(e)}")
-            return []
-
     def _map_source_refs_from_reasoning(self, reasoning: str, sources: List[Dict[str, Any]]) -> List[int]:
         """Parse 'Source N' references from reasoning text and return 0-based indices."""
         import re
@@ -353,23 +423,30 @@ class HallucinationDetector:
                 indices.add(ref - 1)  # convert 1-based → 0-based
         return sorted(indices)
 
-    async def _assess_claims_batch(self, claims: List[str], sources: List[Dict[str, Any]], user_id: str = None) -> List[Claim]:
-        """Assess multiple claims against sources in one LLM call."""
+    @staticmethod
+    def _format_claim_block(index: int, claim: str, sources: List[Dict[str, Any]]) -> str:
+        """A claim and its own numbered sources, as laid out in batch assessment prompts."""
+        source_lines = "\n".join(
+            f"  Source [{i}]: {src.get('url','')}\n  Text: {src.get('text','')[:SOURCE_TEXT_CHARS]}"
+            for i, src in enumerate(sources)
+        )
+        return f"Claim {index}: {claim}\nSources for claim {index}:\n{source_lines}"
+
+    async def _assess_claims_batch(
+        self,
+        batch: List[Tuple[str, str, List[Dict[str, Any]]]],
+        llm_slots: asyncio.Semaphore,
+        user_id: str = None,
+    ) -> Dict[str, Claim]:
+        """Assess (key, claim, sources) entries in one LLM call; returns a Claim per key."""
         try:
-            claims_to_assess = claims[:3]
-
-            combined_sources = "\n\n".join([
-                f"Source [{i}]: {src.get('url','')}\nText: {src.get('text','')[:1000]}"
-                for i, src in enumerate(sources)
-            ])
-
-            claims_text = "\n".join([
-                f"Claim {i}: {claim}"
-                for i, claim in enumerate(claims_to_assess)
-            ])
+            claims_text = "\n\n".join(
+                self._format_claim_block(i, claim, sources)
+                for i, (_, claim, sources) in enumerate(batch)
+            )
 
             prompt = (
-                "You are a strict fact-checker. Analyze each claim against the provided sources.\n\n"
+                "You are a strict fact-checker. Analyze each claim against its own sources.\n\n"
                 "Return ONLY a valid JSON object with this exact structure:\n"
                 "{\n"
                 '  "assessments": [\n'
@@ -377,33 +454,32 @@ class HallucinationDetector:
                 '      "claim_index": 0,\n'
                 '      "assessment": "supported" or "refuted" or "insufficient_information",\n'
                 '      "confidence": number between 0.0 and 1.0,\n'
-                '      "supporting_sources": [array of 0-based source indices, e.g. [0, 2] for Source [0] and Source [2]],\n'
-                '      "refuting_sources": [array of 0-based source indices, e.g. [1] for Source [1]],\n'
+                '      "supporting_sources": [array of 0-based indices into that claim\'s sources, e.g. [0, 2]],\n'
+                '      "refuting_sources": [array of 0-based indices into that claim\'s sources, e.g. [1]],\n'
                 '      "reasoning": "brief explanation of your assessment"\n'
                 '    }\n'
                 '  ]\n'
                 "}\n\n"
-                "IMPORTANT: Source indices are 0-based. Source [0] is the first source, Source [1] is the second, etc.\n"
-                "For every 'supported' or 'refuted' claim you MUST include the relevant source indices.\n\n"
+                "IMPORTANT: Source indices are 0-based and refer to the sources listed under the same claim.\n"
+                "Return one assessment per claim. For every 'supported' or 'refuted' claim you MUST include "
+                "the relevant source indices.\n\n"
                 f"Claims to verify:\n{claims_text}\n\n"
-                f"Sources:\n{combined_sources}\n\n"
                 "Return only the JSON object:"
             )
 
-            result_text = await self._generate_text_async(prompt, user_id=user_id)
+            async with llm_slots:
+                result_text = await self._generate_text_async(prompt, user_id=user_id)
             logger.info(f"Raw LLM response for batch assessment: {result_text[:200]}...")
 
             result = self._parse_json_from_response(result_text, expect_array=False)
 
-            assessments = result.get('assessments', [])
-            verified_claims = []
+            assessments = {
+                a.get('claim_index'): a for a in result.get('assessments', []) if isinstance(a, dict)
+            }
+            verified_claims: Dict[str, Claim] = {}
 
-            for i, claim in enumerate(claims_to_assess):
-                assessment = None
-                for a in assessments:
-                    if a.get('claim_index') == i:
-                        assessment = a
-                        break
+            for i, (key, claim, sources) in enumerate(batch):
+                assessment = assessments.get(i)
 
                 if assessment:
                     supporting_sources = []
@@ -424,35 +500,35 @@ class HallucinationDetector:
                         ref_indices = self._map_source_refs_from_reasoning(assessment.get('reasoning', ''), sources)
                         if ref_indices:
                             if assessment.get('assessment') == 'supported':
-                                supporting_sources = [sources[i] for i in ref_indices]
+                                supporting_sources = [sources[j] for j in ref_indices]
                             elif assessment.get('assessment') == 'refuted':
-                                refuting_sources = [sources[i] for i in ref_indices]
+                                refuting_sources = [sources[j] for j in ref_indices]
 
-                    verified_claims.append(Claim(
+                    verified_claims[key] = Claim(
                         text=claim,
                         confidence=float(assessment.get('confidence', 0.5)),
                         assessment=assessment.get('assessment', 'insufficient_information'),
                         supporting_sources=supporting_sources,
                         refuting_sources=refuting_sources,
                         reasoning=assessment.get('reasoning', '')
-                    ))
+                    )
                 else:
-                    verified_claims.append(Claim(
+                    verified_claims[key] = Claim(
                         text=claim,
                         confidence=0.0,
                         assessment="insufficient_information",
                         supporting_sources=[],
                         refuting_sources=[],
                         reasoning="No assessment provided"
-                    ))
+                    )
 
             logger.info(f"Successfully assessed {len(verified_claims)} claims in batch")
             return verified_claims
 
         except Exception as e:
             logger.error(f"Error in batch assessment: {str(e)}")
-            return [
-                Claim(
+            return {
+                key: Claim(
                     text=claim,
                     confidence=0.0,
                     assessment="insufficient_information",
@@ -460,26 +536,50 @@ class HallucinationDetector:
                     refuting_sources=[],
                     reasoning=f"Batch assessment failed: {str(e)}"
                 )
-                for claim in claims_to_assess
-            ]
+                for key, claim, _ in batch
+            }
 
     async def _search_evidence(self, claim: str, user_id: str = None) -> List[Dict[str, Any]]:
-        """Search for evidence using ExaResearchProvider with subscription checks."""
-        try:
+        """
+        Search for evidence using ExaResearchProvider with subscription checks.
+
+        Results are kept per normalized claim in the shared search cache. Searches are
+        paced by the shared "exa_search" token bucket; an Exa 429 pauses the bucket for
+        every caller and the search is retried. Subscription limits (HTTPException 429)
+        are not retried.
+        """
+        async def fetch() -> List[Dict[str, Any]]:
             from services.blog_writer.research.exa_provider import ExaResearchProvider
             provider = ExaResearchProvider()
-            sources = await provider.simple_search(
-                query=claim,
-                num_results=5,
-                user_id=user_id,
-            )
-            if not sources:
-                raise Exception(f"No search results found for claim: {claim}")
-            logger.info(f"Found {len(sources)} sources for claim: {claim[:50]}...")
-            return sources
-        except Exception as e:
-            logger.error(f"Error searching evidence with Exa: {str(e)}")
-            raise Exception(f"Failed to search evidence: {str(e)}")
+            bucket = get_token_bucket("exa_search", rate=5, capacity=5)
+            attempts = 3
+            for attempt in range(attempts):
+                await bucket.acquire()
+                try:
+                    return await provider.simple_search(
+                        query=claim,
+                        num_results=5,
+                        user_id=user_id,
+                        cache=False,
+                    )
+                except Exception as e:
+                    if _is_provider_rate_limit(e) and attempt < attempts - 1:
+                        backoff = 2.0 ** attempt
+                        logger.warning(f"Exa rate limited evidence search, backing off {backoff:.0f}s")
+                        bucket.penalize(backoff)
+                        continue
+                    if getattr(e, 'status_code', None) == 429:
+                        raise
+                    logger.error(f"Error searching evidence with Exa: {str(e)}")
+                    raise Exception(f"Failed to search evidence: {str(e)}")
+
+        sources = await search_cache.get_or_fetch(
+            "exa", normalize_claim(claim), fetch, options={"purpose": "fact_check", "num_results": 5}, cost=0.005
+        )
+        if not sources:
+            raise Exception(f"No search results found for claim: {claim}")
+        logger.info(f"Found {len(sources)} sources for claim: {claim[:50]}...")
+        return sources
 
     async def _assess_claim_against_sources(self, claim: str, sources: List[Dict[str, Any]], user_id: str = None) -> Dict[str, Any]:
         """Assess whether sources support or refute the claim using LLM."""
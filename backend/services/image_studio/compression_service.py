@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import io
 from dataclasses import dataclass
@@ -9,12 +10,22 @@ from typing import Any, Dict, List, Optional, Literal
 
 from PIL import Image, ExifTags
 
+from utils import image_ops
 from utils.logger_utils import get_service_logger
+from .image_worker_pool import get_image_worker_pool
 
 
 logger = get_service_logger("image_studio.compression")
 
 
+def decode_data_url(image_base64: str) -> bytes:
+    """Decode a base64 string or data URL to bytes."""
+    # Handle data URL format
+    if "," in image_base64:
+        image_base64 = image_base64.split(",", 1)[1]
+    return base64.b64decode(image_base64)
+
+
 @dataclass
 class CompressionRequest:
     """Request model for image compression."""
@@ -60,11 +71,7 @@ class ImageCompressionService:
 
     def _decode_image(self, image_base64: str) -> tuple[Image.Image, int]:
         """Decode base64 image and return PIL Image and original size."""
-        # Handle data URL format
-        if "," in image_base64:
-            image_base64 = image_base64.split(",", 1)[1]
-        
-        image_bytes = base64.b64decode(image_base64)
+        image_bytes = decode_data_url(image_base64)
         original_size = len(image_bytes)
         
         image = Image.open(io.BytesIO(image_bytes))
@@ -72,11 +79,7 @@ class ImageCompressionService:
 
     def _strip_exif(self, image: Image.Image) -> Image.Image:
         """Remove EXIF metadata from image."""
-        # Create a new image without EXIF data
-        data = list(image.getdata())
-        image_without_exif = Image.new(image.mode, image.size)
-        image_without_exif.putdata(data)
-        return image_without_exif
+        return image_ops.strip_metadata(image)
 
     def _compress_to_target_size(
         self,
@@ -86,30 +89,8 @@ class ImageCompressionService:
         min_quality: int = 10,
         max_quality: int = 95,
     ) -> tuple[bytes, int]:
-        """Compress image to target file size using binary search."""
-        target_bytes = target_size_kb * 1024
-        
-        low, high = min_quality, max_quality
-        best_result = None
-        best_quality = max_quality
-        
-        while low <= high:
-            mid = (low + high) // 2
-            compressed = self._compress_image(image, format, mid, True, True)
-            
-            if len(compressed) <= target_bytes:
-                best_result = compressed
-                best_quality = mid
-                low = mid + 1  # Try higher quality
-            else:
-                high = mid - 1  # Try lower quality
-        
-        if best_result is None:
-            # Even minimum quality exceeds target, return min quality result
-            best_result = self._compress_image(image, format, min_quality, True, True)
-            best_quality = min_quality
-        
-        return best_result, best_quality
+        """Compress image to target file size (proxy-estimated, then verified)."""
+        return image_ops.compress_to_target_size(image, target_size_kb, format, min_quality, max_quality)
 
     def _compress_image(
         self,
@@ -120,36 +101,61 @@ class ImageCompressionService:
         optimize: bool,
     ) -> bytes:
         """Compress image with given settings."""
-        buffer = io.BytesIO()
-        
-        # Handle format-specific options
-        save_kwargs: Dict[str, Any] = {}
-        
+        return image_ops.encode_compressed(image, format, quality, progressive, optimize)
+
+    @staticmethod
+    def mime_type(format: str) -> str:
         format_lower = format.lower()
-        if format_lower in ["jpeg", "jpg"]:
-            # Convert to RGB if necessary (JPEG doesn't support alpha)
-            if image.mode in ("RGBA", "P"):
-                image = image.convert("RGB")
-            save_kwargs["format"] = "JPEG"
-            save_kwargs["quality"] = quality
-            save_kwargs["optimize"] = optimize
-            if progressive:
-                save_kwargs["progressive"] = True
-        elif format_lower == "png":
-            save_kwargs["format"] = "PNG"
-            save_kwargs["optimize"] = optimize
-            # PNG uses compress_level (0-9) instead of quality
-            compress_level = max(0, min(9, (100 - quality) // 11))
-            save_kwargs["compress_level"] = compress_level
-        elif format_lower == "webp":
-            save_kwargs["format"] = "WEBP"
-            save_kwargs["quality"] = quality
-            save_kwargs["method"] = 6  # Best compression
-        else:
-            raise ValueError(f"Unsupported format: {format}")
-        
-        image.save(buffer, **save_kwargs)
-        return buffer.getvalue()
+        return "image/jpeg" if format_lower in ["jpeg", "jpg"] else f"image/{format_lower}"
+
+    async def compress_bytes(
+        self,
+        image_bytes: bytes,
+        request: CompressionRequest,
+        user_id: Optional[str] = None,
+    ) -> tuple[bytes, CompressionResult]:
+        """
+        Compress raw image bytes in the image worker pool.
+
+        Returns the compressed bytes and a result whose image_base64 is empty; binary
+        endpoints send the bytes as-is and compress() wraps them in a data URL.
+        """
+        format_lower = request.format.lower()
+        if format_lower not in self.SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported format: {request.format}. Supported: {self.SUPPORTED_FORMATS}")
+
+        original_size_kb = len(image_bytes) / 1024
+        logger.info(f"[Compression] Processing {original_size_kb:.2f} KB image for user: {user_id}")
+
+        output = await get_image_worker_pool().run(
+            image_ops.compress_image_bytes,
+            image_bytes,
+            format_lower,
+            quality=request.quality,
+            target_size_kb=request.target_size_kb,
+            strip=request.strip_metadata,
+            progressive=request.progressive,
+            optimize=request.optimize,
+        )
+        compressed_bytes = output["data"]
+
+        compressed_size_kb = len(compressed_bytes) / 1024
+        compression_ratio = (1 - compressed_size_kb / original_size_kb) * 100 if original_size_kb > 0 else 0
+
+        logger.info(f"[Compression] Compressed: {original_size_kb:.2f}KB → {compressed_size_kb:.2f}KB ({compression_ratio:.1f}% reduction)")
+
+        return compressed_bytes, CompressionResult(
+            success=True,
+            image_base64="",
+            original_size_kb=round(original_size_kb, 2),
+            compressed_size_kb=round(compressed_size_kb, 2),
+            compression_ratio=round(compression_ratio, 2),
+            format=format_lower,
+            width=output["width"],
+            height=output["height"],
+            quality_used=output["quality_used"],
+            metadata_stripped=request.strip_metadata,
+        )
 
     async def compress(
         self,
@@ -157,63 +163,14 @@ class ImageCompressionService:
         user_id: Optional[str] = None,
     ) -> CompressionResult:
         """Compress an image with specified settings."""
-        logger.info(f"[Compression] Processing compression request for user: {user_id}")
-        
         try:
-            # Decode image
-            image, original_size = self._decode_image(request.image_base64)
-            original_size_kb = original_size / 1024
-            
-            logger.info(f"[Compression] Original size: {original_size_kb:.2f} KB, dimensions: {image.size}")
-            
-            # Strip metadata if requested
-            if request.strip_metadata:
-                image = self._strip_exif(image)
-            
-            # Validate format
-            format_lower = request.format.lower()
-            if format_lower not in self.SUPPORTED_FORMATS:
-                raise ValueError(f"Unsupported format: {request.format}. Supported: {self.SUPPORTED_FORMATS}")
-            
-            # Compress to target size or with quality setting
-            if request.target_size_kb:
-                compressed_bytes, quality_used = self._compress_to_target_size(
-                    image,
-                    request.target_size_kb,
-                    format_lower,
-                )
-            else:
-                compressed_bytes = self._compress_image(
-                    image,
-                    format_lower,
-                    request.quality,
-                    request.progressive,
-                    request.optimize,
-                )
-                quality_used = request.quality
-            
-            compressed_size_kb = len(compressed_bytes) / 1024
-            compression_ratio = (1 - compressed_size_kb / original_size_kb) * 100 if original_size_kb > 0 else 0
-            
-            # Encode result
-            mime_type = "image/jpeg" if format_lower in ["jpeg", "jpg"] else f"image/{format_lower}"
-            result_base64 = f"data:{mime_type};base64,{base64.b64encode(compressed_bytes).decode()}"
-            
-            logger.info(f"[Compression] Compressed: {original_size_kb:.2f}KB → {compressed_size_kb:.2f}KB ({compression_ratio:.1f}% reduction)")
-            
-            return CompressionResult(
-                success=True,
-                image_base64=result_base64,
-                original_size_kb=round(original_size_kb, 2),
-                compressed_size_kb=round(compressed_size_kb, 2),
-                compression_ratio=round(compression_ratio, 2),
-                format=format_lower,
-                width=image.width,
-                height=image.height,
-                quality_used=quality_used,
-                metadata_stripped=request.strip_metadata,
+            compressed_bytes, result = await self.compress_bytes(
+                decode_data_url(request.image_base64), request, user_id=user_id
             )
-            
+            result.image_base64 = (
+                f"data:{self.mime_type(result.format)};base64,{base64.b64encode(compressed_bytes).decode()}"
+            )
+            return result
         except Exception as e:
             logger.error(f"[Compression] Failed to compress image: {e}")
             raise
@@ -223,17 +180,18 @@ class ImageCompressionService:
         requests: List[CompressionRequest],
         user_id: Optional[str] = None,
     ) -> List[CompressionResult]:
-        """Compress multiple images with same or individual settings."""
+        """Compress multiple images concurrently with same or individual settings."""
         logger.info(f"[Compression] Processing batch of {len(requests)} images for user: {user_id}")
-        
+
+        outcomes = await asyncio.gather(
+            *(self.compress(request, user_id) for request in requests),
+            return_exceptions=True,
+        )
+
         results = []
-        for i, request in enumerate(requests):
-            try:
-                result = await self.compress(request, user_id)
-                results.append(result)
-                logger.info(f"[Compression] Batch item {i+1}/{len(requests)} complete")
-            except Exception as e:
-                logger.error(f"[Compression] Batch item {i+1} failed: {e}")
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"[Compression] Batch item {i+1} failed: {outcome}")
                 # Return partial success
                 results.append(CompressionResult(
                     success=False,
@@ -247,7 +205,10 @@ class ImageCompressionService:
                     quality_used=0,
                     metadata_stripped=False,
                 ))
-        
+            else:
+                results.append(outcome)
+        logger.info(f"[Compression] Batch complete: {sum(r.success for r in results)}/{len(results)} succeeded")
+
         return results
 
     async def estimate_compression(
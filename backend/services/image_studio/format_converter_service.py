@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import io
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
-from PIL import Image, ImageCms
+from PIL import Image
 
+from utils import image_ops
 from utils.logger_utils import get_service_logger
+from .compression_service import decode_data_url
+from .image_worker_pool import get_image_worker_pool
 
 
 logger = get_service_logger("image_studio.format_converter")
@@ -104,11 +108,7 @@ class ImageFormatConverterService:
 
     def _decode_image(self, image_base64: str) -> tuple[Image.Image, int, str]:
         """Decode base64 image and return PIL Image, size, and format."""
-        # Handle data URL format
-        if "," in image_base64:
-            image_base64 = image_base64.split(",", 1)[1]
-        
-        image_bytes = base64.b64decode(image_base64)
+        image_bytes = decode_data_url(image_base64)
         original_size = len(image_bytes)
         
         image = Image.open(io.BytesIO(image_bytes))
@@ -118,10 +118,7 @@ class ImageFormatConverterService:
 
     def _strip_exif(self, image: Image.Image) -> Image.Image:
         """Remove EXIF metadata from image."""
-        data = list(image.getdata())
-        image_without_exif = Image.new(image.mode, image.size)
-        image_without_exif.putdata(data)
-        return image_without_exif
+        return image_ops.strip_metadata(image)
 
     def _convert_color_space(
         self,
@@ -130,29 +127,10 @@ class ImageFormatConverterService:
     ) -> Image.Image:
         """Convert image color space."""
         try:
-            # Get current color space
-            if hasattr(image, 'info') and 'icc_profile' in image.info:
-                # Image has ICC profile
-                try:
-                    src_profile = ImageCms.ImageCmsProfile(io.BytesIO(image.info['icc_profile']))
-                    if target_color_space.lower() == "srgb":
-                        dst_profile = ImageCms.createProfile("sRGB")
-                    elif target_color_space.lower() == "adobe rgb":
-                        dst_profile = ImageCms.createProfile("Adobe RGB")
-                    else:
-                        return image  # Unknown color space
-                    
-                    transform = ImageCms.ImageCmsTransform(src_profile, dst_profile, image.mode, image.mode)
-                    image = ImageCms.applyTransform(image, transform)
-                except Exception as e:
-                    logger.warning(f"[Format Converter] Color space conversion failed: {e}")
-            else:
-                # No ICC profile, assume sRGB
-                logger.info("[Format Converter] No ICC profile found, assuming sRGB")
+            return image_ops.convert_color_space(image, target_color_space)
         except Exception as e:
-            logger.warning(f"[Format Converter] Color space conversion error: {e}")
-        
-        return image
+            logger.warning(f"[Format Converter] Color space conversion failed: {e}")
+            return image
 
     def _convert_image(
         self,
@@ -164,98 +142,66 @@ class ImageFormatConverterService:
         progressive: bool,
     ) -> bytes:
         """Convert image to target format."""
-        buffer = io.BytesIO()
-        format_lower = target_format.lower()
-        
-        # Handle format-specific conversions
-        save_kwargs: Dict[str, Any] = {}
-        
-        # Check if source has transparency and target doesn't support it
-        has_transparency = image.mode in ("RGBA", "LA", "P") and (
-            "transparency" in image.info or image.mode == "RGBA"
+        return image_ops.encode_converted(
+            image, target_format, quality, preserve_transparency, optimize, progressive
+        )
+
+    async def convert_bytes(
+        self,
+        image_bytes: bytes,
+        request: FormatConversionRequest,
+        user_id: Optional[str] = None,
+    ) -> tuple[bytes, FormatConversionResult]:
+        """
+        Convert raw image bytes in the image worker pool.
+
+        Returns the converted bytes and a result whose image_base64 is empty; binary
+        endpoints send the bytes as-is and convert() wraps them in a data URL.
+        """
+        format_lower = request.target_format.lower()
+        if format_lower not in self.SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported format: {request.target_format}. Supported: {list(self.SUPPORTED_FORMATS.keys())}")
+
+        original_size_kb = len(image_bytes) / 1024
+        logger.info(f"[Format Converter] Converting {original_size_kb:.2f} KB image to {format_lower} for user: {user_id}")
+
+        output = await get_image_worker_pool().run(
+            image_ops.convert_image_bytes,
+            image_bytes,
+            format_lower,
+            quality=request.quality,
+            preserve_transparency=request.preserve_transparency,
+            color_space=request.color_space,
+            strip=request.strip_metadata,
+            optimize=request.optimize,
+            progressive=request.progressive,
+        )
+        if output["color_space_warning"]:
+            logger.warning(f"[Format Converter] Color space conversion failed: {output['color_space_warning']}")
+
+        converted_bytes = output["data"]
+        converted_size_kb = len(converted_bytes) / 1024
+        transparency_preserved = (
+            output["has_transparency"]
+            and self.SUPPORTED_FORMATS[format_lower]["supports_transparency"]
+            and request.preserve_transparency
+        )
+
+        logger.info(f"[Format Converter] Converted: {original_size_kb:.2f}KB → {converted_size_kb:.2f}KB")
+
+        return converted_bytes, FormatConversionResult(
+            success=True,
+            image_base64="",
+            original_format=output["original_format"],
+            target_format=format_lower,
+            original_size_kb=round(original_size_kb, 2),
+            converted_size_kb=round(converted_size_kb, 2),
+            width=output["width"],
+            height=output["height"],
+            transparency_preserved=transparency_preserved,
+            metadata_preserved=not request.strip_metadata,
+            color_space=request.color_space,
         )
-        
-        if format_lower in ["jpeg", "jpg"]:
-            # JPEG doesn't support transparency
-            if has_transparency and preserve_transparency:
-                # Convert to RGB, losing transparency
-                if image.mode in ("RGBA", "LA"):
-                    # Create white background
-                    rgb_image = Image.new("RGB", image.size, (255, 255, 255))
-                    if image.mode == "RGBA":
-                        rgb_image.paste(image, mask=image.split()[3])  # Use alpha channel as mask
-                    else:
-                        rgb_image.paste(image)
-                    image = rgb_image
-                elif image.mode == "P":
-                    image = image.convert("RGB")
-                else:
-                    image = image.convert("RGB")
-            
-            save_kwargs["format"] = "JPEG"
-            if quality:
-                save_kwargs["quality"] = quality
-            else:
-                save_kwargs["quality"] = 95  # Default high quality
-            save_kwargs["optimize"] = optimize
-            if progressive:
-                save_kwargs["progressive"] = True
-                
-        elif format_lower == "png":
-            save_kwargs["format"] = "PNG"
-            save_kwargs["optimize"] = optimize
-            # PNG compression level (0-9)
-            if quality:
-                compress_level = max(0, min(9, (100 - quality) // 11))
-                save_kwargs["compress_level"] = compress_level
-            else:
-                save_kwargs["compress_level"] = 6  # Default
-                
-        elif format_lower == "webp":
-            save_kwargs["format"] = "WEBP"
-            if quality:
-                save_kwargs["quality"] = quality
-            else:
-                save_kwargs["quality"] = 80  # Default
-            save_kwargs["method"] = 6  # Best compression
-            if preserve_transparency and has_transparency:
-                # WebP supports transparency
-                if image.mode not in ("RGBA", "LA"):
-                    image = image.convert("RGBA")
-                    
-        elif format_lower == "gif":
-            save_kwargs["format"] = "GIF"
-            # GIF conversion
-            if image.mode != "P":
-                # Convert to palette mode for GIF
-                image = image.convert("P", palette=Image.ADAPTIVE)
-            save_kwargs["optimize"] = optimize
-            if preserve_transparency and has_transparency:
-                save_kwargs["transparency"] = 255  # Preserve transparency
-                
-        elif format_lower == "bmp":
-            save_kwargs["format"] = "BMP"
-            if image.mode in ("RGBA", "LA", "P") and has_transparency:
-                # BMP doesn't support transparency, convert to RGB
-                if image.mode == "RGBA":
-                    rgb_image = Image.new("RGB", image.size, (255, 255, 255))
-                    rgb_image.paste(image, mask=image.split()[3])
-                    image = rgb_image
-                else:
-                    image = image.convert("RGB")
-                    
-        elif format_lower == "tiff":
-            save_kwargs["format"] = "TIFF"
-            save_kwargs["compression"] = "tiff_lzw"  # Lossless compression
-            if preserve_transparency and has_transparency:
-                # TIFF supports transparency
-                if image.mode not in ("RGBA", "LA"):
-                    image = image.convert("RGBA")
-        else:
-            raise ValueError(f"Unsupported target format: {target_format}")
-        
-        image.save(buffer, **save_kwargs)
-        return buffer.getvalue()
 
     async def convert(
         self,
@@ -263,72 +209,13 @@ class ImageFormatConverterService:
         user_id: Optional[str] = None,
     ) -> FormatConversionResult:
         """Convert an image to target format."""
-        logger.info(f"[Format Converter] Processing conversion request for user: {user_id}")
-        
         try:
-            # Decode image
-            image, original_size, original_format = self._decode_image(request.image_base64)
-            original_size_kb = original_size / 1024
-            
-            logger.info(f"[Format Converter] Original: {original_format}, Target: {request.target_format}, Size: {original_size_kb:.2f} KB")
-            
-            # Validate target format
-            format_lower = request.target_format.lower()
-            if format_lower not in self.SUPPORTED_FORMATS:
-                raise ValueError(f"Unsupported format: {request.target_format}. Supported: {list(self.SUPPORTED_FORMATS.keys())}")
-            
-            # Check transparency preservation
-            has_transparency = image.mode in ("RGBA", "LA", "P") and (
-                "transparency" in image.info or image.mode == "RGBA"
-            )
-            target_supports_transparency = self.SUPPORTED_FORMATS[format_lower]["supports_transparency"]
-            transparency_preserved = (
-                has_transparency and 
-                target_supports_transparency and 
-                request.preserve_transparency
-            )
-            
-            # Color space conversion
-            if request.color_space:
-                image = self._convert_color_space(image, request.color_space)
-            
-            # Strip metadata if requested
-            metadata_preserved = not request.strip_metadata
-            if request.strip_metadata:
-                image = self._strip_exif(image)
-            
-            # Convert format
-            converted_bytes = self._convert_image(
-                image,
-                format_lower,
-                request.quality,
-                request.preserve_transparency,
-                request.optimize,
-                request.progressive,
-            )
-            
-            converted_size_kb = len(converted_bytes) / 1024
-            
-            # Encode result
-            mime_type = self.SUPPORTED_FORMATS[format_lower]["mime_type"]
-            result_base64 = f"data:{mime_type};base64,{base64.b64encode(converted_bytes).decode()}"
-            
-            logger.info(f"[Format Converter] Converted: {original_size_kb:.2f}KB → {converted_size_kb:.2f}KB")
-            
-            return FormatConversionResult(
-                success=True,
-                image_base64=result_base64,
-                original_format=original_format,
-                target_format=format_lower,
-                original_size_kb=round(original_size_kb, 2),
-                converted_size_kb=round(converted_size_kb, 2),
-                width=image.width,
-                height=image.height,
-                transparency_preserved=transparency_preserved,
-                metadata_preserved=metadata_preserved,
-                color_space=request.color_space,
+            converted_bytes, result = await self.convert_bytes(
+                decode_data_url(request.image_base64), request, user_id=user_id
             )
-            
+            mime_type = self.SUPPORTED_FORMATS[result.target_format]["mime_type"]
+            result.image_base64 = f"data:{mime_type};base64,{base64.b64encode(converted_bytes).decode()}"
+            return result
         except Exception as e:
             logger.error(f"[Format Converter] Failed to convert image: {e}")
             raise
@@ -338,17 +225,18 @@ class ImageFormatConverterService:
         requests: List[FormatConversionRequest],
         user_id: Optional[str] = None,
     ) -> List[FormatConversionResult]:
-        """Convert multiple images."""
+        """Convert multiple images concurrently."""
         logger.info(f"[Format Converter] Processing batch of {len(requests)} images for user: {user_id}")
         
+        outcomes = await asyncio.gather(
+            *(self.convert(request, user_id) for request in requests),
+            return_exceptions=True,
+        )
+
         results = []
-        for i, request in enumerate(requests):
-            try:
-                result = await self.convert(request, user_id)
-                results.append(result)
-                logger.info(f"[Format Converter] Batch item {i+1}/{len(requests)} complete")
-            except Exception as e:
-                logger.error(f"[Format Converter] Batch item {i+1} failed: {e}")
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"[Format Converter] Batch item {i+1} failed: {outcome}")
                 results.append(FormatConversionResult(
                     success=False,
                     image_base64="",
@@ -361,6 +249,9 @@ class ImageFormatConverterService:
                     transparency_preserved=False,
                     metadata_preserved=False,
                 ))
+            else:
+                results.append(outcome)
+        logger.info(f"[Format Converter] Batch complete: {sum(r.success for r in results)}/{len(results)} succeeded")
         
         return results
 
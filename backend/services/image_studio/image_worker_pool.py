@@ -0,0 +1,97 @@
+"""
+Image Processing Worker Pool
+
+Runs CPU-bound PIL work (decode, encode, target-size searches) for Image Studio
+in a process pool sized to the machine's cores, so compression and format
+conversion neither block the event loop nor serialize on the GIL. Jobs are the
+picklable byte-in/byte-out functions in utils.image_ops.
+
+If a process pool cannot be created (restricted sandboxes) or breaks (a worker
+was killed), jobs fall back to a thread so requests still succeed.
+
+Configuration (environment):
+    ALWRITY_IMAGE_WORKERS   worker processes (default: CPU count)
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, Callable, Optional
+
+from utils.logger_utils import get_service_logger
+
+logger = get_service_logger("image_studio.worker_pool")
+
+
+def _pool_size() -> int:
+    return max(1, int(os.getenv("ALWRITY_IMAGE_WORKERS", os.cpu_count() or 1)))
+
+
+class ImageWorkerPool:
+    """Lazily started process pool for image jobs with a thread fallback."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or _pool_size()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._disabled = False
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        if self._executor is None and not self._disabled:
+            with self._lock:
+                if self._executor is None and not self._disabled:
+                    try:
+                        # spawn: forking a threaded server process is unsafe
+                        self._executor = ProcessPoolExecutor(
+                            max_workers=self.max_workers,
+                            mp_context=multiprocessing.get_context("spawn"),
+                        )
+                        logger.info(f"[ImageWorkerPool] Started with {self.max_workers} worker processes")
+                    except (OSError, NotImplementedError) as e:
+                        logger.warning(f"[ImageWorkerPool] Process pool unavailable, using threads: {e}")
+                        self._disabled = True
+        return self._executor
+
+    def _reset(self, broken: ProcessPoolExecutor):
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run func(*args, **kwargs) in a worker process and await its result."""
+        call = partial(func, *args, **kwargs)
+        executor = self._get_executor()
+        if executor is None:
+            return await asyncio.to_thread(call)
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(executor, call)
+        except BrokenProcessPool:
+            logger.warning("[ImageWorkerPool] Worker pool broke; restarting and running job in a thread")
+            self._reset(executor)
+            return await asyncio.to_thread(call)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_pool: Optional[ImageWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_image_worker_pool() -> ImageWorkerPool:
+    """Process-wide image worker pool."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ImageWorkerPool()
+    return _pool
@@ -1,6 +1,6 @@
 """Image Studio Manager - Main orchestration service for all image operations."""
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 from .create_service import CreateStudioService, CreateStudioRequest
 from .edit_service import EditStudioService, EditStudioRequest
@@ -498,6 +498,16 @@ class ImageStudioManager:
         logger.info("[Image Studio] Batch compress request (%d images) from user: %s", len(requests), user_id)
         return await self.compression_service.compress_batch(requests, user_id=user_id)
     
+    async def compress_image_bytes(
+        self,
+        image_bytes: bytes,
+        request: CompressionRequest,
+        user_id: Optional[str] = None,
+    ) -> Tuple[bytes, CompressionResult]:
+        """Compress raw image bytes (binary upload path, no base64)."""
+        logger.info("[Image Studio] Binary compress request from user: %s", user_id)
+        return await self.compression_service.compress_bytes(image_bytes, request, user_id=user_id)
+    
     async def estimate_compression(
         self,
         image_base64: str,
@@ -537,6 +547,16 @@ class ImageStudioManager:
         logger.info("[Image Studio] Batch convert format request (%d images) from user: %s", len(requests), user_id)
         return await self.format_converter_service.convert_batch(requests, user_id=user_id)
     
+    async def convert_format_bytes(
+        self,
+        image_bytes: bytes,
+        request: FormatConversionRequest,
+        user_id: Optional[str] = None,
+    ) -> Tuple[bytes, FormatConversionResult]:
+        """Convert raw image bytes (binary upload path, no base64)."""
+        logger.info("[Image Studio] Binary convert format request from user: %s", user_id)
+        return await self.format_converter_service.convert_bytes(image_bytes, request, user_id=user_id)
+    
     def get_supported_formats(self) -> List[Dict[str, Any]]:
         """Get supported conversion formats."""
         return self.format_converter_service.get_supported_formats()
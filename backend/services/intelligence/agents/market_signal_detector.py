@@ -13,7 +13,7 @@ from enum import Enum
 
 # Integration with existing ALwrity services
 from services.intelligence.monitoring.semantic_dashboard import RealTimeSemanticMonitor
-from services.intelligence.semantic_cache import SemanticCacheManager
+from services.intelligence.semantic_cache import semantic_cache_manager
 from services.seo_analyzer import ComprehensiveSEOAnalyzer
 from utils.logger_utils import get_service_logger
 
@@ -90,7 +90,7 @@ class MarketSignalDetector:
     def __init__(self, user_id: str):
         self.user_id = user_id
         self.semantic_monitor = RealTimeSemanticMonitor(user_id)
-        self.cache_manager = SemanticCacheManager()
+        self.cache_manager = semantic_cache_manager
         self.seo_analyzer = ComprehensiveSEOAnalyzer()
         
         # Signal detection thresholds
@@ -119,7 +119,7 @@ class MarketSignalDetector:
             
             # Check cache first
             cache_key = f"market_signals_{self.user_id}"
-            cached_signals = self.cache_manager.get(cache_key)
+            cached_signals = self.cache_manager.get(cache_key, self.user_id)
             
             if cached_signals and self._is_cache_valid(cached_signals):
                 logger.info(f"Using cached market signals for user: {self.user_id}")
@@ -165,7 +165,7 @@ class MarketSignalDetector:
             self._trim_signal_history()
             
             # Cache results
-            self.cache_manager.set(cache_key, prioritized_signals, ttl=300)  # 5 minute cache
+            self.cache_manager.set(cache_key, prioritized_signals, ttl=300, user_id=self.user_id)  # 5 minute cache
             
             logger.info(f"Detected {len(prioritized_signals)} market signals for user: {self.user_id}")
             
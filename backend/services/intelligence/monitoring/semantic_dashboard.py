@@ -596,10 +596,10 @@ class RealTimeSemanticMonitor:
         try:
             cache_key = f"semantic_monitoring_{self.user_id}"
             self.cache_manager.set(
-                cache_key, 
-                self.user_id, 
-                snapshot, 
-                ttl=300  # 5 minutes
+                cache_key,
+                snapshot,
+                ttl=300,  # 5 minutes
+                user_id=self.user_id
             )
             
             logger.debug(f"Cached monitoring results for user {self.user_id}")
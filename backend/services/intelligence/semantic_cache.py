@@ -5,34 +5,101 @@ Provides intelligent caching for semantic operations including:
 - User-specific semantic indices with TTL management
 - Query result caching with relevance-based invalidation
 - Content analysis caching with versioning
-- Intelligent cache warming based on user behavior
+- Size-aware LRU eviction with per-entry byte accounting and per-user quotas
+- Optional disk tier for entries evicted from memory (msgpack, falling back to JSON when it is not installed)
 """
 
 import json
 import hashlib
+import os
+import threading
 import time
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, asdict
 from functools import wraps
 import logging
 from collections import OrderedDict
-import asyncio
-from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
 
 logger = logging.getLogger(__name__)
 
+_MB = 1024 * 1024
+# Approximate fixed cost of one entry beyond its payload (key string, slots object, dict slot)
+_ENTRY_OVERHEAD_BYTES = 256
+_SHARED_OWNER = "_shared"
+
+
+def _encode_payload(value: Any) -> Tuple[bytes, bool]:
+    """
+    Serialize a value for sizing and the disk tier.
+
+    Returns (encoded bytes, lossless). Values that only serialize with a str() fallback
+    (dataclasses, datetimes, ...) are still sized correctly but are kept memory-only.
+    """
+    try:
+        if msgpack is not None:
+            return b"M" + msgpack.packb(value, use_bin_type=True), True
+        return b"J" + json.dumps(value, separators=(",", ":")).encode("utf-8"), True
+    except (TypeError, ValueError, OverflowError):
+        return json.dumps(value, default=str, separators=(",", ":")).encode("utf-8"), False
+
+
+def _decode_payload(raw: bytes) -> Any:
+    marker, body = raw[:1], raw[1:]
+    if marker == b"M":
+        if msgpack is None:
+            raise ValueError("msgpack-encoded cache file but msgpack is not installed")
+        return msgpack.unpackb(body, raw=False)
+    return json.loads(body.decode("utf-8"))
+
 
-@dataclass
 class CacheEntry:
     """Represents a cached semantic intelligence entry"""
-    data: Any
-    timestamp: float
-    ttl: int  # Time to live in seconds
-    version: str
-    metadata: Dict[str, Any]
-    access_count: int = 0
-    last_accessed: float = 0.0
+
+    __slots__ = (
+        "data", "timestamp", "ttl", "version", "metadata",
+        "access_count", "last_accessed", "size_bytes", "owner", "spillable",
+    )
+
+    def __init__(
+        self,
+        data: Any,
+        timestamp: float,
+        ttl: int,
+        version: str,
+        metadata: Dict[str, Any],
+        access_count: int = 0,
+        last_accessed: float = 0.0,
+        size_bytes: int = 0,
+        owner: str = _SHARED_OWNER,
+        spillable: bool = False,
+    ):
+        self.data = data
+        self.timestamp = timestamp
+        self.ttl = ttl  # Time to live in seconds
+        self.version = version
+        self.metadata = metadata
+        self.access_count = access_count
+        self.last_accessed = last_accessed
+        self.size_bytes = size_bytes
+        self.owner = owner
+        self.spillable = spillable
+
+    def to_record(self) -> Dict[str, Any]:
+        """Plain-dict form written to the disk tier."""
+        return {
+            "data": self.data,
+            "timestamp": self.timestamp,
+            "ttl": self.ttl,
+            "version": self.version,
+            "metadata": self.metadata,
+            "access_count": self.access_count,
+            "owner": self.owner,
+        }
 
 
 @dataclass
@@ -41,8 +108,17 @@ class SemanticCacheStats:
     total_hits: int = 0
     total_misses: int = 0
     total_invalidations: int = 0
+    total_evictions: int = 0
+    quota_evictions: int = 0
+    rejected_oversize: int = 0
+    disk_hits: int = 0
+    disk_writes: int = 0
     cache_size: int = 0
+    memory_usage_bytes: int = 0
     memory_usage_mb: float = 0.0
+    disk_entries: int = 0
+    disk_usage_mb: float = 0.0
+    tracked_users: int = 0
     average_hit_time_ms: float = 0.0
     hit_rate: float = 0.0
 
@@ -50,52 +126,76 @@ class SemanticCacheStats:
 class SemanticCacheManager:
     """
     Intelligent caching system for semantic intelligence operations
-    
+
     Features:
-    - Multi-tier caching (memory + persistent)
+    - Multi-tier caching (memory + optional disk spill tier)
     - TTL-based expiration with intelligent defaults
+    - Byte-accurate LRU eviction bounded by max_memory_size_mb
+    - Per-user byte quotas so one tenant cannot evict everyone else
     - Relevance-based cache invalidation
-    - User-specific semantic index isolation
     - Performance monitoring and analytics
     """
-    
+
     def __init__(
         self,
         max_memory_size_mb: int = 512,
         default_ttl_seconds: int = 3600,
         cleanup_interval_seconds: int = 300,
         enable_persistent_cache: bool = True,
-        cache_dir: str = "/tmp/semantic_cache"
+        cache_dir: str = "/tmp/semantic_cache",
+        per_user_quota_mb: Optional[float] = None,
+        max_disk_size_mb: int = 2048
     ):
+        """
+        Args:
+            max_memory_size_mb: Upper bound on the summed size of in-memory entries
+            default_ttl_seconds: TTL used when callers don't pass one
+            cleanup_interval_seconds: Sleep between passes of _periodic_cleanup
+            enable_persistent_cache: Spill evicted entries to cache_dir and promote them back on hit
+            cache_dir: Directory for the disk tier (created on first spill)
+            per_user_quota_mb: Most memory one user may hold (default: a quarter of the total)
+            max_disk_size_mb: Upper bound on the disk tier
+        """
         self.max_memory_size_mb = max_memory_size_mb
+        self.max_memory_bytes = int(max_memory_size_mb * _MB)
+        self.per_user_quota_bytes = int((per_user_quota_mb if per_user_quota_mb is not None
+                                         else max_memory_size_mb / 4) * _MB)
         self.default_ttl = default_ttl_seconds
         self.cleanup_interval = cleanup_interval_seconds
         self.enable_persistent_cache = enable_persistent_cache
         self.cache_dir = cache_dir
-        
-        # In-memory cache with LRU eviction
-        self.memory_cache: Dict[str, CacheEntry] = OrderedDict()
-        self.user_indices: Dict[str, str] = {}  # user_id -> index_hash mapping
-        
+        self.max_disk_bytes = int(max_disk_size_mb * _MB)
+
+        # In-memory cache with LRU eviction (oldest first)
+        self.memory_cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.user_indices: Dict[str, str] = {}  # user_id -> latest semantic insights key
+        self.total_bytes = 0
+        self.user_bytes: Dict[str, int] = {}
+        self.user_keys: Dict[str, Set[str]] = {}
+
+        # Disk tier index: cache_key -> (size_bytes, owner); oldest first
+        self._disk_index: "OrderedDict[str, Tuple[int, str]]" = OrderedDict()
+        self._disk_bytes = 0
+        self._disk_scanned = False
+
         # Statistics
         self.stats = SemanticCacheStats()
-        self._stats_lock = asyncio.Lock()
-        
-        # Thread pool for background operations
-        self.executor = ThreadPoolExecutor(max_workers=4)
-        
-        # Start background cleanup task (optional - can be started manually)
+        self._hit_time_total_ms = 0.0
+        self._lock = threading.RLock()
+
+        # Periodic cleanup is not started automatically; run _periodic_cleanup in a thread if needed
         self.cleanup_task = None
-        if cleanup_interval_seconds > 0:
-            # Note: Cleanup task should be started manually in async context
-            pass
-        
-        logger.info(f"SemanticCacheManager initialized with {max_memory_size_mb}MB limit")
-    
+
+        logger.info(
+            f"SemanticCacheManager initialized with {max_memory_size_mb}MB limit "
+            f"({self.per_user_quota_bytes / _MB:.1f}MB per user, disk tier "
+            f"{'on' if enable_persistent_cache else 'off'}, {'msgpack' if msgpack else 'json'} encoding)"
+        )
+
     def _generate_cache_key(
-        self, 
-        operation: str, 
-        user_id: str, 
+        self,
+        operation: str,
+        user_id: str,
         params: Dict[str, Any]
     ) -> str:
         """Generate a unique cache key for semantic operations"""
@@ -107,72 +207,306 @@ class SemanticCacheManager:
         }
         key_str = json.dumps(key_data, sort_keys=True)
         return hashlib.sha256(key_str.encode()).hexdigest()
-    
+
     def _serialize_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Serialize parameters for consistent hashing"""
         serialized = {}
         for key, value in params.items():
             if isinstance(value, (list, dict)):
-                serialized[key] = json.dumps(value, sort_keys=True)
+                serialized[key] = json.dumps(value, sort_keys=True, default=str)
             else:
                 serialized[key] = str(value)
         return serialized
-    
+
     def _is_entry_valid(self, entry: CacheEntry) -> bool:
         """Check if cache entry is still valid"""
         current_time = time.time()
-        
+
         # Check TTL expiration
         if current_time - entry.timestamp > entry.ttl:
             return False
-        
+
         # Check version compatibility (semantic analysis versions)
         if entry.version != self._get_current_version():
             return False
-        
+
         return True
-    
+
     def _get_current_version(self) -> str:
         """Get current semantic analysis version"""
         # This could be based on model versions, algorithm updates, etc.
         return "v1.0.0"
-    
+
+    @staticmethod
+    def _owner(user_id: Optional[str]) -> str:
+        return str(user_id) if user_id not in (None, "") else _SHARED_OWNER
+
     def _calculate_memory_usage(self) -> float:
-        """Calculate current memory usage in MB"""
-        total_size = 0
-        for entry in self.memory_cache.values():
-            # Rough estimation of memory usage
-            entry_size = len(json.dumps(asdict(entry)).encode())
-            total_size += entry_size
-        
-        return total_size / (1024 * 1024)  # Convert to MB
-    
-    def _evict_lru_entries(self, target_size_mb: float):
-        """Evict least recently used entries to meet memory target"""
-        current_size = self._calculate_memory_usage()
-        
-        while current_size > target_size_mb and self.memory_cache:
-            # Remove oldest entry
-            oldest_key = next(iter(self.memory_cache))
-            del self.memory_cache[oldest_key]
-            current_size = self._calculate_memory_usage()
-            
-            logger.debug(f"Evicted cache entry: {oldest_key}")
-    
+        """Current memory usage in MB (maintained incrementally, O(1))"""
+        return self.total_bytes / _MB
+
+    # ------------------------------------------------------------------
+    # Core store / lookup
+    # ------------------------------------------------------------------
+
+    def _store(
+        self,
+        cache_key: str,
+        data: Any,
+        ttl: int,
+        user_id: Optional[str],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Insert an entry, enforcing the per-user quota and the global byte limit."""
+        encoded, lossless = _encode_payload(data)
+        now = time.time()
+        owner = self._owner(user_id)
+        entry = CacheEntry(
+            data=data,
+            timestamp=now,
+            ttl=ttl,
+            version=self._get_current_version(),
+            metadata=metadata or {},
+            access_count=1,
+            last_accessed=now,
+            size_bytes=len(encoded) + len(cache_key) + _ENTRY_OVERHEAD_BYTES,
+            owner=owner,
+            spillable=lossless,
+        )
+
+        if entry.size_bytes > min(self.max_memory_bytes, self.per_user_quota_bytes):
+            with self._lock:
+                self.stats.rejected_oversize += 1
+            logger.warning(
+                f"Not caching {entry.size_bytes / _MB:.1f}MB entry for {owner}: exceeds per-entry limit"
+            )
+            return False
+
+        with self._lock:
+            self._remove_memory_entry(cache_key)
+            self._drop_disk_entry(cache_key)
+            evicted = self._make_room(owner, entry.size_bytes)
+            self.memory_cache[cache_key] = entry
+            self.total_bytes += entry.size_bytes
+            self.user_bytes[owner] = self.user_bytes.get(owner, 0) + entry.size_bytes
+            self.user_keys.setdefault(owner, set()).add(cache_key)
+
+        self._spill(evicted)
+        return True
+
+    def _make_room(self, owner: str, incoming_bytes: int) -> List[Tuple[str, CacheEntry]]:
+        """Evict LRU entries until the new entry fits. Caller holds the lock."""
+        evicted = []
+
+        # The owner's own quota first: only that user's entries are candidates
+        if self.user_bytes.get(owner, 0) + incoming_bytes > self.per_user_quota_bytes:
+            for key in [k for k, e in self.memory_cache.items() if e.owner == owner]:
+                if self.user_bytes.get(owner, 0) + incoming_bytes <= self.per_user_quota_bytes:
+                    break
+                evicted.append((key, self._remove_memory_entry(key)))
+                self.stats.quota_evictions += 1
+
+        # Then the global limit, plain LRU across users
+        while self.memory_cache and self.total_bytes + incoming_bytes > self.max_memory_bytes:
+            key = next(iter(self.memory_cache))
+            evicted.append((key, self._remove_memory_entry(key)))
+
+        self.stats.total_evictions += len(evicted)
+        return evicted
+
+    def _remove_memory_entry(self, cache_key: str) -> Optional[CacheEntry]:
+        """Remove an entry and its byte accounting. Caller holds the lock."""
+        entry = self.memory_cache.pop(cache_key, None)
+        if entry is None:
+            return None
+        self.total_bytes -= entry.size_bytes
+        remaining = self.user_bytes.get(entry.owner, 0) - entry.size_bytes
+        if remaining > 0:
+            self.user_bytes[entry.owner] = remaining
+        else:
+            self.user_bytes.pop(entry.owner, None)
+        keys = self.user_keys.get(entry.owner)
+        if keys is not None:
+            keys.discard(cache_key)
+            if not keys:
+                del self.user_keys[entry.owner]
+        return entry
+
+    def _lookup(self, cache_key: str) -> Optional[CacheEntry]:
+        """Return a valid entry from memory or disk, recording hit/miss statistics."""
+        started = time.perf_counter()
+        with self._lock:
+            entry = self.memory_cache.get(cache_key)
+            if entry is not None:
+                if self._is_entry_valid(entry):
+                    entry.access_count += 1
+                    entry.last_accessed = time.time()
+                    self.memory_cache.move_to_end(cache_key)
+                    self._record_hit(started)
+                    return entry
+                self._remove_memory_entry(cache_key)
+                self.stats.total_invalidations += 1
+
+        entry = self._load_from_disk(cache_key)
+        with self._lock:
+            if entry is None:
+                self.stats.total_misses += 1
+                return None
+            self.stats.disk_hits += 1
+
+        # Promote back into memory; the disk copy was consumed by _load_from_disk
+        user_id = None if entry.owner == _SHARED_OWNER else entry.owner
+        remaining_ttl = max(1, int(entry.ttl - (time.time() - entry.timestamp)))
+        self._store(cache_key, entry.data, remaining_ttl, user_id, entry.metadata)
+        with self._lock:
+            self._record_hit(started)
+        return entry
+
+    def _record_hit(self, started: float):
+        """Caller holds the lock."""
+        self.stats.total_hits += 1
+        self._hit_time_total_ms += (time.perf_counter() - started) * 1000
+
+    def get(self, cache_key: str, user_id: Optional[str] = None) -> Optional[Any]:
+        """Generic lookup by caller-built key (user_id is accepted for symmetry with set)."""
+        entry = self._lookup(cache_key)
+        return entry.data if entry is not None else None
+
+    def set(
+        self,
+        cache_key: str,
+        data: Any,
+        ttl: Optional[int] = None,
+        user_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Generic store by caller-built key, charged against user_id's quota."""
+        try:
+            metadata = dict(metadata or {})
+            if user_id is not None:
+                metadata.setdefault("user_id", user_id)
+            return self._store(cache_key, data, ttl or self.default_ttl, user_id, metadata)
+        except Exception as e:
+            logger.error(f"Failed to cache entry {cache_key}: {e}")
+            return False
+
+    # ------------------------------------------------------------------
+    # Disk tier
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _owner_dir(owner: str) -> str:
+        return hashlib.sha1(owner.encode("utf-8")).hexdigest()[:16]
+
+    def _disk_path(self, cache_key: str, owner: str) -> str:
+        return os.path.join(self.cache_dir, self._owner_dir(owner), f"{cache_key}.bin")
+
+    def _scan_disk(self):
+        """Rebuild the disk index from cache_dir once per process. Caller holds the lock."""
+        if self._disk_scanned or not self.enable_persistent_cache:
+            return
+        self._disk_scanned = True
+        if not os.path.isdir(self.cache_dir):
+            return
+        found = []
+        for owner_dir in os.scandir(self.cache_dir):
+            if not owner_dir.is_dir():
+                continue
+            for item in os.scandir(owner_dir.path):
+                if item.name.endswith(".bin"):
+                    stat = item.stat()
+                    found.append((stat.st_mtime, item.name[:-4], stat.st_size, owner_dir.name))
+        for _, key, size, owner_dir in sorted(found):
+            self._disk_index[key] = (size, owner_dir)
+            self._disk_bytes += size
+
+    def _spill(self, evicted: List[Tuple[str, CacheEntry]]):
+        """Write memory-evicted entries to the disk tier (outside the lock)."""
+        if not self.enable_persistent_cache:
+            return
+        for cache_key, entry in evicted:
+            if entry is None or not entry.spillable or not self._is_entry_valid(entry):
+                continue
+            try:
+                raw, _ = _encode_payload(entry.to_record())
+                path = self._disk_path(cache_key, entry.owner)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(raw)
+                os.replace(tmp_path, path)
+            except Exception as e:
+                logger.warning(f"Failed to spill semantic cache entry to disk: {e}")
+                continue
+
+            owner_dir = self._owner_dir(entry.owner)
+            with self._lock:
+                self._scan_disk()
+                self._drop_disk_entry(cache_key, delete_file=False)
+                self._disk_index[cache_key] = (len(raw), owner_dir)
+                self._disk_bytes += len(raw)
+                self.stats.disk_writes += 1
+                while self._disk_bytes > self.max_disk_bytes and self._disk_index:
+                    self._drop_disk_entry(next(iter(self._disk_index)))
+
+    def _drop_disk_entry(self, cache_key: str, delete_file: bool = True):
+        """Forget a disk-tier entry. Caller holds the lock."""
+        if not self.enable_persistent_cache:
+            return
+        self._scan_disk()
+        item = self._disk_index.pop(cache_key, None)
+        if item is None:
+            return
+        size, owner_dir = item
+        self._disk_bytes -= size
+        if delete_file:
+            try:
+                os.remove(os.path.join(self.cache_dir, owner_dir, f"{cache_key}.bin"))
+            except OSError:
+                pass
+
+    def _load_from_disk(self, cache_key: str) -> Optional[CacheEntry]:
+        """Read and remove an entry from the disk tier; returns None when missing or stale."""
+        if not self.enable_persistent_cache:
+            return None
+        with self._lock:
+            self._scan_disk()
+            item = self._disk_index.get(cache_key)
+            if item is None:
+                return None
+            path = os.path.join(self.cache_dir, item[1], f"{cache_key}.bin")
+            self._drop_disk_entry(cache_key, delete_file=False)
+        try:
+            with open(path, "rb") as f:
+                record = _decode_payload(f.read())
+            os.remove(path)
+        except Exception as e:
+            logger.warning(f"Failed to read semantic cache entry from disk: {e}")
+            return None
+        entry = CacheEntry(
+            data=record["data"],
+            timestamp=record["timestamp"],
+            ttl=record["ttl"],
+            version=record["version"],
+            metadata=record.get("metadata") or {},
+            access_count=record.get("access_count", 0),
+            owner=record.get("owner", _SHARED_OWNER),
+        )
+        if not self._is_entry_valid(entry):
+            with self._lock:
+                self.stats.total_invalidations += 1
+            return None
+        return entry
+
     def _periodic_cleanup(self):
-        """Background task to clean up expired entries"""
+        """Background loop that cleans up expired entries"""
         while True:
             try:
                 time.sleep(self.cleanup_interval)
                 self.cleanup_expired_entries()
-                
-                # Update statistics
-                self.stats.cache_size = len(self.memory_cache)
-                self.stats.memory_usage_mb = self._calculate_memory_usage()
-                    
             except Exception as e:
                 logger.error(f"Error in periodic cleanup: {e}")
-    
+
     def cache_semantic_insights(
         self,
         user_id: str,
@@ -182,117 +516,106 @@ class SemanticCacheManager:
     ) -> bool:
         """
         Cache semantic insights for a user
-        
+
         Args:
             user_id: User identifier
             insights: Semantic insights data
             ttl: Time to live in seconds (uses default if None)
             metadata: Additional metadata for cache management
-            
+
         Returns:
             True if caching was successful
         """
         try:
             cache_key = self._generate_cache_key(
-                "semantic_insights", 
-                user_id, 
+                "semantic_insights",
+                user_id,
                 {"timestamp": time.time()}
             )
-            
-            entry = CacheEntry(
-                data=insights,
-                timestamp=time.time(),
-                ttl=ttl or self.default_ttl,
-                version=self._get_current_version(),
-                metadata=metadata or {},
-                access_count=1,
-                last_accessed=time.time()
-            )
-            
-            # Check memory limit before adding
-            projected_size = self._calculate_memory_usage() + (
-                len(json.dumps(insights).encode()) / (1024 * 1024)
-            )
-            
-            if projected_size > self.max_memory_size_mb:
-                # Evict old entries to make room
-                self._evict_lru_entries(self.max_memory_size_mb * 0.8)
-            
-            self.memory_cache[cache_key] = entry
-            self.memory_cache.move_to_end(cache_key)  # Mark as recently used
-            
-            # Update user index mapping
-            self.user_indices[user_id] = cache_key
-            
+            metadata = dict(metadata or {})
+            metadata.setdefault("operation", "semantic_insights")
+            metadata.setdefault("user_id", user_id)
+
+            if not self._store(cache_key, insights, ttl or self.default_ttl, user_id, metadata):
+                return False
+
+            # Update user index mapping; the previous snapshot is superseded
+            with self._lock:
+                previous = self.user_indices.get(user_id)
+                self.user_indices[user_id] = cache_key
+                if previous and previous != cache_key:
+                    self._remove_memory_entry(previous)
+                    self._drop_disk_entry(previous)
+
             logger.info(f"Cached semantic insights for user {user_id}")
             return True
-            
+
         except Exception as e:
             logger.error(f"Failed to cache semantic insights: {e}")
             return False
 
     def get_stats(self) -> Dict[str, Any]:
         """Get current cache statistics"""
-        return asdict(self.stats)
+        return asdict(self.get_cache_stats())
 
     def clear_cache(self) -> bool:
-        """Clear all cache entries"""
+        """Clear all cache entries (memory and disk)"""
         try:
-            self.memory_cache.clear()
-            self.stats.cache_size = 0
-            self.stats.memory_usage_mb = 0.0
+            with self._lock:
+                self.memory_cache.clear()
+                self.user_indices.clear()
+                self.user_bytes.clear()
+                self.user_keys.clear()
+                self.total_bytes = 0
+                for key in list(self._disk_index):
+                    self._drop_disk_entry(key)
             return True
         except Exception as e:
             logger.error(f"Error clearing cache: {e}")
             return False
-    
+
     def get_cached_semantic_insights(
-        self, 
+        self,
         user_id: str,
         force_refresh: bool = False
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieve cached semantic insights for a user
-        
+
         Args:
             user_id: User identifier
             force_refresh: Force cache refresh even if valid
-            
+
         Returns:
             Cached insights or None if not found/expired
         """
         try:
-            cache_key = self.user_indices.get(user_id)
-            if not cache_key:
-                self.stats.total_misses += 1
-                return None
-            
-            entry = self.memory_cache.get(cache_key)
-            if not entry:
-                self.stats.total_misses += 1
-                return None
-            
-            # Check validity
-            if not self._is_entry_valid(entry) or force_refresh:
-                del self.memory_cache[cache_key]
-                del self.user_indices[user_id]
-                self.stats.total_invalidations += 1
+            with self._lock:
+                cache_key = self.user_indices.get(user_id)
+                if not cache_key:
+                    self.stats.total_misses += 1
+                    return None
+                if force_refresh:
+                    del self.user_indices[user_id]
+                    self._remove_memory_entry(cache_key)
+                    self._drop_disk_entry(cache_key)
+                    self.stats.total_invalidations += 1
+                    return None
+
+            entry = self._lookup(cache_key)
+            if entry is None:
+                with self._lock:
+                    if self.user_indices.get(user_id) == cache_key:
+                        del self.user_indices[user_id]
                 return None
-            
-            # Update access statistics
-            entry.access_count += 1
-            entry.last_accessed = time.time()
-            self.memory_cache.move_to_end(cache_key)
-            
-            self.stats.total_hits += 1
-                
+
             logger.debug(f"Retrieved cached semantic insights for user {user_id}")
             return entry.data
-            
+
         except Exception as e:
             logger.error(f"Failed to retrieve cached semantic insights: {e}")
             return None
-    
+
     def cache_query_results(
         self,
         query: str,
@@ -303,14 +626,14 @@ class SemanticCacheManager:
     ) -> bool:
         """
         Cache semantic search query results with relevance-based invalidation
-        
+
         Args:
             query: Search query
             results: Query results
             relevance_threshold: Minimum relevance score for caching
             ttl: Time to live in seconds
             user_id: User identifier for scoped caching
-            
+
         Returns:
             True if caching was successful
         """
@@ -318,35 +641,34 @@ class SemanticCacheManager:
             # Only cache high-quality results
             if not results or max(r.get('score', 0) for r in results) < relevance_threshold:
                 return False
-            
+
             cache_key = self._generate_cache_key(
                 "semantic_query",
                 user_id,  # User-scoped cache key
                 {"query": query, "threshold": relevance_threshold}
             )
-            
-            entry = CacheEntry(
-                data=results,
-                timestamp=time.time(),
-                ttl=ttl or (self.default_ttl // 2),  # Shorter TTL for queries
-                version=self._get_current_version(),
-                metadata={
+
+            stored = self._store(
+                cache_key,
+                results,
+                ttl or (self.default_ttl // 2),  # Shorter TTL for queries
+                user_id,
+                {
+                    "operation": "semantic_query",
+                    "user_id": user_id,
                     "query": query,
                     "relevance_threshold": relevance_threshold,
                     "result_count": len(results)
                 }
             )
-            
-            self.memory_cache[cache_key] = entry
-            self.memory_cache.move_to_end(cache_key)
-            
-            logger.info(f"Cached semantic query results for: {query}")
-            return True
-            
+            if stored:
+                logger.info(f"Cached semantic query results for: {query}")
+            return stored
+
         except Exception as e:
             logger.error(f"Failed to cache query results: {e}")
             return False
-    
+
     def get_cached_query_results(
         self,
         query: str,
@@ -360,68 +682,62 @@ class SemanticCacheManager:
                 user_id,
                 {"query": query, "threshold": relevance_threshold}
             )
-            
-            entry = self.memory_cache.get(cache_key)
-            if not entry or not self._is_entry_valid(entry):
+
+            entry = self._lookup(cache_key)
+            if entry is None:
                 return None
-            
-            # Update access statistics
-            entry.access_count += 1
-            entry.last_accessed = time.time()
-            self.memory_cache.move_to_end(cache_key)
-            
+
             logger.debug(f"Retrieved cached query results for: {query}")
             return entry.data
-            
+
         except Exception as e:
             logger.error(f"Failed to retrieve cached query results: {e}")
             return None
-    
+
     def invalidate_user_cache(self, user_id: str, operation_type: Optional[str] = None):
         """
         Invalidate cache entries for a specific user
-        
+
         Args:
             user_id: User identifier
             operation_type: Specific operation type to invalidate (optional)
         """
         try:
-            keys_to_remove = []
-            
-            # Check user index mapping first
-            if user_id in self.user_indices:
-                cache_key = self.user_indices[user_id]
-                if cache_key in self.memory_cache:
-                    entry = self.memory_cache[cache_key]
-                    if operation_type is None or entry.metadata.get("operation") == operation_type:
-                        keys_to_remove.append(cache_key)
-            
-            # Also check all cache entries for user_id in metadata
-            for cache_key, entry in list(self.memory_cache.items()):
-                if entry.metadata.get("user_id") == user_id:
-                    if operation_type is None or entry.metadata.get("operation") == operation_type:
-                        if cache_key not in keys_to_remove:
-                            keys_to_remove.append(cache_key)
-            
-            # Remove identified keys
-            for key in keys_to_remove:
-                if key in self.memory_cache:
-                    del self.memory_cache[key]
-                    # Clean up user index mapping
-                    user_keys = [k for k, v in self.user_indices.items() if v == key]
-                    for user_key in user_keys:
-                        if user_key in self.user_indices:
-                            del self.user_indices[user_key]
-            
+            owner = self._owner(user_id)
+            with self._lock:
+                keys_to_remove = [
+                    key for key in self.user_keys.get(owner, ())
+                    if operation_type is None or self.memory_cache[key].metadata.get("operation") == operation_type
+                ]
+                for key in keys_to_remove:
+                    self._remove_memory_entry(key)
+
+                # Spilled entries: whole-user invalidation drops the user's directory entries;
+                # operation-scoped invalidation can't inspect metadata without reading, so only
+                # the insights snapshot tracked in user_indices is dropped from disk.
+                owner_dir = self._owner_dir(owner)
+                disk_keys = [key for key, (_, d) in self._disk_index.items() if d == owner_dir] \
+                    if operation_type is None else []
+                insights_key = self.user_indices.get(user_id)
+                if insights_key and operation_type in (None, "semantic_insights"):
+                    disk_keys.append(insights_key)
+                    del self.user_indices[user_id]
+                for key in disk_keys:
+                    if key in self._disk_index:
+                        self._drop_disk_entry(key)
+                        keys_to_remove.append(key)
+
+                self.stats.total_invalidations += len(keys_to_remove)
+
             logger.info(f"Invalidated {len(keys_to_remove)} cache entries for user {user_id}")
-            
+
         except Exception as e:
             logger.error(f"Failed to invalidate user cache: {e}")
-    
+
     def invalidate_on_content_update(self, user_id: str, content_type: str):
         """
         Invalidate relevant cache entries when user content is updated
-        
+
         Args:
             user_id: User identifier
             content_type: Type of content updated (e.g., 'blog_post', 'page', etc.)
@@ -429,65 +745,65 @@ class SemanticCacheManager:
         try:
             # Invalidate semantic insights for this user
             self.invalidate_user_cache(user_id, "semantic_insights")
-            
+
             # Invalidate related query caches
             if content_type in ["blog_post", "page", "content"]:
                 # Invalidate pillar-related caches
                 self.invalidate_user_cache(user_id, "semantic_pillars")
-                
+
             logger.info(f"Invalidated cache for user {user_id} content update: {content_type}")
-            
+
         except Exception as e:
             logger.error(f"Failed to invalidate cache on content update: {e}")
-    
+
     def cleanup_expired_entries(self):
         """Clean up expired cache entries"""
         try:
-            expired_keys = []
-            current_time = time.time()
-            
-            for cache_key, entry in self.memory_cache.items():
-                if not self._is_entry_valid(entry):
-                    expired_keys.append(cache_key)
-            
-            for key in expired_keys:
-                del self.memory_cache[key]
-                # Clean up user index mapping
-                user_keys = [k for k, v in self.user_indices.items() if v == key]
-                for user_key in user_keys:
-                    del self.user_indices[user_key]
-            
+            with self._lock:
+                expired_keys = [
+                    key for key, entry in self.memory_cache.items() if not self._is_entry_valid(entry)
+                ]
+                for key in expired_keys:
+                    entry = self._remove_memory_entry(key)
+                    if self.user_indices.get(entry.owner) == key:
+                        del self.user_indices[entry.owner]
+
             if expired_keys:
                 logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
-                
+
         except Exception as e:
             logger.error(f"Error during cache cleanup: {e}")
-    
+
     def get_cache_stats(self) -> SemanticCacheStats:
-        """Get current cache statistics"""
-        try:
-            # Calculate hit rate
-            total_requests = self.stats.total_hits + self.stats.total_misses
-            if total_requests > 0:
-                self.stats.hit_rate = self.stats.total_hits / total_requests
-            
-            # Update current stats
-            self.stats.cache_size = len(self.memory_cache)
-            self.stats.memory_usage_mb = self._calculate_memory_usage()
-            
-            return self.stats
-            
-        except Exception as e:
-            logger.error(f"Failed to get cache stats: {e}")
-            return self.stats
-    
+        """Get a snapshot of current cache statistics"""
+        with self._lock:
+            stats = SemanticCacheStats(**asdict(self.stats))
+            total_requests = stats.total_hits + stats.total_misses
+            stats.hit_rate = stats.total_hits / total_requests if total_requests else 0.0
+            stats.average_hit_time_ms = self._hit_time_total_ms / stats.total_hits if stats.total_hits else 0.0
+            stats.cache_size = len(self.memory_cache)
+            stats.memory_usage_bytes = self.total_bytes
+            stats.memory_usage_mb = self.total_bytes / _MB
+            stats.disk_entries = len(self._disk_index)
+            stats.disk_usage_mb = self._disk_bytes / _MB
+            stats.tracked_users = len(self.user_bytes)
+            return stats
 
+    def get_user_usage(self, user_id: Optional[str]) -> Dict[str, Any]:
+        """Bytes and entries held in memory by one user, against their quota"""
+        owner = self._owner(user_id)
+        with self._lock:
+            return {
+                "entries": len(self.user_keys.get(owner, ())),
+                "bytes": self.user_bytes.get(owner, 0),
+                "quota_bytes": self.per_user_quota_bytes,
+            }
 
 
 def semantic_cache_decorator(ttl: int = 3600, operation_type: str = "generic"):
     """
     Decorator for caching semantic intelligence operations
-    
+
     Args:
         ttl: Time to live in seconds
         operation_type: Type of semantic operation being cached
@@ -499,39 +815,38 @@ def semantic_cache_decorator(ttl: int = 3600, operation_type: str = "generic"):
             cache_manager = getattr(self, 'cache_manager', None)
             if not cache_manager:
                 return await func(self, *args, **kwargs)
-            
+
             # Generate cache key from function and arguments
-            user_id = kwargs.get('user_id') or (args[0] if args else 'unknown')
+            user_id = kwargs.get('user_id') or getattr(self, 'user_id', None) or 'unknown'
             cache_key = cache_manager._generate_cache_key(
                 operation_type,
                 user_id,
-                {"args": args, "kwargs": kwargs}
+                {"function": func.__qualname__, "args": args, "kwargs": kwargs}
             )
-            
+
             # Try to get from cache
-            cached_result = cache_manager.memory_cache.get(cache_key)
-            if cached_result and cache_manager._is_entry_valid(cached_result):
+            cached_result = cache_manager.get(cache_key, user_id)
+            if cached_result is not None:
                 logger.debug(f"Cache hit for {operation_type} operation")
-                return cached_result.data
-            
+                return cached_result
+
             # Execute function and cache result
             result = await func(self, *args, **kwargs)
-            
+
             if result:
-                entry = CacheEntry(
-                    data=result,
-                    timestamp=time.time(),
+                cache_manager.set(
+                    cache_key,
+                    result,
                     ttl=ttl,
-                    version=cache_manager._get_current_version(),
-                    metadata={"operation": operation_type, "user_id": user_id}
+                    user_id=user_id,
+                    metadata={"operation": operation_type}
                 )
-                cache_manager.memory_cache[cache_key] = entry
-            
+
             return result
-        
+
         return wrapper
     return decorator
 
 
 # Global cache manager instance
-semantic_cache_manager = SemanticCacheManager()
\ No newline at end of file
+semantic_cache_manager = SemanticCacheManager()
@@ -757,12 +757,14 @@ def track_video_usage(
     provider: str,
     model_name: str,
     prompt: str,
-    video_bytes: bytes,
+    video_bytes: Optional[bytes] = None,
     cost_override: Optional[float] = None,
     response_time: float = 0.0,
+    video_size: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Track subscription usage for any video generation (text-to-video or image-to-video).
+    Pass video_size instead of video_bytes when the video was streamed to disk.
     """
     from datetime import datetime
 
@@ -855,7 +857,7 @@ def track_video_usage(
             response_time=response_time,  # Use actual response time
             status_code=200,
             request_size=len((prompt or "").encode("utf-8")),
-            response_size=len(video_bytes),
+            response_size=video_size if video_size is not None else len(video_bytes or b""),
             billing_period=current_period,
         )
         db_track.add(usage_log)
@@ -12,7 +12,6 @@ Each model has its own service class for separation of concerns.
 
 from __future__ import annotations
 
-import asyncio
 import requests
 from typing import Optional, Dict, Any, Callable
 from fastapi import HTTPException
@@ -314,8 +313,7 @@ class HunyuanVideoService(BaseWaveSpeedTextToVideoService):
         
         # Poll for completion with progress updates
         try:
-            result = await asyncio.to_thread(
-                self.client.poll_until_complete,
+            result = await self.client.poll_until_complete_async(
                 prediction_id,
                 timeout_seconds=600,  # 10 minutes max
                 interval_seconds=0.5,  # Poll every 0.5 seconds (as per example)
@@ -586,8 +584,7 @@ class LTX2ProService(BaseWaveSpeedTextToVideoService):
         
         # Poll for completion with progress updates
         try:
-            result = await asyncio.to_thread(
-                self.client.poll_until_complete,
+            result = await self.client.poll_until_complete_async(
                 prediction_id,
                 timeout_seconds=600,  # 10 minutes max
                 interval_seconds=0.5,  # Poll every 0.5 seconds
@@ -873,8 +870,7 @@ class GoogleVeo31Service(BaseWaveSpeedTextToVideoService):
         
         # Poll for completion with progress updates
         try:
-            result = await asyncio.to_thread(
-                self.client.poll_until_complete,
+            result = await self.client.poll_until_complete_async(
                 prediction_id,
                 timeout_seconds=600,  # 10 minutes max
                 interval_seconds=0.5,  # Poll every 0.5 seconds
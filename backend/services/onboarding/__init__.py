@@ -7,6 +7,7 @@ All onboarding data is stored in the database with proper user isolation.
 Services:
 - OnboardingDataIntegrationService: Canonical SSOT for onboarding data
 - OnboardingProgressService: Progress tracking and step management
+- onboarding_status_cache: In-memory onboarding status snapshots (write-through)
 - APIKeyManager: API key management
 
 
@@ -19,10 +20,13 @@ Architecture:
 
 # Import all public classes for easy access
 from .progress_service import OnboardingProgressService
+from .status_cache import OnboardingStatusCache, onboarding_status_cache
 from .api_key_manager import OnboardingProgress, APIKeyManager, get_onboarding_progress, get_user_onboarding_progress, get_onboarding_progress_for_user
 
 __all__ = [
     'OnboardingProgressService', 
+    'OnboardingStatusCache',
+    'onboarding_status_cache',
     'OnboardingProgress',
     'APIKeyManager',
     'get_onboarding_progress',
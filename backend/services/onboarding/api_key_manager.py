@@ -13,6 +13,7 @@ from enum import Enum
 
 from services.database import get_session_for_user
 from models.onboarding import OnboardingSession, APIKey, WebsiteAnalysis, ResearchPreferences, PersonaData
+from .status_cache import onboarding_status_cache
 
 
 class StepStatus(Enum):
@@ -354,6 +355,7 @@ class OnboardingProgress:
                 session.updated_at = datetime.utcnow()
                 
                 db.commit()
+                onboarding_status_cache.write_session(self.user_id, session)
                 
                 # Save step-specific data to appropriate tables
                 for step in self.steps:
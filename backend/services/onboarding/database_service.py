@@ -15,6 +15,7 @@ from sqlalchemy import text
 
 from models.onboarding import OnboardingSession, APIKey, WebsiteAnalysis, ResearchPreferences, PersonaData
 from services.database import get_db
+from .status_cache import onboarding_status_cache
 
 
 class OnboardingDatabaseService:
@@ -180,6 +181,7 @@ class OnboardingDatabaseService:
             session_db.add(session)
             session_db.commit()
             session_db.refresh(session)
+            onboarding_status_cache.write_session(user_id, session)
             
             logger.info(f"Created new onboarding session for user {user_id}")
             return session
@@ -214,6 +216,7 @@ class OnboardingDatabaseService:
             session.current_step = step_number
             session.updated_at = datetime.now()
             session_db.commit()
+            onboarding_status_cache.write_session(user_id, session)
             
             logger.info(f"Updated user {user_id} to step {step_number}")
             return True
@@ -234,6 +237,7 @@ class OnboardingDatabaseService:
             session.progress = progress
             session.updated_at = datetime.now()
             session_db.commit()
+            onboarding_status_cache.write_session(user_id, session)
             
             logger.info(f"Updated user {user_id} progress to {progress}%")
             return True
@@ -695,6 +699,7 @@ class OnboardingDatabaseService:
             session.progress = 100.0
             session.updated_at = datetime.now()
             session_db.commit()
+            onboarding_status_cache.write_session(user_id, session)
             
             logger.info(f"Marked onboarding complete for user {user_id}")
             return True
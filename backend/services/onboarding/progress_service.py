@@ -12,6 +12,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from services.database import SessionLocal, get_session_for_user
 from models.onboarding import OnboardingSession
+from .status_cache import build_onboarding_status, normalize_user_id, onboarding_status_cache
 
 
 class OnboardingProgressService:
@@ -44,7 +45,13 @@ class OnboardingProgressService:
             return {}
 
     def get_onboarding_status(self, user_id: str) -> Dict[str, Any]:
-        """Get current onboarding status from database."""
+        """Get current onboarding status (cached snapshot, loaded from the database on first use)."""
+        use_cache = onboarding_status_cache.enabled()
+        if use_cache:
+            cached = onboarding_status_cache.get(user_id)
+            if cached is not None:
+                return cached
+            version = onboarding_status_cache.version(user_id)
         try:
             db = get_session_for_user(user_id)
             try:
@@ -54,53 +61,29 @@ class OnboardingProgressService:
                 # Fallback for sanitized/derived IDs (e.g., workspace-safe IDs)
                 # by comparing normalized IDs from existing onboarding rows.
                 if not session:
-                    normalized_requested = ''.join(c for c in str(user_id) if c.isalnum() or c in ('-', '_'))
+                    normalized_requested = normalize_user_id(user_id)
                     candidate_sessions = db.query(OnboardingSession).all()
                     for candidate in candidate_sessions:
-                        candidate_user_id = str(candidate.user_id or '')
-                        normalized_candidate = ''.join(
-                            c for c in candidate_user_id if c.isalnum() or c in ('-', '_')
-                        )
-                        if normalized_candidate == normalized_requested:
+                        if normalize_user_id(candidate.user_id) == normalized_requested:
                             session = candidate
                             break
 
                 if not session:
-                    return {
-                        "is_completed": False,
-                        "current_step": 1,
-                        "completion_percentage": 0.0,
-                        "started_at": None,
-                        "last_updated": None,
-                        "completed_at": None
-                    }
-                
-                # Check if onboarding is complete
-                # Consider complete if either the final step is reached OR progress hit 100%
-                is_completed = (session.current_step >= 6) or (session.progress >= 100.0)
-                
-                return {
-                    "is_completed": is_completed,
-                    "current_step": session.current_step,
-                    "completion_percentage": session.progress,
-                    "started_at": session.started_at.isoformat() if session.started_at else None,
-                    "last_updated": session.updated_at.isoformat() if session.updated_at else None,
-                    "completed_at": session.updated_at.isoformat() if is_completed else None
-                }
+                    status = build_onboarding_status(None, None)
+                else:
+                    status = build_onboarding_status(
+                        session.current_step, session.progress, session.started_at, session.updated_at
+                    )
+                if use_cache:
+                    onboarding_status_cache.store_loaded(user_id, status, version)
+                return status
                 
             finally:
                 db.close()
                 
         except Exception as e:
             logger.error(f"Error getting onboarding status: {e}")
-            return {
-                "is_completed": False,
-                "current_step": 1,
-                "completion_percentage": 0.0,
-                "started_at": None,
-                "last_updated": None,
-                "completed_at": None
-            }
+            return build_onboarding_status(None, None)
     
     def update_step(self, user_id: str, step_number: int) -> bool:
         """Update current step in database."""
@@ -123,6 +106,7 @@ class OnboardingProgressService:
                     session.updated_at = datetime.utcnow()
                 
                 db.commit()
+                onboarding_status_cache.write_session(user_id, session)
                 logger.info(f"Updated user {user_id} to step {step_number}")
                 return True
             finally:
@@ -141,6 +125,7 @@ class OnboardingProgressService:
                     session.progress = progress_percentage
                     session.updated_at = datetime.utcnow()
                     db.commit()
+                    onboarding_status_cache.write_session(user_id, session)
                     logger.info(f"Updated user {user_id} progress to {progress_percentage}%")
                     return True
                 return False
@@ -161,6 +146,7 @@ class OnboardingProgressService:
                     session.current_step = 6  # Assuming 6 is complete
                     session.updated_at = datetime.utcnow()
                     db.commit()
+                    onboarding_status_cache.write_session(user_id, session)
                     return True
                 return False
             finally:
@@ -181,6 +167,7 @@ class OnboardingProgressService:
                     session.progress = 0.0
                     session.updated_at = datetime.utcnow()
                 db.commit()
+                onboarding_status_cache.write_session(user_id, session)
             finally:
                 db.close()
 
@@ -0,0 +1,142 @@
+"""
+Onboarding Status Snapshot Cache
+
+In-memory snapshot of each user's onboarding status (the dict returned by
+OnboardingProgressService.get_onboarding_status), so the scheduler's check cycle and
+API routes read it with a dictionary lookup instead of a database query.
+
+- Write-through: the code that changes a user's onboarding session (step, progress,
+  completion, reset) stores the new snapshot right after its commit. There is no TTL.
+- Versioned: every write bumps the user's version. A reader that loaded the status
+  from the database only stores it if no write happened while it was loading, so a
+  slow read can never overwrite a newer snapshot with an older one.
+- Snapshots are keyed by user ID; a write also drops snapshots cached under other IDs
+  that normalize to the same user (see get_onboarding_status's sanitized-ID fallback).
+
+The cache is per process: onboarding writes made by another worker process are not
+seen. Disable it when onboarding requests are served by several worker processes.
+
+Configuration (environment):
+    ALWRITY_ONBOARDING_STATUS_CACHE_DISABLED   "true" always reads the database
+"""
+
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional, Set, Tuple
+
+
+def normalize_user_id(user_id: Any) -> str:
+    """The sanitized form of a user ID used for workspace-safe IDs."""
+    return ''.join(c for c in str(user_id or '') if c.isalnum() or c in ('-', '_'))
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def build_onboarding_status(
+    current_step: Optional[int],
+    progress: Optional[float],
+    started_at: Optional[datetime] = None,
+    updated_at: Optional[datetime] = None,
+) -> Dict[str, Any]:
+    """Onboarding status dict for a session's fields; no session is reported as step 1."""
+    if current_step is None:
+        return {
+            "is_completed": False,
+            "current_step": 1,
+            "completion_percentage": 0.0,
+            "started_at": None,
+            "last_updated": None,
+            "completed_at": None
+        }
+    # Consider complete if either the final step is reached OR progress hit 100%
+    is_completed = (current_step >= 6) or ((progress or 0.0) >= 100.0)
+    return {
+        "is_completed": is_completed,
+        "current_step": current_step,
+        "completion_percentage": progress,
+        "started_at": _isoformat(started_at),
+        "last_updated": _isoformat(updated_at),
+        "completed_at": _isoformat(updated_at) if is_completed else None
+    }
+
+
+class OnboardingStatusCache:
+    """Per-user onboarding status snapshots with write-through updates."""
+
+    def __init__(self):
+        # user_id -> (version, status)
+        self._snapshots: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        # Versions and aliases are per normalized user ID, so a write through any
+        # form of the ID invalidates reads through the others
+        self._versions: Dict[str, int] = {}
+        self._aliases: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def enabled() -> bool:
+        return os.getenv("ALWRITY_ONBOARDING_STATUS_CACHE_DISABLED", "").lower() not in ("1", "true", "yes")
+
+    def get(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """Cached status for a user (a copy), or None."""
+        snapshot = self._snapshots.get(user_id)
+        return dict(snapshot[1]) if snapshot is not None else None
+
+    def version(self, user_id: str) -> int:
+        """Current version for a user; pass it to store_loaded() after reading the database."""
+        return self._versions.get(normalize_user_id(user_id), 0)
+
+    def store_loaded(self, user_id: str, status: Dict[str, Any], version: int) -> bool:
+        """Cache a status read from the database, unless a write happened since `version` was taken."""
+        with self._lock:
+            if self._versions.get(normalize_user_id(user_id), 0) != version:
+                return False
+            self._put(user_id, version, status)
+            return True
+
+    def write(self, user_id: str, status: Optional[Dict[str, Any]]) -> None:
+        """
+        Record an onboarding write for a user: store its new status, or drop the
+        snapshot when the new status is unknown (status=None).
+        """
+        normalized = normalize_user_id(user_id)
+        with self._lock:
+            version = self._versions.get(normalized, 0) + 1
+            self._versions[normalized] = version
+            for alias in self._aliases.pop(normalized, set()):
+                self._snapshots.pop(alias, None)
+            if status is not None:
+                self._put(user_id, version, status)
+
+    def write_session(self, user_id: str, session: Any) -> None:
+        """
+        write() with the status of a committed OnboardingSession row. Call it while the
+        row's database session is still open; if the row cannot be read, the snapshot
+        is dropped instead.
+        """
+        try:
+            status = build_onboarding_status(
+                session.current_step, session.progress, session.started_at, session.updated_at
+            ) if session is not None else None
+        except Exception:
+            status = None
+        self.write(user_id, status)
+
+    def clear(self) -> None:
+        with self._lock:
+            for normalized in self._versions:
+                self._versions[normalized] += 1
+            self._snapshots.clear()
+            self._aliases.clear()
+
+    def _put(self, user_id: str, version: int, status: Dict[str, Any]) -> None:
+        self._snapshots[user_id] = (version, dict(status))
+        self._aliases.setdefault(normalize_user_id(user_id), set()).add(user_id)
+
+    def stats(self) -> Dict[str, int]:
+        return {"users": len(self._snapshots)}
+
+
+onboarding_status_cache = OnboardingStatusCache()
@@ -13,6 +13,8 @@ from typing import List, Dict, Any, Optional
 from pathlib import Path
 from loguru import logger
 
+from utils.video_concat import VideoConcatError, concat_videos, get_ffmpeg_exe
+
 
 class PodcastVideoCombinationService:
     """Service for combining podcast scene videos into final episodes."""
@@ -84,7 +86,58 @@ class PodcastVideoCombinationService:
             raise ValueError("No valid video files found to combine")
         
         logger.info(f"[PodcastVideoCombination] Combining {len(valid_video_paths)} videos")
+        video_filename = self._generate_video_filename(podcast_title)
+        
+        # Scene clips from the same model share codec/resolution/fps, so ffmpeg can join them
+        # without re-encoding; MoviePy stays as the fallback when ffmpeg is missing or fails.
+        if get_ffmpeg_exe():
+            try:
+                return self._combine_with_ffmpeg(valid_video_paths, video_filename, fps, progress_callback)
+            except VideoConcatError as e:
+                logger.warning(f"[PodcastVideoCombination] ffmpeg concat failed, falling back to MoviePy: {e}")
+        
+        return self._combine_with_moviepy(valid_video_paths, video_filename, fps, progress_callback)
+    
+    def _combine_with_ffmpeg(
+        self,
+        video_paths: List[str],
+        video_filename: str,
+        fps: int,
+        progress_callback: Optional[callable] = None,
+    ) -> Dict[str, Any]:
+        """Join clips with the ffmpeg concat demuxer (stream copy when the clips are compatible)."""
+        video_path = self.output_dir / video_filename
         
+        def report(percent: float, message: str):
+            if progress_callback:
+                progress_callback(10.0 + percent * 0.89, message)
+        
+        if progress_callback:
+            progress_callback(5.0, "Inspecting scene clips...")
+        
+        result = concat_videos(video_paths, video_path, progress_callback=report, fps=fps)
+        
+        if progress_callback:
+            progress_callback(100.0, "Video combination complete!")
+        
+        return {
+            "video_path": result["video_path"],
+            "video_filename": video_filename,
+            "video_url": f"/api/podcast/final-videos/{video_filename}",
+            "duration": result["duration"],
+            "fps": result["fps"],
+            "file_size": result["file_size"],
+            "num_scenes": result["num_clips"],
+        }
+    
+    def _combine_with_moviepy(
+        self,
+        valid_video_paths: List[str],
+        video_filename: str,
+        fps: int,
+        progress_callback: Optional[callable] = None,
+    ) -> Dict[str, Any]:
+        """Load, concatenate and re-encode every clip with MoviePy."""
         try:
             # Import MoviePy
             try:
@@ -145,8 +198,6 @@ class PodcastVideoCombinationService:
             final_video = concatenate_videoclips(video_clips, method="compose")
             logger.info(f"[PodcastVideoCombination] Concatenation complete, final video duration: {final_video.duration:.2f}s")
             
-            # Generate output filename
-            video_filename = self._generate_video_filename(podcast_title)
             video_path = self.output_dir / video_filename
             
             if progress_callback:
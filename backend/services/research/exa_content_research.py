@@ -17,6 +17,8 @@ import asyncio
 from typing import List, Dict, Any, Optional
 from loguru import logger
 
+from services.cache.search_cache import search_cache
+
 
 class ExaContentResearchProvider:
     """Exa neural search provider for content research."""
@@ -41,7 +43,7 @@ class ExaContentResearchProvider:
     ) -> List[Dict[str, Any]]:
         """
         Simple Exa search for content research and fact-checking.
-        Handles subscription preflight check and usage tracking.
+        Handles subscription preflight check, usage tracking and the shared search cache.
         
         Args:
             query: Search query string
@@ -102,48 +104,52 @@ class ExaContentResearchProvider:
         if exclude_domains:
             search_kwargs["exclude_domains"] = exclude_domains
         
-        try:
-            loop = asyncio.get_running_loop()
-            results = await loop.run_in_executor(
-                None,
-                lambda: self.exa.search_and_contents(query, **search_kwargs),
-            )
-        except Exception as e:
-            logger.error(f"[Exa simple_search] API call failed: {e}")
-            # Retry with simpler parameters
-            retry_kwargs = {"type": "auto", "num_results": num_results, "text": True}
-            if include_domains:
-                retry_kwargs["include_domains"] = include_domains
-            if exclude_domains:
-                retry_kwargs["exclude_domains"] = exclude_domains
+        async def fetch() -> List[Dict[str, Any]]:
             try:
-                logger.info("[Exa simple_search] Retrying with simplified parameters")
+                loop = asyncio.get_running_loop()
                 results = await loop.run_in_executor(
                     None,
-                    lambda: self.exa.search_and_contents(query, **retry_kwargs),
+                    lambda: self.exa.search_and_contents(query, **search_kwargs),
                 )
-            except Exception as retry_error:
-                logger.error(f"[Exa simple_search] Retry also failed: {retry_error}")
-                raise RuntimeError(f"Exa search failed: {str(retry_error)}") from retry_error
+            except Exception as e:
+                logger.error(f"[Exa simple_search] API call failed: {e}")
+                # Retry with simpler parameters
+                retry_kwargs = {"type": "auto", "num_results": num_results, "text": True}
+                if include_domains:
+                    retry_kwargs["include_domains"] = include_domains
+                if exclude_domains:
+                    retry_kwargs["exclude_domains"] = exclude_domains
+                try:
+                    logger.info("[Exa simple_search] Retrying with simplified parameters")
+                    results = await loop.run_in_executor(
+                        None,
+                        lambda: self.exa.search_and_contents(query, **retry_kwargs),
+                    )
+                except Exception as retry_error:
+                    logger.error(f"[Exa simple_search] Retry also failed: {retry_error}")
+                    raise RuntimeError(f"Exa search failed: {str(retry_error)}") from retry_error
         
-        sources = []
-        for result in results.results:
-            sources.append({
-                'title': getattr(result, 'title', 'Untitled'),
-                'url': getattr(result, 'url', ''),
-                'text': getattr(result, 'text', ''),
-                'publishedDate': getattr(result, 'publishedDate', ''),
-                'author': getattr(result, 'author', ''),
-                'score': (lambda v: v if v is not None else 0.5)(getattr(result, 'score', 0.5)),
-            })
+            sources = []
+            for result in results.results:
+                sources.append({
+                    'title': getattr(result, 'title', 'Untitled'),
+                    'url': getattr(result, 'url', ''),
+                    'text': getattr(result, 'text', ''),
+                    'publishedDate': getattr(result, 'publishedDate', ''),
+                    'author': getattr(result, 'author', ''),
+                    'score': (lambda v: v if v is not None else 0.5)(getattr(result, 'score', 0.5)),
+                })
         
-        # Track usage
-        if user_id:
-            cost = 0.005  # ~0.5 cents per search
-            try:
-                self.track_usage(user_id, cost)
-            except Exception as e:
-                logger.warning(f"[Exa simple_search] Failed to track usage: {e}")
+            # Track usage (only searches that reach the API; cache hits are free)
+            if user_id:
+                cost = 0.005  # ~0.5 cents per search
+                try:
+                    self.track_usage(user_id, cost)
+                except Exception as e:
+                    logger.warning(f"[Exa simple_search] Failed to track usage: {e}")
+            return sources
+        
+        sources = await search_cache.get_or_fetch("exa", query, fetch, options=search_kwargs, cost=0.005)
         
         logger.info(f"[Exa simple_search] Found {len(sources)} sources for query: {query[:80]}...")
         return sources
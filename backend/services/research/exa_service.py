@@ -8,7 +8,7 @@ Key Features:
 - Competitor discovery using neural search
 - Content analysis and summarization
 - Competitive intelligence gathering
-- Cost-effective API usage with caching
+- Cost-effective API usage with caching (shared search result cache)
 - Integration with onboarding Step 3
 
 Dependencies:
@@ -30,6 +30,8 @@ from loguru import logger
 from urllib.parse import urlparse
 from exa_py import Exa
 
+from services.cache.search_cache import search_cache
+
 class ExaService:
     """
     Service for competitor discovery and analysis using the Exa API.
@@ -80,6 +82,8 @@ class ExaService:
         """
         Discover competitors for a given website using Exa's neural search.
         
+        Successful discoveries are served from the shared search result cache.
+        
         Args:
             user_url: The website URL to find competitors for
             num_results: Number of competitor results to return (max 100)
@@ -90,6 +94,34 @@ class ExaService:
         Returns:
             Dictionary containing competitor analysis results
         """
+        return await search_cache.get_or_fetch(
+            "exa",
+            f"similar:{user_url}",
+            lambda: self._discover_competitors(
+                user_url, num_results, include_domains, exclude_domains,
+                industry_context, website_analysis_data
+            ),
+            options={
+                "num_results": min(num_results, 10),
+                "include_domains": include_domains,
+                "exclude_domains": exclude_domains,
+                "industry_context": industry_context,
+                "analysis": (website_analysis_data or {}).get("analysis"),
+            },
+            cost=self.get_cost_estimate(min(num_results, 10))["total_estimated_cost"],
+            freshness="evergreen",
+        )
+    
+    async def _discover_competitors(
+        self,
+        user_url: str,
+        num_results: int,
+        include_domains: Optional[List[str]],
+        exclude_domains: Optional[List[str]],
+        industry_context: Optional[str],
+        website_analysis_data: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Uncached competitor discovery (see discover_competitors)."""
         try:
             # Ensure we pick up any per-request injected key
             self._try_initialize()
@@ -460,12 +492,25 @@ class ExaService:
         """
         Discover social media accounts for a given website using Exa's answer API.
         
+        Successful discoveries are served from the shared search result cache.
+        
         Args:
             user_url: The website URL to find social media accounts for
             
         Returns:
             Dictionary containing social media discovery results
         """
+        domain = urlparse(user_url).netloc.replace('www.', '') or user_url
+        return await search_cache.get_or_fetch(
+            "exa",
+            f"social:{domain}",
+            lambda: self._discover_social_media_accounts(user_url),
+            cost=0.005,
+            freshness="evergreen",
+        )
+    
+    async def _discover_social_media_accounts(self, user_url: str) -> Dict[str, Any]:
+        """Uncached social media discovery (see discover_social_media_accounts)."""
         try:
             # Ensure we pick up any per-request injected key
             self._try_initialize()
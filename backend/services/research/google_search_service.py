@@ -30,6 +30,9 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from loguru import logger
 
+from services.cache.search_cache import search_cache
+
+
 class GoogleSearchService:
     """
     Service for conducting real industry research using Google Custom Search API.
@@ -171,15 +174,25 @@ class GoogleSearchService:
                 else:
                     params[k] = v
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(self.base_url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data.get("items", [])
-                else:
-                    error_text = await response.text()
-                    logger.error(f"Google Search API error: {response.status} - {error_text}")
-                    raise Exception(f"Search API returned status {response.status}")
+        async def fetch() -> List[Dict[str, Any]]:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(self.base_url, params=params) as response:
+                    if response.status == 200:
+                        data = await response.json()
+                        return data.get("items", [])
+                    else:
+                        error_text = await response.text()
+                        logger.error(f"Google Search API error: {response.status} - {error_text}")
+                        raise Exception(f"Search API returned status {response.status}")
+        
+        # Custom Search JSON API: $5 per 1000 queries beyond the free tier
+        return await search_cache.get_or_fetch(
+            "google_cse",
+            query,
+            fetch,
+            options={k: v for k, v in params.items() if k not in ("key", "q")},
+            cost=0.005,
+        )
     
     async def _process_search_results(
         self, 
@@ -4,6 +4,7 @@ Research Intent Package
 This package provides intent-driven research capabilities:
 - Intent inference from user input
 - Targeted query generation
+- Concurrent execution of the generated queries
 - Intent-aware result analysis
 
 Author: ALwrity Team
@@ -14,10 +15,13 @@ from .research_intent_inference import ResearchIntentInference
 from .intent_query_generator import IntentQueryGenerator
 from .intent_aware_analyzer import IntentAwareAnalyzer
 from .intent_prompt_builder import IntentPromptBuilder
+from .research_executor import IntentResearchExecutor, ResearchResultAccumulator
 
 __all__ = [
     "ResearchIntentInference",
     "IntentQueryGenerator", 
     "IntentAwareAnalyzer",
     "IntentPromptBuilder",
+    "IntentResearchExecutor",
+    "ResearchResultAccumulator",
 ]
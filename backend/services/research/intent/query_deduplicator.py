@@ -45,6 +45,17 @@ def deduplicate_queries(
     
     deduplicated = []
     seen_keywords = set()
+    # Kept queries grouped by what must match for a merge, with their word sets
+    # computed once, so each query is only compared with its possible duplicates
+    merge_groups = {}
+    
+    def merge_group(query: ResearchQuery):
+        return (
+            query.purpose,
+            query.provider,
+            frozenset(query.targets_focus_areas),
+            frozenset(query.covers_also_answering),
+        )
     
     # Add primary queries first (should be only one, but handle multiple)
     for query in primary_queries:
@@ -52,6 +63,7 @@ def deduplicate_queries(
         if query_key not in seen_keywords:
             seen_keywords.add(query_key)
             deduplicated.append(query)
+            merge_groups.setdefault(merge_group(query), []).append((query, frozenset(query_key[0].split())))
     
     # Process other queries with similarity checking
     for query in other_queries:
@@ -61,57 +73,44 @@ def deduplicate_queries(
         if query_key in seen_keywords:
             continue
         
-        # Check for semantic similarity with existing queries
-        query_words = set(query.query.lower().split())
+        query_words = frozenset(query_key[0].split())
         is_duplicate = False
         
-        for existing in deduplicated:
-            existing_words = set(existing.query.lower().split())
-            
-            # Calculate Jaccard similarity (intersection over union)
-            intersection = query_words & existing_words
-            union = query_words | existing_words
-            similarity = len(intersection) / len(union) if union else 0
-            
-            # CRITICAL: Don't merge queries that target different focus areas or also_answering topics
-            # These should remain separate even if they're similar
-            query_focus_areas = set(query.targets_focus_areas)
-            existing_focus_areas = set(existing.targets_focus_areas)
-            query_also_answering = set(query.covers_also_answering)
-            existing_also_answering = set(existing.covers_also_answering)
-            
-            # If queries target different focus areas, keep them separate
-            if query_focus_areas and existing_focus_areas and query_focus_areas != existing_focus_areas:
-                continue  # Keep separate - different focus areas
-            
-            # If queries cover different also_answering topics, keep them separate
-            if query_also_answering and existing_also_answering and query_also_answering != existing_also_answering:
-                continue  # Keep separate - different also_answering topics
+        # Only merge queries with the same purpose/provider that target the same focus
+        # areas and also_answering topics; queries targeting different ones stay separate
+        group = merge_groups.setdefault(merge_group(query), [])
+        for existing, existing_words in group:
+            # Jaccard similarity (intersection over union) can only exceed 0.9
+            # when the word sets are within 10% of each other in size
+            smaller, larger = sorted((len(query_words), len(existing_words)))
+            if not larger or smaller <= 0.9 * larger:
+                continue
+            union = len(query_words | existing_words)
+            similarity = len(query_words & existing_words) / union if union else 0
             
-            # Only consider duplicate if >90% similarity (increased from 80%) AND same purpose/provider AND same focus/also_answering
+            # Only consider duplicate if >90% similarity (increased from 80%)
             # This is more strict to avoid over-deduplication
-            if similarity > 0.9 and query.purpose == existing.purpose and query.provider == existing.provider:
-                # Only merge if they truly target the same things
-                if query_focus_areas == existing_focus_areas and query_also_answering == existing_also_answering:
-                    is_duplicate = True
-                    # Merge: update existing query's linking arrays
-                    existing.addresses_secondary_questions = list(set(
-                        existing.addresses_secondary_questions + query.addresses_secondary_questions
-                    ))
-                    existing.targets_focus_areas = list(set(
-                        existing.targets_focus_areas + query.targets_focus_areas
-                    ))
-                    existing.covers_also_answering = list(set(
-                        existing.covers_also_answering + query.covers_also_answering
-                    ))
-                    # Update expected_results to reflect merged coverage
-                    if query.expected_results and query.expected_results not in existing.expected_results:
-                        existing.expected_results += f" Also covers: {query.expected_results}"
-                    break
+            if similarity > 0.9:
+                is_duplicate = True
+                # Merge: update existing query's linking arrays
+                existing.addresses_secondary_questions = list(set(
+                    existing.addresses_secondary_questions + query.addresses_secondary_questions
+                ))
+                existing.targets_focus_areas = list(set(
+                    existing.targets_focus_areas + query.targets_focus_areas
+                ))
+                existing.covers_also_answering = list(set(
+                    existing.covers_also_answering + query.covers_also_answering
+                ))
+                # Update expected_results to reflect merged coverage
+                if query.expected_results and query.expected_results not in existing.expected_results:
+                    existing.expected_results += f" Also covers: {query.expected_results}"
+                break
         
         if not is_duplicate:
             deduplicated.append(query)
             seen_keywords.add(query_key)
+            group.append((query, query_words))
         
         # Limit to 8 queries total
         if len(deduplicated) >= 8:
@@ -0,0 +1,330 @@
+"""
+Intent Research Executor
+
+Runs every query generated for a research intent, instead of only the primary one.
+
+- All queries run concurrently. Each provider has its own concurrency limit per
+  request, and Exa/Tavily calls are paced by the process-wide token buckets
+  (utils.token_bucket) shared with the other callers of those APIs.
+- Results are yielded as each query completes, so the caller merges them
+  (ResearchResultAccumulator) while slower queries are still in flight.
+- A query whose provider is not configured, or whose subscription preflight fails,
+  falls back to the next provider (exa -> tavily -> google), like ResearchEngine.
+- Failed and timed-out queries are reported in their outcome, never raised, so one
+  bad query does not lose the results of the others.
+
+Configuration (environment):
+    ALWRITY_RESEARCH_EXA_CONCURRENCY      concurrent Exa queries per request (default 4)
+    ALWRITY_RESEARCH_TAVILY_CONCURRENCY   concurrent Tavily queries per request (default 4)
+    ALWRITY_RESEARCH_GOOGLE_CONCURRENCY   concurrent Google grounding calls per request (default 2)
+    ALWRITY_RESEARCH_QUERY_TIMEOUT        seconds allowed per query (default 90)
+"""
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
+from urllib.parse import urldefrag
+
+from loguru import logger
+
+from models.blog_models import ResearchConfig
+from models.research_intent_models import ResearchQuery
+from utils.token_bucket import get_token_bucket
+
+PROVIDER_ORDER = ("exa", "tavily", "google")
+
+_DEFAULT_CONCURRENCY = {"exa": 4, "tavily": 4, "google": 2}
+
+# Token bucket (name, requests per second) pacing each search API across the process
+_RATE_LIMITS = {"exa": ("exa_search", 5), "tavily": ("tavily_search", 10)}
+
+SearchFunction = Callable[[str, ResearchQuery], Awaitable[Dict[str, Any]]]
+
+
+def _concurrency(provider: str) -> int:
+    try:
+        return max(1, int(os.getenv(f"ALWRITY_RESEARCH_{provider.upper()}_CONCURRENCY", _DEFAULT_CONCURRENCY[provider])))
+    except ValueError:
+        return _DEFAULT_CONCURRENCY[provider]
+
+
+@dataclass
+class QueryOutcome:
+    """Result of one research query."""
+    index: int
+    query: ResearchQuery
+    provider: Optional[str]
+    sources: List[Dict[str, Any]] = field(default_factory=list)
+    content: str = ""
+    answer: Optional[str] = None
+    grounding_metadata: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    duration_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class IntentResearchExecutor:
+    """Fans intent queries out across Exa, Tavily and Google and streams the outcomes."""
+
+    def __init__(
+        self,
+        available_providers: Optional[Set[str]] = None,
+        search: Optional[SearchFunction] = None,
+        query_timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            available_providers: Providers that may be used; defaults to the configured ones
+            search: Override for the per-query search call, ``search(provider, query)``
+            query_timeout: Seconds allowed per query
+        """
+        if available_providers is None:
+            available_providers = {"google"}
+            if os.getenv("EXA_API_KEY"):
+                available_providers.add("exa")
+            if os.getenv("TAVILY_API_KEY"):
+                available_providers.add("tavily")
+        self.available_providers = set(available_providers)
+        self._search_override = search
+        self.query_timeout = query_timeout if query_timeout is not None else float(
+            os.getenv("ALWRITY_RESEARCH_QUERY_TIMEOUT", "90")
+        )
+
+    def resolve_provider(self, requested: Optional[str]) -> Optional[str]:
+        """The requested provider if usable, else the next one in PROVIDER_ORDER."""
+        requested = (requested or "exa").lower()
+        if requested in self.available_providers:
+            return requested
+        for name in PROVIDER_ORDER[PROVIDER_ORDER.index(requested) + 1 if requested in PROVIDER_ORDER else 0:]:
+            if name in self.available_providers:
+                return name
+        return next((name for name in PROVIDER_ORDER if name in self.available_providers), None)
+
+    async def stream(
+        self,
+        queries: List[ResearchQuery],
+        config: Optional[ResearchConfig] = None,
+        user_id: Optional[str] = None,
+        industry: str = "",
+        target_audience: str = "",
+    ) -> AsyncIterator[QueryOutcome]:
+        """
+        Run all queries concurrently and yield each QueryOutcome as soon as it completes.
+
+        Closing the generator early cancels the queries still running.
+        """
+        config = config or ResearchConfig()
+        if self._search_override is None and user_id:
+            await self._preflight(user_id, {self.resolve_provider(q.provider) for q in queries})
+
+        slots = {name: asyncio.Semaphore(_concurrency(name)) for name in PROVIDER_ORDER}
+
+        async def run(index: int, query: ResearchQuery) -> QueryOutcome:
+            provider = self.resolve_provider(query.provider)
+            outcome = QueryOutcome(index=index, query=query, provider=provider)
+            if provider is None:
+                outcome.error = "No research provider available"
+                return outcome
+            async with slots[provider]:
+                started = time.perf_counter()
+                try:
+                    if provider in _RATE_LIMITS:
+                        await get_token_bucket(*_RATE_LIMITS[provider]).acquire()
+                    raw = await asyncio.wait_for(
+                        self._search(provider, query, config, user_id, industry, target_audience),
+                        timeout=self.query_timeout,
+                    )
+                    outcome.sources = [s if isinstance(s, dict) else _source_dict(s) for s in raw.get("sources") or []]
+                    outcome.content = raw.get("content") or ""
+                    outcome.answer = raw.get("answer")
+                    outcome.grounding_metadata = raw.get("grounding_metadata")
+                except asyncio.TimeoutError:
+                    outcome.error = f"Timed out after {self.query_timeout:.0f}s"
+                except Exception as e:
+                    outcome.error = str(e)
+                outcome.duration_ms = (time.perf_counter() - started) * 1000
+            if outcome.error:
+                logger.warning(f"[Research Executor] {provider} query failed '{query.query[:60]}': {outcome.error}")
+            return outcome
+
+        tasks = [asyncio.ensure_future(run(i, q)) for i, q in enumerate(queries)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def run(self, queries: List[ResearchQuery], **kwargs) -> Dict[str, Any]:
+        """Run all queries and return the merged raw results (see ResearchResultAccumulator)."""
+        accumulator = ResearchResultAccumulator()
+        async for outcome in self.stream(queries, **kwargs):
+            accumulator.add(outcome)
+        return accumulator.raw_results()
+
+    async def _preflight(self, user_id: str, providers: Set[Optional[str]]):
+        """Subscription check once per paid search provider; refused providers fall back."""
+        from models.subscription_models import APIProvider
+
+        for name in providers & {"exa", "tavily"}:
+            def check() -> bool:
+                from services.database import get_db_session
+                from services.subscription import PricingService
+                db = get_db_session(user_id)
+                if not db:
+                    return True
+                try:
+                    can_proceed, message, _ = PricingService(db).check_usage_limits(
+                        user_id=user_id,
+                        provider=APIProvider.EXA if name == "exa" else APIProvider.TAVILY,
+                        tokens_requested=0,
+                        actual_provider_name=name,
+                    )
+                    if not can_proceed:
+                        logger.warning(f"[Research Executor] {name} preflight refused for user {user_id}: {message}")
+                    return can_proceed
+                finally:
+                    db.close()
+
+            try:
+                if not await asyncio.to_thread(check):
+                    self.available_providers.discard(name)
+            except Exception as e:
+                logger.warning(f"[Research Executor] {name} preflight check failed: {e}")
+
+    async def _search(
+        self,
+        provider: str,
+        query: ResearchQuery,
+        config: ResearchConfig,
+        user_id: Optional[str],
+        industry: str,
+        target_audience: str,
+    ) -> Dict[str, Any]:
+        """
+        One provider call for one query, with usage tracking.
+
+        Intent queries are already targeted, so Exa and Tavily search the query text as
+        is; industry and audience only shape the Google grounding prompt.
+        """
+        if self._search_override is not None:
+            return await self._search_override(provider, query)
+
+        if provider == "exa":
+            from services.blog_writer.research.exa_provider import ExaResearchProvider
+            exa = ExaResearchProvider()
+            raw = await exa.search(query.query, query.query, "", "", config, user_id)
+            cost = raw.get("cost", {}).get("total", 0.005) if isinstance(raw.get("cost"), dict) else 0.005
+            if user_id:
+                await asyncio.to_thread(exa.track_exa_usage, user_id, cost)
+            return raw
+
+        if provider == "tavily":
+            from services.blog_writer.research.tavily_provider import TavilyResearchProvider
+            tavily = TavilyResearchProvider()
+            raw = await tavily.search(query.query, query.query, "", "", config, user_id)
+            cost = raw.get("cost", {}).get("total", 0.001) if isinstance(raw.get("cost"), dict) else 0.001
+            if user_id:
+                await asyncio.to_thread(tavily.track_tavily_usage, user_id, cost, config.tavily_search_depth or "basic")
+            return raw
+
+        from services.blog_writer.research.google_provider import GoogleResearchProvider
+        from services.blog_writer.research.research_strategies import get_strategy_for_mode
+        prompt = get_strategy_for_mode(config.mode).build_research_prompt(
+            query.query, industry or "General", target_audience or "General", config
+        )
+        return await GoogleResearchProvider().search(
+            prompt, query.query, industry or "General", target_audience or "General", config, user_id
+        ) or {}
+
+
+def _source_dict(source: Any) -> Dict[str, Any]:
+    if hasattr(source, "dict"):
+        return source.dict()
+    return {
+        "title": getattr(source, "title", ""),
+        "url": getattr(source, "url", ""),
+        "excerpt": getattr(source, "excerpt", ""),
+    }
+
+
+def _url_key(url: str) -> str:
+    return urldefrag((url or "").strip())[0].rstrip("/").lower()
+
+
+class ResearchResultAccumulator:
+    """
+    Merges query outcomes, as they arrive, into the raw results read by IntentAwareAnalyzer.
+
+    Sources are deduplicated by URL and remember which queries found them. Content and
+    sources are ordered by query priority, and the analyzer's content budget is shared
+    between the queries so one long result cannot crowd out the others.
+    """
+
+    def __init__(self, content_budget: int = 8000):
+        self.content_budget = content_budget
+        self._sources: Dict[str, Dict[str, Any]] = {}
+        self._rank: Dict[str, tuple] = {}
+        self._contents: List[tuple] = []
+        self._answers: List[tuple] = []
+        self.grounding_metadata: Optional[Dict[str, Any]] = None
+        self.executed: List[Dict[str, Any]] = []
+        self.failed: List[Dict[str, Any]] = []
+
+    def add(self, outcome: QueryOutcome):
+        summary = {
+            "query": outcome.query.query,
+            "purpose": getattr(outcome.query.purpose, "value", outcome.query.purpose),
+            "provider": outcome.provider,
+            "duration_ms": round(outcome.duration_ms, 1),
+        }
+        if not outcome.ok:
+            self.failed.append({**summary, "error": outcome.error})
+            return
+        self.executed.append({**summary, "sources": len(outcome.sources)})
+
+        order = (-outcome.query.priority, outcome.index)
+        for source in outcome.sources:
+            key = _url_key(source.get("url", "")) or f"{outcome.index}:{len(self._sources)}"
+            existing = self._sources.get(key)
+            if existing is None:
+                self._sources[key] = {**source, "found_by_queries": [outcome.query.query]}
+                self._rank[key] = order
+            else:
+                existing["found_by_queries"].append(outcome.query.query)
+                self._rank[key] = min(self._rank[key], order)
+                if (source.get("credibility_score") or 0) > (existing.get("credibility_score") or 0):
+                    existing["credibility_score"] = source["credibility_score"]
+
+        if outcome.content:
+            self._contents.append((order, f"### {summary['purpose']}: {outcome.query.query}\n{outcome.content}"))
+        if outcome.answer:
+            self._answers.append((order, outcome.answer))
+        if outcome.grounding_metadata and self.grounding_metadata is None:
+            self.grounding_metadata = outcome.grounding_metadata
+
+    def sources(self) -> List[Dict[str, Any]]:
+        """Merged sources: higher-priority queries first, then sources found by more queries."""
+        keys = sorted(
+            self._sources,
+            key=lambda k: (self._rank[k], -len(self._sources[k]["found_by_queries"]),
+                           -(self._sources[k].get("credibility_score") or 0)),
+        )
+        return [self._sources[k] for k in keys]
+
+    def raw_results(self) -> Dict[str, Any]:
+        contents = [text for _, text in sorted(self._contents, key=lambda item: item[0])]
+        share = self.content_budget // len(contents) if contents else 0
+        return {
+            "content": "\n\n".join(text[:share] for text in contents),
+            "sources": self.sources(),
+            "grounding_metadata": self.grounding_metadata,
+            "answer": "\n\n".join(answer for _, answer in sorted(self._answers, key=lambda item: item[0])),
+            "queries_executed": list(self.executed),
+            "failed_queries": list(self.failed),
+        }
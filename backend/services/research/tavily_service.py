@@ -10,7 +10,7 @@ Key Features:
 - Real-time information retrieval
 - Topic-based search (general, news, finance)
 - Advanced search depth options
-- Cost-effective API usage with caching
+- Cost-effective API usage with caching (shared search result cache)
 
 Dependencies:
 - aiohttp (for async HTTP requests)
@@ -24,12 +24,15 @@ Last Updated: January 2025
 
 import os
 import json
+import asyncio
 import aiohttp
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timedelta
 from loguru import logger
 from urllib.parse import urlparse
 
+from services.cache.search_cache import search_cache
+
 
 class TavilyService:
     """
@@ -166,39 +169,25 @@ class TavilyService:
             if auto_parameters:
                 payload["auto_parameters"] = True
             
-            # Make API request
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/search",
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.info(f"Tavily search completed successfully. Found {len(result.get('results', []))} results.")
-                        
-                        # Process and structure results
-                        processed_results = self._process_search_results(result, query)
-                        
-                        return {
-                            "success": True,
-                            "query": result.get("query", query),
-                            "answer": result.get("answer"),  # If include_answer was requested
-                            "results": processed_results,
-                            "images": result.get("images", []),
-                            "response_time": result.get("response_time"),
-                            "request_id": result.get("request_id"),
-                            "auto_parameters": result.get("auto_parameters"),
-                            "total_results": len(processed_results),
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Tavily API error: {response.status} - {error_text}")
-                        raise RuntimeError(f"Tavily API error: {response.status} - {error_text}")
+            # Make API request (served from the shared search cache when possible)
+            credits = 2 if search_depth == "advanced" or auto_parameters else 1
+            fetched = False
+
+            async def fetch() -> Dict[str, Any]:
+                nonlocal fetched
+                fetched = True
+                return await self._post_search(payload, query)
+
+            result = await search_cache.get_or_fetch(
+                "tavily",
+                query,
+                fetch,
+                options={k: v for k, v in payload.items() if k not in ("api_key", "query")},
+                cost=0.001 * credits,
+            )
+            return result if fetched else {**result, "cached": True}
                         
-        except aiohttp.ClientTimeout:
+        except asyncio.TimeoutError:
             logger.error("Tavily API request timed out")
             return {
                 "success": False,
@@ -213,6 +202,39 @@ class TavilyService:
                 "details": "An unexpected error occurred during search"
             }
     
+    async def _post_search(self, payload: Dict[str, Any], query: str) -> Dict[str, Any]:
+        """POST a search request to Tavily and structure the response."""
+        async with aiohttp.ClientSession() as session:
+            async with session.post(
+                f"{self.base_url}/search",
+                json=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=60)
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    logger.info(f"Tavily search completed successfully. Found {len(result.get('results', []))} results.")
+                    
+                    # Process and structure results
+                    processed_results = self._process_search_results(result, query)
+                    
+                    return {
+                        "success": True,
+                        "query": result.get("query", query),
+                        "answer": result.get("answer"),  # If include_answer was requested
+                        "results": processed_results,
+                        "images": result.get("images", []),
+                        "response_time": result.get("response_time"),
+                        "request_id": result.get("request_id"),
+                        "auto_parameters": result.get("auto_parameters"),
+                        "total_results": len(processed_results),
+                        "timestamp": datetime.utcnow().isoformat()
+                    }
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Tavily API error: {response.status} - {error_text}")
+                    raise RuntimeError(f"Tavily API error: {response.status} - {error_text}")
+    
     def _process_search_results(self, api_response: Dict[str, Any], query: str) -> List[Dict[str, Any]]:
         """
         Process and structure Tavily API response into standardized format.
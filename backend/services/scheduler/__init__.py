@@ -10,6 +10,7 @@ from apscheduler.triggers.cron import CronTrigger
 
 from .core.scheduler import TaskScheduler
 from .core.executor_interface import TaskExecutor, TaskExecutionResult
+from .core.fair_dispatcher import DispatchPolicy, PRIORITY_URGENT, PRIORITY_BULK
 from .core.exception_handler import (
     SchedulerExceptionHandler, SchedulerException, SchedulerErrorType, SchedulerErrorSeverity,
     TaskExecutionError, DatabaseError, TaskLoaderError, SchedulerConfigError
@@ -25,18 +26,27 @@ from .executors.bing_insights_executor import BingInsightsExecutor
 from .executors.advertools_executor import AdvertoolsExecutor
 from .executors.sif_indexing_executor import SIFIndexingExecutor
 from .executors.market_trends_executor import MarketTrendsExecutor
-from .utils.task_loader import load_due_monitoring_tasks
-from .utils.oauth_token_task_loader import load_due_oauth_token_monitoring_tasks
-from .utils.website_analysis_task_loader import load_due_website_analysis_tasks
-from .utils.onboarding_full_website_analysis_task_loader import load_due_onboarding_full_website_analysis_tasks
-from .utils.deep_competitor_analysis_task_loader import load_due_deep_competitor_analysis_tasks
-from .utils.deep_website_crawl_task_loader import load_due_deep_website_crawl_tasks
-from .utils.platform_insights_task_loader import load_due_platform_insights_tasks
-from .utils.advertools_task_loader import load_due_advertools_tasks
-from .utils.sif_indexing_task_loader import load_due_sif_indexing_tasks
-from .utils.market_trends_task_loader import load_due_market_trends_tasks
+from .utils.task_loader import load_due_monitoring_tasks, MONITORING_TASK_DUE_SOURCE
+from .utils.oauth_token_task_loader import load_due_oauth_token_monitoring_tasks, OAUTH_TOKEN_MONITORING_DUE_SOURCE
+from .utils.website_analysis_task_loader import load_due_website_analysis_tasks, WEBSITE_ANALYSIS_DUE_SOURCE
+from .utils.onboarding_full_website_analysis_task_loader import (
+    load_due_onboarding_full_website_analysis_tasks, ONBOARDING_FULL_WEBSITE_ANALYSIS_DUE_SOURCE
+)
+from .utils.deep_competitor_analysis_task_loader import (
+    load_due_deep_competitor_analysis_tasks, DEEP_COMPETITOR_ANALYSIS_DUE_SOURCE
+)
+from .utils.deep_website_crawl_task_loader import load_due_deep_website_crawl_tasks, DEEP_WEBSITE_CRAWL_DUE_SOURCE
+from .utils.platform_insights_task_loader import load_due_platform_insights_tasks, platform_insights_due_source
+from .utils.advertools_task_loader import load_due_advertools_tasks, ADVERTOOLS_DUE_SOURCE
+from .utils.sif_indexing_task_loader import load_due_sif_indexing_tasks, SIF_INDEXING_DUE_SOURCE
+from .utils.market_trends_task_loader import load_due_market_trends_tasks, MARKET_TRENDS_DUE_SOURCE
 from services.today_workflow_service import generate_scheduled_daily_workflows
 
+# Token refreshes go ahead of everything; crawls and full-site analyses are bulk work
+# that may use half the slots, at most two per type (other types: normal priority)
+URGENT_TASK_POLICY = DispatchPolicy(priority=PRIORITY_URGENT)
+BULK_TASK_POLICY = DispatchPolicy(priority=PRIORITY_BULK, max_concurrent=2)
+
 # Global scheduler instance (initialized on first access)
 _scheduler_instance: TaskScheduler = None
 
@@ -60,7 +70,8 @@ def get_scheduler() -> TaskScheduler:
         _scheduler_instance.register_executor(
             'monitoring_task',
             monitoring_executor,
-            load_due_monitoring_tasks
+            load_due_monitoring_tasks,
+            due_source=MONITORING_TASK_DUE_SOURCE
         )
         
         # Register OAuth token monitoring executor
@@ -68,7 +79,9 @@ def get_scheduler() -> TaskScheduler:
         _scheduler_instance.register_executor(
             'oauth_token_monitoring',
             oauth_token_executor,
-            load_due_oauth_token_monitoring_tasks
+            load_due_oauth_token_monitoring_tasks,
+            due_source=OAUTH_TOKEN_MONITORING_DUE_SOURCE,
+            dispatch_policy=URGENT_TASK_POLICY
         )
         
         # Register website analysis executor
@@ -76,21 +89,26 @@ def get_scheduler() -> TaskScheduler:
         _scheduler_instance.register_executor(
             'website_analysis',
             website_analysis_executor,
-            load_due_website_analysis_tasks
+            load_due_website_analysis_tasks,
+            due_source=WEBSITE_ANALYSIS_DUE_SOURCE
         )
 
         onboarding_full_site_executor = OnboardingFullWebsiteAnalysisExecutor()
         _scheduler_instance.register_executor(
             'onboarding_full_website_analysis',
             onboarding_full_site_executor,
-            load_due_onboarding_full_website_analysis_tasks
+            load_due_onboarding_full_website_analysis_tasks,
+            due_source=ONBOARDING_FULL_WEBSITE_ANALYSIS_DUE_SOURCE,
+            dispatch_policy=BULK_TASK_POLICY
         )
 
         deep_competitor_analysis_executor = DeepCompetitorAnalysisExecutor()
         _scheduler_instance.register_executor(
             'deep_competitor_analysis',
             deep_competitor_analysis_executor,
-            load_due_deep_competitor_analysis_tasks
+            load_due_deep_competitor_analysis_tasks,
+            due_source=DEEP_COMPETITOR_ANALYSIS_DUE_SOURCE,
+            dispatch_policy=BULK_TASK_POLICY
         )
         
         # Register deep website crawl executor
@@ -98,7 +116,9 @@ def get_scheduler() -> TaskScheduler:
         _scheduler_instance.register_executor(
             'deep_website_crawl',
             deep_website_crawl_executor,
-            load_due_deep_website_crawl_tasks
+            load_due_deep_website_crawl_tasks,
+            due_source=DEEP_WEBSITE_CRAWL_DUE_SOURCE,
+            dispatch_policy=BULK_TASK_POLICY
         )
         
         # Register platform insights executors
@@ -110,7 +130,8 @@ def get_scheduler() -> TaskScheduler:
         _scheduler_instance.register_executor(
             'gsc_insights',
             gsc_insights_executor,
-            load_due_gsc_insights_tasks
+            load_due_gsc_insights_tasks,
+            due_source=platform_insights_due_source('gsc')
         )
         
         # Bing insights executor
@@ -121,7 +142,8 @@ def get_scheduler() -> TaskScheduler:
         _scheduler_instance.register_executor(
             'bing_insights',
             bing_insights_executor,
-            load_due_bing_insights_tasks
+            load_due_bing_insights_tasks,
+            due_source=platform_insights_due_source('bing')
         )
 
         # Register Advertools executor
@@ -129,7 +151,9 @@ def get_scheduler() -> TaskScheduler:
         _scheduler_instance.register_executor(
             'advertools_intelligence',
             advertools_executor,
-            load_due_advertools_tasks
+            load_due_advertools_tasks,
+            due_source=ADVERTOOLS_DUE_SOURCE,
+            dispatch_policy=BULK_TASK_POLICY
         )
 
         # Register SIF indexing executor
@@ -137,7 +161,9 @@ def get_scheduler() -> TaskScheduler:
         _scheduler_instance.register_executor(
             'sif_indexing',
             sif_indexing_executor,
-            load_due_sif_indexing_tasks
+            load_due_sif_indexing_tasks,
+            due_source=SIF_INDEXING_DUE_SOURCE,
+            dispatch_policy=BULK_TASK_POLICY
         )
 
         # Register market trends executor
@@ -145,7 +171,8 @@ def get_scheduler() -> TaskScheduler:
         _scheduler_instance.register_executor(
             'market_trends',
             market_trends_executor,
-            load_due_market_trends_tasks
+            load_due_market_trends_tasks,
+            due_source=MARKET_TRENDS_DUE_SOURCE
         )
 
         today_workflow_hour_utc = int(os.getenv('TODAY_WORKFLOW_SCHEDULE_HOUR_UTC', '2'))
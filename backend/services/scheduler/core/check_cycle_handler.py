@@ -5,7 +5,7 @@ Handles the main scheduler check cycle that finds and executes due tasks.
 
 import json
 import os
-from typing import TYPE_CHECKING, Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 
@@ -65,13 +65,15 @@ def _save_semantic_check_timestamps(checks: Dict[str, datetime]):
 # meaning heavy model initialisation happens at most once per user.
 LAST_SEMANTIC_CHECKS: Dict[str, datetime] = _load_semantic_check_timestamps()
 
-async def check_and_execute_due_tasks(scheduler: 'TaskScheduler'):
+async def check_and_execute_due_tasks(scheduler: 'TaskScheduler', user_ids: Optional[List[str]] = None):
     """
     Main scheduler loop: check for due tasks and execute them.
-    This runs periodically with intelligent interval adjustment based on active strategies.
+    This runs periodically with intelligent interval adjustment based on active strategies,
+    and for the users the wakeup queue found due.
     
     Args:
         scheduler: TaskScheduler instance
+        user_ids: Users to check (a wakeup); None checks every user (the periodic sweep)
     """
     scheduler.stats['total_checks'] += 1
     check_start_time = datetime.utcnow()
@@ -88,11 +90,20 @@ async def check_and_execute_due_tasks(scheduler: 'TaskScheduler'):
     }
     
     # Iterate through all users (Multi-tenancy support)
-    user_ids = get_all_user_ids()
+    is_sweep = user_ids is None
+    if is_sweep:
+        user_ids = get_all_user_ids()
     total_active_strategies = 0
 
     # Evict stale semantic monitor instances to prevent unbounded memory growth
     semantic_dashboard_api.evict_stale_monitors()
+    if is_sweep:
+        scheduler._task_leases.sweep()
+
+    # Onboarding status is served from the in-memory snapshot cache kept current by
+    # the onboarding writers, so this is a dictionary lookup per user after the first cycle
+    from services.onboarding.progress_service import OnboardingProgressService
+    onboarding_service = OnboardingProgressService()
 
     for user_id in user_ids:
         db = get_session_for_user(user_id)
@@ -103,8 +114,6 @@ async def check_and_execute_due_tasks(scheduler: 'TaskScheduler'):
         try:
             # Check onboarding status first
             # Skip users who haven't completed onboarding to prevent premature agent initialization
-            from services.onboarding.progress_service import OnboardingProgressService
-            onboarding_service = OnboardingProgressService()
             status = onboarding_service.get_onboarding_status(user_id)
             
             onboarding_completed = status.get("is_completed", False)
@@ -142,27 +151,57 @@ async def check_and_execute_due_tasks(scheduler: 'TaskScheduler'):
                     logger.warning(f"[Semantic Monitor] Error checking semantic health for user {user_id}: {e}")
 
 
-            # Check each registered task type for this user
+            # Due tasks of every indexed type come from one query on the user's
+            # scheduled_tasks view, earliest due first; other types use their loader
+            due_index = scheduler.registry.due_index
+            checked_at = datetime.utcnow()
+            try:
+                due_tasks = due_index.load_due(db, now=checked_at)
+            except Exception as e:
+                logger.warning(f"[Scheduler Check] Due-task index unavailable for user {user_id}, using loaders: {e}")
+                db.rollback()
+                due_tasks = None
+
             registered_types = scheduler.registry.get_registered_types()
-            for task_type in registered_types:
+            if due_tasks is None:
+                pending_types = [(task_type, None) for task_type in registered_types]
+            else:
+                pending_types = list(due_tasks.items()) + [
+                    (task_type, None) for task_type in registered_types if not due_index.has_source(task_type)
+                ]
+            for task_type, tasks in pending_types:
                 # Pass the user-specific session
-                await scheduler._process_task_type(task_type, db, cycle_summary, user_id=user_id)
+                await scheduler._process_task_type(task_type, db, cycle_summary, user_id=user_id, tasks=tasks)
+
+            # The wakeup queue keeps one entry per user, so the user's later tasks are
+            # only woken for if their next due time is queued again now. Tasks due by
+            # checked_at were queued above; their next run is pushed when they finish.
+            if scheduler.wakeups_enabled and due_tasks is not None:
+                next_due = due_index.next_due(db, after=checked_at)
+                if next_due is not None:
+                    scheduler.wakeup_queue.schedule(user_id, next_due)
         
         except Exception as e:
             logger.error(f"[Scheduler Check] Error processing user {user_id}: {e}")
         finally:
             db.close()
+
+    # Start the queued tasks of all users: by priority class, fairly across users and
+    # task types, within the concurrency caps (see fair_dispatcher)
+    scheduler._dispatch_queued()
     
     # Adjust interval based on active strategy presence across all users.
     # Only one strategy can be active per user at a time, so > 0 check is sufficient.
-    scheduler.stats['active_strategies_count'] = total_active_strategies
+    # With wakeups the periodic check is only a safety sweep at the maximum interval.
+    if is_sweep:
+        scheduler.stats['active_strategies_count'] = total_active_strategies
 
-    if total_active_strategies > 0:
+    if total_active_strategies > 0 and not scheduler.wakeups_enabled:
         optimal_interval = scheduler.min_check_interval_minutes
     else:
         optimal_interval = scheduler.max_check_interval_minutes
     
-    if optimal_interval != scheduler.current_check_interval_minutes:
+    if is_sweep and optimal_interval != scheduler.current_check_interval_minutes:
         interval_message = (
             f"[Scheduler] ⚙️ Adjusting Check Interval\n"
             f"   ├─ Current: {scheduler.current_check_interval_minutes}min\n"
@@ -194,7 +233,7 @@ async def check_and_execute_due_tasks(scheduler: 'TaskScheduler'):
         f"   ├─ Duration: {check_duration:.2f}s",
         f"   ├─ Active Strategies: {total_active_strategies}",
         f"   ├─ Check Interval: {scheduler.current_check_interval_minutes}min",
-        f"   ├─ User Isolation: Enabled (Scanned {len(user_ids)} users)",
+        f"   ├─ User Isolation: Enabled ({'Scanned' if is_sweep else 'Woken'} {len(user_ids)} users)",
         f"   ├─ Tasks Found: {cycle_summary['total_found']} total"
     ]
     
@@ -210,7 +249,10 @@ async def check_and_execute_due_tasks(scheduler: 'TaskScheduler'):
     if cycle_summary['total_found'] > 0:
         check_lines.append(f"   ├─ Total Executed: {cycle_summary['total_executed']}")
         check_lines.append(f"   ├─ Total Failed: {cycle_summary['total_failed']}")
-        check_lines.append(f"   └─ Active Executions: {active_executions}/{scheduler.max_concurrent_executions}")
+        check_lines.append(
+            f"   └─ Active Executions: {active_executions}/{scheduler.max_concurrent_executions} "
+            f"({scheduler.dispatcher.queued_count()} queued)"
+        )
     else:
         check_lines.append(f"   └─ No tasks found - scheduler idle")
     
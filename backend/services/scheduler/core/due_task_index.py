@@ -0,0 +1,188 @@
+"""
+Due Task Index
+One query per user for the due tasks of every registered task type.
+
+Task types register a DueTaskSource next to their loader: the model, its next-run
+column and which rows the loader treats as runnable. From these the index keeps a
+`scheduled_tasks` view in each user database, a UNION ALL of the runnable rows of
+every task table, and makes sure each table has its (status, next run) index. The
+check cycle then reads the due (task_type, task_id) pairs of all types from the view,
+ordered by due time, and loads only those rows, instead of running every loader.
+
+Being a view, the index can never drift from the task tables; writers need no changes.
+Task types without a source keep using their loader.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import DateTime, String, bindparam, inspect, text
+from sqlalchemy.orm import Query, Session
+
+from utils.logger_utils import get_service_logger
+
+logger = get_service_logger("due_task_index")
+
+VIEW_NAME = "scheduled_tasks"
+
+
+@dataclass(frozen=True)
+class DueTaskSource:
+    """
+    Where a task type's due tasks live, mirroring the predicate of its loader.
+
+    Attributes:
+        model: SQLAlchemy model of the task table
+        time_column: Column holding the next run time
+        statuses: Statuses the loader treats as runnable
+        include_unscheduled: Whether rows with no next run time are due
+        filters: Extra column == value conditions (e.g. platform)
+        prepare_query: Adds joins/eager loads the executor needs to the row query
+    """
+    model: Any
+    time_column: str = "next_execution"
+    statuses: Tuple[str, ...] = ("active",)
+    include_unscheduled: bool = True
+    filters: Tuple[Tuple[str, str], ...] = ()
+    prepare_query: Optional[Callable[[Query], Query]] = field(default=None, compare=False)
+
+    @property
+    def table_name(self) -> str:
+        return self.model.__tablename__
+
+    def is_runnable(self, task: Any, now: Optional[datetime] = None) -> bool:
+        """Whether a loaded row is still due, by the same predicate as select_sql() and load_due()."""
+        if getattr(task, "status", None) not in self.statuses:
+            return False
+        if any(getattr(task, column, None) != value for column, value in self.filters):
+            return False
+        due_at = getattr(task, self.time_column, None)
+        if due_at is None:
+            return self.include_unscheduled
+        if due_at.tzinfo is not None:
+            due_at = due_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return due_at <= (now or datetime.utcnow())
+
+    def select_sql(self, task_type: str) -> str:
+        conditions = [f"status IN ({', '.join(_quote(s) for s in self.statuses)})"]
+        conditions += [f"{column} = {_quote(value)}" for column, value in self.filters]
+        if not self.include_unscheduled:
+            conditions.append(f"{self.time_column} IS NOT NULL")
+        return (
+            f"SELECT {_quote(task_type)} AS task_type, id AS task_id, {self.time_column} AS due_at "
+            f"FROM {self.table_name} WHERE {' AND '.join(conditions)}"
+        )
+
+
+def _quote(value: str) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class DueTaskIndex:
+    """Registered due-task sources and the per-database `scheduled_tasks` view built from them."""
+
+    def __init__(self):
+        self.sources: Dict[str, DueTaskSource] = {}
+        # database URL -> view definition it was last prepared with
+        self._prepared: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def register(self, task_type: str, source: DueTaskSource):
+        self.sources[task_type] = source
+        with self._lock:
+            self._prepared.clear()
+
+    def has_source(self, task_type: str) -> bool:
+        return task_type in self.sources
+
+    def view_sql(self, table_names: Optional[set] = None) -> str:
+        selects = [
+            source.select_sql(task_type)
+            for task_type, source in self.sources.items()
+            if table_names is None or source.table_name in table_names
+        ]
+        return f"CREATE VIEW {VIEW_NAME} AS " + "\nUNION ALL\n".join(selects)
+
+    def prepare(self, db: Session):
+        """Create the task tables' indexes and the view in this database, once per process."""
+        bind = db.get_bind()
+        url = str(bind.url)
+        signature = self.view_sql()
+        if self._prepared.get(url) == signature:
+            return
+
+        with self._lock:
+            if self._prepared.get(url) == signature:
+                return
+            existing = set(inspect(bind).get_table_names())
+            sources = [s for s in self.sources.values() if s.table_name in existing]
+            for source in sources:
+                for index in source.model.__table__.indexes:
+                    index.create(bind, checkfirst=True)
+            with bind.begin() as conn:
+                conn.execute(text(f"DROP VIEW IF EXISTS {VIEW_NAME}"))
+                if sources:
+                    conn.execute(text(self.view_sql(existing)))
+            self._prepared[url] = signature
+            logger.info(f"Prepared {VIEW_NAME} view over {len(sources)} task tables for {url}")
+
+    def load_due(self, db: Session, now: Optional[datetime] = None) -> Dict[str, List[Any]]:
+        """
+        Due tasks of every indexed task type, ordered by due time (unscheduled first).
+
+        Returns:
+            {task_type: [task, ...]}, task types ordered by their earliest due task.
+            Indexed task types with nothing due are absent.
+        """
+        if not self.sources:
+            return {}
+        self.prepare(db)
+
+        query = text(
+            f"SELECT task_type, task_id FROM {VIEW_NAME} "
+            f"WHERE due_at IS NULL OR due_at <= :now ORDER BY due_at, task_type, task_id"
+        ).bindparams(bindparam("now", type_=DateTime()))
+        due_ids: Dict[str, List[int]] = {}
+        for task_type, task_id in db.execute(query, {"now": now or datetime.utcnow()}):
+            if task_type in self.sources:
+                due_ids.setdefault(task_type, []).append(task_id)
+
+        due_tasks: Dict[str, List[Any]] = {}
+        for task_type, ids in due_ids.items():
+            source = self.sources[task_type]
+            rows = db.query(source.model)
+            if source.prepare_query is not None:
+                rows = source.prepare_query(rows)
+            by_id = {row.id: row for row in rows.filter(source.model.id.in_(ids)).all()}
+            tasks = [by_id[task_id] for task_id in ids if task_id in by_id]
+            if tasks:
+                due_tasks[task_type] = tasks
+        return due_tasks
+
+    def next_due(
+        self, db: Session, now: Optional[datetime] = None, after: Optional[datetime] = None
+    ) -> Optional[datetime]:
+        """
+        Earliest next run time of any indexed task in this database; `now` (default:
+        the current time) when an unscheduled task is runnable, None when there are none.
+
+        With `after`, only tasks scheduled later than that count: the ones due by then
+        were just loaded by the check that asks.
+        """
+        if not self.sources:
+            return None
+        self.prepare(db)
+
+        if after is None:
+            query = text(f"SELECT task_type, due_at FROM {VIEW_NAME} ORDER BY due_at LIMIT 1")
+        else:
+            query = text(
+                f"SELECT task_type, due_at FROM {VIEW_NAME} WHERE due_at > :after ORDER BY due_at LIMIT 1"
+            ).bindparams(bindparam("after", type_=DateTime()))
+        query = query.columns(task_type=String(), due_at=DateTime())
+        row = db.execute(query, {} if after is None else {"after": after}).first()
+        if row is None:
+            return None
+        return row.due_at or now or datetime.utcnow()
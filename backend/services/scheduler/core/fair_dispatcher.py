@@ -0,0 +1,291 @@
+"""
+Fair Dispatcher
+Decides which due task runs next when execution slots are scarce.
+
+Due tasks found by the check cycle are queued here instead of being started in the
+order users and task types were scanned. Whenever a slot is free the dispatcher
+starts the next task:
+
+- Priority classes: every task type has a class (urgent, normal, bulk). A class is
+  only served when no task of a higher class can start, so token refreshes never
+  wait behind crawls. The bulk class may use at most a share of the slots.
+- Weighted fair queuing inside a class: each (task type, user) pair is a flow, and
+  flows take turns in proportion to their type's weight (start-time fair queuing
+  with a virtual clock per class), so no user or type can monopolise the slots.
+- Concurrency caps per task type and per user.
+
+Queued tasks are deduplicated by execution key. Database rows are queued as TaskRefs
+and reloaded (and re-checked against their due predicate) when they start. Wait times (queued -> started) are
+recorded in histograms per task type and per priority class for the dashboard.
+
+Configuration (environment):
+    ALWRITY_SCHEDULER_MAX_TASKS_PER_USER     Running tasks per user (default: 3)
+    ALWRITY_SCHEDULER_BULK_SHARE             Share of the slots bulk tasks may use (default: 0.5)
+    ALWRITY_SCHEDULER_MAX_QUEUE_WAIT_SECONDS Queued tasks older than this are dropped and
+                                             reloaded by the next check (default: 900)
+"""
+
+import math
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+PRIORITY_URGENT = "urgent"
+PRIORITY_NORMAL = "normal"
+PRIORITY_BULK = "bulk"
+PRIORITY_CLASSES = (PRIORITY_URGENT, PRIORITY_NORMAL, PRIORITY_BULK)
+
+# Upper bounds (seconds) of the wait-time histogram buckets; the last bucket is open
+WAIT_BUCKETS = (1, 5, 15, 60, 300, 900, 3600)
+
+
+@dataclass(frozen=True)
+class DispatchPolicy:
+    """
+    How a task type competes for execution slots.
+
+    Attributes:
+        priority: Priority class (urgent, normal or bulk)
+        weight: Share of its class's slots relative to other types' flows
+        max_concurrent: Running tasks of this type at once (None: no type cap)
+    """
+    priority: str = PRIORITY_NORMAL
+    weight: float = 1.0
+    max_concurrent: Optional[int] = None
+
+    def __post_init__(self):
+        if self.priority not in PRIORITY_CLASSES:
+            raise ValueError(f"Unknown priority class: {self.priority}")
+        if self.weight <= 0:
+            raise ValueError("weight must be positive")
+
+
+@dataclass(frozen=True)
+class TaskRef:
+    """
+    Identity of a queued task row. The row itself is reloaded when the task starts:
+    a snapshot kept while queued would be stale, and merging it back would undo
+    changes made meanwhile (e.g. the user pausing the task).
+    """
+    model: Any
+    id: Any
+
+
+@dataclass
+class QueuedExecution:
+    """A due task waiting for a slot."""
+    task_type: str
+    user_id: Optional[str]
+    key: str
+    task: Any  # TaskRef for database rows
+    summary: Dict[str, int]
+    queued_at: float = 0.0
+    tag: float = field(default=0.0, compare=False)  # virtual start time within its class
+
+
+class WaitHistogram:
+    """Counts of wait times per bucket, with count, sum and max."""
+
+    def __init__(self):
+        self.counts = [0] * (len(WAIT_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        index = next((i for i, bound in enumerate(WAIT_BUCKETS) if seconds <= bound), len(WAIT_BUCKETS))
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "counts": list(self.counts),
+            "count": self.count,
+            "mean_seconds": round(self.total / self.count, 3) if self.count else 0.0,
+            "max_seconds": round(self.max, 3),
+        }
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+class FairDispatcher:
+    """Priority classes, weighted fair queuing between flows and concurrency caps."""
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_per_user: Optional[int] = None,
+        bulk_share: Optional[float] = None,
+        max_queue_wait_seconds: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_per_user = max_per_user or int(_env_float("ALWRITY_SCHEDULER_MAX_TASKS_PER_USER", 3))
+        share = bulk_share if bulk_share is not None else _env_float("ALWRITY_SCHEDULER_BULK_SHARE", 0.5)
+        self.max_bulk = max(1, math.floor(max_concurrent * share))
+        self.max_queue_wait_seconds = (
+            max_queue_wait_seconds if max_queue_wait_seconds is not None
+            else _env_float("ALWRITY_SCHEDULER_MAX_QUEUE_WAIT_SECONDS", 900)
+        )
+        self._clock = clock
+        self.policies: Dict[str, DispatchPolicy] = {}
+
+        # (task_type, user_id) -> queued executions, in arrival order
+        self._flows: Dict[Tuple[str, Optional[str]], Deque[QueuedExecution]] = {}
+        # flow -> virtual finish time of its last queued task
+        self._last_finish: Dict[Tuple[str, Optional[str]], float] = {}
+        self._virtual_time: Dict[str, float] = {priority: 0.0 for priority in PRIORITY_CLASSES}
+        self._queued_keys: Dict[str, QueuedExecution] = {}
+
+        # execution key -> (task_type, user_id, priority) of started executions
+        self._running: Dict[str, Tuple[str, Optional[str], str]] = {}
+        self._running_by_type: Dict[str, int] = {}
+        self._running_by_user: Dict[Optional[str], int] = {}
+        self._running_by_priority: Dict[str, int] = {priority: 0 for priority in PRIORITY_CLASSES}
+
+        self._waits_by_type: Dict[str, WaitHistogram] = {}
+        self._waits_by_priority: Dict[str, WaitHistogram] = {p: WaitHistogram() for p in PRIORITY_CLASSES}
+        self.stats = {"queued": 0, "started": 0, "dropped_stale": 0, "duplicates": 0}
+
+    def set_policy(self, task_type: str, policy: DispatchPolicy):
+        self.policies[task_type] = policy
+
+    def policy(self, task_type: str) -> DispatchPolicy:
+        return self.policies.get(task_type) or DispatchPolicy()
+
+    def submit(
+        self,
+        task_type: str,
+        user_id: Optional[str],
+        key: str,
+        task: Any,
+        summary: Dict[str, int],
+    ) -> bool:
+        """Queue a due task; False if the same execution is already queued or running."""
+        if key in self._queued_keys or key in self._running:
+            self.stats["duplicates"] += 1
+            return False
+        policy = self.policy(task_type)
+        flow = (task_type, user_id)
+        # Start-time fair queuing: a task starts (in virtual time) when its flow's previous
+        # task finishes, or at the class's virtual time if the flow was idle
+        start = max(self._virtual_time[policy.priority], self._last_finish.get(flow, 0.0))
+        self._last_finish[flow] = start + 1.0 / policy.weight
+        entry = QueuedExecution(task_type, user_id, key, task, summary, queued_at=self._clock(), tag=start)
+        self._flows.setdefault(flow, deque()).append(entry)
+        self._queued_keys[key] = entry
+        self.stats["queued"] += 1
+        return True
+
+    def next_ready(self) -> Optional[QueuedExecution]:
+        """
+        Take the next task allowed to start now and count it as running, or None if
+        every slot is taken or no queued task fits under the caps.
+        """
+        if len(self._running) >= self.max_concurrent:
+            return None
+        for priority in PRIORITY_CLASSES:
+            if priority == PRIORITY_BULK and self._running_by_priority[PRIORITY_BULK] >= self.max_bulk:
+                continue
+            best_flow, best_entry = None, None
+            for flow, queue in self._flows.items():
+                entry = queue[0]
+                policy = self.policy(entry.task_type)
+                if policy.priority != priority:
+                    continue
+                if policy.max_concurrent is not None and \
+                        self._running_by_type.get(entry.task_type, 0) >= policy.max_concurrent:
+                    continue
+                if entry.user_id is not None and self._running_by_user.get(entry.user_id, 0) >= self.max_per_user:
+                    continue
+                if best_entry is None or entry.tag < best_entry.tag:
+                    best_flow, best_entry = flow, entry
+            if best_entry is not None:
+                self._pop(best_flow)
+                self._virtual_time[priority] = max(self._virtual_time[priority], best_entry.tag)
+                self._start(best_entry, priority)
+                return best_entry
+        return None
+
+    def finished(self, key: Optional[str]):
+        """An execution started by next_ready() ended (or never started); free its slot."""
+        running = self._running.pop(key, None) if key else None
+        if running is None:
+            return
+        task_type, user_id, priority = running
+        self._running_by_type[task_type] -= 1
+        self._running_by_user[user_id] -= 1
+        self._running_by_priority[priority] -= 1
+
+    def drop_stale(self) -> List[QueuedExecution]:
+        """Remove queued tasks that waited longer than max_queue_wait_seconds; returns them."""
+        cutoff = self._clock() - self.max_queue_wait_seconds
+        dropped = []
+        for flow in list(self._flows):
+            queue = self._flows[flow]
+            while queue and queue[0].queued_at < cutoff:
+                dropped.append(queue.popleft())
+            if not queue:
+                del self._flows[flow]
+        for entry in dropped:
+            del self._queued_keys[entry.key]
+        self.stats["dropped_stale"] += len(dropped)
+        return dropped
+
+    def queued_count(self) -> int:
+        return len(self._queued_keys)
+
+    def running_count(self) -> int:
+        return len(self._running)
+
+    def get_stats(self) -> Dict[str, Any]:
+        queued_by_type: Dict[str, int] = {}
+        for entry in self._queued_keys.values():
+            queued_by_type[entry.task_type] = queued_by_type.get(entry.task_type, 0) + 1
+        return {
+            **self.stats,
+            "queue_length": len(self._queued_keys),
+            "queued_by_type": queued_by_type,
+            "running": len(self._running),
+            "running_by_type": {t: n for t, n in self._running_by_type.items() if n},
+            "running_by_priority": dict(self._running_by_priority),
+            "max_concurrent": self.max_concurrent,
+            "max_per_user": self.max_per_user,
+            "max_bulk": self.max_bulk,
+            "policies": {
+                task_type: {"priority": p.priority, "weight": p.weight, "max_concurrent": p.max_concurrent}
+                for task_type, p in self.policies.items()
+            },
+            "wait_seconds": {
+                "buckets": [f"<={bound}s" for bound in WAIT_BUCKETS] + [f">{WAIT_BUCKETS[-1]}s"],
+                "by_task_type": {t: h.to_dict() for t, h in self._waits_by_type.items()},
+                "by_priority": {p: h.to_dict() for p, h in self._waits_by_priority.items()},
+            },
+        }
+
+    def _pop(self, flow: Tuple[str, Optional[str]]):
+        queue = self._flows[flow]
+        entry = queue.popleft()
+        if not queue:
+            del self._flows[flow]
+        del self._queued_keys[entry.key]
+
+    def _start(self, entry: QueuedExecution, priority: str):
+        self._running[entry.key] = (entry.task_type, entry.user_id, priority)
+        self._running_by_type[entry.task_type] = self._running_by_type.get(entry.task_type, 0) + 1
+        self._running_by_user[entry.user_id] = self._running_by_user.get(entry.user_id, 0) + 1
+        self._running_by_priority[priority] += 1
+        self.stats["started"] += 1
+
+        waited = max(0.0, self._clock() - entry.queued_at)
+        self._waits_by_type.setdefault(entry.task_type, WaitHistogram()).observe(waited)
+        self._waits_by_priority[priority].observe(waited)
@@ -271,3 +271,42 @@ async def restore_persona_jobs(scheduler: 'TaskScheduler'):
     except Exception as e:
         logger.warning(f"Error restoring persona jobs: {e}")
 
+
+
+async def restore_task_wakeups(scheduler: 'TaskScheduler') -> int:
+    """
+    Rebuild the scheduler's wakeup queue from the task tables: one entry per user at
+    the next run time of their earliest indexed task (see wakeup_queue).
+
+    Args:
+        scheduler: TaskScheduler instance
+
+    Returns:
+        Number of users with a scheduled wakeup
+    """
+    due_index = scheduler.registry.due_index
+    scheduled = 0
+    try:
+        user_ids = get_all_user_ids()
+        for user_id in user_ids:
+            db = get_session_for_user(user_id)
+            if not db:
+                continue
+            try:
+                next_due = due_index.next_due(db)
+                if next_due is not None:
+                    scheduler.wakeup_queue.schedule(user_id, next_due)
+                    scheduled += 1
+            except Exception as e:
+                logger.warning(f"[Restoration] Could not read next due task for user {user_id}: {e}")
+            finally:
+                db.close()
+
+        next_wakeup = scheduler.wakeup_queue.next_due()
+        logger.info(
+            f"[Restoration] Wakeup queue rebuilt for {scheduled}/{len(user_ids)} users, "
+            f"next wakeup: {next_wakeup.isoformat() if next_wakeup else 'none'}"
+        )
+    except Exception as e:
+        logger.warning(f"Error restoring task wakeups: {e}")
+    return scheduled
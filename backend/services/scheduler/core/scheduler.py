@@ -17,6 +17,10 @@ from sqlalchemy import text
 
 from .executor_interface import TaskExecutor, TaskExecutionResult
 from .task_registry import TaskRegistry
+from .due_task_index import DueTaskSource
+from .wakeup_queue import WakeupQueue, wakeups_enabled
+from .task_lease_table import TaskLeaseTable
+from .fair_dispatcher import DispatchPolicy, FairDispatcher, TaskRef
 from .exception_handler import (
     SchedulerExceptionHandler, SchedulerException, TaskExecutionError, DatabaseError,
     TaskLoaderError, SchedulerConfigError
@@ -28,7 +32,7 @@ from utils.logger_utils import get_service_logger
 from ..utils.user_job_store import get_user_job_store_name
 from models.scheduler_models import SchedulerEventLog
 from .interval_manager import determine_optimal_interval
-from .job_restoration import restore_persona_jobs
+from .job_restoration import restore_persona_jobs, restore_task_wakeups
 from .oauth_task_restoration import restore_oauth_monitoring_tasks
 from .website_analysis_task_restoration import restore_website_analysis_tasks
 from .platform_insights_task_restoration import restore_platform_insights_tasks
@@ -48,7 +52,9 @@ class TaskScheduler:
     - Plugin-based executor system
     - Database-backed task persistence
     - Configurable check intervals
+    - Event-driven wakeups: sleeps until the earliest due task (see wakeup_queue)
     - Automatic retry logic
+    - Fair dispatch: priority classes, per-type/per-user caps (see fair_dispatcher)
     - User isolation: All tasks are filtered by user_id for isolation
     - Per-user job store context: Logs show user's website root for debugging
     
@@ -134,9 +140,21 @@ class TaskScheduler:
         self._last_leadership_error = None
 
 
-        # Execution lease registry (prevents duplicate redispatch across check cycles)
-        self._task_leases: Dict[str, str] = {}
-        self._task_lease_ttl_seconds = int(os.getenv("SCHEDULER_TASK_LEASE_TTL_SECONDS", "900"))
+        # Execution lease registry (prevents duplicate redispatch across check cycles,
+        # and across worker processes when SCHEDULER_TASK_LEASE_DB is set)
+        self._task_leases = TaskLeaseTable.from_env(owner=self._scheduler_identity())
+        self._task_lease_ttl_seconds = self._task_leases.ttl_seconds
+
+        # Next due time per user; the wakeup loop runs the check cycle for due users,
+        # and check_due_tasks becomes a sweep at the maximum interval
+        self.wakeup_queue = WakeupQueue()
+        self.wakeups_enabled = wakeups_enabled()
+        self._wakeup_task: Optional[asyncio.Task] = None
+        
+        # Due tasks wait here for a slot; started by priority class, fairly across
+        # (task type, user) flows and within per-type and per-user caps
+        self.dispatcher = FairDispatcher(max_concurrent_executions)
+        self._stopping = False
     
     def _get_trigger_for_interval(self, interval_minutes: int):
         """
@@ -162,7 +180,9 @@ class TaskScheduler:
         self,
         task_type: str,
         executor: TaskExecutor,
-        task_loader: Callable[[Session], List[Any]]
+        task_loader: Callable[[Session], List[Any]],
+        due_source: Optional[DueTaskSource] = None,
+        dispatch_policy: Optional[DispatchPolicy] = None
     ):
         """
         Register a task executor for a specific task type.
@@ -171,8 +191,16 @@ class TaskScheduler:
             task_type: Unique identifier for task type (e.g., 'monitoring_task')
             executor: TaskExecutor instance that handles execution
             task_loader: Function that loads due tasks from database
+            due_source: Task table for the shared due-task index; when given, the
+                check cycle finds this type's due tasks through one query per user
+            dispatch_policy: Priority class, weight and concurrency cap of this type
+                (default: normal priority, weight 1, no type cap)
         """
-        self.registry.register(task_type, executor, task_loader)
+        self.registry.register(task_type, executor, task_loader, due_source)
+        if due_source is not None and self.wakeups_enabled:
+            self.wakeup_queue.watch(due_source)
+        if dispatch_policy is not None:
+            self.dispatcher.set_policy(task_type, dispatch_policy)
         logger.info(f"Registered executor for task type: {task_type}")
     
     def _configure_apscheduler_logging(self):
@@ -274,44 +302,16 @@ class TaskScheduler:
         self._sync_check_due_tasks_job()
 
     def _acquire_task_lease(self, task_key: str) -> bool:
-        """Acquire in-memory lease for a task key if available/expired."""
-        now = datetime.utcnow()
-        expiry_str = self._task_leases.get(task_key)
-
-        if expiry_str:
-            try:
-                expiry = datetime.fromisoformat(expiry_str)
-                if expiry > now:
-                    return False
-            except Exception:
-                # Corrupted lease value: overwrite safely
-                pass
-
-        expiry = now + timedelta(seconds=self._task_lease_ttl_seconds)
-        self._task_leases[task_key] = expiry.isoformat()
-        return True
+        """Acquire lease for a task key if available/expired."""
+        return self._task_leases.acquire(task_key)
 
     def _release_task_lease(self, task_key: str):
         """Release lease for task key."""
-        if task_key in self._task_leases:
-            del self._task_leases[task_key]
+        self._task_leases.release(task_key)
 
     def _is_task_leased(self, task_key: str) -> bool:
         """Check whether task key is currently leased and not expired."""
-        expiry_str = self._task_leases.get(task_key)
-        if not expiry_str:
-            return False
-
-        try:
-            expiry = datetime.fromisoformat(expiry_str)
-            if expiry > datetime.utcnow():
-                return True
-        except Exception:
-            pass
-
-        # Expired/corrupt lease gets cleaned up lazily
-        self._release_task_lease(task_key)
-        return False
+        return self._task_leases.is_leased(task_key)
 
     async def start(self):
         """Start the scheduler with intelligent interval adjustment."""
@@ -320,16 +320,21 @@ class TaskScheduler:
             return
         
         try:
-            # Determine initial check interval based on active strategies
-            initial_interval = await determine_optimal_interval(
-                self,
-                self.min_check_interval_minutes,
-                self.max_check_interval_minutes
-            )
+            # Determine initial check interval based on active strategies; with
+            # wakeups the check is only a sweep and stays at the maximum interval
+            if self.wakeups_enabled:
+                initial_interval = self.max_check_interval_minutes
+            else:
+                initial_interval = await determine_optimal_interval(
+                    self,
+                    self.min_check_interval_minutes,
+                    self.max_check_interval_minutes
+                )
             self.current_check_interval_minutes = initial_interval
             
             self.scheduler.start()
             self._running = True
+            self._stopping = False
 
             # Leadership monitor runs on all replicas; only leader executes due-task loop.
             self.scheduler.add_job(
@@ -363,6 +368,12 @@ class TaskScheduler:
             # Restore/create missing Advertools intelligence tasks
             advertools_tasks_count = await restore_advertools_tasks(self)
             
+            # Rebuild the wakeup queue from the task tables and start sleeping on it
+            if self.wakeups_enabled:
+                await restore_task_wakeups(self)
+                self.wakeup_queue.bind()
+                self._wakeup_task = asyncio.create_task(self._wakeup_loop())
+            
             # Validate and rebuild cumulative stats if needed
             await self._validate_and_rebuild_cumulative_stats()
             
@@ -429,6 +440,7 @@ class TaskScheduler:
             startup_lines = [
                 f"[Scheduler] ✅ Task Scheduler Started",
                 f"   ├─ Check Interval: {initial_interval} minutes",
+                f"   ├─ Wakeups: {self._describe_wakeups()}",
                 f"   ├─ Registered Task Types: {len(registered_types)} ({', '.join(registered_types) if registered_types else 'none'})",
                 f"   ├─ Active Strategies: {active_strategies}",
                 f"   ├─ Total Scheduled Jobs: {total_jobs}",
@@ -550,17 +562,30 @@ class TaskScheduler:
             return
         
         try:
-            # Cancel all active executions
+            # Finishing executions must not start queued ones
+            self._stopping = True
+            
+            # Cancel all active executions; finished executions remove themselves
+            # from active_executions, so remember which ones were cancelled
+            cancelled = list(self.active_executions)
             for task_id, execution_task in self.active_executions.items():
                 execution_task.cancel()
             
             # Wait for active executions to complete (with timeout)
             if self.active_executions:
                 await asyncio.wait(
-                    self.active_executions.values(),
+                    list(self.active_executions.values()),
                     timeout=30
                 )
             
+            # Hand cancelled tasks back to the other workers sharing the lease table
+            for task_id in cancelled:
+                self._release_task_lease(task_id)
+            
+            if self._wakeup_task is not None:
+                self._wakeup_task.cancel()
+                self._wakeup_task = None
+            
             # Get final job count before shutdown
             all_jobs_before = self.scheduler.get_jobs()
 
@@ -627,6 +652,64 @@ class TaskScheduler:
             return
 
         await check_and_execute_due_tasks(self)
+
+    async def _wakeup_loop(self):
+        """Sleep until users have due tasks (or tasks change) and run the check cycle for them."""
+        while self._running:
+            try:
+                user_ids = await self.wakeup_queue.wait_until_due()
+                if not self._execution_enabled or not self._is_leader:
+                    continue
+                await check_and_execute_due_tasks(self, user_ids=user_ids)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"[Scheduler] Error in wakeup loop: {e}")
+                await asyncio.sleep(1)
+
+    def _describe_wakeups(self) -> str:
+        if not self.wakeups_enabled:
+            return "disabled (interval polling)"
+        next_wakeup = self.wakeup_queue.next_due()
+        return (
+            f"{len(self.wakeup_queue)} users queued, "
+            f"next: {next_wakeup.isoformat() if next_wakeup else 'none'}"
+        )
+
+    def _on_execution_finished(self, execution_key: Optional[str] = None):
+        """An execution ended: free its dispatcher slot and start queued tasks."""
+        self.dispatcher.finished(execution_key)
+        self._dispatch_queued()
+
+    def _dispatch_queued(self):
+        """Start queued tasks while the dispatcher has a slot for one."""
+        if self._stopping:
+            return
+        for entry in self.dispatcher.drop_stale():
+            # Reloaded fresh by the user's next check
+            if entry.user_id and self.wakeups_enabled:
+                self.wakeup_queue.schedule(entry.user_id)
+
+        while True:
+            entry = self.dispatcher.next_ready()
+            if entry is None:
+                return
+            if not self._acquire_task_lease(entry.key):
+                # Another worker took it while it was queued
+                self.dispatcher.finished(entry.key)
+                continue
+            execution_task = asyncio.create_task(
+                execute_task_async(
+                    self,
+                    entry.task_type,
+                    entry.task,
+                    entry.summary,
+                    execution_source="scheduler",
+                    user_id=entry.user_id,
+                    execution_key=entry.key,
+                )
+            )
+            self.active_executions[entry.key] = execution_task
     
     async def _execute_missed_jobs(self):
         """
@@ -674,8 +757,13 @@ class TaskScheduler:
         task_type: str,
         db: Session,
         cycle_summary: Dict[str, Any],
-        user_id: Optional[str] = None
+        user_id: Optional[str] = None,
+        tasks: Optional[List[Any]] = None
     ) -> Dict[str, int]:
+        """
+        Queue the due tasks of one type for the dispatcher. `tasks` are the type's due
+        tasks when already loaded through the due-task index; otherwise its loader is called.
+        """
         summary = {"found": 0, "executed": 0, "failed": 0}
         try:
             task_loader = self.registry.get_task_loader(task_type)
@@ -691,38 +779,34 @@ class TaskScheduler:
             return summary
 
         try:
-            tasks = task_loader(db)
+            if tasks is None:
+                tasks = task_loader(db)
 
             if not tasks:
                 return summary
 
             summary["found"] = len(tasks)
-            max_concurrent = self.max_concurrent_executions
 
             for task in tasks:
                 task_id = getattr(task, "id", None)
+                # Task IDs are per user database, so the user is part of the key
                 lease_key = f"{task_type}_{task_id or id(task)}"
+                if user_id:
+                    lease_key = f"{user_id}:{lease_key}"
 
                 if self._is_task_leased(lease_key):
+                    # Still due when the lease runs out: look again then
+                    remaining = self._task_leases.remaining(lease_key)
+                    if user_id and self.wakeups_enabled and remaining is not None:
+                        self.wakeup_queue.schedule(user_id, datetime.utcnow() + timedelta(seconds=remaining))
                     continue
 
-                if len(self.active_executions) >= max_concurrent:
-                    break
-
-                if not self._acquire_task_lease(lease_key):
-                    continue
-
-                execution_task = asyncio.create_task(
-                    execute_task_async(
-                        self,
-                        task_type,
-                        task,
-                        summary,
-                        execution_source="scheduler",
-                        user_id=user_id,
-                    )
-                )
-                self.active_executions[lease_key] = execution_task
+                # Queued for the dispatcher, which the check cycle runs once every
+                # user's due tasks are queued; already queued executions are not queued twice.
+                # Rows are queued by identity and reloaded when they start.
+                if task_id is not None and hasattr(type(task), "__table__"):
+                    task = TaskRef(type(task), task_id)
+                self.dispatcher.submit(task_type, user_id, lease_key, task, summary)
 
             cycle_summary.setdefault("tasks_found_by_type", {})
             cycle_summary.setdefault("tasks_executed_by_type", {})
@@ -755,6 +839,32 @@ class TaskScheduler:
             self.stats["tasks_failed"] += 1
             return summary
 
+    def get_stats(self, user_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Scheduler statistics for the dashboard.
+
+        Args:
+            user_id: Only include this user's per-user stats (None: all users)
+        """
+        stats = dict(self.stats)
+        per_user = self.stats.get('per_user_stats', {})
+        stats['per_user_stats'] = (
+            {user_id: per_user[user_id]} if user_id and user_id in per_user
+            else {} if user_id else dict(per_user)
+        )
+        stats.update({
+            'active_executions': len(self.active_executions),
+            'running': self._running,
+            'check_interval_minutes': self.current_check_interval_minutes,
+            'min_check_interval_minutes': self.min_check_interval_minutes,
+            'max_check_interval_minutes': self.max_check_interval_minutes,
+            'intelligent_scheduling': True,
+            'registered_types': self.registry.get_registered_types(),
+            'task_leases': self._task_leases.get_stats(),
+            'dispatch': self.dispatcher.get_stats(),
+        })
+        return stats
+
     def _update_user_stats(self, user_id: Optional[str], success: bool):
         if not user_id:
             return
@@ -11,6 +11,7 @@ from utils.logger_utils import get_service_logger
 from .exception_handler import (
     SchedulerException, TaskExecutionError, DatabaseError, SchedulerConfigError
 )
+from .fair_dispatcher import TaskRef
 
 if TYPE_CHECKING:
     from .scheduler import TaskScheduler
@@ -24,7 +25,8 @@ async def execute_task_async(
     task: Any,
     summary: Optional[Dict[str, Any]] = None,
     execution_source: str = "scheduler",  # "scheduler" or "manual"
-    user_id: Optional[str] = None
+    user_id: Optional[str] = None,
+    execution_key: Optional[str] = None
 ):
     """
     Execute a single task asynchronously with user isolation.
@@ -37,9 +39,11 @@ async def execute_task_async(
     Args:
         scheduler: TaskScheduler instance
         task_type: Type of task
-        task: Task instance from database (detached from original session)
+        task: Task instance from database (detached from original session), or a
+            TaskRef of a queued task, which is reloaded and skipped if no longer due
         summary: Optional summary dict to update with execution results
         user_id: Optional user ID for user isolation (overrides extraction from task)
+        execution_key: Key of this execution in scheduler.active_executions (default: task_id)
     """
     task_id = f"{task_type}_{getattr(task, 'id', id(task))}"
     db = None
@@ -82,6 +86,19 @@ async def execute_task_async(
         # Set database session for exception handler
         scheduler.exception_handler.db = db
         
+        # Queued tasks are reloaded: the user may have paused, edited or deleted the
+        # task, or another execution rescheduled it, while it waited for a slot
+        if isinstance(task, TaskRef):
+            task = db.get(task.model, task.id)
+            source = scheduler.registry.due_index.sources.get(task_type)
+            if task is None or (source is not None and not source.is_runnable(task)):
+                logger.debug(f"[Scheduler] ⏭️ Skipping task {task_id} - no longer due")
+                scheduler.stats['tasks_skipped'] += 1
+                if summary:
+                    summary.setdefault('skipped', 0)
+                    summary['skipped'] += 1
+                return
+
         # Merge the detached task object into this session
         # The task object was loaded in a different session and is now detached
         from sqlalchemy.inspection import inspect
@@ -219,6 +236,8 @@ async def execute_task_async(
                 logger.error(f"Error closing database session for task {task_id}: {e}")
         
         # Remove from active executions
-        if task_id in scheduler.active_executions:
-            del scheduler.active_executions[task_id]
+        execution_key = execution_key or task_id
+        if execution_key in scheduler.active_executions:
+            del scheduler.active_executions[execution_key]
+        scheduler._on_execution_finished(execution_key)
 
@@ -0,0 +1,234 @@
+"""
+Task Lease Table
+Execution leases that stop a due task from being dispatched twice while it runs.
+
+Leases live in a dict of task key -> expiry on the monotonic clock (a float, so a
+check is one lookup and one comparison, and wall-clock changes cannot extend or cut
+short a lease). Every lease also goes on a min-heap of (expiry, key); sweep() pops
+the expired ones in bulk, so leases that are never looked at again do not pile up.
+
+Optionally the table is backed by a shared SQLite table, so several worker processes
+(e.g. gunicorn workers each running a scheduler) split the due tasks between them: a
+lease is only granted once the shared table accepts it, and a task leased by another
+worker is remembered locally until that lease runs out. The shared table stores wall
+clock expiries, since monotonic clocks are per process.
+
+Configuration (environment):
+    SCHEDULER_TASK_LEASE_TTL_SECONDS   Lease duration (default: 900)
+    SCHEDULER_TASK_LEASE_DB            Path of the shared SQLite lease table (default: none, per process)
+"""
+
+import heapq
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.logger_utils import get_service_logger
+
+logger = get_service_logger("task_lease_table")
+
+
+class SharedLeaseStore:
+    """Leases in a WAL-mode SQLite table shared by the worker processes of one host."""
+
+    def __init__(self, db_path: str, owner: str):
+        self.db_path = db_path
+        self.owner = owner
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=5, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS scheduler_task_leases (
+                    task_key TEXT PRIMARY KEY,
+                    owner TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            """)
+            self._conn = conn
+        return self._conn
+
+    def acquire(self, task_key: str, ttl_seconds: float) -> Tuple[bool, float]:
+        """
+        Take the lease unless another owner holds an unexpired one.
+
+        Returns:
+            (granted, seconds until the lease held now expires)
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            cursor = conn.execute(
+                "INSERT INTO scheduler_task_leases (task_key, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(task_key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE scheduler_task_leases.expires_at <= ? OR scheduler_task_leases.owner = excluded.owner",
+                (task_key, self.owner, now + ttl_seconds, now),
+            )
+            if cursor.rowcount == 1:
+                return True, ttl_seconds
+            row = conn.execute(
+                "SELECT expires_at FROM scheduler_task_leases WHERE task_key = ?", (task_key,)
+            ).fetchone()
+        return False, max(0.0, row[0] - now) if row else 0.0
+
+    def release(self, task_key: str):
+        with self._lock:
+            self._connection().execute(
+                "DELETE FROM scheduler_task_leases WHERE task_key = ? AND owner = ?", (task_key, self.owner)
+            )
+
+    def sweep(self) -> int:
+        with self._lock:
+            cursor = self._connection().execute(
+                "DELETE FROM scheduler_task_leases WHERE expires_at <= ?", (time.time(),)
+            )
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class TaskLeaseTable:
+    """Task key -> monotonic expiry, with a heap for bulk expiry and contention counters."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 900,
+        store: Optional[SharedLeaseStore] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.store = store
+        self._clock = clock
+        self._expiries: Dict[str, float] = {}
+        # Keys held by another worker of the shared store (not ours to release)
+        self._foreign: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self.stats = {
+            "acquired": 0,
+            "contended": 0,  # refused: still leased by this process
+            "shared_contended": 0,  # refused: leased by another worker
+            "shared_errors": 0,
+            "released": 0,
+            "expired": 0,
+        }
+
+    @classmethod
+    def from_env(cls, owner: str) -> "TaskLeaseTable":
+        ttl_seconds = int(os.getenv("SCHEDULER_TASK_LEASE_TTL_SECONDS", "900"))
+        db_path = os.getenv("SCHEDULER_TASK_LEASE_DB")
+        store = SharedLeaseStore(db_path, owner) if db_path else None
+        return cls(ttl_seconds=ttl_seconds, store=store)
+
+    def acquire(self, task_key: str) -> bool:
+        """Lease a task key for ttl_seconds; False if it is already leased."""
+        now = self._clock()
+        with self._lock:
+            self._sweep_locked(now)
+            if self._lease_expiry(task_key, now) is not None:
+                self.stats["contended"] += 1
+                return False
+
+        if self.store is not None:
+            try:
+                granted, remaining = self.store.acquire(task_key, self.ttl_seconds)
+            except sqlite3.Error as e:
+                # Without the shared table this worker cannot know what the others
+                # run, so it does not run anything rather than risk a double execution
+                self.stats["shared_errors"] += 1
+                logger.warning(f"[Scheduler] Shared lease table unavailable, not leasing {task_key}: {e}")
+                return False
+            if not granted:
+                with self._lock:
+                    self.stats["shared_contended"] += 1
+                    self._put(self._foreign, task_key, now + remaining)
+                return False
+
+        with self._lock:
+            self._foreign.pop(task_key, None)
+            self._put(self._expiries, task_key, now + self.ttl_seconds)
+            self.stats["acquired"] += 1
+        return True
+
+    def release(self, task_key: str):
+        with self._lock:
+            held = self._expiries.pop(task_key, None) is not None
+            self._foreign.pop(task_key, None)
+            if held:
+                self.stats["released"] += 1
+        if held and self.store is not None:
+            try:
+                self.store.release(task_key)
+            except sqlite3.Error as e:
+                logger.warning(f"[Scheduler] Could not release shared lease {task_key}: {e}")
+
+    def is_leased(self, task_key: str) -> bool:
+        return self.remaining(task_key) is not None
+
+    def remaining(self, task_key: str) -> Optional[float]:
+        """Seconds until the key's lease expires, or None if it is not leased."""
+        now = self._clock()
+        expiry = self._lease_expiry(task_key, now)
+        return expiry - now if expiry is not None else None
+
+    def sweep(self) -> int:
+        """Drop every expired lease (and expired rows of the shared table); returns how many."""
+        with self._lock:
+            expired = self._sweep_locked(self._clock())
+        if self.store is not None:
+            try:
+                self.store.sweep()
+            except sqlite3.Error as e:
+                logger.debug(f"Could not sweep shared lease table: {e}")
+        return expired
+
+    def __len__(self) -> int:
+        return len(self._expiries)
+
+    def __contains__(self, task_key: str) -> bool:
+        return self.is_leased(task_key)
+
+    def get_stats(self) -> Dict[str, int]:
+        stats = dict(self.stats)
+        stats["active"] = len(self._expiries)
+        stats["held_by_other_workers"] = len(self._foreign)
+        stats["shared"] = self.store is not None
+        return stats
+
+    def _lease_expiry(self, task_key: str, now: float) -> Optional[float]:
+        expiry = self._expiries.get(task_key)
+        if expiry is None:
+            expiry = self._foreign.get(task_key)
+        return expiry if expiry is not None and expiry > now else None
+
+    def _put(self, leases: Dict[str, float], task_key: str, expiry: float):
+        leases[task_key] = expiry
+        heapq.heappush(self._heap, (expiry, task_key))
+        # Released and renewed leases leave stale heap entries; compact when they dominate
+        if len(self._heap) > 2 * (len(self._expiries) + len(self._foreign)) + 64:
+            self._heap = [(e, k) for k, e in self._expiries.items()] + [(e, k) for k, e in self._foreign.items()]
+            heapq.heapify(self._heap)
+
+    def _sweep_locked(self, now: float) -> int:
+        expired = 0
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            expiry, task_key = heapq.heappop(heap)
+            if self._expiries.get(task_key) == expiry:
+                del self._expiries[task_key]
+                expired += 1
+            elif self._foreign.get(task_key) == expiry:
+                del self._foreign[task_key]
+        self.stats["expired"] += expired
+        return expired
@@ -4,10 +4,11 @@ Manages registration of task executors and loaders.
 """
 
 import logging
-from typing import Dict, Callable, List, Any
+from typing import Dict, Callable, List, Any, Optional
 from sqlalchemy.orm import Session
 
 from .executor_interface import TaskExecutor
+from .due_task_index import DueTaskIndex, DueTaskSource
 
 logger = logging.getLogger(__name__)
 
@@ -18,12 +19,14 @@ class TaskRegistry:
     def __init__(self):
         self.executors: Dict[str, TaskExecutor] = {}
         self.task_loaders: Dict[str, Callable[[Session], List[Any]]] = {}
+        self.due_index = DueTaskIndex()
     
     def register(
         self,
         task_type: str,
         executor: TaskExecutor,
-        task_loader: Callable[[Session], List[Any]]
+        task_loader: Callable[[Session], List[Any]],
+        due_source: Optional[DueTaskSource] = None
     ):
         """
         Register a task executor and loader.
@@ -32,12 +35,15 @@ class TaskRegistry:
             task_type: Unique identifier for task type
             executor: TaskExecutor instance
             task_loader: Function that loads due tasks from database
+            due_source: Task table for the shared due-task index (see due_task_index)
         """
         if task_type in self.executors:
             logger.warning(f"Overwriting existing executor for task type: {task_type}")
         
         self.executors[task_type] = executor
         self.task_loaders[task_type] = task_loader
+        if due_source is not None:
+            self.due_index.register(task_type, due_source)
         
         logger.info(f"Registered task type: {task_type}")
     
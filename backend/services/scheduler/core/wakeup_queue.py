@@ -0,0 +1,210 @@
+"""
+Wakeup Queue
+Event-driven scheduling: the scheduler sleeps until the earliest due task of any user.
+
+The queue is a min-heap of (next due time, user_id), one live entry per user (the
+earliest). The scheduler's wakeup loop waits until the head is due, or until it is
+woken because a task was created or rescheduled, then runs the check cycle for just
+the users that are due.
+
+Entries come from:
+- start-up: job_restoration.restore_task_wakeups() reads each user's earliest due
+  task from the scheduled_tasks view (see due_task_index)
+- task writes: for every indexed task type, ORM hooks on its model record the new
+  next run time of inserted/updated runnable rows and push it once the session
+  commits (a rollback discards them)
+- the scheduler itself, for leased tasks when their lease runs out, and for tasks
+  dropped from the dispatch queue after waiting too long for a slot
+
+Writes that bypass the ORM, and task types without a due-task source, are picked up
+by the periodic check_due_tasks sweep, which then runs at the maximum interval.
+
+Configuration (environment):
+    ALWRITY_SCHEDULER_WAKEUPS_DISABLED   "true" goes back to interval polling only
+"""
+
+import asyncio
+import heapq
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from utils.logger_utils import get_service_logger
+from .due_task_index import DueTaskSource
+
+logger = get_service_logger("wakeup_queue")
+
+
+def wakeups_enabled() -> bool:
+    return os.getenv("ALWRITY_SCHEDULER_WAKEUPS_DISABLED", "").lower() not in ("1", "true", "yes")
+
+
+def _as_utc_naive(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class WakeupQueue:
+    """Min-heap of each user's next due time, with an asyncio wait for the earliest."""
+
+    def __init__(self):
+        self._heap: List[Tuple[datetime, str]] = []
+        # user_id -> due time of the user's live heap entry; other entries are stale
+        self._next_due: Dict[str, datetime] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._event: Optional[asyncio.Event] = None
+        self._watched: Set[Tuple[int, str]] = set()
+        self._info_key = f"scheduler_wakeups_{id(self)}"
+        self._session_hooks = False
+        self.stats = {"scheduled": 0, "wakeups": 0, "users_woken": 0}
+
+    def schedule(self, user_id: Optional[str], due_at: Optional[datetime] = None) -> bool:
+        """
+        Make sure the user is woken at `due_at` (now when None). Thread-safe.
+
+        Returns:
+            True if this moved the user's wakeup earlier
+        """
+        if not user_id:
+            return False
+        due_at = _as_utc_naive(due_at) if due_at is not None else datetime.utcnow()
+        with self._lock:
+            current = self._next_due.get(user_id)
+            if current is not None and current <= due_at:
+                return False
+            self._next_due[user_id] = due_at
+            heapq.heappush(self._heap, (due_at, user_id))
+            self.stats["scheduled"] += 1
+            is_head = self._heap[0] == (due_at, user_id)
+        if is_head:
+            self.wake()
+        return True
+
+    def next_due(self) -> Optional[datetime]:
+        """Earliest due time in the queue, or None when it is empty."""
+        with self._lock:
+            self._drop_stale_head()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[datetime] = None) -> List[str]:
+        """Remove and return the users due by `now`, earliest first."""
+        now = now or datetime.utcnow()
+        users = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due_at, user_id = heapq.heappop(self._heap)
+                if self._next_due.get(user_id) == due_at:
+                    del self._next_due[user_id]
+                    users.append(user_id)
+        return users
+
+    def _drop_stale_head(self):
+        while self._heap and self._next_due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._next_due)
+
+    def clear(self):
+        with self._lock:
+            self._heap.clear()
+            self._next_due.clear()
+
+    # -- waiting ---------------------------------------------------------------
+
+    def bind(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Attach to the event loop that will call wait_until_due()."""
+        self._loop = loop or asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def wake(self):
+        """Interrupt wait_until_due() so it re-reads the head. Safe from any thread."""
+        loop, wakeup_event = self._loop, self._event
+        if loop is None or wakeup_event is None or loop.is_closed():
+            return
+        try:
+            if asyncio.get_running_loop() is loop:
+                wakeup_event.set()
+                return
+        except RuntimeError:
+            pass
+        loop.call_soon_threadsafe(wakeup_event.set)
+
+    async def wait_until_due(self) -> List[str]:
+        """
+        Sleep until the earliest entry is due (indefinitely while the queue is empty,
+        until a schedule() wakes it) and return the due users.
+        """
+        if self._event is None:
+            self.bind()
+        while True:
+            self._event.clear()
+            head = self.next_due()
+            if head is not None:
+                delay = (head - datetime.utcnow()).total_seconds()
+                if delay <= 0:
+                    users = self.pop_due()
+                    if users:
+                        self.stats["wakeups"] += 1
+                        self.stats["users_woken"] += len(users)
+                        return users
+                    continue
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout=None if head is None else delay)
+            except asyncio.TimeoutError:
+                pass
+
+    # -- task write hooks ------------------------------------------------------
+
+    def watch(self, source: DueTaskSource):
+        """Push the next run time of runnable rows of `source` written through the ORM."""
+        key = (id(source.model), source.select_sql(""))
+        if key in self._watched:
+            return
+        self._watched.add(key)
+        self._install_session_hooks()
+
+        def record(mapper, connection, target):
+            try:
+                self._record_write(source, target)
+            except Exception as e:
+                logger.debug(f"Could not record wakeup for {source.table_name} row: {e}")
+
+        event.listen(source.model, "after_insert", record)
+        event.listen(source.model, "after_update", record)
+
+    def _record_write(self, source: DueTaskSource, target: Any):
+        if getattr(target, "status", None) not in source.statuses:
+            return
+        if any(getattr(target, column, None) != value for column, value in source.filters):
+            return
+        due_at = getattr(target, source.time_column, None)
+        if due_at is None and not source.include_unscheduled:
+            return
+        session = object_session(target)
+        if session is None:
+            return
+        user_id = session.info.get("user_id") or getattr(target, "user_id", None)
+        if user_id:
+            session.info.setdefault(self._info_key, []).append((str(user_id), due_at))
+
+    def _install_session_hooks(self):
+        if self._session_hooks:
+            return
+        self._session_hooks = True
+
+        def after_commit(session):
+            for user_id, due_at in session.info.pop(self._info_key, ()):
+                self.schedule(user_id, due_at)
+
+        def after_rollback(session):
+            session.info.pop(self._info_key, None)
+
+        event.listen(Session, "after_commit", after_commit)
+        event.listen(Session, "after_soft_rollback", lambda session, previous_transaction: after_rollback(session))
@@ -7,6 +7,7 @@ from typing import List, Optional
 from datetime import datetime
 from sqlalchemy.orm import Session
 from models.advertools_monitoring_models import AdvertoolsTask
+from ..core.due_task_index import DueTaskSource
 
 def load_due_advertools_tasks(db: Session, user_id: Optional[str] = None) -> List[AdvertoolsTask]:
     """
@@ -30,3 +31,7 @@ def load_due_advertools_tasks(db: Session, user_id: Optional[str] = None) -> Lis
         query = query.filter(AdvertoolsTask.user_id == user_id)
         
     return query.all()
+
+
+# Same predicate as load_due_advertools_tasks, for the shared due-task index
+ADVERTOOLS_DUE_SOURCE = DueTaskSource(AdvertoolsTask, include_unscheduled=False)
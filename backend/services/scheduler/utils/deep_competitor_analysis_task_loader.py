@@ -5,6 +5,7 @@ from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
 from models.website_analysis_monitoring_models import DeepCompetitorAnalysisTask
+from ..core.due_task_index import DueTaskSource
 
 
 def load_due_deep_competitor_analysis_tasks(
@@ -28,3 +29,6 @@ def load_due_deep_competitor_analysis_tasks(
 
     return query.all()
 
+
+# Same predicate as load_due_deep_competitor_analysis_tasks, for the shared due-task index
+DEEP_COMPETITOR_ANALYSIS_DUE_SOURCE = DueTaskSource(DeepCompetitorAnalysisTask)
@@ -4,6 +4,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import or_
 
 from models.website_analysis_monitoring_models import DeepWebsiteCrawlTask
+from ..core.due_task_index import DueTaskSource
 
 def load_due_deep_website_crawl_tasks(db: Session, user_id: str = None) -> List[DeepWebsiteCrawlTask]:
     """
@@ -31,3 +32,7 @@ def load_due_deep_website_crawl_tasks(db: Session, user_id: str = None) -> List[
         query = query.filter(DeepWebsiteCrawlTask.user_id == user_id)
         
     return query.all()
+
+
+# Same predicate as load_due_deep_website_crawl_tasks, for the shared due-task index
+DEEP_WEBSITE_CRAWL_DUE_SOURCE = DueTaskSource(DeepWebsiteCrawlTask, statuses=('active', 'retry'))
@@ -10,6 +10,7 @@ from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from models.website_analysis_monitoring_models import MarketTrendsTask
+from ..core.due_task_index import DueTaskSource
 from utils.logger_utils import get_service_logger
 
 logger = get_service_logger("market_trends_task_loader")
@@ -35,3 +36,6 @@ def load_due_market_trends_tasks(db: Session, user_id: Optional[str] = None) ->
         logger.error(f"Error loading market trends tasks: {e}")
         return []
 
+
+# Same predicate as load_due_market_trends_tasks, for the shared due-task index
+MARKET_TRENDS_DUE_SOURCE = DueTaskSource(MarketTrendsTask)
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 
 from models.oauth_token_monitoring_models import OAuthTokenMonitoringTask
+from ..core.due_task_index import DueTaskSource
 
 
 def load_due_oauth_token_monitoring_tasks(
@@ -52,3 +53,6 @@ def load_due_oauth_token_monitoring_tasks(
     
     return query.all()
 
+
+# Same predicate as load_due_oauth_token_monitoring_tasks, for the shared due-task index
+OAUTH_TOKEN_MONITORING_DUE_SOURCE = DueTaskSource(OAuthTokenMonitoringTask, time_column='next_check')
@@ -10,6 +10,7 @@ from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
 from models.website_analysis_monitoring_models import OnboardingFullWebsiteAnalysisTask
+from ..core.due_task_index import DueTaskSource
 
 
 def load_due_onboarding_full_website_analysis_tasks(
@@ -33,3 +34,6 @@ def load_due_onboarding_full_website_analysis_tasks(
 
     return query.all()
 
+
+# Same predicate as load_due_onboarding_full_website_analysis_tasks, for the shared due-task index
+ONBOARDING_FULL_WEBSITE_ANALYSIS_DUE_SOURCE = DueTaskSource(OnboardingFullWebsiteAnalysisTask)
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 
 from models.platform_insights_monitoring_models import PlatformInsightsTask
+from ..core.due_task_index import DueTaskSource
 
 
 def load_due_platform_insights_tasks(
@@ -58,3 +59,7 @@ def load_due_platform_insights_tasks(
     
     return tasks
 
+
+def platform_insights_due_source(platform: str) -> DueTaskSource:
+    """Same predicate as load_due_platform_insights_tasks(platform=...), for the shared due-task index."""
+    return DueTaskSource(PlatformInsightsTask, time_column='next_check', filters=(('platform', platform),))
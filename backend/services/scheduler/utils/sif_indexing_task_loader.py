@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import or_
 
 from models.website_analysis_monitoring_models import SIFIndexingTask
+from ..core.due_task_index import DueTaskSource
 from utils.logger_utils import get_service_logger
 
 logger = get_service_logger("sif_indexing_task_loader")
@@ -44,3 +45,9 @@ def load_due_sif_indexing_tasks(db: Session, user_id: str = None) -> List[SIFInd
     except Exception as e:
         logger.error(f"Error loading SIF indexing tasks: {str(e)}")
         return []
+
+
+# Same predicate as load_due_sif_indexing_tasks, for the shared due-task index
+SIF_INDEXING_DUE_SOURCE = DueTaskSource(
+    SIFIndexingTask, statuses=('pending', 'active', 'failed'), include_unscheduled=False
+)
@@ -10,6 +10,7 @@ from sqlalchemy import and_, or_
 
 from models.monitoring_models import MonitoringTask
 from models.enhanced_strategy_models import EnhancedContentStrategy
+from ..core.due_task_index import DueTaskSource
 
 
 def load_due_monitoring_tasks(
@@ -61,3 +62,13 @@ def load_due_monitoring_tasks(
     
     return query.all()
 
+
+# Same predicate as load_due_monitoring_tasks, for the shared due-task index; the
+# strategy join keeps tasks without a strategy out and loads it for user isolation
+MONITORING_TASK_DUE_SOURCE = DueTaskSource(
+    MonitoringTask,
+    prepare_query=lambda query: query.join(
+        EnhancedContentStrategy,
+        MonitoringTask.strategy_id == EnhancedContentStrategy.id
+    ).options(joinedload(MonitoringTask.strategy)),
+)
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 
 from models.website_analysis_monitoring_models import WebsiteAnalysisTask
+from ..core.due_task_index import DueTaskSource
 
 
 def load_due_website_analysis_tasks(
@@ -52,3 +53,6 @@ def load_due_website_analysis_tasks(
     
     return query.all()
 
+
+# Same predicate as load_due_website_analysis_tasks, for the shared due-task index
+WEBSITE_ANALYSIS_DUE_SOURCE = DueTaskSource(WebsiteAnalysisTask, time_column='next_check')
@@ -12,6 +12,8 @@ This package provides:
 - User experience analysis
 - Security headers analysis
 - Keyword analysis
+- Shared page model (fetched and parsed once per analysis)
+- Bulk site audits with a site-level rollup
 - AI-powered insights generation
 - Database service for storing and retrieving analysis results
 """
@@ -28,8 +30,10 @@ from .analyzers import (
     SecurityHeadersAnalyzer,
     KeywordAnalyzer
 )
+from .page import ParsedPage
 from .utils import HTMLFetcher, AIInsightGenerator
 from .service import SEOAnalysisService
+from .site_audit import SiteAuditEngine
 
 __version__ = "1.0.0"
 __author__ = "AI-Writer Team"
@@ -46,7 +50,9 @@ __all__ = [
     'UserExperienceAnalyzer',
     'SecurityHeadersAnalyzer',
     'KeywordAnalyzer',
+    'ParsedPage',
     'HTMLFetcher',
     'AIInsightGenerator',
-    'SEOAnalysisService'
+    'SEOAnalysisService',
+    'SiteAuditEngine'
 ] 
\ No newline at end of file
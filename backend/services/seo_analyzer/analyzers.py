@@ -7,10 +7,19 @@ import re
 import time
 import requests
 from urllib.parse import urlparse, urljoin
-from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, List, Any, Optional, Union
 from loguru import logger
 
+from .page import ParsedPage
+
+# Internal-link heuristic used by ContentAnalyzer: href not starting with "http"
+_RELATIVE_HREF = re.compile(r'^[^http]')
+
+
+def _header(headers: Any, name: str) -> Optional[str]:
+    """Header lookup for requests' case-insensitive headers or a ParsedPage's lower-cased ones."""
+    return headers.get(name) or headers.get(name.lower())
+
 
 class BaseAnalyzer:
     """Base class for all SEO analyzers"""
@@ -98,15 +107,15 @@ class URLStructureAnalyzer(BaseAnalyzer):
 class MetaDataAnalyzer(BaseAnalyzer):
     """Analyzes meta data and technical SEO elements"""
     
-    def analyze(self, html_content: str, url: str) -> Dict[str, Any]:
+    def analyze(self, html_content: Union[ParsedPage, str], url: str) -> Dict[str, Any]:
         """Enhanced meta data analysis with specific element locations"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        page = ParsedPage.coerce(html_content, url)
         issues = []
         warnings = []
         recommendations = []
         
         # Title analysis
-        title_tag = soup.find('title')
+        title_tag = page.title
         if not title_tag:
             issues.append({
                 'type': 'critical',
@@ -140,7 +149,7 @@ class MetaDataAnalyzer(BaseAnalyzer):
                 })
         
         # Meta description analysis
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
+        meta_desc = page.meta('name', 'description')
         if not meta_desc:
             issues.append({
                 'type': 'critical',
@@ -174,7 +183,7 @@ class MetaDataAnalyzer(BaseAnalyzer):
                 })
         
         # Viewport meta tag
-        viewport = soup.find('meta', attrs={'name': 'viewport'})
+        viewport = page.meta('name', 'viewport')
         if not viewport:
             issues.append({
                 'type': 'critical',
@@ -186,7 +195,7 @@ class MetaDataAnalyzer(BaseAnalyzer):
             })
         
         # Charset declaration
-        charset = soup.find('meta', attrs={'charset': True}) or soup.find('meta', attrs={'http-equiv': 'Content-Type'})
+        charset = page.meta_charset or page.meta('http-equiv', 'Content-Type')
         if not charset:
             warnings.append({
                 'type': 'warning',
@@ -198,9 +207,9 @@ class MetaDataAnalyzer(BaseAnalyzer):
             })
             
         # Social Tags (Open Graph)
-        og_title = soup.find('meta', property='og:title')
-        og_desc = soup.find('meta', property='og:description')
-        og_image = soup.find('meta', property='og:image')
+        og_title = page.meta('property', 'og:title')
+        og_desc = page.meta('property', 'og:description')
+        og_image = page.meta('property', 'og:image')
         
         if not og_title or not og_image:
             warnings.append({
@@ -213,7 +222,7 @@ class MetaDataAnalyzer(BaseAnalyzer):
             })
             
         # Twitter Card
-        twitter_card = soup.find('meta', attrs={'name': 'twitter:card'})
+        twitter_card = page.meta('name', 'twitter:card')
         if not twitter_card:
             recommendations.append({
                 'type': 'recommendation',
@@ -225,7 +234,7 @@ class MetaDataAnalyzer(BaseAnalyzer):
             })
 
         # Robots Meta
-        robots = soup.find('meta', attrs={'name': 'robots'})
+        robots = page.meta('name', 'robots')
         if not robots:
              recommendations.append({
                 'type': 'recommendation',
@@ -258,15 +267,15 @@ class MetaDataAnalyzer(BaseAnalyzer):
 class ContentAnalyzer(BaseAnalyzer):
     """Analyzes content quality and structure"""
     
-    def analyze(self, html_content: str, url: str) -> Dict[str, Any]:
+    def analyze(self, html_content: Union[ParsedPage, str], url: str) -> Dict[str, Any]:
         """Enhanced content analysis with specific text locations"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        page = ParsedPage.coerce(html_content, url)
         issues = []
         warnings = []
         recommendations = []
         
         # Get all text content
-        text_content = soup.get_text()
+        text_content = page.text
         words = text_content.split()
         word_count = len(words)
         
@@ -283,7 +292,7 @@ class ContentAnalyzer(BaseAnalyzer):
             })
         
         # Check for H1 tags
-        h1_tags = soup.find_all('h1')
+        h1_tags = page.tags('h1')
         if len(h1_tags) == 0:
             issues.append({
                 'type': 'critical',
@@ -305,7 +314,7 @@ class ContentAnalyzer(BaseAnalyzer):
             })
         
         # Check for images without alt text
-        images = soup.find_all('img')
+        images = page.images
         images_without_alt = [img for img in images if not img.get('alt')]
         if images_without_alt:
             warnings.append({
@@ -319,7 +328,7 @@ class ContentAnalyzer(BaseAnalyzer):
             })
         
         # Check for internal links
-        internal_links = soup.find_all('a', href=re.compile(r'^[^http]'))
+        internal_links = [a for a in page.links if _RELATIVE_HREF.search(a['href'])]
         if len(internal_links) < 3:
             warnings.append({
                 'type': 'warning',
@@ -370,12 +379,9 @@ class ContentAnalyzer(BaseAnalyzer):
 class TechnicalSEOAnalyzer(BaseAnalyzer):
     """Analyzes technical SEO elements"""
     
-    def analyze(self, html_content: str, url: str) -> Dict[str, Any]:
-        """Enhanced technical SEO analysis with specific fixes"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        issues = []
+    def site_file_warnings(self, url: str) -> List[Dict[str, Any]]:
+        """robots.txt and sitemap.xml checks; these are per site, so bulk audits run them once."""
         warnings = []
-        recommendations = []
         
         # Check for robots.txt
         robots_url = urljoin(url, '/robots.txt')
@@ -422,9 +428,22 @@ class TechnicalSEOAnalyzer(BaseAnalyzer):
                 'code_example': '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n<url>\n<loc>https://example.com/</loc>\n</url>\n</urlset>',
                 'action': 'create_sitemap'
             })
+        return warnings
+    
+    def analyze(self, html_content: Union[ParsedPage, str], url: str,
+                site_warnings: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Enhanced technical SEO analysis with specific fixes.
+
+        `site_warnings` are the result of site_file_warnings() for this site; when omitted
+        robots.txt and sitemap.xml are checked for this URL.
+        """
+        page = ParsedPage.coerce(html_content, url)
+        issues = []
+        warnings = list(site_warnings) if site_warnings is not None else self.site_file_warnings(url)
+        recommendations = []
         
         # Check for structured data
-        structured_data = soup.find_all('script', type='application/ld+json')
+        structured_data = [s for s in page.tags('script') if s.get('type') == 'application/ld+json']
         if not structured_data:
             warnings.append({
                 'type': 'warning',
@@ -436,7 +455,7 @@ class TechnicalSEOAnalyzer(BaseAnalyzer):
             })
         
         # Check for H1 tags (Technical aspect)
-        h1_tags = soup.find_all('h1')
+        h1_tags = page.tags('h1')
         if len(h1_tags) == 0:
             issues.append({
                 'type': 'critical',
@@ -457,7 +476,7 @@ class TechnicalSEOAnalyzer(BaseAnalyzer):
             })
             
         # Check for canonical URL
-        canonical = soup.find('link', rel='canonical')
+        canonical = page.link_rel('canonical')
         if not canonical:
             issues.append({
                 'type': 'critical',
@@ -488,12 +507,23 @@ class TechnicalSEOAnalyzer(BaseAnalyzer):
 class PerformanceAnalyzer(BaseAnalyzer):
     """Analyzes page performance"""
     
-    def analyze(self, url: str) -> Dict[str, Any]:
-        """Enhanced performance analysis with specific fixes"""
+    def analyze(self, url: Union[ParsedPage, str]) -> Dict[str, Any]:
+        """Enhanced performance analysis with specific fixes.
+
+        Given a fetched ParsedPage, its captured load time and headers are used and the
+        URL is not requested again.
+        """
+        page = url if isinstance(url, ParsedPage) and url.was_fetched else None
+        url = url.url if isinstance(url, ParsedPage) else url
         try:
-            start_time = time.time()
-            response = self.session.get(url, timeout=20)
-            load_time = time.time() - start_time
+            if page is not None:
+                load_time = page.load_time or 0
+                response_headers = page.headers
+            else:
+                start_time = time.time()
+                response = self.session.get(url, timeout=20)
+                load_time = time.time() - start_time
+                response_headers = response.headers
             
             issues = []
             warnings = []
@@ -522,7 +552,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
                 })
             
             # Check for compression
-            content_encoding = response.headers.get('Content-Encoding')
+            content_encoding = _header(response_headers, 'Content-Encoding')
             if not content_encoding:
                 warnings.append({
                     'type': 'warning',
@@ -535,7 +565,7 @@ class PerformanceAnalyzer(BaseAnalyzer):
             
             # Check for caching headers
             cache_headers = ['Cache-Control', 'Expires', 'ETag']
-            has_cache = any(response.headers.get(header) for header in cache_headers)
+            has_cache = any(_header(response_headers, header) for header in cache_headers)
             if not has_cache:
                 warnings.append({
                     'type': 'warning',
@@ -571,15 +601,15 @@ class PerformanceAnalyzer(BaseAnalyzer):
 class AccessibilityAnalyzer(BaseAnalyzer):
     """Analyzes accessibility features"""
     
-    def analyze(self, html_content: str) -> Dict[str, Any]:
+    def analyze(self, html_content: Union[ParsedPage, str]) -> Dict[str, Any]:
         """Enhanced accessibility analysis with specific fixes"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        page = ParsedPage.coerce(html_content)
         issues = []
         warnings = []
         recommendations = []
         
         # Check for alt text on images
-        images = soup.find_all('img')
+        images = page.images
         images_without_alt = [img for img in images if not img.get('alt')]
         if images_without_alt:
             issues.append({
@@ -593,15 +623,14 @@ class AccessibilityAnalyzer(BaseAnalyzer):
             })
         
         # Check for form labels
-        forms = soup.find_all('form')
+        forms = page.tags('form')
         for form in forms:
             inputs = form.find_all(['input', 'textarea', 'select'])
             for input_elem in inputs:
                 if input_elem.get('type') not in ['hidden', 'submit', 'button']:
                     input_id = input_elem.get('id')
                     if input_id:
-                        label = soup.find('label', attrs={'for': input_id})
-                        if not label:
+                        if input_id not in page.label_targets:
                             warnings.append({
                                 'type': 'warning',
                                 'message': f'Input without label (ID: {input_id})',
@@ -613,7 +642,7 @@ class AccessibilityAnalyzer(BaseAnalyzer):
                             })
         
         # Check for heading hierarchy
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+        headings = page.headings
         if headings:
             h1_count = len([h for h in headings if h.name == 'h1'])
             if h1_count == 0:
@@ -627,8 +656,8 @@ class AccessibilityAnalyzer(BaseAnalyzer):
                 })
         
         # Check for color contrast (basic check)
-        style_tags = soup.find_all('style')
-        inline_styles = soup.find_all(style=True)
+        style_tags = page.tags('style')
+        inline_styles = page.styled_elements
         if style_tags or inline_styles:
             warnings.append({
                 'type': 'warning',
@@ -656,15 +685,15 @@ class AccessibilityAnalyzer(BaseAnalyzer):
 class UserExperienceAnalyzer(BaseAnalyzer):
     """Analyzes user experience elements"""
     
-    def analyze(self, html_content: str, url: str) -> Dict[str, Any]:
+    def analyze(self, html_content: Union[ParsedPage, str], url: str) -> Dict[str, Any]:
         """Enhanced user experience analysis with specific fixes"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        page = ParsedPage.coerce(html_content, url)
         issues = []
         warnings = []
         recommendations = []
         
         # Check for mobile responsiveness indicators
-        viewport = soup.find('meta', attrs={'name': 'viewport'})
+        viewport = page.meta('name', 'viewport')
         if not viewport:
             issues.append({
                 'type': 'critical',
@@ -676,7 +705,7 @@ class UserExperienceAnalyzer(BaseAnalyzer):
             })
         
         # Check for navigation menu
-        nav_elements = soup.find_all(['nav', 'ul', 'ol'])
+        nav_elements = page.tags('nav', 'ul', 'ol')
         if not nav_elements:
             warnings.append({
                 'type': 'warning',
@@ -689,7 +718,7 @@ class UserExperienceAnalyzer(BaseAnalyzer):
         
         # Check for contact information
         contact_patterns = ['contact', 'phone', 'email', '@', 'tel:']
-        page_text = soup.get_text().lower()
+        page_text = page.text_lower
         has_contact = any(pattern in page_text for pattern in contact_patterns)
         if not has_contact:
             warnings.append({
@@ -732,17 +761,29 @@ class UserExperienceAnalyzer(BaseAnalyzer):
 class SecurityHeadersAnalyzer(BaseAnalyzer):
     """Analyzes security headers"""
     
-    def analyze(self, url: str) -> Dict[str, Any]:
-        """Enhanced security headers analysis with specific fixes"""
+    def analyze(self, url: Union[ParsedPage, str]) -> Dict[str, Any]:
+        """Enhanced security headers analysis with specific fixes.
+
+        Given a fetched ParsedPage, its captured response headers are used and the URL is
+        not requested again.
+        """
+        page = url if isinstance(url, ParsedPage) and url.was_fetched else None
+        url = url.url if isinstance(url, ParsedPage) else url
         try:
-            response = self.session.get(url, timeout=15, allow_redirects=True)
+            if page is not None:
+                response_headers = page.headers
+            else:
+                response_headers = self.session.get(url, timeout=15, allow_redirects=True).headers
             security_headers = {
-                'X-Frame-Options': response.headers.get('X-Frame-Options'),
-                'X-Content-Type-Options': response.headers.get('X-Content-Type-Options'),
-                'X-XSS-Protection': response.headers.get('X-XSS-Protection'),
-                'Strict-Transport-Security': response.headers.get('Strict-Transport-Security'),
-                'Content-Security-Policy': response.headers.get('Content-Security-Policy'),
-                'Referrer-Policy': response.headers.get('Referrer-Policy')
+                name: _header(response_headers, name)
+                for name in (
+                    'X-Frame-Options',
+                    'X-Content-Type-Options',
+                    'X-XSS-Protection',
+                    'Strict-Transport-Security',
+                    'Content-Security-Policy',
+                    'Referrer-Policy',
+                )
             }
             
             issues = []
@@ -800,18 +841,18 @@ class SecurityHeadersAnalyzer(BaseAnalyzer):
 class KeywordAnalyzer(BaseAnalyzer):
     """Analyzes keyword usage and optimization"""
     
-    def analyze(self, html_content: str, target_keywords: Optional[List[str]] = None) -> Dict[str, Any]:
+    def analyze(self, html_content: Union[ParsedPage, str], target_keywords: Optional[List[str]] = None) -> Dict[str, Any]:
         """Enhanced keyword analysis with specific locations"""
         if not target_keywords:
             return {'score': 0, 'issues': [], 'warnings': [], 'recommendations': []}
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        page = ParsedPage.coerce(html_content)
         issues = []
         warnings = []
         recommendations = []
         
-        page_text = soup.get_text().lower()
-        title_text = soup.find('title')
+        page_text = page.text_lower
+        title_text = page.title
         title_text = title_text.get_text().lower() if title_text else ""
         
         for keyword in target_keywords:
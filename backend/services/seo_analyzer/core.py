@@ -19,6 +19,7 @@ from .analyzers import (
     SecurityHeadersAnalyzer,
     KeywordAnalyzer
 )
+from .page import ParsedPage
 from .utils import HTMLFetcher, AIInsightGenerator
 
 
@@ -64,36 +65,52 @@ class ComprehensiveSEOAnalyzer:
         try:
             logger.info(f"Starting enhanced SEO analysis for URL: {url}")
             
-            # Fetch HTML content
-            html_content = self.html_fetcher.fetch_html(url)
-            if not html_content:
+            # Fetch and parse the page once; every analyzer reads the same ParsedPage
+            page = self.html_fetcher.fetch_page(url)
+            if page is None or not page.html:
                 return self._create_error_result(url, "Failed to fetch HTML content")
             
+            return self.analyze_page(page, target_keywords)
+            
+        except Exception as e:
+            logger.error(f"Error in enhanced SEO analysis for {url}: {str(e)}")
+            return self._create_error_result(url, str(e))
+
+    def analyze_page(self, page: ParsedPage, target_keywords: Optional[List[str]] = None,
+                     site_warnings: Optional[List[Dict[str, Any]]] = None) -> SEOAnalysisResult:
+        """
+        Run every analyzer on an already fetched page.
+
+        Makes no requests for the page itself; robots.txt/sitemap.xml are checked unless
+        `site_warnings` (TechnicalSEOAnalyzer.site_file_warnings) is given.
+        """
+        url = page.url
+        try:
             # Run all analyzers
             analysis_data = {}
             
             logger.info("Running enhanced analyses...")
             analysis_data.update({
                 'url_structure': self.url_analyzer.analyze(url),
-                'meta_data': self.meta_analyzer.analyze(html_content, url),
-                'content_analysis': self.content_analyzer.analyze(html_content, url),
-                'keyword_analysis': self.keyword_analyzer.analyze(html_content, target_keywords) if target_keywords else {},
-                'technical_seo': self.technical_analyzer.analyze(html_content, url),
-                'accessibility': self.accessibility_analyzer.analyze(html_content),
-                'user_experience': self.ux_analyzer.analyze(html_content, url)
+                'meta_data': self.meta_analyzer.analyze(page, url),
+                'content_analysis': self.content_analyzer.analyze(page, url),
+                'keyword_analysis': self.keyword_analyzer.analyze(page, target_keywords) if target_keywords else {},
+                'technical_seo': self.technical_analyzer.analyze(page, url, site_warnings),
+                'accessibility': self.accessibility_analyzer.analyze(page),
+                'user_experience': self.ux_analyzer.analyze(page, url)
             })
             
             # Run potentially slower analyses with error handling
             logger.info("Running security headers analysis...")
             try:
-                analysis_data['security_headers'] = self.security_analyzer.analyze(url)
+                analysis_data['security_headers'] = self.security_analyzer.analyze(page)
             except Exception as e:
                 logger.warning(f"Security headers analysis failed: {e}")
                 analysis_data['security_headers'] = self._create_fallback_result('security_headers', str(e))
             
             logger.info("Running performance analysis...")
             try:
-                analysis_data['performance'] = self.performance_analyzer.analyze(url)
+                analysis_data['performance'] = self.performance_analyzer.analyze(page)
             except Exception as e:
                 logger.warning(f"Performance analysis failed: {e}")
                 analysis_data['performance'] = self._create_fallback_result('performance', str(e))
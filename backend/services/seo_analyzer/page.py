@@ -0,0 +1,167 @@
+"""
+SEO Analyzer Page Model
+A page fetched once and parsed once, shared by every analyzer of a run.
+
+The analyzers used to receive raw HTML and each built its own BeautifulSoup tree,
+while the performance and security analyzers fetched the URL again for timing and
+headers. ParsedPage carries the response data (final URL, status, headers, load time)
+together with a single parse of the document and the element indexes the analyzers
+read (title, meta tags, links, images, headings, ...), collected in one tree walk.
+
+Configuration (environment):
+    ALWRITY_SEO_HTML_PARSER   BeautifulSoup tree builder ('lxml' when installed, else 'html.parser')
+"""
+
+import os
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+_META_KEYS = ('name', 'property', 'http-equiv')
+
+
+def default_parser() -> str:
+    """Tree builder used for pages: ALWRITY_SEO_HTML_PARSER, else lxml when available."""
+    configured = os.getenv('ALWRITY_SEO_HTML_PARSER', '').strip()
+    if configured:
+        return configured
+    try:
+        import lxml  # noqa: F401
+        return 'lxml'
+    except ImportError:
+        return 'html.parser'
+
+
+def _parse(html: str, parser: Optional[str]) -> BeautifulSoup:
+    try:
+        return BeautifulSoup(html, parser or default_parser())
+    except FeatureNotFound:
+        return BeautifulSoup(html, 'html.parser')
+
+
+@dataclass
+class ParsedPage:
+    """A fetched page: response metadata plus one parsed tree and its element indexes."""
+    url: str
+    html: str
+    final_url: str = ''
+    status_code: Optional[int] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    load_time: Optional[float] = None
+    fetched_at: Optional[float] = None
+    parser: Optional[str] = None
+
+    def __post_init__(self):
+        self.final_url = self.final_url or self.url
+        # Header lookups are case-insensitive, like requests' response.headers
+        self.headers = {str(k).lower(): v for k, v in (self.headers or {}).items()}
+        self.soup = _parse(self.html or '', self.parser)
+        self._build_indexes()
+
+    @classmethod
+    def from_html(cls, html: str, url: str = '', parser: Optional[str] = None) -> 'ParsedPage':
+        """Wrap HTML that was not fetched by HTMLFetcher (saved pages, crawler output)."""
+        return cls(url=url, html=html, parser=parser)
+
+    @classmethod
+    def from_response(cls, response: Any, url: str, load_time: float, parser: Optional[str] = None) -> 'ParsedPage':
+        """Build a page from a requests.Response, keeping the data the analyzers need."""
+        return cls(
+            url=url,
+            html=response.text,
+            final_url=getattr(response, 'url', '') or url,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            load_time=load_time,
+            fetched_at=time.time(),
+            parser=parser,
+        )
+
+    @classmethod
+    def coerce(cls, page_or_html: Union['ParsedPage', str], url: str = '') -> 'ParsedPage':
+        """Accept either a ParsedPage or raw HTML (the analyzers' original input)."""
+        if isinstance(page_or_html, ParsedPage):
+            return page_or_html
+        return cls.from_html(page_or_html or '', url)
+
+    @property
+    def was_fetched(self) -> bool:
+        """True when headers and timing come from a real response."""
+        return self.status_code is not None
+
+    def header(self, name: str) -> Optional[str]:
+        return self.headers.get(name.lower())
+
+    def _build_indexes(self) -> None:
+        """Walk the tree once and bucket the elements the analyzers look up."""
+        self._by_name: Dict[str, List[Any]] = {}
+        self._meta: Dict[Tuple[str, str], Any] = {}
+        self._link_rel: Dict[str, Any] = {}
+        self.headings: List[Any] = []
+        self.styled_elements: List[Any] = []
+        self.meta_charset = None
+        self.label_targets = set()
+
+        for tag in self.soup.find_all(True):
+            name = tag.name
+            self._by_name.setdefault(name, []).append(tag)
+            attrs = tag.attrs
+            if 'style' in attrs:
+                self.styled_elements.append(tag)
+            if name in _HEADING_TAGS:
+                self.headings.append(tag)
+            elif name == 'meta':
+                for key in _META_KEYS:
+                    value = attrs.get(key)
+                    if isinstance(value, str):
+                        self._meta.setdefault((key, value), tag)
+                if self.meta_charset is None and 'charset' in attrs:
+                    self.meta_charset = tag
+            elif name == 'link':
+                rel = attrs.get('rel') or []
+                for value in ([rel] if isinstance(rel, str) else rel):
+                    self._link_rel.setdefault(value, tag)
+            elif name == 'label':
+                target = attrs.get('for')
+                if target:
+                    self.label_targets.add(target)
+
+    def tags(self, *names: str) -> List[Any]:
+        """All elements with the given tag name(s); document order within each name."""
+        if len(names) == 1:
+            return self._by_name.get(names[0], [])
+        return [tag for name in names for tag in self._by_name.get(name, [])]
+
+    def meta(self, key: str, value: str) -> Optional[Any]:
+        """First <meta> whose `key` attribute (name, property, http-equiv) equals `value`."""
+        return self._meta.get((key, value))
+
+    def link_rel(self, rel: str) -> Optional[Any]:
+        """First <link> carrying `rel` (e.g. 'canonical')."""
+        return self._link_rel.get(rel)
+
+    @property
+    def title(self) -> Optional[Any]:
+        titles = self._by_name.get('title')
+        return titles[0] if titles else None
+
+    @property
+    def links(self) -> List[Any]:
+        """<a> elements that have an href."""
+        return [a for a in self._by_name.get('a', []) if a.get('href') is not None]
+
+    @property
+    def images(self) -> List[Any]:
+        return self._by_name.get('img', [])
+
+    @cached_property
+    def text(self) -> str:
+        return self.soup.get_text()
+
+    @cached_property
+    def text_lower(self) -> str:
+        return self.text.lower()
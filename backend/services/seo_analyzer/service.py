@@ -16,6 +16,7 @@ from models.seo_analysis import (
     SEORecommendation,
     SEOCategoryScore,
     SEOAnalysisHistory,
+    SEOAnalysisSession,
     create_analysis_from_result,
     create_issues_from_result,
     create_warnings_from_result,
@@ -30,12 +31,13 @@ class SEOAnalysisService:
     def __init__(self, db_session: Session):
         self.db = db_session
     
-    def store_analysis_result(self, result: SEOAnalysisResult) -> Optional[SEOAnalysis]:
+    def store_analysis_result(self, result: SEOAnalysisResult, session_id: Optional[int] = None) -> Optional[SEOAnalysis]:
         """
         Store SEO analysis result in the database.
         
         Args:
             result: SEOAnalysisResult from the analyzer
+            session_id: Optional SEOAnalysisSession (e.g. a site audit) the page belongs to
             
         Returns:
             Stored SEOAnalysis record or None if failed
@@ -43,6 +45,7 @@ class SEOAnalysisService:
         try:
             # Create main analysis record
             analysis_record = create_analysis_from_result(result)
+            analysis_record.session_id = session_id
             self.db.add(analysis_record)
             self.db.flush()  # Get the ID
             
@@ -105,6 +108,75 @@ class SEOAnalysisService:
             self.db.rollback()
             return None
     
+    def start_site_audit(self, url: str, user_id: Optional[str] = None,
+                         input_context: Optional[Dict[str, Any]] = None) -> Optional[SEOAnalysisSession]:
+        """
+        Open a session for a bulk site audit; page analyses are stored against it as they finish.
+        
+        Args:
+            url: Site (or sitemap) URL being audited
+            user_id: User who started the audit
+            input_context: Audit parameters (URL count, limits, keywords)
+            
+        Returns:
+            The running SEOAnalysisSession or None if failed
+        """
+        try:
+            session = SEOAnalysisSession(
+                url=url,
+                triggered_by_user_id=user_id,
+                trigger_source='manual',
+                input_context=input_context,
+                status='running',
+                started_at=datetime.utcnow()
+            )
+            self.db.add(session)
+            self.db.commit()
+            return session
+        except Exception as e:
+            logger.error(f"Error starting site audit for {url}: {str(e)}")
+            self.db.rollback()
+            return None
+    
+    def finish_site_audit(self, session_id: int, rollup: Dict[str, Any], status: str = 'success') -> bool:
+        """
+        Close a site audit session with its site-level rollup.
+        
+        Args:
+            session_id: SEOAnalysisSession ID returned by start_site_audit
+            rollup: Site-level rollup (scores, duplicates, orphans, broken links)
+            status: Final status (success, failed, cancelled)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            session = self.db.query(SEOAnalysisSession).filter(
+                SEOAnalysisSession.id == session_id
+            ).first()
+            if not session:
+                logger.warning(f"Site audit session {session_id} not found")
+                return False
+            
+            session.status = status
+            session.completed_at = datetime.utcnow()
+            session.overall_score = rollup.get('average_score')
+            session.health_label = rollup.get('health_status')
+            session.metrics = rollup
+            session.issues_overview = rollup.get('top_issues')
+            session.summary = (
+                f"{rollup.get('pages_audited', 0)} pages audited, "
+                f"{rollup.get('pages_failed', 0)} failed, "
+                f"{len(rollup.get('broken_links', []))} broken links, "
+                f"{len(rollup.get('orphan_pages', []))} orphan pages"
+            )
+            self.db.commit()
+            return True
+        except Exception as e:
+            logger.error(f"Error finishing site audit {session_id}: {str(e)}")
+            self.db.rollback()
+            return False
+    
     def get_latest_analysis(self, url: str) -> Optional[SEOAnalysis]:
         """
         Get the latest SEO analysis for a URL.
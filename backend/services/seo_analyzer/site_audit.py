@@ -0,0 +1,553 @@
+"""
+SEO Analyzer Site Audit
+Audits every page of a site (a sitemap or any URL list) and rolls the results up per site.
+
+- Pages are fetched concurrently over one aiohttp session, politely: a cap on
+  concurrent requests per host and a minimum gap between request starts to a host.
+- Parsing and analysis (ComprehensiveSEOAnalyzer.analyze_page) run in a process pool.
+  robots.txt and sitemap.xml are checked once per host, not once per page.
+- Only a bounded window of pages is in flight. A page's HTML is dropped as soon as the
+  worker has analysed it; what is kept for the rollup is its title, meta description
+  and internal links, so large sites (10k pages) run in bounded memory.
+- Per-page results are yielded as they finish and, when a SEOAnalysisService is given,
+  stored against an SEOAnalysisSession as they arrive. The last event is the site-level
+  rollup: scores, duplicate titles and meta descriptions, orphan pages, broken links.
+
+Configuration (environment):
+    ALWRITY_SEO_AUDIT_CONCURRENCY        pages in flight across all hosts (default 16)
+    ALWRITY_SEO_AUDIT_HOST_CONCURRENCY   concurrent requests per host (default 4)
+    ALWRITY_SEO_AUDIT_HOST_DELAY         minimum seconds between requests to one host (default 0.1)
+    ALWRITY_SEO_AUDIT_WORKERS            analysis worker processes (default: CPU count)
+    ALWRITY_SEO_AUDIT_MAX_PAGES          pages audited per run (default 10000)
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urldefrag, urljoin, urlsplit, urlunsplit
+
+import aiohttp
+from loguru import logger
+
+from .analyzers import TechnicalSEOAnalyzer
+from .core import ComprehensiveSEOAnalyzer
+from .page import ParsedPage
+
+MAX_PAGE_BYTES = 5 * 1024 * 1024
+USER_AGENT = 'Mozilla/5.0 (compatible; ALwritySEO/1.0; +https://alwrity.com)'
+
+FetchedPage = Dict[str, Any]
+
+
+def _env_number(name: str, default, cast=int):
+    try:
+        return cast(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form used to match links to pages: no fragment, lower-case host, no trailing slash."""
+    url, _ = urldefrag((url or '').strip())
+    parts = urlsplit(url)
+    path = parts.path or '/'
+    if len(path) > 1 and path.endswith('/'):
+        path = path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ''))
+
+
+def _site_host(url: str) -> str:
+    host = urlsplit(url).netloc.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def internal_links(page: ParsedPage) -> List[str]:
+    """Normalized same-site http(s) link targets of a page, without duplicates or self-links."""
+    base = page.final_url or page.url
+    host = _site_host(base)
+    own = {normalize_url(page.url), normalize_url(base)}
+    targets = []
+    seen = set()
+    for link in page.links:
+        href = (link.get('href') or '').strip()
+        if not href or href.startswith(('mailto:', 'tel:', 'javascript:', '#')):
+            continue
+        target = urljoin(base, href)
+        if not target.startswith(('http://', 'https://')) or _site_host(target) != host:
+            continue
+        target = normalize_url(target)
+        if target not in own and target not in seen:
+            seen.add(target)
+            targets.append(target)
+    return targets
+
+
+_worker_analyzer: Optional[ComprehensiveSEOAnalyzer] = None
+
+
+def audit_page(fetched: FetchedPage, target_keywords: Optional[List[str]] = None,
+               site_warnings: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Worker job: parse and analyse one fetched page.
+
+    Returns the SEOAnalysisResult and the facts the site rollup needs; the HTML itself
+    is not returned.
+    """
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = ComprehensiveSEOAnalyzer()
+
+    page = ParsedPage(
+        url=fetched['url'],
+        html=fetched['html'],
+        final_url=fetched.get('final_url') or fetched['url'],
+        status_code=fetched.get('status_code'),
+        headers=fetched.get('headers') or {},
+        load_time=fetched.get('load_time'),
+    )
+    result = _worker_analyzer.analyze_page(page, target_keywords, site_warnings)
+    description = page.meta('name', 'description')
+    return {
+        'result': result,
+        'title': page.title.get_text().strip() if page.title else '',
+        'meta_description': (description.get('content') or '').strip() if description else '',
+        'links': internal_links(page),
+    }
+
+
+def _health_label(score: float) -> str:
+    if score >= 80:
+        return 'excellent'
+    if score >= 60:
+        return 'good'
+    if score >= 40:
+        return 'needs_improvement'
+    return 'poor'
+
+
+class HostPoliteness:
+    """Per-host cap on concurrent requests and minimum spacing between request starts."""
+
+    def __init__(self, concurrency: int, delay: float):
+        self.concurrency = max(1, concurrency)
+        self.delay = max(0.0, delay)
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+        self._next_start: Dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._slots.setdefault(host, asyncio.Semaphore(self.concurrency))
+        async with semaphore:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            start = max(now, self._next_start.get(host, 0.0))
+            self._next_start[host] = start + self.delay
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+
+class SiteAuditRollup:
+    """Site-level aggregates, built incrementally from page results."""
+
+    def __init__(self, urls: Iterable[str], max_examples: int = 10, max_unlisted: int = 50000):
+        self.listed = {normalize_url(u) for u in urls}
+        self.max_examples = max_examples
+        self.max_unlisted = max_unlisted
+        self.aliases: Dict[str, str] = {}
+        self.inbound: Counter = Counter()
+        self.first_referrer: Dict[str, str] = {}
+        self.unlisted: Dict[str, List[Any]] = {}
+        self.titles: Dict[str, List[Any]] = {}
+        self.descriptions: Dict[str, List[Any]] = {}
+        self.missing = Counter()
+        self.issues: Counter = Counter()
+        self.issue_messages: Dict[str, str] = {}
+        self.health = Counter()
+        self.failed: Dict[str, Dict[str, Any]] = {}
+        self.score_total = 0
+        self.pages_audited = 0
+
+    def _group(self, groups: Dict[str, List[Any]], value: str, url: str) -> None:
+        entry = groups.setdefault(value.casefold(), [0, value, []])
+        entry[0] += 1
+        if len(entry[2]) < self.max_examples:
+            entry[2].append(url)
+
+    def add_failure(self, url: str, status_code: Optional[int], error: str) -> None:
+        self.failed[normalize_url(url)] = {'url': url, 'status_code': status_code, 'error': error}
+
+    def add_page(self, url: str, final_url: str, score: int, health_status: str,
+                 title: str, meta_description: str, links: List[str],
+                 issues: List[Dict[str, Any]]) -> None:
+        key = normalize_url(url)
+        final_key = normalize_url(final_url or url)
+        if final_key != key:
+            self.aliases[final_key] = key
+
+        self.pages_audited += 1
+        self.score_total += score
+        self.health[health_status] += 1
+
+        if title:
+            self._group(self.titles, title, url)
+        else:
+            self.missing['title'] += 1
+        if meta_description:
+            self._group(self.descriptions, meta_description, url)
+        else:
+            self.missing['meta_description'] += 1
+
+        for action in {issue.get('action') or issue.get('message') for issue in issues if isinstance(issue, dict)}:
+            if action:
+                self.issues[action] += 1
+        for issue in issues:
+            if isinstance(issue, dict):
+                self.issue_messages.setdefault(issue.get('action') or issue.get('message'), issue.get('message', ''))
+
+        for target in links:
+            if target in self.listed:
+                self.inbound[target] += 1
+                self.first_referrer.setdefault(target, url)
+            elif target in self.unlisted:
+                self.unlisted[target][0] += 1
+            elif len(self.unlisted) < self.max_unlisted:
+                self.unlisted[target] = [1, url]
+
+    def unlisted_targets(self, limit: int) -> List[str]:
+        """Most-linked internal URLs that are not in the audited list (candidates for link checks)."""
+        candidates = [t for t in self.unlisted if t not in self.aliases]
+        candidates.sort(key=lambda t: self.unlisted[t][0], reverse=True)
+        return candidates[:limit]
+
+    def _duplicates(self, groups: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        duplicates = [
+            {'value': value, 'pages': count, 'urls': urls}
+            for count, value, urls in groups.values() if count > 1
+        ]
+        return sorted(duplicates, key=lambda d: d['pages'], reverse=True)
+
+    def summary(self, unlisted_status: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
+        average = round(self.score_total / self.pages_audited, 1) if self.pages_audited else 0
+
+        # Links to a page's redirect target count as links to the page itself
+        inbound = Counter(self.inbound)
+        for alias, listed in self.aliases.items():
+            if alias in self.unlisted:
+                inbound[listed] += self.unlisted[alias][0]
+
+        broken_links = []
+        for target, failure in self.failed.items():
+            broken = failure['status_code'] is None or failure['status_code'] >= 400
+            if broken and inbound[target]:
+                broken_links.append({
+                    'url': failure['url'], 'status_code': failure['status_code'],
+                    'inbound_links': inbound[target], 'example_referrer': self.first_referrer.get(target),
+                })
+        for target, status in (unlisted_status or {}).items():
+            if status is None or status >= 400:
+                count, referrer = self.unlisted[target]
+                broken_links.append({
+                    'url': target, 'status_code': status,
+                    'inbound_links': count, 'example_referrer': referrer,
+                })
+        broken_links.sort(key=lambda b: b['inbound_links'], reverse=True)
+
+        audited = self.listed - set(self.failed)
+        orphan_pages = sorted(t for t in audited if not inbound[t])
+
+        return {
+            'pages_listed': len(self.listed),
+            'pages_audited': self.pages_audited,
+            'pages_failed': len(self.failed),
+            'average_score': average,
+            'health_status': _health_label(average) if self.pages_audited else 'error',
+            'health_distribution': dict(self.health),
+            'duplicate_titles': self._duplicates(self.titles),
+            'duplicate_meta_descriptions': self._duplicates(self.descriptions),
+            'missing_titles': self.missing['title'],
+            'missing_meta_descriptions': self.missing['meta_description'],
+            'orphan_pages': orphan_pages,
+            'broken_links': broken_links,
+            'failed_pages': list(self.failed.values()),
+            'top_issues': [
+                {'action': action, 'message': self.issue_messages.get(action, ''), 'pages': count}
+                for action, count in self.issues.most_common(20)
+            ],
+        }
+
+
+class SiteAuditEngine:
+    """Bulk SEO audit of a URL list with streamed page results and a site rollup."""
+
+    def __init__(self, concurrency: Optional[int] = None, host_concurrency: Optional[int] = None,
+                 host_delay: Optional[float] = None, workers: Optional[int] = None,
+                 max_pages: Optional[int] = None, max_link_checks: int = 200,
+                 fetch: Optional[Callable[[str], Awaitable[FetchedPage]]] = None,
+                 executor: Optional[Executor] = None):
+        """
+        Args:
+            concurrency: Pages in flight across all hosts
+            host_concurrency: Concurrent requests per host
+            host_delay: Minimum seconds between request starts to one host
+            workers: Analysis worker processes
+            max_pages: Maximum pages audited per run
+            max_link_checks: Internal link targets outside the URL list to check for breakage
+            fetch: Replacement for the built-in aiohttp fetch (returns a fetched page dict)
+            executor: Executor for analysis jobs; by default a process pool per audit
+        """
+        self.concurrency = max(1, concurrency or _env_number('ALWRITY_SEO_AUDIT_CONCURRENCY', 16))
+        self.politeness = HostPoliteness(
+            host_concurrency or _env_number('ALWRITY_SEO_AUDIT_HOST_CONCURRENCY', 4),
+            host_delay if host_delay is not None else _env_number('ALWRITY_SEO_AUDIT_HOST_DELAY', 0.1, float),
+        )
+        self.workers = max(1, workers or _env_number('ALWRITY_SEO_AUDIT_WORKERS', os.cpu_count() or 1))
+        self.max_pages = max_pages or _env_number('ALWRITY_SEO_AUDIT_MAX_PAGES', 10000)
+        self.max_link_checks = max_link_checks
+        self._custom_fetch = fetch
+        self._executor = executor
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._site_warnings: Dict[str, asyncio.Task] = {}
+
+    async def audit_sitemap(self, sitemap_url: str, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """Audit every page listed in a sitemap (see audit_urls for events and arguments)."""
+        from services.seo_tools.sitemap_service import SitemapService
+
+        urls = await SitemapService().list_sitemap_urls(sitemap_url, limit=self.max_pages)
+        kwargs.setdefault('site_url', sitemap_url)
+        async for event in self.audit_urls(urls, **kwargs):
+            yield event
+
+    async def audit_urls(self, urls: Iterable[str], target_keywords: Optional[List[str]] = None,
+                         service: Any = None, site_url: Optional[str] = None,
+                         user_id: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Audit pages concurrently, yielding events as work completes.
+
+        Args:
+            urls: Page URLs (duplicates are audited once; at most max_pages)
+            target_keywords: Optional keywords for KeywordAnalyzer
+            service: Optional SEOAnalysisService; page results and the rollup are stored as they arrive
+            site_url: Site or sitemap URL recorded on the audit session
+            user_id: User who started the audit
+
+        Yields:
+            {'type': 'started', 'total', 'session_id'}, then one {'type': 'page', 'page'}
+            per URL in completion order, then {'type': 'rollup', 'rollup', 'session_id'}
+        """
+        unique: Dict[str, str] = {}
+        for url in urls:
+            key = normalize_url(url)
+            if key and key not in unique:
+                unique[key] = url.strip()
+                if len(unique) >= self.max_pages:
+                    break
+        page_urls = list(unique.values())
+        rollup = SiteAuditRollup(page_urls)
+
+        session_id = None
+        if service is not None:
+            record = await asyncio.to_thread(
+                service.start_site_audit, site_url or (page_urls[0] if page_urls else ''), user_id,
+                {'pages': len(page_urls), 'target_keywords': target_keywords, 'concurrency': self.concurrency},
+            )
+            session_id = getattr(record, 'id', None)
+
+        yield {'type': 'started', 'total': len(page_urls), 'session_id': session_id}
+        logger.info(f"[SiteAudit] Auditing {len(page_urls)} pages (concurrency={self.concurrency}, workers={self.workers})")
+
+        status = 'failed'
+        pending = set()
+        async with self._resources() as executor:
+            try:
+                remaining = iter(page_urls)
+                done_count = 0
+                while True:
+                    for url in remaining:
+                        pending.add(asyncio.create_task(self._audit_one(url, target_keywords, executor)))
+                        if len(pending) >= self.concurrency:
+                            break
+                    if not pending:
+                        break
+                    finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in finished:
+                        done_count += 1
+                        page = await self._record(task.result(), rollup, service, session_id)
+                        yield {'type': 'page', 'index': done_count, 'total': len(page_urls), 'page': page}
+
+                unlisted_status = await self._check_links(rollup.unlisted_targets(self.max_link_checks))
+                summary = rollup.summary(unlisted_status)
+                status = 'success'
+            finally:
+                for task in pending:
+                    task.cancel()
+                if service is not None and session_id is not None:
+                    final = summary if status == 'success' else rollup.summary()
+                    await asyncio.to_thread(service.finish_site_audit, session_id, final,
+                                            status if status == 'success' else 'cancelled')
+
+        logger.info(
+            f"[SiteAudit] Done: {summary['pages_audited']} audited, {summary['pages_failed']} failed, "
+            f"{len(summary['broken_links'])} broken links, {len(summary['orphan_pages'])} orphans"
+        )
+        yield {'type': 'rollup', 'rollup': summary, 'session_id': session_id}
+
+    async def run(self, urls: Iterable[str], **kwargs) -> Dict[str, Any]:
+        """Audit without streaming; returns the site rollup."""
+        summary: Dict[str, Any] = {}
+        async for event in self.audit_urls(urls, **kwargs):
+            if event['type'] == 'rollup':
+                summary = event['rollup']
+        return summary
+
+    @asynccontextmanager
+    async def _resources(self):
+        """HTTP session and analysis executor for one audit."""
+        executor = self._executor
+        owned = None
+        if executor is None:
+            try:
+                # spawn: forking a threaded server process is unsafe
+                owned = executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"[SiteAudit] Process pool unavailable, analysing in threads: {e}")
+                owned = executor = ThreadPoolExecutor(max_workers=self.workers)
+        if self._custom_fetch is None:
+            connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=self.politeness.concurrency)
+            timeout = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
+            self._http = aiohttp.ClientSession(connector=connector, timeout=timeout, headers={'User-Agent': USER_AGENT})
+        try:
+            yield executor
+        finally:
+            if self._http is not None:
+                await self._http.close()
+                self._http = None
+            self._site_warnings.clear()
+            if owned is not None:
+                owned.shutdown(wait=False, cancel_futures=True)
+
+    async def _audit_one(self, url: str, target_keywords: Optional[List[str]], executor: Executor) -> Dict[str, Any]:
+        async with self.politeness.slot(url):
+            try:
+                fetched = await (self._custom_fetch or self._fetch)(url)
+            except Exception as e:
+                fetched = {'url': url, 'status_code': None, 'error': f'Fetch failed: {e}'}
+
+        if fetched.get('error') or not fetched.get('html'):
+            fetched.pop('html', None)
+            return {'fetched': fetched}
+
+        site_warnings = await self._site_file_warnings(fetched.get('final_url') or url)
+        job = partial(audit_page, fetched, target_keywords, site_warnings)
+        loop = asyncio.get_running_loop()
+        try:
+            analysis = await loop.run_in_executor(executor, job)
+        except BrokenProcessPool:
+            logger.warning(f"[SiteAudit] Worker pool broke; analysing {url} in a thread")
+            analysis = await asyncio.to_thread(job)
+        except Exception as e:
+            logger.error(f"[SiteAudit] Analysis failed for {url}: {e}")
+            analysis = None
+        fetched.pop('html', None)
+        if analysis is None:
+            fetched['error'] = 'Analysis failed'
+        return {'fetched': fetched, 'analysis': analysis}
+
+    async def _record(self, outcome: Dict[str, Any], rollup: SiteAuditRollup, service: Any,
+                      session_id: Optional[int]) -> Dict[str, Any]:
+        """Fold one page into the rollup, persist it, and return its streamed summary."""
+        fetched, analysis = outcome['fetched'], outcome.get('analysis')
+        page = {
+            'url': fetched['url'],
+            'final_url': fetched.get('final_url') or fetched['url'],
+            'status_code': fetched.get('status_code'),
+            'load_time': fetched.get('load_time'),
+        }
+        if analysis is None:
+            error = fetched.get('error') or f"HTTP {fetched.get('status_code')}"
+            rollup.add_failure(fetched['url'], fetched.get('status_code'), error)
+            page.update({'error': error, 'overall_score': None, 'health_status': 'error'})
+            return page
+
+        result = analysis['result']
+        rollup.add_page(
+            fetched['url'], page['final_url'], result.overall_score, result.health_status,
+            analysis['title'], analysis['meta_description'], analysis['links'], result.critical_issues,
+        )
+        page.update({
+            'overall_score': result.overall_score,
+            'health_status': result.health_status,
+            'title': analysis['title'],
+            'critical_issues': result.critical_issues,
+            'warnings': result.warnings,
+            'internal_links': len(analysis['links']),
+        })
+        if service is not None:
+            record = await asyncio.to_thread(service.store_analysis_result, result, session_id)
+            page['analysis_id'] = getattr(record, 'id', None)
+        return page
+
+    async def _fetch(self, url: str) -> FetchedPage:
+        """GET one page with the shared session, capping the body at MAX_PAGE_BYTES."""
+        start_time = time.time()
+        async with self._http.get(url, allow_redirects=True) as response:
+            fetched = {
+                'url': url,
+                'final_url': str(response.url),
+                'status_code': response.status,
+                'headers': dict(response.headers),
+            }
+            content_type = response.headers.get('Content-Type', '').lower()
+            if response.status >= 400:
+                fetched['error'] = f'HTTP {response.status}'
+            elif content_type and 'html' not in content_type:
+                fetched['error'] = f'Not an HTML page ({content_type.split(";")[0]})'
+            else:
+                raw = await response.content.read(MAX_PAGE_BYTES)
+                fetched['html'] = raw.decode(response.charset or 'utf-8', errors='replace')
+            fetched['load_time'] = time.time() - start_time
+            return fetched
+
+    async def _site_file_warnings(self, url: str) -> List[Dict[str, Any]]:
+        """robots.txt/sitemap.xml warnings, checked once per host and shared by its pages."""
+        parts = urlsplit(url)
+        root = f"{parts.scheme}://{parts.netloc}/"
+        task = self._site_warnings.get(root)
+        if task is None:
+            task = asyncio.ensure_future(asyncio.to_thread(self.site_file_warnings, root))
+            self._site_warnings[root] = task
+        return await asyncio.shield(task)
+
+    def site_file_warnings(self, root_url: str) -> List[Dict[str, Any]]:
+        return TechnicalSEOAnalyzer().site_file_warnings(root_url)
+
+    async def _check_links(self, targets: List[str]) -> Dict[str, Optional[int]]:
+        """Status of internal link targets outside the URL list (None when unreachable)."""
+        if not targets:
+            return {}
+
+        async def check(target: str) -> Optional[int]:
+            async with self.politeness.slot(target):
+                try:
+                    if self._custom_fetch is not None:
+                        return (await self._custom_fetch(target)).get('status_code')
+                    async with self._http.head(target, allow_redirects=True) as response:
+                        if response.status not in (405, 501):
+                            return response.status
+                    async with self._http.get(target, allow_redirects=True) as response:
+                        return response.status
+                except Exception:
+                    return None
+
+        statuses = await asyncio.gather(*(check(t) for t in targets))
+        return dict(zip(targets, statuses))
@@ -3,10 +3,13 @@ SEO Analyzer Utilities
 Contains utility classes for HTML fetching and AI insight generation.
 """
 
+import time
 import requests
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from loguru import logger
 
+from .page import ParsedPage
+
 
 class HTMLFetcher:
     """Utility class for fetching HTML content from URLs"""
@@ -19,37 +22,51 @@ class HTMLFetcher:
 
     def fetch_html(self, url: str) -> Optional[str]:
         """Fetch HTML content with retries and protocol fallback."""
-        def _try_fetch(target_url: str, timeout_s: int = 30) -> Optional[str]:
+        fetched = self._fetch(url)
+        return fetched[0].text if fetched else None
+
+    def fetch_page(self, url: str) -> Optional[ParsedPage]:
+        """Fetch and parse a page once, capturing final URL, status, headers and load time."""
+        fetched = self._fetch(url)
+        if not fetched:
+            return None
+        response, load_time = fetched
+        return ParsedPage.from_response(response, url, load_time)
+
+    def _fetch(self, url: str) -> Optional[Tuple[requests.Response, float]]:
+        """GET with retries and protocol fallback; returns the response and its load time."""
+        def _try_fetch(target_url: str, timeout_s: int = 30) -> Optional[Tuple[requests.Response, float]]:
             try:
+                start_time = time.time()
                 response = self.session.get(
                     target_url,
                     timeout=timeout_s,
                     allow_redirects=True,
                 )
                 response.raise_for_status()
-                return response.text
+                return response, time.time() - start_time
             except Exception as inner_e:
                 logger.error(f"Error fetching HTML from {target_url}: {inner_e}")
                 return None
 
         # First attempt
-        html = _try_fetch(url, timeout_s=30)
-        if html is not None:
-            return html
+        fetched = _try_fetch(url, timeout_s=30)
+        if fetched is not None:
+            return fetched
 
         # Retry once (shorter timeout)
-        html = _try_fetch(url, timeout_s=15)
-        if html is not None:
-            return html
+        fetched = _try_fetch(url, timeout_s=15)
+        if fetched is not None:
+            return fetched
 
         # If https fails due to resets, try http fallback once
         try:
             if url.startswith("https://"):
                 http_url = "http://" + url[len("https://"):]
                 logger.info(f"SEO Analyzer: Falling back to HTTP for {http_url}")
-                html = _try_fetch(http_url, timeout_s=15)
-                if html is not None:
-                    return html
+                fetched = _try_fetch(http_url, timeout_s=15)
+                if fetched is not None:
+                    return fetched
         except Exception:
             # Best-effort fallback; errors already logged in _try_fetch
             pass
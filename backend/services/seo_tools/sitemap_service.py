@@ -151,6 +151,20 @@ class SitemapService:
             
             raise
     
+    async def list_sitemap_urls(self, sitemap_url: str, limit: int = 10000) -> List[str]:
+        """Page URLs listed in a sitemap (or sitemap index), de-duplicated, in sitemap order."""
+        sitemap_data = await self._fetch_sitemap_data(sitemap_url)
+        urls: List[str] = []
+        seen = set()
+        for entry in sitemap_data.get("urls", []):
+            loc = (entry.get("loc") or "").strip()
+            if loc and loc not in seen:
+                seen.add(loc)
+                urls.append(loc)
+                if len(urls) >= limit:
+                    break
+        return urls
+
     async def _fetch_sitemap_data(self, sitemap_url: str, depth: int = 0, session: aiohttp.ClientSession = None) -> Dict[str, Any]:
         """Fetch and parse sitemap data"""
         
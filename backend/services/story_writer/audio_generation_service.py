@@ -144,6 +144,22 @@ class StoryAudioGenerationService:
             logger.error(f"[StoryAudioGeneration] Error generating audio with pyttsx3: {e}")
             return False
     
+    def _synthesize(
+        self,
+        text: str,
+        output_path: Path,
+        provider: str = "gtts",
+        lang: str = "en",
+        slow: bool = False,
+        rate: int = 150,
+    ) -> bool:
+        """Generate speech for text with the given TTS provider (unknown providers use gTTS)."""
+        if provider == "pyttsx3":
+            return self._generate_audio_pyttsx3(text=text, output_path=output_path, rate=rate)
+        if provider != "gtts":
+            logger.warning(f"[StoryAudioGeneration] Unknown provider '{provider}', using gTTS")
+        return self._generate_audio_gtts(text=text, output_path=output_path, lang=lang, slow=slow)
+    
     def generate_scene_audio(
         self,
         scene: Dict[str, Any],
@@ -187,30 +203,7 @@ class StoryAudioGenerationService:
             audio_filename = self._generate_audio_filename(scene_number, scene_title)
             audio_path = output_dir / audio_filename
             
-            # Generate audio based on provider
-            success = False
-            if provider == "gtts":
-                success = self._generate_audio_gtts(
-                    text=audio_narration,
-                    output_path=audio_path,
-                    lang=lang,
-                    slow=slow
-                )
-            elif provider == "pyttsx3":
-                success = self._generate_audio_pyttsx3(
-                    text=audio_narration,
-                    output_path=audio_path,
-                    rate=rate
-                )
-            else:
-                # Default to gTTS
-                logger.warning(f"[StoryAudioGeneration] Unknown provider '{provider}', using gTTS")
-                success = self._generate_audio_gtts(
-                    text=audio_narration,
-                    output_path=audio_path,
-                    lang=lang,
-                    slow=slow
-                )
+            success = self._synthesize(audio_narration, audio_path, provider, lang=lang, slow=slow, rate=rate)
             
             if not success or not audio_path.exists():
                 raise RuntimeError(f"Failed to generate audio file: {audio_path}")
@@ -268,49 +261,19 @@ class StoryAudioGenerationService:
         if not scenes:
             raise ValueError("No scenes provided for audio generation")
         
-        logger.info(f"[StoryAudioGeneration] Generating audio for {len(scenes)} scenes")
-        
-        audio_results = []
-        total_scenes = len(scenes)
-        
-        for idx, scene in enumerate(scenes):
-            try:
-                # Generate audio for scene
-                audio_result = self.generate_scene_audio(
-                    scene=scene,
-                    user_id=user_id,
-                    provider=provider,
-                    lang=lang,
-                    slow=slow,
-                    rate=rate,
-                    db=db
-                )
-                
-                audio_results.append(audio_result)
-                
-                # Call progress callback if provided
-                if progress_callback:
-                    progress = ((idx + 1) / total_scenes) * 100
-                    progress_callback(progress, f"Generated audio for scene {scene.get('scene_number', idx + 1)}")
-                
-                logger.info(f"[StoryAudioGeneration] Generated audio {idx + 1}/{total_scenes}")
-                
-            except Exception as e:
-                logger.error(f"[StoryAudioGeneration] Failed to generate audio for scene {idx + 1}: {e}")
-                # Continue with next scene instead of failing completely
-                # Use empty strings for required fields instead of None
-                audio_results.append({
-                    "scene_number": scene.get("scene_number", idx + 1),
-                    "scene_title": scene.get("title", "Untitled"),
-                    "audio_filename": "",
-                    "audio_url": "",
-                    "provider": provider,
-                    "file_size": 0,
-                    "error": str(e),
-                })
+        # Scenes are synthesized concurrently; identical narration is generated once
+        from services.story_writer.scene_media_engine import StorySceneMediaEngine
         
-        logger.info(f"[StoryAudioGeneration] Generated {len(audio_results)} audio files out of {total_scenes} scenes")
-        return audio_results
+        return StorySceneMediaEngine(audio_service=self).generate_audio(
+            scenes=scenes,
+            user_id=user_id,
+            provider=provider,
+            lang=lang,
+            slow=slow,
+            rate=rate,
+            progress_callback=progress_callback,
+            db=db,
+        )
     
     def generate_ai_audio(
         self,
@@ -253,46 +253,19 @@ class StoryImageGenerationService:
         if not scenes:
             raise ValueError("No scenes provided for image generation")
         
-        logger.info(f"[StoryImageGeneration] Generating images for {len(scenes)} scenes")
+        # Scenes are generated concurrently within the provider's limit
+        from services.story_writer.scene_media_engine import StorySceneMediaEngine
         
-        image_results = []
-        total_scenes = len(scenes)
-        
-        for idx, scene in enumerate(scenes):
-            try:
-                # Generate image for scene
-                image_result = self.generate_scene_image(
-                    scene=scene,
-                    user_id=user_id,
-                    provider=provider,
-                    width=width,
-                    height=height,
-                    model=model,
-                    anime_bible=anime_bible,
-                )
-                
-                image_results.append(image_result)
-                
-                # Call progress callback if provided
-                if progress_callback:
-                    progress = ((idx + 1) / total_scenes) * 100
-                    progress_callback(progress, f"Generated image for scene {scene.get('scene_number', idx + 1)}")
-                
-                logger.info(f"[StoryImageGeneration] Generated image {idx + 1}/{total_scenes}")
-                
-            except Exception as e:
-                logger.error(f"[StoryImageGeneration] Failed to generate image for scene {idx + 1}: {e}")
-                # Continue with next scene instead of failing completely
-                image_results.append({
-                    "scene_number": scene.get("scene_number", idx + 1),
-                    "scene_title": scene.get("title", "Untitled"),
-                    "error": str(e),
-                    "image_path": None,
-                    "image_url": None,
-                })
-        
-        logger.info(f"[StoryImageGeneration] Generated {len(image_results)} images out of {total_scenes} scenes")
-        return image_results
+        return StorySceneMediaEngine(image_service=self).generate_images(
+            scenes=scenes,
+            user_id=user_id,
+            provider=provider,
+            width=width,
+            height=height,
+            model=model,
+            progress_callback=progress_callback,
+            anime_bible=anime_bible,
+        )
     
     def regenerate_scene_image(
         self,
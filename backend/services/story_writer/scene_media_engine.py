@@ -0,0 +1,355 @@
+"""
+Scene Media Engine for Story Writer
+
+Runs narration, image and scene-video generation for all scenes of a story
+concurrently instead of one scene after another. Every job holds a slot of its
+provider's limiter, so a batch cannot exceed what a provider tolerates no matter
+how many batches run at once. Narration is content-addressed: scenes with the
+same text and voice settings share one synthesized file, also across requests.
+Progress from all workers is folded into one callback.
+
+Configuration (environment):
+    ALWRITY_STORY_TTS_CONCURRENCY     concurrent TTS jobs per provider (default 4; pyttsx3 is always 1)
+    ALWRITY_STORY_IMAGE_CONCURRENCY   concurrent image jobs per provider (default 3)
+    ALWRITY_STORY_VIDEO_CONCURRENCY   concurrent scene video renders (default 2)
+"""
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+from sqlalchemy.orm import Session
+
+_DEFAULT_LIMITS = {"tts": 4, "image": 3, "video": 2}
+# pyttsx3 drives one process-wide speech engine that is not safe to use concurrently
+_FIXED_LIMITS = {("tts", "pyttsx3"): 1}
+
+_provider_slots: Dict[Tuple[str, str], threading.BoundedSemaphore] = {}
+_provider_slots_lock = threading.Lock()
+
+
+def _limit_for(kind: str, provider: str) -> int:
+    if (kind, provider) in _FIXED_LIMITS:
+        return _FIXED_LIMITS[(kind, provider)]
+    return max(1, int(os.getenv(f"ALWRITY_STORY_{kind.upper()}_CONCURRENCY", _DEFAULT_LIMITS[kind])))
+
+
+def provider_slot(kind: str, provider: Optional[str]) -> threading.BoundedSemaphore:
+    """Process-wide limiter for one media kind ('tts', 'image', 'video') and provider."""
+    key = (kind, provider or "default")
+    with _provider_slots_lock:
+        slot = _provider_slots.get(key)
+        if slot is None:
+            slot = threading.BoundedSemaphore(_limit_for(*key))
+            _provider_slots[key] = slot
+        return slot
+
+
+def _open_worker_session(user_id: str) -> Optional[Session]:
+    """A session of the user's database for one video render worker thread."""
+    from services.database import get_session_for_user
+    return get_session_for_user(user_id)
+
+
+def narration_cache_key(text: str, provider: str, lang: str, slow: bool, rate: int) -> str:
+    """Content address of a narration: identical text and voice settings give identical audio."""
+    settings = {"text": text.strip(), "provider": provider, "lang": lang, "slow": slow, "rate": rate}
+    if provider == "pyttsx3":
+        settings.pop("slow")
+    else:
+        settings.pop("rate")
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()[:24]
+
+
+class _BatchProgress:
+    """Thread-safe completion counter reporting 0-100 across all jobs of a batch."""
+
+    def __init__(self, total: int, callback: Optional[Callable[[float, str], None]]):
+        self.total = max(total, 1)
+        self.callback = callback
+        self.done = 0
+        self._lock = threading.Lock()
+
+    def step(self, message: str, count: int = 1):
+        with self._lock:
+            self.done += count
+            progress = (self.done / self.total) * 100
+            if self.callback:
+                try:
+                    self.callback(progress, message)
+                except Exception as e:
+                    logger.warning(f"[StorySceneMedia] Progress callback failed: {e}")
+
+
+class StorySceneMediaEngine:
+    """Concurrent per-scene audio, image and video generation."""
+
+    def __init__(self, audio_service=None, image_service=None, video_service=None):
+        self._audio_service = audio_service
+        self._image_service = image_service
+        self._video_service = video_service
+
+    @property
+    def audio_service(self):
+        if self._audio_service is None:
+            from services.story_writer.audio_generation_service import StoryAudioGenerationService
+            self._audio_service = StoryAudioGenerationService()
+        return self._audio_service
+
+    @property
+    def image_service(self):
+        if self._image_service is None:
+            from services.story_writer.image_generation_service import StoryImageGenerationService
+            self._image_service = StoryImageGenerationService()
+        return self._image_service
+
+    @property
+    def video_service(self):
+        if self._video_service is None:
+            from services.story_writer.video_generation_service import StoryVideoGenerationService
+            self._video_service = StoryVideoGenerationService()
+        return self._video_service
+
+    # ------------------------------------------------------------------ #
+    # Audio
+    # ------------------------------------------------------------------ #
+
+    def _submit_audio(
+        self,
+        pool: ThreadPoolExecutor,
+        scenes: List[Dict[str, Any]],
+        user_id: str,
+        provider: str,
+        lang: str,
+        slow: bool,
+        rate: int,
+        progress: _BatchProgress,
+        db: Optional[Session],
+    ) -> Callable[[], List[Dict[str, Any]]]:
+        """Queue one synthesis per distinct narration; returns a collector for per-scene results."""
+        output_dir = self.audio_service._get_user_audio_dir(user_id, db)
+        jobs: Dict[str, Future] = {}
+        scene_keys: List[Optional[str]] = []
+
+        for scene in scenes:
+            narration = scene.get("audio_narration", "")
+            if not narration:
+                scene_keys.append(None)
+                progress.step(f"Skipped audio for scene {scene.get('scene_number', 0)}")
+                continue
+            key = narration_cache_key(narration, provider, lang, slow, rate)
+            scene_keys.append(key)
+            if key not in jobs:
+                jobs[key] = pool.submit(self._synthesize_cached, key, narration, output_dir, provider, lang, slow, rate)
+
+        # Report progress as each distinct narration finishes, once for every scene sharing it
+        for key, job in jobs.items():
+            job.add_done_callback(
+                lambda _f, count=scene_keys.count(key): progress.step("Generated scene narration", count)
+            )
+
+        def collect() -> List[Dict[str, Any]]:
+            results = []
+            for idx, (scene, key) in enumerate(zip(scenes, scene_keys)):
+                scene_number = scene.get("scene_number", idx + 1)
+                scene_title = scene.get("title", "Untitled")
+                try:
+                    if key is None:
+                        raise ValueError(f"Scene {scene_number} ({scene_title}) has no audio_narration")
+                    audio_path = jobs[key].result()
+                    results.append({
+                        "scene_number": scene_number,
+                        "scene_title": scene_title,
+                        "audio_path": str(audio_path),
+                        "audio_filename": audio_path.name,
+                        "audio_url": f"/api/story/audio/{audio_path.name}",
+                        "provider": provider,
+                        "file_size": audio_path.stat().st_size,
+                    })
+                except Exception as e:
+                    logger.error(f"[StorySceneMedia] Failed to generate audio for scene {scene_number}: {e}")
+                    # Use empty strings for required fields instead of None
+                    results.append({
+                        "scene_number": scene_number,
+                        "scene_title": scene_title,
+                        "audio_filename": "",
+                        "audio_url": "",
+                        "provider": provider,
+                        "file_size": 0,
+                        "error": str(e),
+                    })
+            return results
+
+        return collect
+
+    def _synthesize_cached(
+        self, key: str, text: str, output_dir: Path, provider: str, lang: str, slow: bool, rate: int
+    ) -> Path:
+        """Return the narration file for key, synthesizing it only if it is not cached yet."""
+        audio_path = Path(output_dir) / f"narration_{key}.mp3"
+        if audio_path.exists() and audio_path.stat().st_size > 0:
+            logger.info(f"[StorySceneMedia] Reusing cached narration {audio_path.name}")
+            return audio_path
+
+        tmp_path = audio_path.with_name(f".{audio_path.stem}.{threading.get_ident()}.mp3")
+        try:
+            with provider_slot("tts", provider):
+                success = self.audio_service._synthesize(text, tmp_path, provider, lang=lang, slow=slow, rate=rate)
+            if not success or not tmp_path.exists():
+                raise RuntimeError(f"Failed to generate audio file: {audio_path}")
+            os.replace(tmp_path, audio_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        return audio_path
+
+    def generate_audio(
+        self,
+        scenes: List[Dict[str, Any]],
+        user_id: str,
+        provider: str = "gtts",
+        lang: str = "en",
+        slow: bool = False,
+        rate: int = 150,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        db: Optional[Session] = None,
+    ) -> List[Dict[str, Any]]:
+        """Narration for every scene, in scene order (failed scenes carry an 'error')."""
+        progress = _BatchProgress(len(scenes), progress_callback)
+        with ThreadPoolExecutor(max_workers=_limit_for("tts", provider), thread_name_prefix="story-tts") as pool:
+            collect = self._submit_audio(pool, scenes, user_id, provider, lang, slow, rate, progress, db)
+            results = collect()
+        logger.info(f"[StorySceneMedia] Generated audio for {len(scenes)} scenes")
+        return results
+
+    # ------------------------------------------------------------------ #
+    # Images
+    # ------------------------------------------------------------------ #
+
+    def _generate_image(self, scene: Dict[str, Any], idx: int, user_id: str, options: Dict[str, Any],
+                        progress: _BatchProgress) -> Dict[str, Any]:
+        scene_number = scene.get("scene_number", idx + 1)
+        try:
+            with provider_slot("image", options.get("provider")):
+                result = self.image_service.generate_scene_image(scene=scene, user_id=user_id, **options)
+            progress.step(f"Generated image for scene {scene_number}")
+            return result
+        except Exception as e:
+            logger.error(f"[StorySceneMedia] Failed to generate image for scene {scene_number}: {e}")
+            progress.step(f"Image failed for scene {scene_number}")
+            return {
+                "scene_number": scene_number,
+                "scene_title": scene.get("title", "Untitled"),
+                "error": str(e),
+                "image_path": None,
+                "image_url": None,
+            }
+
+    def _submit_images(self, pool, scenes, user_id, options, progress) -> List[Future]:
+        return [
+            pool.submit(self._generate_image, scene, idx, user_id, options, progress)
+            for idx, scene in enumerate(scenes)
+        ]
+
+    def generate_images(
+        self,
+        scenes: List[Dict[str, Any]],
+        user_id: str,
+        provider: Optional[str] = None,
+        width: int = 1024,
+        height: int = 1024,
+        model: Optional[str] = None,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        anime_bible: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Image for every scene, in scene order (failed scenes carry an 'error')."""
+        options = {"provider": provider, "width": width, "height": height, "model": model, "anime_bible": anime_bible}
+        progress = _BatchProgress(len(scenes), progress_callback)
+        with ThreadPoolExecutor(max_workers=_limit_for("image", provider or "default"),
+                                thread_name_prefix="story-image") as pool:
+            results = [f.result() for f in self._submit_images(pool, scenes, user_id, options, progress)]
+        logger.info(f"[StorySceneMedia] Generated images for {len(scenes)} scenes")
+        return results
+
+    # ------------------------------------------------------------------ #
+    # Combined and video
+    # ------------------------------------------------------------------ #
+
+    def generate_scene_assets(
+        self,
+        scenes: List[Dict[str, Any]],
+        user_id: str,
+        image_options: Optional[Dict[str, Any]] = None,
+        audio_options: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        db: Optional[Session] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Images and narration for every scene at the same time, with one aggregated progress.
+
+        Parameters:
+            image_options: provider, width, height, model, anime_bible for generate_scene_image
+            audio_options: provider, lang, slow, rate for TTS
+
+        Returns:
+            (image_results, audio_results), each in scene order
+        """
+        image_options = {"provider": None, "width": 1024, "height": 1024, "model": None, "anime_bible": None,
+                         **(image_options or {})}
+        audio_options = {"provider": "gtts", "lang": "en", "slow": False, "rate": 150, **(audio_options or {})}
+        progress = _BatchProgress(len(scenes) * 2, progress_callback)
+        workers = _limit_for("image", image_options["provider"] or "default") + _limit_for("tts", audio_options["provider"])
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="story-media") as pool:
+            image_futures = self._submit_images(pool, scenes, user_id, image_options, progress)
+            collect_audio = self._submit_audio(
+                pool, scenes, user_id, audio_options["provider"], audio_options["lang"],
+                audio_options["slow"], audio_options["rate"], progress, db,
+            )
+            audio_results = collect_audio()
+            image_results = [f.result() for f in image_futures]
+        return image_results, audio_results
+
+    def generate_scene_videos(
+        self,
+        scenes: List[Dict[str, Any]],
+        image_paths: List[str],
+        audio_paths: List[str],
+        user_id: str,
+        fps: int = 24,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        db: Optional[Session] = None,
+    ) -> List[Dict[str, Any]]:
+        """Render each scene's image + narration clip concurrently; failed scenes carry an 'error'."""
+        progress = _BatchProgress(len(scenes), progress_callback)
+
+        def render(idx: int) -> Dict[str, Any]:
+            scene = scenes[idx]
+            scene_number = scene.get("scene_number", idx + 1)
+            # Sessions are not thread-safe: the caller's session stays on its thread
+            worker_db = None
+            try:
+                if db is not None:
+                    worker_db = _open_worker_session(user_id)
+                with provider_slot("video", "moviepy"):
+                    result = self.video_service.generate_scene_video(
+                        scene=scene, image_path=image_paths[idx], audio_path=audio_paths[idx],
+                        user_id=user_id, fps=fps, db=worker_db,
+                    )
+                progress.step(f"Rendered video for scene {scene_number}")
+                return result
+            except Exception as e:
+                logger.error(f"[StorySceneMedia] Failed to render video for scene {scene_number}: {e}")
+                progress.step(f"Video failed for scene {scene_number}")
+                return {"scene_number": scene_number, "error": str(e), "video_path": None}
+            finally:
+                if worker_db is not None:
+                    worker_db.close()
+
+        with ThreadPoolExecutor(max_workers=_limit_for("video", "moviepy"), thread_name_prefix="story-video") as pool:
+            return list(pool.map(render, range(len(scenes))))
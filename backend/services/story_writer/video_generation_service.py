@@ -12,6 +12,8 @@ from loguru import logger
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
+from utils.video_concat import VideoConcatError, concat_videos, get_ffmpeg_exe
+
 
 def _get_story_media_write_dir(media_type: str, user_id: Optional[str] = None, db: Optional[Session] = None) -> Path:
     """Lazy import wrapper to avoid circular imports."""
@@ -55,6 +57,34 @@ class StoryVideoGenerationService:
         unique_id = str(uuid.uuid4())[:8]
         return f"story_{clean_title}_{unique_id}.mp4"
     
+    def new_scene_video_path(self, scene_number: int, user_id: str, db: Optional[Session] = None) -> Path:
+        """
+        Allocate the workspace path for a scene video, so providers can stream straight into it.
+        
+        Parameters:
+            scene_number: Scene number for naming
+            user_id: Clerk user ID for naming
+            db: Database session for workspace resolution
+        """
+        # Generate filename with scene number and user ID
+        clean_user_id = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in user_id[:16])
+        timestamp = str(uuid.uuid4())[:8]
+        filename = f"scene_{scene_number}_{clean_user_id}_{timestamp}.mp4"
+        
+        # Resolve output directory (user workspace or default)
+        return self._get_user_video_dir(user_id, db) / filename
+    
+    def describe_scene_video(self, video_path: Path) -> Dict[str, Any]:
+        """Video metadata (filename, URL, path, size) for a scene video already on disk."""
+        video_path = Path(video_path)
+        return {
+            "video_filename": video_path.name,
+            # URL path relative to /api/story/videos/
+            "video_url": f"/api/story/videos/{video_path.name}",
+            "video_path": str(video_path),
+            "file_size": video_path.stat().st_size,
+        }
+    
     def save_scene_video(self, video_bytes: bytes, scene_number: int, user_id: str, db: Optional[Session] = None) -> Dict[str, str]:
         """
         Save individual scene video bytes to file.
@@ -69,31 +99,15 @@ class StoryVideoGenerationService:
             Dict[str, str]: Video metadata with video_url and video_filename
         """
         try:
-            # Generate filename with scene number and user ID
-            clean_user_id = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in user_id[:16])
-            timestamp = str(uuid.uuid4())[:8]
-            filename = f"scene_{scene_number}_{clean_user_id}_{timestamp}.mp4"
-            
-            # Resolve output directory (user workspace or default)
-            output_dir = self._get_user_video_dir(user_id, db)
-            video_path = output_dir / filename
+            video_path = self.new_scene_video_path(scene_number, user_id, db)
             
             # Write video bytes to file
             with open(video_path, 'wb') as f:
                 f.write(video_bytes)
             
-            file_size = video_path.stat().st_size
-            logger.info(f"[StoryVideoGeneration] Saved scene {scene_number} video: {filename} ({file_size} bytes)")
-            
-            # Generate URL path (relative to /api/story/videos/)
-            video_url = f"/api/story/videos/{filename}"
-            
-            return {
-                "video_filename": filename,
-                "video_url": video_url,
-                "video_path": str(video_path),
-                "file_size": file_size
-            }
+            saved = self.describe_scene_video(video_path)
+            logger.info(f"[StoryVideoGeneration] Saved scene {scene_number} video: {saved['video_filename']} ({saved['file_size']} bytes)")
+            return saved
             
         except Exception as e:
             logger.error(f"[StoryVideoGeneration] Error saving scene video: {e}", exc_info=True)
@@ -472,3 +486,58 @@ class StoryVideoGenerationService:
             logger.error(f"[StoryVideoGeneration] Error generating story video: {e}")
             raise RuntimeError(f"Failed to generate story video: {str(e)}") from e
 
+    
+    def combine_scene_videos(
+        self,
+        video_paths: List[str],
+        user_id: str,
+        story_title: str = "Story",
+        fps: int = 24,
+        progress_callback: Optional[callable] = None,
+    ) -> Dict[str, Any]:
+        """
+        Join already-rendered scene videos (with embedded audio) into one video.
+        
+        Uses the ffmpeg concat demuxer, which stream-copies clips that share codec,
+        resolution and frame rate; falls back to the MoviePy composition path when
+        ffmpeg is unavailable or fails.
+        
+        Parameters:
+            video_paths (List[str]): Scene video file paths in playback order.
+            user_id (str): Clerk user ID.
+            story_title (str): Title used for the output filename.
+            fps (int): Frame rate used if the clips have to be re-encoded.
+            progress_callback (callable, optional): Called as callback(progress, message), progress 0-100.
+        
+        Returns:
+            Dict[str, Any]: Same metadata shape as generate_story_video.
+        """
+        if not video_paths:
+            raise ValueError("Video paths are required")
+        
+        video_filename = self._generate_video_filename(story_title)
+        if get_ffmpeg_exe():
+            try:
+                result = concat_videos(video_paths, self.output_dir / video_filename, progress_callback, fps=fps)
+                return {
+                    "video_path": result["video_path"],
+                    "video_filename": video_filename,
+                    "video_url": f"/api/story/videos/{video_filename}",
+                    "duration": result["duration"],
+                    "fps": result["fps"],
+                    "file_size": result["file_size"],
+                    "num_scenes": result["num_clips"],
+                }
+            except VideoConcatError as e:
+                logger.warning(f"[StoryVideoGeneration] ffmpeg concat failed, falling back to MoviePy: {e}")
+        
+        return self.generate_story_video(
+            scenes=[{"scene_number": idx + 1, "title": f"Scene {idx + 1}"} for idx in range(len(video_paths))],
+            image_paths=[None] * len(video_paths),
+            audio_paths=[None] * len(video_paths),
+            video_paths=[str(p) for p in video_paths],
+            user_id=user_id,
+            story_title=story_title,
+            fps=fps,
+            progress_callback=progress_callback,
+        )
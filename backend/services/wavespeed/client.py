@@ -14,6 +14,7 @@ from fastapi import HTTPException
 from services.onboarding.api_key_manager import APIKeyManager
 from utils.logger_utils import get_service_logger
 from .polling import WaveSpeedPolling
+from .session import get_wavespeed_session
 from .generators.prompt import PromptGenerator
 from .generators.image import ImageGenerator
 from .generators.video import VideoGenerator
@@ -98,16 +99,17 @@ class WaveSpeedClient:
         timeout_seconds: Optional[int] = None,
         interval_seconds: float = 1.0,
         progress_callback: Optional[Callable[[float, str], None]] = None,
+        expected_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
-        Poll WaveSpeed until the job completes or fails.
-        Matches the example pattern: simple polling loop until status is "completed" or "failed".
+        Wait on the shared poller until the job completes or fails.
         
         Args:
             prediction_id: The prediction ID to poll for
-            timeout_seconds: Optional timeout in seconds. If None, polls indefinitely until completion/failure.
-            interval_seconds: Seconds to wait between polling attempts (default: 1.0, faster than 2.0)
+            timeout_seconds: Optional timeout in seconds. If None, waits until completion/failure.
+            interval_seconds: Minimum seconds between status checks once the job is due
             progress_callback: Optional callback function(progress: float, message: str) for progress updates
+            expected_seconds: Expected run time; checks are sparse until then (learned per model if omitted)
         
         Returns:
             Dict containing the completed result
@@ -120,8 +122,35 @@ class WaveSpeedClient:
             timeout_seconds=timeout_seconds,
             interval_seconds=interval_seconds,
             progress_callback=progress_callback,
+            expected_seconds=expected_seconds,
         )
 
+    async def poll_until_complete_async(
+        self,
+        prediction_id: str,
+        timeout_seconds: Optional[int] = None,
+        interval_seconds: float = 1.0,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        expected_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Awaitable variant of poll_until_complete for async callers."""
+        return await self.polling.poll_until_complete_async(
+            prediction_id,
+            timeout_seconds=timeout_seconds,
+            interval_seconds=interval_seconds,
+            progress_callback=progress_callback,
+            expected_seconds=expected_seconds,
+        )
+
+    def download_to_file(self, url: str, dest_path: str, timeout: int = 180) -> int:
+        """
+        Stream a result asset (e.g. a generated video) to dest_path through the pooled session.
+        
+        Returns:
+            Number of bytes written
+        """
+        return get_wavespeed_session().download_to_file(url, dest_path, timeout=timeout)
+
     # Generator methods (delegated to specialized generators)
     def optimize_prompt(
         self,
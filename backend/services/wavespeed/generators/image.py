@@ -9,6 +9,7 @@ from requests import exceptions as requests_exceptions
 from fastapi import HTTPException
 
 from utils.logger_utils import get_service_logger
+from ..session import get_wavespeed_session
 
 logger = get_service_logger("wavespeed.generators.image")
 
@@ -27,6 +28,7 @@ class ImageGenerator:
         self.api_key = api_key
         self.base_url = base_url
         self.polling = polling
+        self.http = get_wavespeed_session()
     
     def _get_headers(self) -> dict:
         """Get HTTP headers for API requests."""
@@ -104,7 +106,7 @@ class ImageGenerator:
                 payload[key] = value
         
         logger.info(f"[WaveSpeed] Generating image via {url} (model={model}, prompt_length={len(prompt)})")
-        response = requests.post(url, headers=self._get_headers(), json=payload, timeout=timeout)
+        response = self.http.submit(url, headers=self._get_headers(), json=payload, timeout=timeout)
         
         if response.status_code != 200:
             logger.error(f"[WaveSpeed] Image generation failed: {response.status_code} {response.text}")
@@ -216,7 +218,7 @@ class ImageGenerator:
         
         for attempt in range(max_retries + 1):
             try:
-                response = requests.post(
+                response = self.http.submit(
                     url, 
                     headers=self._get_headers(), 
                     json=payload, 
@@ -362,7 +364,7 @@ class ImageGenerator:
     def _download_image(self, image_url: str, timeout: int = 60) -> bytes:
         """Download image from URL."""
         logger.info(f"[WaveSpeed] Fetching image from URL: {image_url}")
-        image_response = requests.get(image_url, timeout=timeout)
+        image_response = self.http.download(image_url, timeout=timeout)
         if image_response.status_code == 200:
             image_bytes = image_response.content
             logger.info(f"[WaveSpeed] Image generated successfully (size: {len(image_bytes)} bytes)")
@@ -7,6 +7,7 @@ from typing import Optional
 from fastapi import HTTPException
 
 from utils.logger_utils import get_service_logger
+from ..session import get_wavespeed_session
 
 logger = get_service_logger("wavespeed.generators.prompt")
 
@@ -25,6 +26,7 @@ class PromptGenerator:
         self.api_key = api_key
         self.base_url = base_url
         self.polling = polling
+        self.http = get_wavespeed_session()
     
     def _get_headers(self) -> dict:
         """Get HTTP headers for API requests."""
@@ -70,7 +72,7 @@ class PromptGenerator:
             payload["image"] = image
         
         logger.info(f"[WaveSpeed] Optimizing prompt via {url} (mode={mode}, style={style})")
-        response = requests.post(url, headers=self._get_headers(), json=payload, timeout=timeout)
+        response = self.http.submit(url, headers=self._get_headers(), json=payload, timeout=timeout)
         
         if response.status_code != 200:
             logger.error(f"[WaveSpeed] Prompt optimization failed: {response.status_code} {response.text}")
@@ -149,7 +151,7 @@ class PromptGenerator:
                 
                 # Use stream=True to avoid downloading large files into memory
                 try:
-                    with requests.get(first_output, timeout=timeout, stream=True) as url_response:
+                    with self.http.download(first_output, timeout=timeout, stream=True) as url_response:
                         if url_response.status_code == 200:
                             # Check Content-Length if available
                             content_length = url_response.headers.get("Content-Length")
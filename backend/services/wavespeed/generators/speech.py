@@ -10,6 +10,7 @@ from requests import exceptions as requests_exceptions
 from fastapi import HTTPException
 
 from utils.logger_utils import get_service_logger
+from ..session import get_wavespeed_session
 
 logger = get_service_logger("wavespeed.generators.speech")
 
@@ -28,6 +29,7 @@ class SpeechGenerator:
         self.api_key = api_key
         self.base_url = base_url
         self.polling = polling
+        self.http = get_wavespeed_session()
     
     def _get_headers(self) -> dict:
         """Get HTTP headers for API requests."""
@@ -151,7 +153,7 @@ class SpeechGenerator:
         retry_delay = 2.0
         for attempt in range(max_retries + 1):
             try:
-                response = requests.post(
+                response = self.http.submit(
                     url,
                     headers=self._get_headers(),
                     json=payload,
@@ -269,7 +271,7 @@ class SpeechGenerator:
         logger.info(f"[WaveSpeed] Voice design via {url}")
 
         try:
-            response = requests.post(
+            response = self.http.submit(
                 url,
                 headers=self._get_headers(),
                 json=payload,
@@ -291,7 +293,7 @@ class SpeechGenerator:
             # The API is async and returns a task ID or direct output depending on implementation.
             # Based on user input, it returns a "data" object with "id" and we poll.
             # BUT wait, the Python example provided by user shows:
-            # response = requests.post(url, ...)
+            # response = self.http.submit(url, ...)
             # if response.status_code == 200: result = response.json()["data"] ...
             # Then it polls /api/v3/predictions/{request_id}/result
             
@@ -319,7 +321,7 @@ class SpeechGenerator:
         
         while time.time() - start_time < timeout:
             try:
-                response = requests.get(url, headers=self._get_headers(), timeout=10)
+                response = self.http.get(url, headers=self._get_headers(), timeout=10)
                 if response.status_code == 200:
                     result = response.json().get("data", {})
                     status = result.get("status")
@@ -380,7 +382,7 @@ class SpeechGenerator:
         logger.info(f"[WaveSpeed] Voice clone via {url} (voice_id={custom_voice_id})")
 
         try:
-            response = requests.post(
+            response = self.http.submit(
                 url,
                 headers=self._get_headers(),
                 json=payload,
@@ -445,7 +447,7 @@ class SpeechGenerator:
         logger.info(f"[WaveSpeed] Qwen3 voice clone via {url} (language={payload.get('language')})")
 
         try:
-            response = requests.post(
+            response = self.http.submit(
                 url,
                 headers=self._get_headers(),
                 json=payload,
@@ -511,7 +513,7 @@ class SpeechGenerator:
         logger.info(f"[WaveSpeed] CosyVoice voice clone via {url}")
 
         try:
-            response = requests.post(
+            response = self.http.submit(
                 url,
                 headers=self._get_headers(),
                 json=payload,
@@ -579,7 +581,7 @@ class SpeechGenerator:
     def _download_audio(self, audio_url: str, timeout: int) -> bytes:
         """Download audio from URL."""
         logger.info(f"[WaveSpeed] Fetching audio from URL: {audio_url}")
-        audio_response = requests.get(audio_url, timeout=timeout)
+        audio_response = self.http.download(audio_url, timeout=timeout)
         if audio_response.status_code == 200:
             audio_bytes = audio_response.content
             logger.info(f"[WaveSpeed] Speech generated successfully (size: {len(audio_bytes)} bytes)")
@@ -2,7 +2,6 @@
 Video audio generation operations.
 """
 
-import requests
 from typing import Optional, Callable
 from fastapi import HTTPException
 
@@ -59,7 +58,7 @@ class VideoAudio(VideoBase):
         )
         
         # Submit the task
-        response = requests.post(url, headers=self._get_headers(), json=payload, timeout=timeout)
+        response = self.http.submit(url, headers=self._get_headers(), json=payload, timeout=timeout)
         
         if response.status_code != 200:
             logger.error(f"[WaveSpeed] Hunyuan Video Foley submission failed: {response.status_code} {response.text}")
@@ -107,7 +106,7 @@ class VideoAudio(VideoBase):
                 raise HTTPException(status_code=502, detail="WaveSpeed Hunyuan Video Foley output format not recognized")
             
             logger.info(f"[WaveSpeed] Downloading video with audio from: {video_url}")
-            video_response = requests.get(video_url, timeout=timeout)
+            video_response = self.http.download(video_url, timeout=timeout)
             
             if video_response.status_code != 200:
                 logger.error(f"[WaveSpeed] Failed to download video with audio: {video_response.status_code}")
@@ -173,7 +172,7 @@ class VideoAudio(VideoBase):
         )
         
         # Submit the task
-        response = requests.post(url, headers=self._get_headers(), json=payload, timeout=timeout)
+        response = self.http.submit(url, headers=self._get_headers(), json=payload, timeout=timeout)
         
         if response.status_code != 200:
             logger.error(f"[WaveSpeed] Think Sound submission failed: {response.status_code} {response.text}")
@@ -221,7 +220,7 @@ class VideoAudio(VideoBase):
                 raise HTTPException(status_code=502, detail="WaveSpeed Think Sound output format not recognized")
             
             logger.info(f"[WaveSpeed] Downloading video with audio from: {video_url}")
-            video_response = requests.get(video_url, timeout=timeout)
+            video_response = self.http.download(video_url, timeout=timeout)
             
             if video_response.status_code != 200:
                 logger.error(f"[WaveSpeed] Failed to download video with audio: {video_response.status_code}")
@@ -2,7 +2,6 @@
 Video background removal operations.
 """
 
-import requests
 from typing import Optional, Callable
 from fastapi import HTTPException
 
@@ -56,7 +55,7 @@ class VideoBackground(VideoBase):
         )
         
         # Submit the task
-        response = requests.post(url, headers=self._get_headers(), json=payload, timeout=timeout)
+        response = self.http.submit(url, headers=self._get_headers(), json=payload, timeout=timeout)
         
         if response.status_code != 200:
             logger.error(f"[WaveSpeed] Video background removal submission failed: {response.status_code} {response.text}")
@@ -104,7 +103,7 @@ class VideoBackground(VideoBase):
                 raise HTTPException(status_code=502, detail="WaveSpeed video background removal output format not recognized")
             
             logger.info(f"[WaveSpeed] Downloading processed video from: {video_url}")
-            video_response = requests.get(video_url, timeout=timeout)
+            video_response = self.http.download(video_url, timeout=timeout)
             
             if video_response.status_code != 200:
                 logger.error(f"[WaveSpeed] Failed to download processed video: {video_response.status_code}")
@@ -9,6 +9,7 @@ from typing import Optional
 from fastapi import HTTPException
 
 from utils.logger_utils import get_service_logger
+from ...session import get_wavespeed_session
 
 logger = get_service_logger("wavespeed.generators.video.base")
 
@@ -27,6 +28,7 @@ class VideoBase:
         self.api_key = api_key
         self.base_url = base_url
         self.polling = polling
+        self.http = get_wavespeed_session()
     
     def _get_headers(self) -> dict:
         """Get HTTP headers for API requests."""
@@ -49,7 +51,7 @@ class VideoBase:
             HTTPException: If download fails
         """
         logger.info(f"[WaveSpeed] Downloading video from: {video_url}")
-        video_response = requests.get(video_url, timeout=timeout)
+        video_response = self.http.download(video_url, timeout=timeout)
         
         if video_response.status_code != 200:
             raise HTTPException(
@@ -63,6 +65,20 @@ class VideoBase:
         
         return video_response.content
     
+    def _download_video_to_file(self, video_url: str, dest_path: str, timeout: int = 180) -> int:
+        """Stream video from URL straight to dest_path.
+        
+        Args:
+            video_url: URL to download video from
+            dest_path: File to write (written atomically)
+            timeout: Request timeout in seconds
+            
+        Returns:
+            int: Bytes written
+        """
+        logger.info(f"[WaveSpeed] Streaming video from: {video_url}")
+        return self.http.download_to_file(video_url, dest_path, timeout=timeout)
+    
     def _extract_video_url(self, outputs: list) -> Optional[str]:
         """Extract video URL from outputs array.
         
@@ -2,7 +2,6 @@
 Video enhancement operations (upscaling).
 """
 
-import requests
 from typing import Optional, Callable
 from fastapi import HTTPException
 
@@ -50,7 +49,7 @@ class VideoEnhancement(VideoBase):
         logger.info(f"[WaveSpeed] Upscaling video via {url} (target={target_resolution})")
         
         # Submit the task
-        response = requests.post(url, headers=self._get_headers(), json=payload, timeout=timeout)
+        response = self.http.submit(url, headers=self._get_headers(), json=payload, timeout=timeout)
         
         if response.status_code != 200:
             logger.error(f"[WaveSpeed] FlashVSR submission failed: {response.status_code} {response.text}")
@@ -94,7 +93,7 @@ class VideoEnhancement(VideoBase):
         
         # Download the upscaled video
         logger.info(f"[WaveSpeed] Downloading upscaled video from: {video_url}")
-        video_response = requests.get(video_url, timeout=timeout)
+        video_response = self.http.download(video_url, timeout=timeout)
         
         if video_response.status_code != 200:
             logger.error(f"[WaveSpeed] Failed to download upscaled video: {video_response.status_code}")
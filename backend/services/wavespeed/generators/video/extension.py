@@ -2,7 +2,6 @@
 Video extension operations.
 """
 
-import requests
 from typing import Optional, Callable
 from fastapi import HTTPException
 
@@ -96,7 +95,7 @@ class VideoExtension(VideoBase):
         logger.info(f"[WaveSpeed] Extending video via {url} (duration={duration}s, resolution={resolution})")
         
         # Submit the task
-        response = requests.post(url, headers=self._get_headers(), json=payload, timeout=timeout)
+        response = self.http.submit(url, headers=self._get_headers(), json=payload, timeout=timeout)
         
         if response.status_code != 200:
             logger.error(f"[WaveSpeed] Video extend submission failed: {response.status_code} {response.text}")
@@ -146,7 +145,7 @@ class VideoExtension(VideoBase):
         
         # Download the extended video
         logger.info(f"[WaveSpeed] Downloading extended video from: {video_url}")
-        video_response = requests.get(video_url, timeout=timeout)
+        video_response = self.http.download(video_url, timeout=timeout)
         
         if video_response.status_code != 200:
             logger.error(f"[WaveSpeed] Failed to download extended video: {video_response.status_code}")
@@ -2,7 +2,6 @@
 Face swap operations.
 """
 
-import requests
 from typing import Optional, Callable
 from fastapi import HTTPException
 
@@ -73,7 +72,7 @@ class VideoFaceSwap(VideoBase):
         )
         
         # Submit the task
-        response = requests.post(url, headers=self._get_headers(), json=payload, timeout=timeout)
+        response = self.http.submit(url, headers=self._get_headers(), json=payload, timeout=timeout)
         
         if response.status_code != 200:
             logger.error(f"[WaveSpeed] Face swap submission failed: {response.status_code} {response.text}")
@@ -131,7 +130,7 @@ class VideoFaceSwap(VideoBase):
             
             # Download video
             logger.info(f"[WaveSpeed] Downloading face-swapped video from: {video_url}")
-            video_response = requests.get(video_url, timeout=timeout)
+            video_response = self.http.download(video_url, timeout=timeout)
             if video_response.status_code != 200:
                 raise HTTPException(
                     status_code=502,
@@ -204,7 +203,7 @@ class VideoFaceSwap(VideoBase):
         )
         
         # Submit the task
-        response = requests.post(url, headers=self._get_headers(), json=payload, timeout=timeout)
+        response = self.http.submit(url, headers=self._get_headers(), json=payload, timeout=timeout)
         
         if response.status_code != 200:
             logger.error(f"[WaveSpeed] Video face swap submission failed: {response.status_code} {response.text}")
@@ -262,7 +261,7 @@ class VideoFaceSwap(VideoBase):
             
             # Download video
             logger.info(f"[WaveSpeed] Downloading face-swapped video from: {video_url}")
-            video_response = requests.get(video_url, timeout=timeout)
+            video_response = self.http.download(video_url, timeout=timeout)
             if video_response.status_code != 200:
                 raise HTTPException(
                     status_code=502,
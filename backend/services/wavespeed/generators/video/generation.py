@@ -2,7 +2,6 @@
 Video generation operations (text-to-video and image-to-video).
 """
 
-import requests
 from typing import Any, Dict, Optional
 from fastapi import HTTPException
 
@@ -33,7 +32,7 @@ class VideoGeneration(VideoBase):
         """
         url = f"{self.base_url}/{model_path}"
         logger.info(f"[WaveSpeed] Submitting request to {url}")
-        response = requests.post(url, headers=self._get_headers(), json=payload, timeout=timeout)
+        response = self.http.submit(url, headers=self._get_headers(), json=payload, timeout=timeout)
         if response.status_code != 200:
             logger.error(f"[WaveSpeed] Submission failed: {response.status_code} {response.text}")
 
@@ -84,7 +83,7 @@ class VideoGeneration(VideoBase):
         """
         url = f"{self.base_url}/{model_path}"
         logger.info(f"[WaveSpeed] Submitting text-to-video request to {url}")
-        response = requests.post(url, headers=self._get_headers(), json=payload, timeout=timeout)
+        response = self.http.submit(url, headers=self._get_headers(), json=payload, timeout=timeout)
         
         if response.status_code != 200:
             logger.error(f"[WaveSpeed] Text-to-video submission failed: {response.status_code} {response.text}")
@@ -191,7 +190,7 @@ class VideoGeneration(VideoBase):
         # For sync mode, submit and get result directly
         if enable_sync_mode:
             url = f"{self.base_url}/{model_path}"
-            response = requests.post(url, headers=self._get_headers(), json=payload, timeout=timeout)
+            response = self.http.submit(url, headers=self._get_headers(), json=payload, timeout=timeout)
             
             if response.status_code != 200:
                 logger.error(f"[WaveSpeed] Text-to-video submission failed: {response.status_code} {response.text}")
@@ -2,7 +2,6 @@
 Video translation operations.
 """
 
-import requests
 from typing import Optional, Callable
 from fastapi import HTTPException
 
@@ -54,7 +53,7 @@ class VideoTranslation(VideoBase):
         )
         
         # Submit the task
-        response = requests.post(url, headers=self._get_headers(), json=payload, timeout=timeout)
+        response = self.http.submit(url, headers=self._get_headers(), json=payload, timeout=timeout)
         
         if response.status_code != 200:
             logger.error(f"[WaveSpeed] Video translate submission failed: {response.status_code} {response.text}")
@@ -112,7 +111,7 @@ class VideoTranslation(VideoBase):
             
             # Download video
             logger.info(f"[WaveSpeed] Downloading translated video from: {video_url}")
-            video_response = requests.get(video_url, timeout=timeout)
+            video_response = self.http.download(video_url, timeout=timeout)
             if video_response.status_code != 200:
                 raise HTTPException(
                     status_code=502,
@@ -15,6 +15,7 @@ from fastapi import HTTPException
 from loguru import logger
 
 from .client import WaveSpeedClient
+from .session import get_wavespeed_session
 
 HUNYUAN_AVATAR_MODEL_PATH = "wavespeed-ai/hunyuan-avatar"
 HUNYUAN_AVATAR_MODEL_NAME = "wavespeed-ai/hunyuan-avatar"
@@ -175,7 +176,7 @@ def create_hunyuan_avatar(
 
     # Download video
     try:
-        video_response = requests.get(video_url, timeout=180)
+        video_response = get_wavespeed_session().download(video_url, timeout=180)
         if video_response.status_code != 200:
             raise HTTPException(
                 status_code=502,
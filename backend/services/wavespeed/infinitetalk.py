@@ -3,11 +3,11 @@ from __future__ import annotations
 import base64
 from typing import Any, Dict, Optional
 
-import requests
 from fastapi import HTTPException
 from loguru import logger
 
 from .client import WaveSpeedClient
+from .session import download_result_video
 
 INFINITALK_MODEL_PATH = "wavespeed-ai/infinitetalk"
 INFINITALK_MODEL_NAME = "wavespeed-ai/infinitetalk"
@@ -135,10 +135,12 @@ def animate_scene_with_voiceover(
     image_mime: str = "image/png",
     audio_mime: str = "audio/mpeg",
     client: Optional[WaveSpeedClient] = None,
+    output_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Animate a scene image with narration audio using WaveSpeed InfiniteTalk.
-    Returns dict with video bytes, prompt used, model name, and cost.
+    Returns dict with video bytes (or, when output_path is given, the streamed video_path),
+    prompt used, model name, and cost.
     """
 
     if not image_bytes:
@@ -194,16 +196,9 @@ def animate_scene_with_voiceover(
         raise HTTPException(status_code=502, detail="WaveSpeed InfiniteTalk completed but returned no outputs.")
 
     video_url = outputs[0]
-    video_response = requests.get(video_url, timeout=180)
-    if video_response.status_code != 200:
-        raise HTTPException(
-            status_code=502,
-            detail={
-                "error": "Failed to download InfiniteTalk video",
-                "status_code": video_response.status_code,
-                "response": video_response.text[:200],
-            },
-        )
+    video = download_result_video(
+        video_url, output_path, timeout=180, error_message="Failed to download InfiniteTalk video"
+    )
 
     metadata = result.get("metadata") or {}
     duration = metadata.get("duration_seconds") or metadata.get("duration") or 0
@@ -213,11 +208,11 @@ def animate_scene_with_voiceover(
         user_id,
         scene_data.get("scene_number"),
         resolution,
-        len(video_response.content),
+        video["file_size"],
     )
 
     return {
-        "video_bytes": video_response.content,
+        **video,
         "prompt": animation_prompt,
         "duration": duration or 5,
         "model_name": INFINITALK_MODEL_NAME,
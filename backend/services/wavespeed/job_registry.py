@@ -0,0 +1,144 @@
+"""
+Resumable registry of WaveSpeed predictions.
+
+Every prediction handed to the shared poller is recorded here with its lifecycle status
+and, once finished, its result or error. After a worker restart the poller re-attaches to
+predictions that were still running, and resume endpoints can read a finished result
+without hitting the WaveSpeed API again. The API key is never stored.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from utils.logger_utils import get_service_logger
+
+logger = get_service_logger("wavespeed.job_registry")
+
+PENDING_STATUS = "polling"
+
+
+def _default_db_path() -> str:
+    """Default to root/data/wavespeed/jobs.db."""
+    root_dir = Path(__file__).resolve().parents[3]
+    return str(root_dir / "data" / "wavespeed" / "jobs.db")
+
+
+class WaveSpeedJobRegistry:
+    """Small WAL-mode SQLite table keyed by prediction ID."""
+
+    def __init__(self, db_path: Optional[str] = None, retention_seconds: int = 7 * 24 * 3600):
+        self.db_path = db_path or _default_db_path()
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS wavespeed_jobs (
+                    prediction_id TEXT PRIMARY KEY,
+                    base_url TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    model TEXT,
+                    remote_status TEXT,
+                    submitted_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    result TEXT,
+                    error TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_wavespeed_jobs_status ON wavespeed_jobs(status, submitted_at)")
+            conn.execute(
+                "DELETE FROM wavespeed_jobs WHERE status != ? AND updated_at < ?",
+                (PENDING_STATUS, time.time() - self.retention_seconds),
+            )
+            self._initialized = True
+        return conn
+
+    def _execute(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            if not self._initialized:
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = self._connect()
+            try:
+                return conn.execute(sql, params).fetchall()
+            finally:
+                conn.close()
+
+    def register(self, prediction_id: str, base_url: str, submitted_at: Optional[float] = None):
+        """Record a prediction as being polled (no-op if it is already known)."""
+        now = time.time()
+        try:
+            self._execute(
+                "INSERT OR IGNORE INTO wavespeed_jobs (prediction_id, base_url, status, submitted_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (prediction_id, base_url, PENDING_STATUS, submitted_at or now, now),
+            )
+        except Exception as e:
+            logger.warning(f"[WaveSpeed] Failed to register prediction {prediction_id}: {e}")
+
+    def update_remote_status(self, prediction_id: str, remote_status: Optional[str], model: Optional[str]):
+        try:
+            self._execute(
+                "UPDATE wavespeed_jobs SET remote_status = ?, model = COALESCE(?, model), updated_at = ? "
+                "WHERE prediction_id = ?",
+                (remote_status, model, time.time(), prediction_id),
+            )
+        except Exception as e:
+            logger.warning(f"[WaveSpeed] Failed to update prediction {prediction_id}: {e}")
+
+    def finish(self, prediction_id: str, status: str, result: Optional[Dict[str, Any]] = None,
+               error: Optional[Dict[str, Any]] = None):
+        """Record the terminal state of a prediction."""
+        try:
+            self._execute(
+                "UPDATE wavespeed_jobs SET status = ?, result = ?, error = ?, updated_at = ? WHERE prediction_id = ?",
+                (
+                    status,
+                    json.dumps(result, default=str) if result is not None else None,
+                    json.dumps(error, default=str) if error is not None else None,
+                    time.time(),
+                    prediction_id,
+                ),
+            )
+        except Exception as e:
+            logger.warning(f"[WaveSpeed] Failed to record outcome for prediction {prediction_id}: {e}")
+
+    def get(self, prediction_id: str) -> Optional[Dict[str, Any]]:
+        """Return the recorded job (with decoded result/error) or None."""
+        try:
+            rows = self._execute("SELECT * FROM wavespeed_jobs WHERE prediction_id = ?", (prediction_id,))
+        except Exception as e:
+            logger.warning(f"[WaveSpeed] Failed to read prediction {prediction_id}: {e}")
+            return None
+        if not rows:
+            return None
+        job = dict(rows[0])
+        for field in ("result", "error"):
+            if job[field]:
+                job[field] = json.loads(job[field])
+        return job
+
+    def pending(self, max_age_seconds: float) -> List[Dict[str, Any]]:
+        """Predictions still being polled that are young enough to resume; older ones are abandoned."""
+        try:
+            self._execute(
+                "UPDATE wavespeed_jobs SET status = 'abandoned', updated_at = ? WHERE status = ? AND submitted_at < ?",
+                (time.time(), PENDING_STATUS, time.time() - max_age_seconds),
+            )
+            rows = self._execute(
+                "SELECT prediction_id, base_url, submitted_at, model FROM wavespeed_jobs "
+                "WHERE status = ? AND submitted_at >= ? ORDER BY submitted_at",
+                (PENDING_STATUS, time.time() - max_age_seconds),
+            )
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.warning(f"[WaveSpeed] Failed to list pending predictions: {e}")
+            return []
@@ -4,13 +4,13 @@ import base64
 import json
 from typing import Any, Dict, Optional
 
-import requests
 from fastapi import HTTPException
 
 from services.llm_providers.main_text_generation import llm_text_gen
 from utils.logger_utils import get_service_logger
 
 from .client import WaveSpeedClient
+from .session import download_result_video
 
 try:
     import imghdr
@@ -330,10 +330,12 @@ def animate_scene_image(
     guidance_scale: float = 0.5,
     negative_prompt: Optional[str] = None,
     client: Optional[WaveSpeedClient] = None,
+    output_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Animate a scene image using WaveSpeed Kling v2.5 Turbo Std.
-    Returns dict with video bytes, prompt used, model name, duration, and cost.
+    Returns dict with video bytes (or, when output_path is given, the streamed video_path),
+    prompt used, model name, duration, and cost.
     """
     if duration not in (5, 10):
         raise HTTPException(status_code=400, detail="Duration must be 5 or 10 seconds for scene animation.")
@@ -374,22 +376,15 @@ def animate_scene_image(
         raise HTTPException(status_code=502, detail="WaveSpeed completed but returned no outputs.")
 
     video_url = outputs[0]
-    video_response = requests.get(video_url, timeout=60)
-    if video_response.status_code != 200:
-        raise HTTPException(
-            status_code=502,
-            detail={
-                "error": "Failed to download animation video",
-                "status_code": video_response.status_code,
-                "response": video_response.text[:200],
-            },
-        )
+    video = download_result_video(
+        video_url, output_path, timeout=60, error_message="Failed to download animation video"
+    )
 
     model_name = KLING_MODEL_5S if duration == 5 else KLING_MODEL_10S
     cost = 0.21 if duration == 5 else 0.42
 
     return {
-        "video_bytes": video_response.content,
+        **video,
         "prompt": animation_prompt,
         "duration": duration,
         "model_name": model_name,
@@ -406,15 +401,22 @@ def resume_scene_animation(
     duration: int,
     user_id: str,
     client: Optional[WaveSpeedClient] = None,
+    output_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Resume a previously submitted animation by fetching the completed result.
+    With output_path the video is streamed to that file instead of returned as bytes.
     """
     if duration not in (5, 10):
         raise HTTPException(status_code=400, detail="Duration must be 5 or 10 seconds for scene animation.")
 
     client = client or WaveSpeedClient()
-    result = client.get_prediction_result(prediction_id, timeout=120)
+    # The shared poller keeps tracking timed-out predictions; reuse its recorded result if it has one
+    recorded = client.polling.poller.get_job(prediction_id)
+    if recorded and recorded.get("status") == "completed" and recorded.get("result"):
+        result = recorded["result"]
+    else:
+        result = client.get_prediction_result(prediction_id, timeout=120)
     status = result.get("status")
     if status != "completed":
         raise HTTPException(
@@ -431,17 +433,13 @@ def resume_scene_animation(
         raise HTTPException(status_code=502, detail="WaveSpeed completed but returned no outputs.")
 
     video_url = outputs[0]
-    video_response = requests.get(video_url, timeout=120)
-    if video_response.status_code != 200:
-        raise HTTPException(
-            status_code=502,
-            detail={
-                "error": "Failed to download animation video during resume",
-                "status_code": video_response.status_code,
-                "response": video_response.text[:200],
-                "prediction_id": prediction_id,
-            },
+    try:
+        video = download_result_video(
+            video_url, output_path, timeout=120, error_message="Failed to download animation video during resume"
         )
+    except HTTPException as exc:
+        exc.detail["prediction_id"] = prediction_id
+        raise
 
     animation_prompt = result.get("prompt") or ""
     model_name = KLING_MODEL_5S if duration == 5 else KLING_MODEL_10S
@@ -450,7 +448,7 @@ def resume_scene_animation(
     logger.info("[AnimateScene] Resumed download for prediction=%s", prediction_id)
 
     return {
-        "video_bytes": video_response.content,
+        **video,
         "prompt": animation_prompt,
         "duration": duration,
         "model_name": model_name,
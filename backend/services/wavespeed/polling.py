@@ -1,36 +1,53 @@
 """
 Polling utilities for WaveSpeed API.
+
+All waiting on predictions goes through one shared WaveSpeedPollerService: a single
+asyncio loop (on a daemon thread) that tracks every in-flight prediction ID over one
+pooled httpx.AsyncClient. Each job is checked on its own adaptive schedule, waiters are
+notified through futures, and the job registry lets polling resume after a restart.
 """
 
+import asyncio
+import concurrent.futures
+import threading
 import time
-from typing import Any, Dict, Optional, Callable
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Callable
 
-import requests
+import httpx
 from fastapi import HTTPException
 from requests import exceptions as requests_exceptions
 
 from utils.logger_utils import get_service_logger
+from .job_registry import WaveSpeedJobRegistry
+from .session import get_wavespeed_session
 
 logger = get_service_logger("wavespeed.polling")
 
 
 class WaveSpeedPolling:
     """Polling utilities for WaveSpeed API predictions."""
-    
-    def __init__(self, api_key: str, base_url: str):
+
+    def __init__(self, api_key: str, base_url: str, poller: Optional["WaveSpeedPollerService"] = None):
         """Initialize polling utilities.
-        
+
         Args:
             api_key: WaveSpeed API key
             base_url: WaveSpeed API base URL
+            poller: Shared poller service (defaults to the process-wide instance)
         """
         self.api_key = api_key
         self.base_url = base_url
-    
+        self._poller = poller
+
+    @property
+    def poller(self) -> "WaveSpeedPollerService":
+        return self._poller or get_wavespeed_poller()
+
     def _get_headers(self) -> Dict[str, str]:
         """Get HTTP headers for API requests."""
         return {"Authorization": f"Bearer {self.api_key}"}
-    
+
     def get_prediction_result(self, prediction_id: str, timeout: int = 30) -> Dict[str, Any]:
         """
         Fetch the current status/result for a prediction.
@@ -38,9 +55,9 @@ class WaveSpeedPolling:
         """
         url = f"{self.base_url}/predictions/{prediction_id}/result"
         headers = self._get_headers()
-        
+
         try:
-            response = requests.get(url, headers=headers, timeout=timeout)
+            response = get_wavespeed_session().get(url, headers=headers, timeout=timeout)
         except requests_exceptions.Timeout as exc:
             raise HTTPException(
                 status_code=504,
@@ -61,143 +78,525 @@ class WaveSpeedPolling:
                     "exception": str(exc),
                 },
             ) from exc
-        
-        # Match example pattern: check status_code == 200, then get data
-        if response.status_code == 200:
-            result = response.json().get("data")
-            if not result:
-                raise HTTPException(status_code=502, detail={"error": "WaveSpeed polling response missing data"})
-            return result
-        else:
-            # Non-200 status - log and raise error (matching example's break behavior)
-            logger.error(f"[WaveSpeed] Polling failed: {response.status_code} {response.text}")
-            raise HTTPException(
-                status_code=502,
-                detail={
-                    "error": "WaveSpeed prediction polling failed",
-                    "status_code": response.status_code,
-                    "response": response.text,
-                },
-            )
-    
+
+        return _parse_result_response(response.status_code, response, prediction_id)
+
     def poll_until_complete(
         self,
         prediction_id: str,
         timeout_seconds: Optional[int] = None,
         interval_seconds: float = 1.0,
         progress_callback: Optional[Callable[[float, str], None]] = None,
+        expected_seconds: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
-        Poll WaveSpeed until the job completes or fails.
-        Matches the example pattern: simple polling loop until status is "completed" or "failed".
-        
+        Wait until the job completes or fails.
+
+        Blocks the calling thread on a future only; the status checks themselves run on
+        the shared poller loop alongside every other in-flight prediction.
+
         Args:
             prediction_id: The prediction ID to poll for
-            timeout_seconds: Optional timeout in seconds. If None, polls indefinitely until completion/failure.
-            interval_seconds: Seconds to wait between polling attempts (default: 1.0, faster than 2.0)
+            timeout_seconds: Optional timeout in seconds. If None, waits until completion/failure.
+                The job keeps being tracked after a timeout so it can be resumed.
+            interval_seconds: Minimum seconds between status checks once the job is due
             progress_callback: Optional callback function(progress: float, message: str) for progress updates
-        
+            expected_seconds: Expected run time; checks are sparse until then. Learned per model when omitted.
+
         Returns:
             Dict containing the completed result
-            
+
         Raises:
             HTTPException: If the task fails, polling fails, or times out (if timeout_seconds is set)
         """
-        start_time = time.time()
-        consecutive_errors = 0
-        max_consecutive_errors = 6  # safety guard for non-transient errors
-        
+        return self.poller.wait(
+            prediction_id,
+            api_key=self.api_key,
+            base_url=self.base_url,
+            timeout_seconds=timeout_seconds,
+            interval_seconds=interval_seconds,
+            progress_callback=progress_callback,
+            expected_seconds=expected_seconds,
+        )
+
+    async def poll_until_complete_async(
+        self,
+        prediction_id: str,
+        timeout_seconds: Optional[int] = None,
+        interval_seconds: float = 1.0,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        expected_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Awaitable poll_until_complete for async callers; no worker thread is held while waiting."""
+        return await self.poller.wait_async(
+            prediction_id,
+            api_key=self.api_key,
+            base_url=self.base_url,
+            timeout_seconds=timeout_seconds,
+            interval_seconds=interval_seconds,
+            progress_callback=progress_callback,
+            expected_seconds=expected_seconds,
+        )
+
+
+def _parse_result_response(status_code: int, response: Any, prediction_id: str) -> Dict[str, Any]:
+    """Shared handling of a /predictions/{id}/result response (requests or httpx)."""
+    # Match example pattern: check status_code == 200, then get data
+    if status_code == 200:
+        result = response.json().get("data")
+        if not result:
+            raise HTTPException(status_code=502, detail={"error": "WaveSpeed polling response missing data"})
+        return result
+    # Non-200 status - log and raise error (matching example's break behavior)
+    logger.error(f"[WaveSpeed] Polling failed for {prediction_id}: {status_code} {response.text}")
+    raise HTTPException(
+        status_code=502,
+        detail={
+            "error": "WaveSpeed prediction polling failed",
+            "status_code": status_code,
+            "response": response.text,
+        },
+    )
+
+
+def next_poll_interval(
+    elapsed: float,
+    expected_seconds: Optional[float],
+    base_interval: float,
+    max_interval: float,
+) -> float:
+    """
+    Adaptive delay before the next status check.
+
+    Before the expected completion time the job is checked at half the remaining
+    time (never faster than base_interval), so a 3-minute render is not hit every
+    second. Once due, checks run at base_interval and back off slowly while overdue.
+    """
+    if expected_seconds and elapsed < expected_seconds:
+        return max(base_interval, min(max_interval, (expected_seconds - elapsed) / 2))
+    overdue = elapsed - (expected_seconds or 0)
+    return min(max_interval, base_interval * (1 + overdue / 60))
+
+
+@dataclass
+class _Waiter:
+    future: concurrent.futures.Future
+    started_at: float
+    timeout_seconds: Optional[float]
+    progress_callback: Optional[Callable[[float, str], None]]
+
+
+@dataclass
+class _PolledJob:
+    prediction_id: str
+    api_key: str
+    base_url: str
+    submitted_at: float
+    base_interval: float
+    expected_seconds: Optional[float]
+    waiters: List[_Waiter] = field(default_factory=list)
+    next_check: float = 0.0
+    in_flight: bool = False
+    checks: int = 0
+    consecutive_errors: int = 0
+    last_status: Optional[str] = None
+    model: Optional[str] = None
+
+
+class WaveSpeedPollerService:
+    """
+    Process-wide multiplexed poller for WaveSpeed predictions.
+
+    One event loop thread, one pooled httpx.AsyncClient, and a bounded number of
+    concurrent status requests serve every waiter. Several waiters on the same
+    prediction share a single polling schedule.
+    """
+
+    MAX_CONSECUTIVE_ERRORS = 6  # safety guard for non-transient errors
+
+    def __init__(
+        self,
+        registry: Optional[WaveSpeedJobRegistry] = None,
+        max_concurrent_requests: int = 16,
+        request_timeout: float = 30.0,
+        max_interval: float = 15.0,
+        job_max_age_seconds: float = 6 * 3600,
+        api_key_resolver: Optional[Callable[[], Optional[str]]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Args:
+            registry: Persistent job registry (defaults to data/wavespeed/jobs.db)
+            max_concurrent_requests: Cap on simultaneous status requests / pooled connections
+            request_timeout: Per-request timeout for status checks
+            max_interval: Longest gap between two checks of one job
+            job_max_age_seconds: Jobs older than this are abandoned instead of polled
+            api_key_resolver: Supplies the API key when resuming jobs after a restart
+            transport: Optional httpx transport (tests)
+        """
+        self.registry = registry or WaveSpeedJobRegistry()
+        self.max_concurrent_requests = max_concurrent_requests
+        self.request_timeout = request_timeout
+        self.max_interval = max_interval
+        self.job_max_age_seconds = job_max_age_seconds
+        self.api_key_resolver = api_key_resolver or _default_api_key
+        self._transport = transport
+
+        self._jobs: Dict[str, _PolledJob] = {}
+        self._learned_durations: Dict[str, float] = {}  # model -> EWMA of completion seconds
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._start_lock = threading.Lock()
+        # Registry I/O runs off the loop on one thread, so writes for a job stay ordered
+        self._registry_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="wavespeed-registry"
+        )
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def watch(
+        self,
+        prediction_id: str,
+        api_key: str,
+        base_url: str,
+        timeout_seconds: Optional[float] = None,
+        interval_seconds: float = 1.0,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        expected_seconds: Optional[float] = None,
+    ) -> concurrent.futures.Future:
+        """Start (or join) tracking a prediction; the future resolves to the completed result."""
+        self._ensure_started()
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        waiter = _Waiter(future, time.time(), timeout_seconds, progress_callback)
+        self._loop.call_soon_threadsafe(
+            self._add_waiter, prediction_id, api_key, base_url, interval_seconds, expected_seconds, waiter
+        )
+        return future
+
+    def wait(
+        self,
+        prediction_id: str,
+        api_key: str,
+        base_url: str,
+        timeout_seconds: Optional[float] = None,
+        interval_seconds: float = 1.0,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        expected_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Blocking wait for synchronous callers (runs no HTTP on the calling thread)."""
+        future = self.watch(
+            prediction_id, api_key, base_url, timeout_seconds, interval_seconds, progress_callback, expected_seconds
+        )
+        try:
+            return future.result(timeout=timeout_seconds)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise self._timeout_error(prediction_id, timeout_seconds, self._current_status(prediction_id))
+
+    async def wait_async(
+        self,
+        prediction_id: str,
+        api_key: str,
+        base_url: str,
+        timeout_seconds: Optional[float] = None,
+        interval_seconds: float = 1.0,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        expected_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Awaitable wait for async callers on any event loop."""
+        future = self.watch(
+            prediction_id, api_key, base_url, timeout_seconds, interval_seconds, progress_callback, expected_seconds
+        )
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            raise self._timeout_error(prediction_id, timeout_seconds, self._current_status(prediction_id))
+
+    def get_job(self, prediction_id: str) -> Optional[Dict[str, Any]]:
+        """Registry record for a prediction (status, result or error), if known."""
+        return self._registry_executor.submit(self.registry.get, prediction_id).result()
+
+    def active_jobs(self) -> int:
+        return len(self._jobs)
+
+    def _current_status(self, prediction_id: str) -> Optional[str]:
+        job = self._jobs.get(prediction_id)
+        return job.last_status if job else None
+
+    def shutdown(self):
+        """Stop the poller loop and close the shared client."""
+        loop = self._loop
+        if loop is None:
+            return
+
+        async def _close():
+            if self._scheduler_task is not None:
+                self._scheduler_task.cancel()
+            if self._client is not None:
+                await self._client.aclose()
+
+        asyncio.run_coroutine_threadsafe(_close(), loop).result(timeout=5)
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # Loop internals (everything below runs on the poller thread)
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self):
+        if self._loop is not None:
+            return
+        with self._start_lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _run():
+                asyncio.set_event_loop(loop)
+                self._client = httpx.AsyncClient(
+                    timeout=self.request_timeout,
+                    limits=httpx.Limits(
+                        max_connections=self.max_concurrent_requests,
+                        max_keepalive_connections=self.max_concurrent_requests,
+                    ),
+                    transport=self._transport,
+                )
+                self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+                self._wakeup = asyncio.Event()
+                self._scheduler_task = loop.create_task(self._scheduler())
+                ready.set()
+                loop.run_forever()
+
+            self._thread = threading.Thread(target=_run, name="wavespeed-poller", daemon=True)
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+            loop.call_soon_threadsafe(lambda: loop.create_task(self._resume_pending()))
+            logger.info("[WaveSpeed] Shared poller started")
+
+    async def _resume_pending(self):
+        """Re-attach to predictions that were still running when the last worker stopped."""
+        pending = await self._loop.run_in_executor(
+            self._registry_executor, self.registry.pending, self.job_max_age_seconds
+        )
+        if not pending:
+            return
+        api_key = await asyncio.to_thread(self.api_key_resolver)
+        if not api_key:
+            logger.warning(f"[WaveSpeed] {len(pending)} pending predictions not resumed: no API key available")
+            return
+        for row in pending:
+            if row["prediction_id"] not in self._jobs:
+                job = self._new_job(row["prediction_id"], api_key, row["base_url"], 1.0, None, row["submitted_at"])
+                job.model = row.get("model")
+        logger.info(f"[WaveSpeed] Resumed polling for {len(pending)} predictions")
+        self._wakeup.set()
+
+    def _new_job(self, prediction_id, api_key, base_url, interval, expected, submitted_at=None) -> _PolledJob:
+        job = _PolledJob(
+            prediction_id=prediction_id,
+            api_key=api_key,
+            base_url=base_url,
+            submitted_at=submitted_at or time.time(),
+            base_interval=interval,
+            expected_seconds=expected,
+            next_check=time.monotonic(),
+        )
+        self._jobs[prediction_id] = job
+        return job
+
+    def _add_waiter(self, prediction_id, api_key, base_url, interval, expected, waiter: _Waiter):
+        job = self._jobs.get(prediction_id)
+        if job is None:
+            job = self._new_job(prediction_id, api_key, base_url, interval, expected)
+            self._registry_executor.submit(self.registry.register, prediction_id, base_url, job.submitted_at)
+        else:
+            job.base_interval = min(job.base_interval, interval)
+            job.expected_seconds = job.expected_seconds or expected
+            if not job.in_flight:
+                job.next_check = min(job.next_check, time.monotonic() + interval)
+        job.waiters.append(waiter)
+        self._wakeup.set()
+
+    async def _scheduler(self):
         while True:
-            try:
-                result = self.get_prediction_result(prediction_id)
-                consecutive_errors = 0  # Reset error counter on success
-            except HTTPException as exc:
-                detail = exc.detail or {}
-                if isinstance(detail, dict):
-                    detail.setdefault("prediction_id", prediction_id)
-                    detail.setdefault("resume_available", True)
-                    detail.setdefault("error", detail.get("error", "WaveSpeed polling failed"))
-
-                # Determine underlying status code (WaveSpeed vs proxy)
-                status_code = detail.get("status_code", exc.status_code)
-
-                # Treat 5xx as transient: keep polling indefinitely with backoff
-                if 500 <= int(status_code) < 600:
-                    consecutive_errors += 1
-                    backoff = min(30.0, interval_seconds * (2 ** (consecutive_errors - 1)))
-                    logger.warning(
-                        f"[WaveSpeed] Transient polling error {consecutive_errors} for {prediction_id}: "
-                        f"{status_code}. Backing off {backoff:.1f}s"
-                    )
-                    time.sleep(backoff)
+            now = time.monotonic()
+            next_due = now + 60
+            for job in list(self._jobs.values()):
+                job.waiters = [w for w in job.waiters if not w.future.done()]
+                if job.in_flight:
                     continue
+                if job.next_check <= now:
+                    job.in_flight = True
+                    asyncio.get_running_loop().create_task(self._check(job))
+                else:
+                    next_due = min(next_due, job.next_check)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, next_due - time.monotonic()))
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
 
-                # For non-transient (typically 4xx) errors, apply safety cap
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    logger.error(
-                        f"[WaveSpeed] Too many polling errors ({consecutive_errors}) for {prediction_id}, "
-                        f"status_code={status_code}. Giving up."
-                    )
-                raise HTTPException(status_code=exc.status_code, detail=detail) from exc
-
-                backoff = min(30.0, interval_seconds * (2 ** (consecutive_errors - 1)))
-                logger.warning(
-                    f"[WaveSpeed] Polling error {consecutive_errors}/{max_consecutive_errors} for {prediction_id}: "
-                    f"{status_code}. Backing off {backoff:.1f}s"
-                )
-                time.sleep(backoff)
-                continue
-            
-            # Extract status from result (matching example pattern)
-            status = result.get("status")
-            
-            if status == "completed":
-                elapsed = time.time() - start_time
-                logger.info(f"[WaveSpeed] Prediction {prediction_id} completed in {elapsed:.1f}s")
-                return result
-            
-            if status == "failed":
-                error_msg = result.get("error", "Unknown error")
-                logger.error(f"[WaveSpeed] Prediction {prediction_id} failed: {error_msg}")
-                raise HTTPException(
-                    status_code=502,
-                    detail={
-                        "error": "WaveSpeed task failed",
-                        "prediction_id": prediction_id,
-                        "message": error_msg,
-                        "details": result,
-                    },
+    async def _fetch(self, job: _PolledJob) -> Dict[str, Any]:
+        url = f"{job.base_url}/predictions/{job.prediction_id}/result"
+        try:
+            async with self._semaphore:
+                response = await self._client.get(url, headers={"Authorization": f"Bearer {job.api_key}"})
+        except httpx.TimeoutException as exc:
+            raise HTTPException(
+                status_code=504,
+                detail={"error": "WaveSpeed polling request timed out", "exception": str(exc)},
+            ) from exc
+        except httpx.HTTPError as exc:
+            raise HTTPException(
+                status_code=502,
+                detail={"error": "WaveSpeed polling request failed", "exception": str(exc)},
+            ) from exc
+        return _parse_result_response(response.status_code, response, job.prediction_id)
+
+    async def _check(self, job: _PolledJob):
+        try:
+            await self._check_once(job)
+        except Exception as exc:  # never let one job kill the scheduler
+            logger.error(f"[WaveSpeed] Unexpected poller error for {job.prediction_id}: {exc}")
+            job.next_check = time.monotonic() + self.max_interval
+        finally:
+            job.in_flight = False
+            self._wakeup.set()
+
+    async def _check_once(self, job: _PolledJob):
+        elapsed = time.time() - job.submitted_at
+        if elapsed > self.job_max_age_seconds:
+            self._finish(job, "abandoned",
+                         error=self._timeout_error(job.prediction_id, self.job_max_age_seconds, job.last_status))
+            return
+
+        job.checks += 1
+        try:
+            result = await self._fetch(job)
+            job.consecutive_errors = 0
+        except HTTPException as exc:
+            detail = exc.detail if isinstance(exc.detail, dict) else {"error": str(exc.detail)}
+            detail.setdefault("prediction_id", job.prediction_id)
+            detail.setdefault("resume_available", True)
+            status_code = int(detail.get("status_code", exc.status_code))
+            job.consecutive_errors += 1
+
+            # Treat 5xx as transient: keep polling with backoff. Cap non-transient (4xx) errors.
+            if not 500 <= status_code < 600 and job.consecutive_errors >= self.MAX_CONSECUTIVE_ERRORS:
+                logger.error(
+                    f"[WaveSpeed] Too many polling errors ({job.consecutive_errors}) for {job.prediction_id}, "
+                    f"status_code={status_code}. Giving up."
                 )
+                self._finish(job, "failed", error=HTTPException(status_code=exc.status_code, detail=detail))
+                return
+            backoff = min(30.0, job.base_interval * (2 ** (job.consecutive_errors - 1)))
+            logger.warning(
+                f"[WaveSpeed] Polling error {job.consecutive_errors} for {job.prediction_id}: "
+                f"{status_code}. Backing off {backoff:.1f}s"
+            )
+            job.next_check = time.monotonic() + backoff
+            return
 
-            # Check timeout only if specified
-            if timeout_seconds is not None:
-                elapsed = time.time() - start_time
-                if elapsed > timeout_seconds:
-                    logger.error(f"[WaveSpeed] Prediction {prediction_id} timed out after {timeout_seconds}s")
-                    raise HTTPException(
-                        status_code=504,
-                        detail={
-                            "error": "WaveSpeed task timed out",
-                            "prediction_id": prediction_id,
-                            "timeout_seconds": timeout_seconds,
-                            "current_status": status,
-                            "message": f"Task did not complete within {timeout_seconds} seconds. Status: {status}",
-                        },
-                    )
-
-            # Log progress periodically (every 30 seconds)
-            elapsed = time.time() - start_time
-            if int(elapsed) % 30 == 0 and elapsed > 0:
-                logger.info(f"[WaveSpeed] Polling {prediction_id}: status={status}, elapsed={elapsed:.0f}s")
-            
-            # Call progress callback if provided
-            if progress_callback:
+        status = result.get("status")
+        model = result.get("model")
+        if status != job.last_status or (model and model != job.model):
+            job.last_status = status
+            job.model = model or job.model
+            self._registry_executor.submit(self.registry.update_remote_status, job.prediction_id, status, job.model)
+
+        if status == "completed":
+            logger.info(f"[WaveSpeed] Prediction {job.prediction_id} completed in {elapsed:.1f}s ({job.checks} checks)")
+            if job.model:
+                previous = self._learned_durations.get(job.model)
+                self._learned_durations[job.model] = elapsed if previous is None else 0.7 * previous + 0.3 * elapsed
+            self._finish(job, "completed", result=result)
+            return
+
+        if status == "failed":
+            error_msg = result.get("error", "Unknown error")
+            logger.error(f"[WaveSpeed] Prediction {job.prediction_id} failed: {error_msg}")
+            self._finish(job, "failed", error=HTTPException(
+                status_code=502,
+                detail={
+                    "error": "WaveSpeed task failed",
+                    "prediction_id": job.prediction_id,
+                    "message": error_msg,
+                    "details": result,
+                },
+            ))
+            return
+
+        for waiter in job.waiters:
+            if waiter.progress_callback and not waiter.future.done():
                 # Map elapsed time to progress (20-80% range during polling)
-                # Assume typical completion time is timeout_seconds or 120s default
-                estimated_total = timeout_seconds or 120
-                progress = min(80.0, 20.0 + (elapsed / estimated_total) * 60.0)
-                progress_callback(progress, f"Video generation in progress... ({elapsed:.0f}s)")
-            
-            # Poll faster (1.0s instead of 2.0s) to match example's responsiveness
-            time.sleep(interval_seconds)
+                waited = time.time() - waiter.started_at
+                estimated_total = waiter.timeout_seconds or job.expected_seconds or 120
+                progress = min(80.0, 20.0 + (waited / estimated_total) * 60.0)
+                try:
+                    waiter.progress_callback(progress, f"Video generation in progress... ({waited:.0f}s)")
+                except Exception as exc:
+                    logger.warning(f"[WaveSpeed] Progress callback failed for {job.prediction_id}: {exc}")
+
+        expected = job.expected_seconds or self._learned_durations.get(job.model or "")
+        job.next_check = time.monotonic() + next_poll_interval(elapsed, expected, job.base_interval, self.max_interval)
+
+    def _finish(self, job: _PolledJob, status: str, result: Optional[Dict[str, Any]] = None,
+                error: Optional[HTTPException] = None):
+        self._jobs.pop(job.prediction_id, None)
+        # Queue the registry write first so get_job() from a woken waiter already sees the outcome
+        self._registry_executor.submit(
+            self.registry.finish, job.prediction_id, status, result, error.detail if error is not None else None
+        )
+        for waiter in job.waiters:
+            if waiter.future.done():
+                continue
+            if error is not None:
+                waiter.future.set_exception(error)
+            else:
+                waiter.future.set_result(result)
+
+    @staticmethod
+    def _timeout_error(prediction_id: str, timeout_seconds: Optional[float],
+                       status: Optional[str] = None) -> HTTPException:
+        logger.error(f"[WaveSpeed] Prediction {prediction_id} timed out after {timeout_seconds}s")
+        return HTTPException(
+            status_code=504,
+            detail={
+                "error": "WaveSpeed task timed out",
+                "prediction_id": prediction_id,
+                "timeout_seconds": timeout_seconds,
+                "current_status": status,
+                "resume_available": True,
+                "message": f"Task did not complete within {timeout_seconds} seconds. Status: {status}",
+            },
+        )
+
+
+def _default_api_key() -> Optional[str]:
+    from services.onboarding.api_key_manager import APIKeyManager
+
+    return APIKeyManager().get_api_key("wavespeed")
+
+
+_poller: Optional[WaveSpeedPollerService] = None
+_poller_lock = threading.Lock()
+
+
+def get_wavespeed_poller() -> WaveSpeedPollerService:
+    """Process-wide shared poller."""
+    global _poller
+    if _poller is None:
+        with _poller_lock:
+            if _poller is None:
+                _poller = WaveSpeedPollerService()
+    return _poller
@@ -0,0 +1,208 @@
+"""
+Pooled HTTP session for WaveSpeed API calls and result downloads.
+
+Every submit, status and download request shares one keep-alive requests.Session,
+so repeated calls reuse TCP/TLS connections instead of reconnecting each time.
+Idempotent GETs are retried on connection errors and 429/5xx responses. Each
+endpoint class has its own concurrency bound, so a burst of large downloads
+cannot starve job submission. Result media can be streamed straight to a file.
+
+Configuration (environment):
+    ALWRITY_WAVESPEED_SUBMIT_CONCURRENCY    concurrent submit requests (default 8)
+    ALWRITY_WAVESPEED_POLL_CONCURRENCY      concurrent status requests (default 16)
+    ALWRITY_WAVESPEED_DOWNLOAD_CONCURRENCY  concurrent media downloads (default 4)
+"""
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+import requests
+from fastapi import HTTPException
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from utils.logger_utils import get_service_logger
+
+logger = get_service_logger("wavespeed.session")
+
+ENDPOINT_CLASSES = ("submit", "poll", "download")
+_DEFAULT_CONCURRENCY = {"submit": 8, "poll": 16, "download": 4}
+_DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+def _concurrency_from_env() -> Dict[str, int]:
+    return {
+        name: max(1, int(os.getenv(f"ALWRITY_WAVESPEED_{name.upper()}_CONCURRENCY", default)))
+        for name, default in _DEFAULT_CONCURRENCY.items()
+    }
+
+
+class WaveSpeedSession:
+    """Thread-safe pooled session with per-endpoint-class concurrency limits."""
+
+    def __init__(
+        self,
+        concurrency: Optional[Dict[str, int]] = None,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+    ):
+        """
+        Args:
+            concurrency: Max in-flight requests per endpoint class ('submit', 'poll', 'download')
+            retries: Retry budget for connection errors and, on GETs, 429/5xx responses
+            backoff_factor: urllib3 exponential backoff factor between retries
+        """
+        limits = {**_concurrency_from_env(), **(concurrency or {})}
+        self._slots = {name: threading.BoundedSemaphore(limits[name]) for name in ENDPOINT_CLASSES}
+        self.limits = limits
+
+        # POSTs are not idempotent: urllib3 only retries them when the connection was never made
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=sum(limits.values()),
+            max_retries=retry,
+        )
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    @contextmanager
+    def _slot(self, endpoint_class: str):
+        semaphore = self._slots[endpoint_class]
+        semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+    def submit(self, url: str, **kwargs) -> requests.Response:
+        """POST a job submission (or other WaveSpeed API call)."""
+        with self._slot("submit"):
+            return self._session.post(url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET a prediction status/result."""
+        with self._slot("poll"):
+            return self._session.get(url, **kwargs)
+
+    def download(self, url: str, **kwargs) -> requests.Response:
+        """GET a result asset into memory (small media such as images and audio)."""
+        with self._slot("download"):
+            response = self._session.get(url, **kwargs)
+            if not kwargs.get("stream"):
+                response.content  # read the body while holding the slot
+            return response
+
+    def download_to_file(
+        self,
+        url: str,
+        dest_path: Union[str, Path],
+        timeout: Union[int, tuple] = 180,
+        chunk_size: int = _DOWNLOAD_CHUNK_BYTES,
+    ) -> int:
+        """
+        Stream a result asset to dest_path without holding it in memory.
+
+        The body is written to a temporary sibling and renamed into place, so a failed
+        or interrupted download never leaves a truncated file at dest_path.
+
+        Returns:
+            Number of bytes written
+
+        Raises:
+            HTTPException: If the download fails
+        """
+        dest_path = Path(dest_path)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = dest_path.with_name(f".{dest_path.name}.{threading.get_ident()}.part")
+        written = 0
+        try:
+            with self._slot("download"), self._session.get(url, timeout=timeout, stream=True) as response:
+                if response.status_code != 200:
+                    raise HTTPException(
+                        status_code=502,
+                        detail={
+                            "error": "Failed to download WaveSpeed result",
+                            "status_code": response.status_code,
+                            "response": response.text[:200],
+                        },
+                    )
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if chunk:
+                            f.write(chunk)
+                            written += len(chunk)
+            os.replace(tmp_path, dest_path)
+        except requests.exceptions.RequestException as exc:
+            raise HTTPException(
+                status_code=502,
+                detail={"error": "Failed to download WaveSpeed result", "exception": str(exc)},
+            ) from exc
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        logger.info(f"[WaveSpeed] Streamed {written} bytes to {dest_path.name}")
+        return written
+
+
+def download_result_video(
+    video_url: str,
+    output_path: Optional[Union[str, Path]] = None,
+    timeout: Union[int, tuple] = 180,
+    error_message: str = "Failed to download WaveSpeed video",
+) -> Dict[str, Any]:
+    """
+    Fetch a finished video for the module-level WaveSpeed helpers.
+
+    With output_path the video is streamed to that file and {'video_path', 'file_size'}
+    is returned; otherwise the legacy {'video_bytes', 'file_size'} shape is returned.
+    """
+    session = get_wavespeed_session()
+    if output_path:
+        try:
+            file_size = session.download_to_file(video_url, output_path, timeout=timeout)
+        except HTTPException as exc:
+            detail = exc.detail if isinstance(exc.detail, dict) else {}
+            raise HTTPException(status_code=502, detail={**detail, "error": error_message}) from exc
+        return {"video_path": str(output_path), "file_size": file_size}
+
+    video_response = session.download(video_url, timeout=timeout)
+    if video_response.status_code != 200:
+        raise HTTPException(
+            status_code=502,
+            detail={
+                "error": error_message,
+                "status_code": video_response.status_code,
+                "response": video_response.text[:200],
+            },
+        )
+    return {"video_bytes": video_response.content, "file_size": len(video_response.content)}
+
+
+_session: Optional[WaveSpeedSession] = None
+_session_lock = threading.Lock()
+
+
+def get_wavespeed_session() -> WaveSpeedSession:
+    """Process-wide shared WaveSpeed session."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = WaveSpeedSession()
+    return _session
@@ -15,6 +15,7 @@ from fastapi import HTTPException
 from services.wavespeed.client import WaveSpeedClient
 from services.llm_providers.main_audio_generation import generate_audio
 from services.story_writer.video_generation_service import StoryVideoGenerationService
+from services.youtube.scene_pipeline import YouTubeScenePipeline
 from services.subscription import PricingService
 from services.subscription.preflight_validator import validate_scene_animation_operation
 from services.llm_providers.main_video_generation import track_video_usage
@@ -463,65 +464,38 @@ class YouTubeVideoRendererService:
             if not enabled_scenes:
                 raise HTTPException(status_code=400, detail="No enabled scenes to render")
             
-            scene_results = []
-            total_cost = 0.0
+            # Scenes render concurrently within the user's budget; finished scenes are
+            # checkpointed, so a retry after a failure only re-renders what failed.
+            pipeline = YouTubeScenePipeline(
+                renderer=self,
+                user_id=user_id,
+                video_plan=video_plan,
+                resolution=resolution,
+                voice_id=voice_id,
+                db=db,
+            )
+            run = pipeline.run(
+                enabled_scenes,
+                combine=combine_scenes,
+                title=video_plan.get("video_summary", "YouTube Video")[:50],
+            )
             
-            # Render each scene
-            for idx, scene in enumerate(enabled_scenes):
-                logger.info(
-                    f"[YouTubeRenderer] Rendering scene {idx + 1}/{len(enabled_scenes)}: "
-                    f"Scene {scene.get('scene_number', idx + 1)}"
-                )
-                
-                scene_result = self.render_scene_video(
-                    scene=scene,
-                    video_plan=video_plan,
-                    user_id=user_id,
-                    resolution=resolution,
-                    generate_audio_enabled=True,
-                    voice_id=voice_id,
-                    db=db,
+            failed = [o for o in run["outcomes"] if not o.ok]
+            if failed:
+                logger.error(
+                    f"[YouTubeRenderer] {len(failed)}/{len(enabled_scenes)} scenes failed; "
+                    f"finished scenes are checkpointed for retry"
                 )
-                
-                scene_results.append(scene_result)
-                total_cost += scene_result["cost"]
+                raise failed[0].error
+            
+            scene_results = [o.result for o in run["outcomes"]]
+            total_cost = sum(o.result["cost"] for o in run["outcomes"] if not o.from_checkpoint)
             
-            # Combine scenes if requested
             final_video_path = None
             final_video_url = None
-            if combine_scenes and len(scene_results) > 1:
-                logger.info("[YouTubeRenderer] Combining scenes into final video...")
-                
-                # Prepare data for video concatenation
-                scene_video_paths = [r["video_path"] for r in scene_results]
-                scene_audio_paths = [r.get("audio_path") for r in scene_results if r.get("audio_path")]
-                
-                # Use StoryVideoGenerationService to combine
-                # Resolve user-specific output directory
-                user_video_dir = self._get_user_video_dir(user_id, db)
-                video_service = StoryVideoGenerationService(output_dir=str(user_video_dir))
-                
-                # Create scene dicts for concatenation
-                scene_dicts = [
-                    {
-                        "scene_number": r["scene_number"],
-                        "title": f"Scene {r['scene_number']}",
-                    }
-                    for r in scene_results
-                ]
-                
-                combined_result = video_service.generate_story_video(
-                    scenes=scene_dicts,
-                    image_paths=[None] * len(scene_results),  # No static images
-                    audio_paths=scene_audio_paths if scene_audio_paths else [],
-                    video_paths=scene_video_paths,  # Use rendered videos
-                    user_id=user_id,
-                    story_title=video_plan.get("video_summary", "YouTube Video")[:50],
-                    fps=24,
-                )
-                
-                final_video_path = combined_result["video_path"]
-                final_video_url = combined_result["video_url"]
+            if run["final_video"]:
+                final_video_path = run["final_video"]["video_path"]
+                final_video_url = run["final_video"]["video_url"]
             
             logger.info(
                 f"[YouTubeRenderer] ✅ Full video rendered: {len(scene_results)} scenes, "
@@ -0,0 +1,325 @@
+"""
+YouTube Scene Rendering Pipeline
+
+Renders all scenes of a video concurrently instead of one after another. Each scene
+still runs narration audio -> WAN 2.5 video in sequence (the audio drives lip-sync),
+but different scenes overlap, bounded by a per-user budget shared by every render
+the user has in flight. Finished scenes are stitched in order as soon as a contiguous
+prefix is ready, so the final assembly is only the tail of the work.
+
+Each successful scene is checkpointed by a hash of its render inputs. Re-rendering
+after a failure reuses the checkpointed scenes and only pays for the failed ones.
+
+Configuration (environment):
+    ALWRITY_YOUTUBE_SCENE_CONCURRENCY   concurrent scene renders per user (default 3)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from services.story_writer.video_generation_service import StoryVideoGenerationService
+from utils.logger_utils import get_service_logger
+from utils.video_concat import VideoConcatError, concat_videos
+
+logger = get_service_logger("youtube.scene_pipeline")
+
+_DEFAULT_USER_CONCURRENCY = 3
+
+def _open_worker_session(user_id: str) -> Optional[Session]:
+    """A session of the user's database for one render worker thread."""
+    from services.database import get_session_for_user
+    return get_session_for_user(user_id)
+
+
+_user_budgets: Dict[str, threading.BoundedSemaphore] = {}
+_user_budgets_lock = threading.Lock()
+
+
+def _user_concurrency() -> int:
+    return max(1, int(os.getenv("ALWRITY_YOUTUBE_SCENE_CONCURRENCY", _DEFAULT_USER_CONCURRENCY)))
+
+
+def get_user_render_budget(user_id: str) -> threading.BoundedSemaphore:
+    """Semaphore bounding concurrent scene renders for one user across all their renders."""
+    with _user_budgets_lock:
+        budget = _user_budgets.get(user_id)
+        if budget is None:
+            budget = threading.BoundedSemaphore(_user_concurrency())
+            _user_budgets[user_id] = budget
+        return budget
+
+
+def scene_checkpoint_key(scene: Dict[str, Any], resolution: str, voice_id: str) -> str:
+    """Stable hash of everything that changes a scene's rendered output."""
+    inputs = {
+        "scene_number": scene.get("scene_number"),
+        "visual_prompt": (scene.get("enhanced_visual_prompt") or scene.get("visual_prompt", "")).strip(),
+        "narration": scene.get("narration", "").strip(),
+        "duration_estimate": scene.get("duration_estimate", 5),
+        "audio_url": scene.get("audioUrl"),
+        "resolution": resolution,
+        "voice_id": voice_id,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:32]
+
+
+class SceneCheckpointStore:
+    """One JSON file per finished scene, next to the user's rendered videos."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Checkpointed scene result, or None if absent or its video file is gone."""
+        path = self.directory / f"{key}.json"
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"[YouTubeScenePipeline] Ignoring unreadable checkpoint {path.name}: {e}")
+            return None
+        if not Path(result.get("video_path") or "").exists():
+            return None
+        return result
+
+    def save(self, key: str, result: Dict[str, Any]):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{key}.json"
+            tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(result, f, default=str)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"[YouTubeScenePipeline] Failed to checkpoint scene {result.get('scene_number')}: {e}")
+
+
+class SceneRenderCancelled(Exception):
+    """Raised for scenes that had not started when the pipeline was cancelled."""
+
+
+@dataclass
+class SceneOutcome:
+    """Result of one scene in the pipeline (in the order the scenes were given)."""
+
+    index: int
+    scene: Dict[str, Any]
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[BaseException] = None
+    from_checkpoint: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.result is not None
+
+    @property
+    def scene_number(self) -> int:
+        return self.scene.get("scene_number", self.index + 1)
+
+
+class _InOrderStitcher:
+    """
+    Appends scene videos to a running stream-copied partial as soon as they are next in order.
+
+    If the clips turn out not to be stream-copy compatible, incremental stitching stops
+    (each step would re-encode the whole prefix) and everything is joined once at the end.
+    """
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = Path(output_dir)
+        self.current: Optional[str] = None
+        self.pending: List[str] = []
+        self.incremental = True
+        self._partial_files: List[Path] = []
+
+    def advance(self, video_paths: List[str]):
+        if not video_paths:
+            return
+        if not self.incremental:
+            self.pending.extend(video_paths)
+            return
+        inputs = ([self.current] if self.current else []) + list(video_paths)
+        if len(inputs) == 1:
+            self.current = inputs[0]
+            return
+        partial = self.output_dir / f".stitch_{uuid.uuid4().hex[:12]}.mp4"
+        try:
+            result = concat_videos(inputs, partial)
+        except VideoConcatError as e:
+            logger.warning(f"[YouTubeScenePipeline] Incremental stitching disabled: {e}")
+            self.incremental = False
+            self.pending.extend(video_paths)
+            return
+        self._discard_partials()
+        self._partial_files.append(partial)
+        self.current = str(partial)
+        if result["method"] != "stream_copy":
+            self.incremental = False
+
+    def inputs(self) -> List[str]:
+        return ([self.current] if self.current else []) + self.pending
+
+    def cleanup(self):
+        self._discard_partials()
+
+    def _discard_partials(self):
+        for path in self._partial_files:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        self._partial_files.clear()
+
+
+class YouTubeScenePipeline:
+    """Concurrent, checkpointed scene rendering with in-order stitching."""
+
+    def __init__(
+        self,
+        renderer,
+        user_id: str,
+        video_plan: Dict[str, Any],
+        resolution: str = "720p",
+        voice_id: str = "Wise_Woman",
+        db: Optional[Session] = None,
+        use_checkpoints: bool = True,
+    ):
+        """
+        Args:
+            renderer: YouTubeVideoRendererService used to render each scene
+            user_id: Clerk user ID (owner of the concurrency budget)
+            video_plan: Original video plan for context
+            resolution: Video resolution
+            voice_id: Voice ID for narration
+            db: Database session for workspace resolution; only used on the calling
+                thread (render workers open their own session of the user's database)
+            use_checkpoints: Reuse scenes already rendered with identical inputs
+        """
+        self.renderer = renderer
+        self.user_id = user_id
+        self.video_plan = video_plan
+        self.resolution = resolution
+        self.voice_id = voice_id
+        self.db = db
+        self.use_checkpoints = use_checkpoints
+        self.budget = get_user_render_budget(user_id)
+        self.video_dir = Path(renderer._get_user_video_dir(user_id, db))
+        self.checkpoints = SceneCheckpointStore(self.video_dir / "checkpoints")
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Stop starting new scenes; scenes already rendering run to completion."""
+        self._cancelled.set()
+
+    def _render(self, index: int, scene: Dict[str, Any]) -> SceneOutcome:
+        key = scene_checkpoint_key(scene, self.resolution, self.voice_id)
+        if self.use_checkpoints:
+            cached = self.checkpoints.load(key)
+            if cached:
+                logger.info(f"[YouTubeScenePipeline] Scene {cached.get('scene_number')} reused from checkpoint")
+                return SceneOutcome(index, scene, result=cached, from_checkpoint=True)
+
+        with self.budget:
+            if self._cancelled.is_set():
+                return SceneOutcome(index, scene, error=SceneRenderCancelled("Render cancelled before this scene started"))
+            # Sessions are not thread-safe: the caller's session stays on its thread
+            db = None
+            try:
+                if self.db is not None:
+                    db = _open_worker_session(self.user_id)
+                result = self.renderer.render_scene_video(
+                    scene=scene,
+                    video_plan=self.video_plan,
+                    user_id=self.user_id,
+                    resolution=self.resolution,
+                    generate_audio_enabled=True,
+                    voice_id=self.voice_id,
+                    db=db,
+                )
+            except Exception as e:
+                return SceneOutcome(index, scene, error=e)
+            finally:
+                if db is not None:
+                    db.close()
+
+        self.checkpoints.save(key, result)
+        return SceneOutcome(index, scene, result=result)
+
+    def run(
+        self,
+        scenes: List[Dict[str, Any]],
+        combine: bool = True,
+        title: str = "YouTube Video",
+        on_scene_complete: Optional[Callable[[SceneOutcome, int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Render scenes concurrently and optionally join the successful ones in order.
+
+        Args:
+            scenes: Scenes in playback order
+            combine: Produce a combined video from the successful scenes (needs 2+)
+            title: Title used for the combined video filename
+            on_scene_complete: Called as callback(outcome, completed_count, total) in completion order
+
+        Returns:
+            Dict with 'outcomes' (SceneOutcome list in scene order) and 'final_video'
+            (combine_scene_videos metadata, or None)
+        """
+        total = len(scenes)
+        outcomes: List[Optional[SceneOutcome]] = [None] * total
+        stitcher = _InOrderStitcher(self.video_dir) if combine else None
+        next_to_stitch = 0
+        completed = 0
+
+        workers = max(1, min(total, _user_concurrency()))
+        logger.info(
+            f"[YouTubeScenePipeline] Rendering {total} scenes for user {self.user_id} "
+            f"with up to {workers} in flight"
+        )
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="youtube-scene") as pool:
+                futures = [pool.submit(self._render, idx, scene) for idx, scene in enumerate(scenes)]
+                for future in as_completed(futures):
+                    outcome = future.result()
+                    outcomes[outcome.index] = outcome
+                    completed += 1
+                    if on_scene_complete:
+                        try:
+                            on_scene_complete(outcome, completed, total)
+                        except Exception as e:
+                            logger.warning(f"[YouTubeScenePipeline] Scene completion callback failed: {e}")
+
+                    if stitcher is not None:
+                        ready = []
+                        while next_to_stitch < total and outcomes[next_to_stitch] is not None:
+                            if outcomes[next_to_stitch].ok:
+                                ready.append(outcomes[next_to_stitch].result["video_path"])
+                            next_to_stitch += 1
+                        stitcher.advance(ready)
+
+            final_video = None
+            successful = [o for o in outcomes if o.ok]
+            if stitcher is not None and len(successful) > 1 and not self._cancelled.is_set():
+                video_service = StoryVideoGenerationService(output_dir=str(self.video_dir))
+                final_video = video_service.combine_scene_videos(
+                    video_paths=stitcher.inputs(),
+                    user_id=self.user_id,
+                    story_title=title,
+                    fps=24,
+                )
+        finally:
+            if stitcher is not None:
+                stitcher.cleanup()
+
+        return {"outcomes": outcomes, "final_video": final_video}
@@ -1,14 +1,15 @@
 """
 YouTube Creator Task Manager
 
-Hybrid DB-backed + in-memory task manager for YouTube video operations.
-Writes task state to PostgreSQL so renders/combines/publishes survive
-server restarts. Falls back to in-memory dict when DB is unavailable.
+Hybrid DB-backed task manager for YouTube video operations. Live task state
+is kept in the shared task state store (utils.task_state_store), so every
+worker sees it and restarts do not lose it; the per-user database keeps the
+task history for renders/combines/publishes.
 
 API surface matches Story Writer's TaskManager for drop-in compatibility.
 """
 
-import uuid
+import asyncio
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from loguru import logger
@@ -17,13 +18,18 @@ from sqlalchemy.orm import Session
 from models.youtube_task_models import YouTubeVideoTask, YouTubeTaskType, YouTubeTaskStatus
 from services.database import get_session_for_user, get_engine_for_user
 from models.subscription_models import Base as SubscriptionBase
+from utils.task_state_store import get_task_state_store, iso_timestamp
+
+TASK_NAMESPACE = "youtube"
+# Upper bound for a long-polling status request
+MAX_STATUS_WAIT_SECONDS = 30.0
 
 
 class YouTubeTaskManager:
-    """Hybrid persistent + in-memory task manager for YouTube Creator."""
+    """Hybrid per-user DB + shared task state store task manager for YouTube Creator."""
 
     def __init__(self):
-        self.task_storage: Dict[str, Dict[str, Any]] = {}
+        self.store = get_task_state_store()
         self._ensure_tables()
 
     def _ensure_tables(self):
@@ -92,26 +98,15 @@ class YouTubeTaskManager:
         metadata: Optional[Dict[str, Any]] = None,
         user_id: Optional[str] = None,
     ) -> str:
-        """Create a new task. Persists to DB if user_id provided; always writes to in-memory."""
-        task_id = str(uuid.uuid4())
+        """Create a new task. Persists to DB if user_id provided; always writes to the task state store."""
         task_metadata = metadata or {}
         now = datetime.now(timezone.utc)
+        effective_user_id = user_id or task_metadata.get("owner_user_id")
 
-        # Always write to in-memory for fast lookups
-        self.task_storage[task_id] = {
-            "status": "pending",
-            "created_at": now,
-            "updated_at": now,
-            "result": None,
-            "error": None,
-            "progress_messages": [],
-            "task_type": task_type,
-            "progress": 0.0,
-            "metadata": task_metadata,
-        }
+        # Always write to the shared store for fast lookups from any worker
+        task_id = self.store.create(TASK_NAMESPACE, task_type=task_type, owner=effective_user_id, metadata=task_metadata)
 
         # Persist to DB
-        effective_user_id = user_id or task_metadata.get("owner_user_id")
         if effective_user_id:
             db = self._get_db(effective_user_id)
             if db:
@@ -139,34 +134,11 @@ class YouTubeTaskManager:
         return task_id
 
     def get_task_status(self, task_id: str, requester_user_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """Get task status. Checks in-memory first, then DB."""
-        # Check in-memory first (fast path)
-        if task_id in self.task_storage:
-            task = self.task_storage[task_id]
-            metadata = task.get("metadata", {}) or {}
-            owner_user_id = metadata.get("owner_user_id")
-
-            if requester_user_id is not None and owner_user_id is not None and requester_user_id != owner_user_id:
-                logger.warning(f"[YouTubeTaskManager] Task access denied for task {task_id}")
-                return None
-
-            response = {
-                "task_id": task_id,
-                "status": task["status"],
-                "progress": task.get("progress", 0.0),
-                "message": task.get("progress_messages", [])[-1] if task.get("progress_messages") else None,
-                "created_at": task["created_at"].isoformat() if task.get("created_at") else None,
-                "updated_at": task.get("updated_at", task.get("created_at")).isoformat() if task.get("updated_at") or task.get("created_at") else None,
-            }
-            if task["status"] == "completed" and task.get("result"):
-                response["result"] = task["result"]
-            if task["status"] == "failed" and task.get("error"):
-                response["error"] = task["error"]
-                if task.get("error_status") is not None:
-                    response["error_status"] = task["error_status"]
-                if task.get("error_data") is not None:
-                    response["error_data"] = task["error_data"]
-            return response
+        """Get task status. Checks the task state store first, then DB (blocking; async callers use poll_task_status)."""
+        # Check the shared store first (fast path)
+        task = self.store.get(task_id)
+        if task is not None:
+            return self._to_status(task, requester_user_id)
 
         # Fall back to DB
         if requester_user_id:
@@ -201,6 +173,48 @@ class YouTubeTaskManager:
 
         return None
 
+    async def poll_task_status(
+        self,
+        task_id: str,
+        since: Optional[int] = None,
+        wait: float = 0,
+        requester_user_id: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Get task status, long-polling until it changes when since/wait are given."""
+        if since is None or wait <= 0:
+            return await asyncio.to_thread(self.get_task_status, task_id, requester_user_id)
+        task = await self.store.wait_for_change(task_id, since, min(wait, MAX_STATUS_WAIT_SECONDS))
+        if task is None:
+            return await asyncio.to_thread(self.get_task_status, task_id, requester_user_id)
+        return self._to_status(task, requester_user_id)
+
+    def _to_status(self, task: Dict[str, Any], requester_user_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        task_id = task["task_id"]
+        owner_user_id = task["metadata"].get("owner_user_id")
+
+        if requester_user_id is not None and owner_user_id is not None and requester_user_id != owner_user_id:
+            logger.warning(f"[YouTubeTaskManager] Task access denied for task {task_id}")
+            return None
+
+        response = {
+            "task_id": task_id,
+            "status": task["status"],
+            "progress": task.get("progress") or 0.0,
+            "message": task["messages"][-1] if task["messages"] else None,
+            "created_at": iso_timestamp(task["created_at"]),
+            "updated_at": iso_timestamp(task["updated_at"]),
+            "version": task["version"],
+        }
+        if task["status"] == "completed" and task.get("result"):
+            response["result"] = task["result"]
+        if task["status"] == "failed" and task.get("error"):
+            response["error"] = task["error"]
+            if task.get("error_status") is not None:
+                response["error_status"] = task["error_status"]
+            if task.get("error_data") is not None:
+                response["error_data"] = task["error_data"]
+        return response
+
     def update_task_status(
         self,
         task_id: str,
@@ -212,37 +226,32 @@ class YouTubeTaskManager:
         error_status: Optional[int] = None,
         error_data: Optional[Dict[str, Any]] = None,
     ):
-        """Update task status. Writes to both in-memory and DB."""
+        """Update task status. Writes to both the task state store and DB."""
         now = datetime.now(timezone.utc)
 
-        # Update in-memory
-        if task_id in self.task_storage:
-            task = self.task_storage[task_id]
-            task["status"] = status
-            task["updated_at"] = now
-            if progress is not None:
-                task["progress"] = progress
-            if message:
-                if "progress_messages" not in task:
-                    task["progress_messages"] = []
-                task["progress_messages"].append(message)
-                logger.info(f"[YouTubeTaskManager] Task {task_id}: {message} (progress: {progress}%)")
-            if result is not None:
-                task["result"] = result
-            if error is not None:
-                task["error"] = error
-                logger.error(f"[YouTubeTaskManager] Task {task_id} error: {error}")
-            if error_status is not None:
-                task["error_status"] = error_status
-            if error_data is not None:
-                task["error_data"] = error_data
-
-            # Try DB update
-            metadata = task.get("metadata", {}) or {}
-            user_id = metadata.get("owner_user_id")
-            self._update_db_task(task_id, user_id, status, progress, message, result, error, now)
-        else:
+        changes: Dict[str, Any] = {}
+        if result is not None:
+            changes["result"] = result
+        if error is not None:
+            changes["error"] = error
+        if error_status is not None:
+            changes["error_status"] = error_status
+        if error_data is not None:
+            changes["error_data"] = error_data
+
+        if self.store.update(task_id, status=status, progress=progress, message=message or None, **changes) is None:
             logger.warning(f"[YouTubeTaskManager] Cannot update non-existent task: {task_id}")
+            return
+
+        if message:
+            logger.info(f"[YouTubeTaskManager] Task {task_id}: {message} (progress: {progress}%)")
+        if error is not None:
+            logger.error(f"[YouTubeTaskManager] Task {task_id} error: {error}")
+
+        # Try DB update
+        task = self.store.get(task_id)
+        user_id = task["metadata"].get("owner_user_id") if task else None
+        self._update_db_task(task_id, user_id, status, progress, message, result, error, now)
 
     def _update_db_task(
         self,
@@ -295,7 +304,8 @@ class YouTubeTaskManager:
         """Mark in-flight tasks that were interrupted by server restart as failed.
 
         Called on startup for each user to handle tasks that were 'processing'
-        when the server went down.
+        when the server went down. Tasks still running in another live worker
+        are left alone.
         """
         db = self._get_db(user_id)
         if not db:
@@ -312,6 +322,17 @@ class YouTubeTaskManager:
             ).all()
 
             for task in stale_tasks:
+                live = self.store.get(task.task_id)
+                if live is not None:
+                    # The shared store knows whether the task's worker is still alive
+                    if not self.store.is_interrupted(live):
+                        continue
+                    self.store.update(
+                        task.task_id,
+                        status="failed",
+                        error="Task interrupted by server restart",
+                        message="Marked as failed on server restart",
+                    )
                 task.status = YouTubeTaskStatus.FAILED
                 task.error = "Task interrupted by server restart"
                 task.message = "Marked as failed on server restart"
@@ -332,21 +353,10 @@ class YouTubeTaskManager:
         return count
 
     def cleanup_old_tasks(self):
-        """Remove in-memory tasks older than 1 hour. DB cleanup is handled by vacuum."""
-        now = datetime.now(timezone.utc)
-        cutoff = now.timestamp() - 3600  # 1 hour
-
-        tasks_to_remove = []
-        for task_id, task_data in self.task_storage.items():
-            created_at = task_data.get("created_at")
-            if created_at:
-                ts = created_at.timestamp() if hasattr(created_at, 'timestamp') else 0
-                if ts < cutoff:
-                    tasks_to_remove.append(task_id)
-
-        for task_id in tasks_to_remove:
-            del self.task_storage[task_id]
-            logger.debug(f"[YouTubeTaskManager] Cleaned up old in-memory task: {task_id}")
+        """Remove finished tasks older than 1 hour from the task state store. DB cleanup is handled by vacuum."""
+        removed = self.store.cleanup(max_age_seconds=3600, namespace=TASK_NAMESPACE)
+        if removed:
+            logger.debug(f"[YouTubeTaskManager] Cleaned up {removed} old tasks")
 
     def cleanup_old_db_tasks(self, days: int = 7, user_id: Optional[str] = None):
         """Delete completed/failed DB tasks older than N days."""
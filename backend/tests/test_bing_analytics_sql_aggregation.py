@@ -0,0 +1,86 @@
+"""SQL-side aggregation checks for BingAnalyticsStorageService daily metrics and summaries."""
+
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models.bing_analytics_models import Base, BingDailyMetrics, BingQueryStats
+from services.bing_analytics_storage_service import BingAnalyticsStorageService
+
+USER_ID = "bing-user"
+SITE_URL = "https://example.com"
+
+
+def _make_service(monkeypatch):
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    service = BingAnalyticsStorageService()
+    monkeypatch.setattr(service, "_get_db_session", lambda user_id: Session())
+    return service, Session
+
+
+def _add_queries(Session, day, rows):
+    db = Session()
+    for query, clicks, impressions, position in rows:
+        db.add(BingQueryStats(
+            user_id=USER_ID,
+            site_url=SITE_URL,
+            query=query,
+            clicks=clicks,
+            impressions=impressions,
+            avg_click_position=position,
+            ctr=(clicks / impressions * 100) if impressions else 0,
+            query_date=day + timedelta(hours=3),
+        ))
+    db.commit()
+    db.close()
+
+
+def test_backfill_aggregates_each_day_in_one_pass(monkeypatch):
+    service, Session = _make_service(monkeypatch)
+    day1 = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=3)
+    day2 = day1 + timedelta(days=1)
+    _add_queries(Session, day1, [("alpha", 10, 100, 2.0), ("beta", 5, 300, -1), ("gamma", 1, 50, 4.0)])
+    _add_queries(Session, day2, [("alpha", 20, 200, 3.0)])
+
+    assert service.backfill_daily_metrics(USER_ID, SITE_URL, day1, day2 + timedelta(days=1)) == 2
+
+    db = Session()
+    metrics = db.query(BingDailyMetrics).order_by(BingDailyMetrics.metric_date).all()
+    first, second = metrics
+    assert (first.total_clicks, first.total_impressions, first.total_queries) == (16, 450, 3)
+    assert first.avg_position == 3.0
+    assert [q["query"] for q in json.loads(first.top_clicks)] == ["alpha", "beta", "gamma"]
+    assert [q["query"] for q in json.loads(first.top_impressions)] == ["beta", "alpha", "gamma"]
+    assert second.clicks_change == 25.0
+    db.close()
+
+    # Regenerating updates rows in place instead of duplicating them
+    assert service.generate_daily_metrics(USER_ID, SITE_URL, day2)
+    db = Session()
+    assert db.query(BingDailyMetrics).count() == 2
+    db.close()
+
+
+def test_analytics_summary_uses_sql_totals_and_top_queries(monkeypatch):
+    service, Session = _make_service(monkeypatch)
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    start = today - timedelta(days=5)
+    for offset in range(4):
+        _add_queries(Session, start + timedelta(days=offset), [("alpha", 2, 20, 1.0), ("beta", 3, 10, 2.0)])
+    service.backfill_daily_metrics(USER_ID, SITE_URL, start, today)
+
+    summary = service.get_analytics_summary(USER_ID, SITE_URL, days=30)
+
+    assert summary["total_clicks"] == 20
+    assert summary["total_impressions"] == 120
+    assert summary["daily_metrics_count"] == 4
+    assert summary["top_queries"][0] == {"query": "beta", "clicks": 12, "impressions": 40, "count": 4}
+    assert len(service.get_daily_metrics(USER_ID, SITE_URL, days=30)) == 4
+    assert service.get_top_queries(USER_ID, SITE_URL, days=30, limit=1)[0]["query"] == "beta"
@@ -0,0 +1,103 @@
+"""Blog section scheduler: concurrent fan-out within limits, in-order results, streaming and smoothing."""
+
+import asyncio
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from services.blog_writer.content.section_scheduler import SectionGenerationScheduler, outline_context
+
+
+class _FakeGenerator:
+    def __init__(self, delays):
+        self.delays = delays
+        self.prompts = {}
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+        self.memory = SimpleNamespace(entries=[], update_with_section=lambda sid, text, use_llm: self.memory.entries.append((sid, use_llm)))
+        self.transitioner = SimpleNamespace(generate_transition=lambda prev, heading, use_llm: f"{len(prev)}->{heading}")
+        self.flow = SimpleNamespace(assess_flow=lambda prev, cur, use_llm: {"flow": 1.0 if prev else 0.0})
+        self.continuity = {}
+
+    def write_section(self, section, research, prev_summary, user_id, competitive_advantage):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.prompts[section.id] = prev_summary
+        time.sleep(self.delays[section.id])
+        with self.lock:
+            self.active -= 1
+        return {"content": f"text of {section.heading}", "sources": []}
+
+    def record_continuity(self, section_id, metrics):
+        self.continuity[section_id] = metrics
+
+
+def _sections(count):
+    return [
+        SimpleNamespace(id=f"s{i}", heading=f"Heading {i}", key_points=[f"point {i}"])
+        for i in range(count)
+    ]
+
+
+def test_sections_run_concurrently_within_user_limit_and_come_back_in_order(monkeypatch):
+    monkeypatch.setenv("ALWRITY_BLOG_SECTION_USER_CONCURRENCY", "3")
+    sections = _sections(6)
+    # Later sections finish first
+    generator = _FakeGenerator({s.id: 0.05 * (6 - i) for i, s in enumerate(sections)})
+    streamed = []
+
+    async def on_section(index, result):
+        streamed.append(index)
+
+    start = time.perf_counter()
+    results = asyncio.run(
+        SectionGenerationScheduler(generator).generate_sections(sections, user_id=f"user-{uuid.uuid4().hex}", on_section=on_section)
+    )
+    elapsed = time.perf_counter() - start
+
+    assert [r["content"] for r in results] == [f"text of Heading {i}" for i in range(6)]
+    assert generator.peak == 3
+    assert elapsed < 0.05 * sum(range(1, 7))
+    assert sorted(streamed) == list(range(6)) and streamed != list(range(6))
+
+    # Smoothing sees the real neighbouring text, in outline order
+    assert results[0]["transition"] == "0->Heading 0"
+    assert results[1]["transition"] == f"{len('text of Heading 0')}->Heading 1"
+    assert generator.continuity["s3"] == {"flow": 1.0}
+    assert generator.memory.entries == [(s.id, False) for s in sections]
+
+
+def test_prompts_use_outline_context_not_generated_text():
+    sections = _sections(3)
+    generator = _FakeGenerator({s.id: 0 for s in sections})
+    asyncio.run(SectionGenerationScheduler(generator).generate_sections(sections, user_id="u"))
+
+    assert generator.prompts["s0"] == ""
+    assert generator.prompts["s2"] == outline_context(sections, 2)
+    assert "'Heading 0' covers: point 0" in generator.prompts["s2"]
+    assert "text of" not in generator.prompts["s2"]
+
+
+def test_sections_waiting_for_a_slot_leave_the_default_executor_free(monkeypatch):
+    monkeypatch.setenv("ALWRITY_BLOG_SECTION_USER_CONCURRENCY", "1")
+    sections = _sections(6)
+    generator = _FakeGenerator({s.id: 0.1 for s in sections})
+
+    async def scenario():
+        asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=2))
+        blog = asyncio.create_task(
+            SectionGenerationScheduler(generator).generate_sections(sections, user_id=f"user-{uuid.uuid4().hex}")
+        )
+        await asyncio.sleep(0.02)
+        start = time.perf_counter()
+        await asyncio.to_thread(lambda: None)  # any other blocking call of the app
+        waited = time.perf_counter() - start
+        await blog
+        return waited
+
+    assert asyncio.run(scenario()) < 0.05
+    assert generator.peak == 1
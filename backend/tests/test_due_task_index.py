@@ -0,0 +1,107 @@
+"""Due-task index: one scheduled_tasks view query returns the same due tasks as every loader, earliest first."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from models.advertools_monitoring_models import AdvertoolsTask
+from models.oauth_token_monitoring_models import OAuthTokenMonitoringTask
+from models.platform_insights_monitoring_models import PlatformInsightsTask
+from models.website_analysis_monitoring_models import DeepWebsiteCrawlTask, SIFIndexingTask
+from services.scheduler.core.due_task_index import DueTaskIndex
+from services.scheduler.utils import (
+    advertools_task_loader,
+    deep_website_crawl_task_loader,
+    oauth_token_task_loader,
+    platform_insights_task_loader,
+    sif_indexing_task_loader,
+)
+
+NOW = datetime.utcnow()
+PAST, FUTURE = NOW - timedelta(hours=1), NOW + timedelta(hours=1)
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'user.db'}")
+    for model in (AdvertoolsTask, OAuthTokenMonitoringTask, PlatformInsightsTask, DeepWebsiteCrawlTask, SIFIndexingTask):
+        model.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    session.statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: session.statements.append(args[2]))
+
+    def add(model, **fields):
+        fields.setdefault("user_id", "user_1")
+        session.add(model(**fields))
+
+    for status in ("active", "paused"):
+        for due in (PAST - timedelta(minutes=5), None, FUTURE):
+            add(AdvertoolsTask, website_url="https://a.com", status=status, next_execution=due)
+            add(OAuthTokenMonitoringTask, platform="gsc", status=status, next_check=due)
+            for platform in ("gsc", "bing"):
+                add(PlatformInsightsTask, platform=platform, status=status, next_check=due)
+    for status in ("active", "retry", "failed", "pending"):
+        add(DeepWebsiteCrawlTask, website_url="https://a.com", status=status, next_execution=PAST)
+        add(SIFIndexingTask, website_url="https://a.com", status=status, next_execution=PAST)
+    add(SIFIndexingTask, website_url="https://a.com", status="active", next_execution=None)
+    session.commit()
+    yield session
+    session.close()
+
+
+# task type -> (due source, loader), as registered by get_scheduler()
+TASK_TYPES = {
+    "advertools_intelligence": (advertools_task_loader.ADVERTOOLS_DUE_SOURCE,
+                                advertools_task_loader.load_due_advertools_tasks),
+    "oauth_token_monitoring": (oauth_token_task_loader.OAUTH_TOKEN_MONITORING_DUE_SOURCE,
+                               oauth_token_task_loader.load_due_oauth_token_monitoring_tasks),
+    "gsc_insights": (platform_insights_task_loader.platform_insights_due_source("gsc"),
+                     lambda db: platform_insights_task_loader.load_due_platform_insights_tasks(db, platform="gsc")),
+    "bing_insights": (platform_insights_task_loader.platform_insights_due_source("bing"),
+                      lambda db: platform_insights_task_loader.load_due_platform_insights_tasks(db, platform="bing")),
+    "deep_website_crawl": (deep_website_crawl_task_loader.DEEP_WEBSITE_CRAWL_DUE_SOURCE,
+                           deep_website_crawl_task_loader.load_due_deep_website_crawl_tasks),
+    "sif_indexing": (sif_indexing_task_loader.SIF_INDEXING_DUE_SOURCE,
+                     sif_indexing_task_loader.load_due_sif_indexing_tasks),
+}
+
+
+def _index():
+    index = DueTaskIndex()
+    for task_type, (source, _) in TASK_TYPES.items():
+        index.register(task_type, source)
+    return index
+
+
+def test_view_returns_what_the_loaders_return(db):
+    due = _index().load_due(db, now=NOW)
+
+    for task_type, (_, loader) in TASK_TYPES.items():
+        expected = sorted(task.id for task in loader(db))
+        assert expected and sorted(task.id for task in due[task_type]) == expected, task_type
+    assert {t.platform for t in due["gsc_insights"]} == {"gsc"}
+    assert {t.status for t in due["sif_indexing"]} == {"active", "failed", "pending"}
+
+
+def test_due_tasks_come_earliest_first_from_one_query(db):
+    index = _index()
+    index.load_due(db, now=NOW)  # creates the indexes and the view
+    db.statements.clear()
+
+    due = index.load_due(db, now=NOW)
+
+    view_queries = [s for s in db.statements if "scheduled_tasks" in s]
+    assert len(view_queries) == 1
+    assert len(db.statements) == 1 + len(due)  # plus one row load per type with due tasks
+    # unscheduled tasks first, then by due time
+    assert list(due) == ["bing_insights", "gsc_insights", "oauth_token_monitoring",
+                         "advertools_intelligence", "deep_website_crawl", "sif_indexing"]
+    plan = " ".join(str(row) for row in db.execute(sqlalchemy.text(
+        "EXPLAIN QUERY PLAN SELECT task_type, task_id FROM scheduled_tasks WHERE due_at IS NULL OR due_at <= '2100-01-01'"
+    )))
+    assert "_status_due" in plan
@@ -0,0 +1,156 @@
+"""Fair dispatcher: priority classes, fair turns between users, concurrency caps and wait histograms."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from services.scheduler.core.fair_dispatcher import (
+    PRIORITY_BULK, PRIORITY_URGENT, DispatchPolicy, FairDispatcher, TaskRef,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _dispatcher(**kwargs):
+    kwargs.setdefault("max_per_user", 100)
+    kwargs.setdefault("clock", FakeClock())
+    dispatcher = FairDispatcher(**kwargs)
+    dispatcher.set_policy("oauth_token_monitoring", DispatchPolicy(priority=PRIORITY_URGENT))
+    dispatcher.set_policy("deep_website_crawl", DispatchPolicy(priority=PRIORITY_BULK, max_concurrent=2))
+    dispatcher.set_policy("deep_competitor_analysis", DispatchPolicy(priority=PRIORITY_BULK, max_concurrent=2))
+    return dispatcher
+
+
+def _submit(dispatcher, task_type, user_id, count):
+    for i in range(count):
+        dispatcher.submit(task_type, user_id, f"{user_id}:{task_type}_{i}", object(), {})
+
+
+def _drain(dispatcher):
+    started = []
+    while (entry := dispatcher.next_ready()) is not None:
+        started.append(entry)
+    return started
+
+
+def test_urgent_tasks_start_first_and_bulk_work_keeps_to_its_share():
+    dispatcher = _dispatcher(max_concurrent=10)
+    _submit(dispatcher, "deep_website_crawl", "user_1", 5)
+    _submit(dispatcher, "deep_competitor_analysis", "user_1", 5)
+    _submit(dispatcher, "website_analysis", "user_2", 2)
+    _submit(dispatcher, "oauth_token_monitoring", "user_3", 2)
+
+    started = [(e.task_type, e.user_id) for e in _drain(dispatcher)]
+
+    assert started[:4] == [("oauth_token_monitoring", "user_3")] * 2 + [("website_analysis", "user_2")] * 2
+    # bulk: at most half the slots, at most two per type
+    assert sorted(started[4:]) == [("deep_competitor_analysis", "user_1")] * 2 + [("deep_website_crawl", "user_1")] * 2
+    assert dispatcher.queued_count() == 6
+
+    # a freed slot goes to urgent work queued after the bulk backlog
+    dispatcher.finished("user_1:deep_website_crawl_0")
+    _submit(dispatcher, "oauth_token_monitoring", "user_4", 1)
+    assert dispatcher.next_ready().task_type == "oauth_token_monitoring"
+
+
+def test_users_take_turns_whatever_order_they_were_scanned_in():
+    dispatcher = _dispatcher(max_concurrent=6)
+    _submit(dispatcher, "website_analysis", "user_a", 10)
+    _submit(dispatcher, "website_analysis", "user_b", 3)
+    _submit(dispatcher, "gsc_insights", "user_c", 3)
+
+    started = [e.user_id for e in _drain(dispatcher)]
+    assert set(started[:3]) == set(started[3:]) == {"user_a", "user_b", "user_c"}
+
+    capped = _dispatcher(max_concurrent=10, max_per_user=2)
+    _submit(capped, "website_analysis", "user_a", 10)
+    _submit(capped, "website_analysis", "user_b", 10)
+    assert sorted(e.user_id for e in _drain(capped)) == ["user_a", "user_a", "user_b", "user_b"]
+
+
+def test_waits_are_recorded_and_duplicates_and_stale_entries_dropped():
+    clock = FakeClock()
+    dispatcher = _dispatcher(max_concurrent=1, clock=clock, max_queue_wait_seconds=600)
+    _submit(dispatcher, "oauth_token_monitoring", "user_1", 2)
+    assert not dispatcher.submit("oauth_token_monitoring", "user_1", "user_1:oauth_token_monitoring_0", object(), {})
+
+    clock.now = 3
+    first = dispatcher.next_ready()
+    assert dispatcher.next_ready() is None  # the only slot is taken
+    assert not dispatcher.submit("oauth_token_monitoring", "user_1", first.key, object(), {})  # running
+
+    clock.now = 700
+    assert [e.key for e in dispatcher.drop_stale()] == ["user_1:oauth_token_monitoring_1"]
+    dispatcher.finished(first.key)
+    assert dispatcher.next_ready() is None
+
+    stats = dispatcher.get_stats()
+    urgent = stats["wait_seconds"]["by_priority"]["urgent"]
+    assert urgent["count"] == 1 and urgent["counts"][1] == 1  # 3s falls in the <=5s bucket
+    assert stats["wait_seconds"]["by_task_type"]["oauth_token_monitoring"]["mean_seconds"] == 3.0
+    assert (stats["duplicates"], stats["dropped_stale"], stats["running"]) == (2, 1, 0)
+
+
+def test_queued_tasks_are_reloaded_and_skipped_once_no_longer_due(tmp_path, monkeypatch):
+    pytest.importorskip("sqlalchemy")
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from models.advertools_monitoring_models import AdvertoolsTask
+    from services.scheduler.core import task_execution_handler
+    from services.scheduler.core.due_task_index import DueTaskIndex, DueTaskSource
+    from services.scheduler.core.executor_interface import TaskExecutionResult
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'user.db'}")
+    AdvertoolsTask.__table__.create(engine)
+    maker = sessionmaker(bind=engine)
+    db = maker()
+    paused = AdvertoolsTask(user_id="user_1", website_url="https://a.com", status="active")
+    still_due = AdvertoolsTask(user_id="user_1", website_url="https://b.com", status="active")
+    db.add_all([paused, still_due])
+    db.commit()
+    refs = [TaskRef(AdvertoolsTask, paused.id), TaskRef(AdvertoolsTask, still_due.id)]
+    paused.status = "paused"  # by the user, while both tasks waited for a slot
+    db.commit()
+    db.close()
+
+    executed = []
+
+    class Executor:
+        async def execute_task(self, task, session):
+            executed.append(task.website_url)
+            return TaskExecutionResult(success=True)
+
+    index = DueTaskIndex()
+    index.register("advertools_intelligence", DueTaskSource(AdvertoolsTask))
+    finished = []
+    scheduler = SimpleNamespace(
+        registry=SimpleNamespace(due_index=index, get_executor=lambda task_type: Executor()),
+        stats={"tasks_executed": 0, "tasks_failed": 0, "tasks_skipped": 0},
+        exception_handler=SimpleNamespace(db=None, handle_exception=lambda *a, **k: None),
+        active_executions={},
+        enable_retries=False,
+        _update_user_stats=lambda user_id, success: None,
+        _on_execution_finished=finished.append,
+    )
+    monkeypatch.setattr(task_execution_handler, "get_db_session", lambda user_id: maker())
+
+    for i, ref in enumerate(refs):
+        asyncio.run(task_execution_handler.execute_task_async(
+            scheduler, "advertools_intelligence", ref, {"executed": 0, "failed": 0},
+            user_id="user_1", execution_key=f"key_{i}",
+        ))
+
+    assert executed == ["https://b.com"]
+    assert (scheduler.stats["tasks_skipped"], scheduler.stats["tasks_executed"]) == (1, 1)
+    assert finished == ["key_0", "key_1"]
+    db = maker()
+    assert db.get(AdvertoolsTask, refs[0].id).status == "paused"
+    db.close()
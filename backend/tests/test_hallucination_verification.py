@@ -0,0 +1,127 @@
+"""Fact-check verification: every claim checked concurrently, cached evidence, token-budgeted assessment and 429 back-off."""
+
+import asyncio
+import json
+import re
+import sys
+import threading
+import time
+from types import ModuleType
+
+import pytest
+
+from services import hallucination_detector as hd
+from services.cache.search_cache import SearchResultCache
+from services.cache.tiered_cache import TieredCache
+from utils.token_bucket import TokenBucket
+
+SEARCH_DELAY = 0.2
+LLM_DELAY = 0.2
+
+
+class _FakeExa:
+    calls = []
+    failures = {}
+
+    async def simple_search(self, query, num_results=5, user_id=None, cache=True):
+        _FakeExa.calls.append(query)
+        await asyncio.sleep(SEARCH_DELAY)
+        failure = _FakeExa.failures.get(query)
+        if failure:
+            _FakeExa.failures[query] = failure[1:]
+            raise failure[0]
+        if "unknown" in query:
+            return []
+        return [{"url": f"https://example.com/{len(_FakeExa.calls)}", "text": f"Evidence that {query}"}]
+
+
+class _Detector(hd.HallucinationDetector):
+    def __init__(self):
+        super().__init__()
+        self.prompts = []
+        self.lock = threading.Lock()
+
+    def _generate_text(self, prompt, system_prompt=None, user_id=None):
+        with self.lock:
+            self.prompts.append(prompt)
+        time.sleep(LLM_DELAY)
+        indices = sorted({int(i) for i in re.findall(r"^Claim (\d+):", prompt, re.M)})
+        return json.dumps({"assessments": [
+            {"claim_index": i, "assessment": "supported", "confidence": 0.9,
+             "supporting_sources": [0], "refuting_sources": [], "reasoning": "matches Source 1"}
+            for i in indices
+        ]})
+
+
+@pytest.fixture(autouse=True)
+def fake_exa(monkeypatch, tmp_path):
+    module = ModuleType("services.blog_writer.research.exa_provider")
+    module.ExaResearchProvider = _FakeExa
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    _FakeExa.calls, _FakeExa.failures = [], {}
+    store = TieredCache(str(tmp_path / "cache.db"), sweep_interval_seconds=0)
+    monkeypatch.setattr(hd, "search_cache", SearchResultCache(store))
+    bucket = TokenBucket(rate=1000, capacity=1000)
+    monkeypatch.setattr(hd, "get_token_bucket", lambda *a, **k: bucket)
+    return bucket
+
+
+def _verify(detector, claims):
+    start = time.perf_counter()
+    verified = asyncio.run(detector._verify_claims_batch(claims, user_id="u1"))
+    return verified, time.perf_counter() - start
+
+
+def test_every_claim_is_verified_in_about_the_time_of_one(monkeypatch):
+    monkeypatch.setenv("ALWRITY_FACT_CHECK_PROMPT_TOKENS", "500")
+    claims = [f"Fact number {i} about content marketing is true " * 3 for i in range(12)]
+    claims += ["An unknown claim", "FACT NUMBER 0 about content marketing is true " * 3]
+    detector = _Detector()
+
+    verified, elapsed = _verify(detector, claims)
+
+    assert [c.text for c in verified] == claims
+    assert [c.assessment for c in verified[:12]] == ["supported"] * 12
+    assert verified[0].supporting_sources and verified[-1].assessment == "supported"
+    assert verified[12].assessment == "insufficient_information"
+    assert verified[12].reasoning == "No sources found for verification"
+    # duplicates share one search; prompts are split by the token budget
+    assert len(_FakeExa.calls) == 13
+    assert 1 < len(detector.prompts) < 12
+    assert all(hd._estimate_tokens(p) < 1000 for p in detector.prompts)
+    assert elapsed < SEARCH_DELAY + 3 * LLM_DELAY
+
+
+def test_evidence_is_cached_across_requests():
+    claims = ["Water boils at 100 C at sea level", "The Eiffel Tower is in Paris"]
+    _verify(_Detector(), claims)
+    verified, elapsed = _verify(_Detector(), ["  water boils at 100 c at sea level.", claims[1]])
+
+    assert len(_FakeExa.calls) == 2
+    assert [c.assessment for c in verified] == ["supported", "supported"]
+    assert hd.search_cache.get_stats()["providers"]["exa"]["hits"] == 2
+    assert elapsed < SEARCH_DELAY + LLM_DELAY
+
+
+def test_exa_rate_limit_pauses_the_bucket_and_retries(fake_exa):
+    claim = "Mount Everest is the highest mountain"
+    _FakeExa.failures[claim] = [RuntimeError("Exa search failed: 429 Too Many Requests")]
+
+    verified, elapsed = _verify(_Detector(), [claim])
+
+    assert verified[0].assessment == "supported"
+    assert _FakeExa.calls == [claim, claim]
+    assert elapsed >= 1.0  # first back-off is one second
+
+
+def test_subscription_limit_stops_verification():
+    class LimitReached(Exception):
+        status_code = 429
+
+    claims = ["Claim one is true", "Claim two is true"]
+    _FakeExa.failures[claims[0]] = [LimitReached("Subscription limit reached")]
+
+    verified, _ = _verify(_Detector(), claims)
+
+    assert [c.assessment for c in verified] == ["insufficient_information"] * 2
+    assert all("Subscription limit" in c.reasoning for c in verified)
@@ -0,0 +1,90 @@
+"""Image Studio worker pool: binary compression/conversion and proxy target-size search."""
+
+import asyncio
+import base64
+import io
+import random
+
+from PIL import Image
+
+from services.image_studio.compression_service import CompressionRequest, ImageCompressionService
+from services.image_studio.format_converter_service import FormatConversionRequest, ImageFormatConverterService
+from services.image_studio.image_worker_pool import get_image_worker_pool
+from utils import image_ops
+
+
+def _photo_like(width, height, seed=7):
+    rng = random.Random(seed)
+    image = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+    noise = Image.frombytes("RGB", (width, height), bytes(rng.getrandbits(8) for _ in range(width * height * 3)))
+    return Image.blend(image, noise, 0.3)
+
+
+def _png_bytes(image):
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_proxy_target_search_matches_full_search_with_fewer_encodes(monkeypatch):
+    image = _photo_like(1600, 1200)
+    target_kb = 180
+
+    calls = []
+    real_encode = image_ops.encode_compressed
+
+    def counting_encode(img, *args, **kwargs):
+        if img.size == image.size:
+            calls.append(args[1])
+        return real_encode(img, *args, **kwargs)
+
+    monkeypatch.setattr(image_ops, "encode_compressed", counting_encode)
+    data, quality = image_ops.compress_to_target_size(image, target_kb, "jpeg")
+    proxy_full_encodes = len(calls)
+
+    calls.clear()
+    expected = image_ops._search_quality(
+        lambda q: image_ops.encode_compressed(image, "jpeg", q, True, True), target_kb * 1024, 10, 95
+    )
+    assert (data, quality) == expected
+    assert len(data) <= target_kb * 1024
+    assert proxy_full_encodes < len(calls)
+
+
+def test_binary_and_base64_paths_run_in_pool_and_batch_keeps_order():
+    compressor = ImageCompressionService()
+    converter = ImageFormatConverterService()
+    source = _png_bytes(_photo_like(320, 200))
+
+    async def scenario():
+        data, result = await compressor.compress_bytes(source, CompressionRequest(image_base64="", format="webp", quality=60))
+        converted, conversion = await converter.convert_bytes(source, FormatConversionRequest(image_base64="", target_format="jpeg"))
+        payload = "data:image/png;base64," + base64.b64encode(source).decode()
+        batch = await compressor.compress_batch([
+            CompressionRequest(image_base64=payload, format="jpeg", quality=50),
+            CompressionRequest(image_base64="not an image", format="jpeg"),
+            CompressionRequest(image_base64=payload, format="png"),
+        ])
+        return data, result, converted, conversion, batch
+
+    try:
+        data, result, converted, conversion, batch = asyncio.run(scenario())
+    finally:
+        get_image_worker_pool().shutdown()
+
+    assert Image.open(io.BytesIO(data)).format == "WEBP" and result.image_base64 == ""
+    assert (result.width, result.height) == (320, 200)
+    assert Image.open(io.BytesIO(converted)).format == "JPEG" and conversion.original_format == "png"
+    assert [r.success for r in batch] == [True, False, True]
+    assert batch[0].image_base64.startswith("data:image/jpeg;base64,")
+    assert batch[2].format == "png"
+
+
+def test_binary_responses_accept_any_upload_name():
+    from routers.image_studio.deps import binary_image_response
+
+    response = binary_image_response(b"x", "image/jpeg", '照片 "final"_compressed.jpg', {"Width": 10})
+    disposition = response.headers["content-disposition"]
+    assert disposition.startswith('inline; filename="final__compressed.jpg"; ')
+    assert disposition.endswith("filename*=UTF-8''%E7%85%A7%E7%89%87%20%22final%22_compressed.jpg")
+    assert response.headers["x-image-width"] == "10"
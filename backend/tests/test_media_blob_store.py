@@ -0,0 +1,95 @@
+"""Content-addressed media blob store: dedup on write, references, GC and blob serving."""
+
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from middleware.auth_middleware import get_current_user_with_query_token
+from utils.media_blob_store import MediaBlobStore, dedup_enabled
+
+
+def test_identical_content_is_stored_once_and_adopted_files_are_linked(tmp_path):
+    store = MediaBlobStore(tmp_path / "blobs")
+    user_a = tmp_path / "workspace_a" / "scene_1.mp4"
+    user_b = tmp_path / "workspace_b" / "scene_1_retry.mp4"
+
+    first = store.write_file(b"frame-bytes" * 1000, user_a, mime_type="video/mp4")
+    second = store.write_file(b"frame-bytes" * 1000, user_b)
+    assert first.digest == second.digest
+    assert os.path.samefile(user_a, user_b) and os.path.samefile(user_a, first.path)
+
+    # A file written outside the store with duplicate bytes is replaced by a link
+    upload = tmp_path / "workspace_b" / "reupload.mp4"
+    upload.write_bytes(b"frame-bytes" * 1000)
+    assert store.put_file(upload).digest == first.digest
+    assert os.path.samefile(upload, first.path) and upload.read_bytes() == b"frame-bytes" * 1000
+    assert store.get(first.digest).mime_type == "video/mp4"
+    assert store.stats()["blobs"] == 1
+
+
+def test_gc_keeps_referenced_or_linked_blobs_and_frees_the_rest(tmp_path):
+    store = MediaBlobStore(tmp_path / "blobs")
+    user_file = tmp_path / "workspace" / "image.png"
+    blob = store.write_file(b"png" * 500, user_file)
+    store.add_ref(blob.digest, "asset:1", owner="user_1")
+
+    assert store.collect_garbage(grace_seconds=0)["deleted"] == 0
+    assert store.release_ref("asset:1") == blob.digest and store.refcount(blob.digest) == 0
+
+    # Unreferenced but still linked from the user's workspace: kept
+    assert store.collect_garbage(grace_seconds=0)["still_linked"] == 1
+    assert user_file.read_bytes() == b"png" * 500
+
+    user_file.unlink()
+    result = store.collect_garbage(grace_seconds=0)
+    assert result["deleted"] == 1 and result["bytes_freed"] == 1500
+    assert store.get(blob.digest) is None
+
+
+def test_blob_endpoint_serves_strong_etags_ranges_and_owner_only(tmp_path, monkeypatch):
+    assets_serving = pytest.importorskip("api.assets_serving")
+    store = MediaBlobStore(tmp_path / "blobs")
+    blob = store.put_bytes(bytes(range(256)) * 4, mime_type="audio/mpeg")
+    store.add_ref(blob.digest, "asset:7", owner="user_1")
+    other = store.put_bytes(b"someone else's", mime_type="audio/mpeg")
+    store.add_ref(other.digest, "asset:8", owner="user_2")
+    monkeypatch.setattr(assets_serving, "get_media_blob_store", lambda: store)
+
+    app = FastAPI()
+    app.include_router(assets_serving.router)
+    app.dependency_overrides[get_current_user_with_query_token] = lambda: {"id": "user_1"}
+    client = TestClient(app)
+    url = f"/api/assets/user_1/blobs/{blob.digest}"
+
+    full = client.get(url)
+    assert full.status_code == 200 and full.content == bytes(range(256)) * 4
+    assert full.headers["etag"] == f'"{blob.digest}"' and "immutable" in full.headers["cache-control"]
+
+    assert client.get(url, headers={"If-None-Match": full.headers["etag"]}).status_code == 304
+
+    partial = client.get(url, headers={"Range": "bytes=10-19"})
+    assert partial.status_code == 206 and partial.content == bytes(range(10, 20))
+
+    assert client.get(f"/api/assets/user_1/blobs/{other.digest}").status_code == 404
+
+
+def test_dedup_is_opt_in_leaves_permissions_alone_and_never_stores_copies(tmp_path, monkeypatch):
+    monkeypatch.delenv("ALWRITY_MEDIA_DEDUP", raising=False)
+    assert not dedup_enabled()
+
+    store = MediaBlobStore(tmp_path / "blobs")
+    user_file = tmp_path / "workspace" / "image.png"
+    store.write_file(b"png" * 500, user_file)
+    assert os.access(user_file, os.W_OK)
+
+    def no_links(source, dest):
+        raise OSError("hard links not supported")
+
+    monkeypatch.setattr(os, "link", no_links)
+    other_fs = MediaBlobStore(tmp_path / "other_blobs")
+    copied = tmp_path / "workspace" / "audio.mp3"
+    info = other_fs.write_file(b"mp3" * 500, copied)
+    assert copied.read_bytes() == b"mp3" * 500 and info.path == copied
+    assert other_fs.stats()["blobs"] == 0 and not list((tmp_path / "other_blobs").glob("objects/*/*"))
@@ -0,0 +1,104 @@
+"""Shared workspace media serving: validators, 304s, ranges, zero-copy and proxy offload."""
+
+import asyncio
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from utils import media_serving
+from utils.media_serving import MediaFileResponse, cached_media_lookup
+
+
+def _client(path):
+    app = FastAPI()
+
+    @app.get("/media")
+    async def media():
+        return MediaFileResponse(path, media_type="video/mp4")
+
+    return TestClient(app)
+
+
+def test_conditional_and_range_requests(tmp_path, monkeypatch):
+    monkeypatch.setenv("ALWRITY_MEDIA_DEDUP", "0")
+    video = tmp_path / "scene.mp4"
+    video.write_bytes(bytes(range(256)) * 64)
+    client = _client(video)
+
+    full = client.get("/media")
+    assert full.status_code == 200 and len(full.content) == 256 * 64
+    assert full.headers["accept-ranges"] == "bytes" and full.headers["cache-control"] == "private, no-cache"
+    etag = full.headers["etag"]
+
+    not_modified = client.get("/media", headers={"If-None-Match": f'W/{etag}, "other"'})
+    assert not_modified.status_code == 304 and not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert client.get("/media", headers={"If-Modified-Since": full.headers["last-modified"]}).status_code == 304
+
+    partial = client.get("/media", headers={"Range": "bytes=256-511", "If-Range": etag})
+    assert partial.status_code == 206 and partial.content == bytes(range(256))
+    assert partial.headers["content-range"] == f"bytes 256-511/{256 * 64}"
+
+    # A stale If-Range validator gets the whole (changed) file
+    assert client.get("/media", headers={"Range": "bytes=0-9", "If-Range": '"stale"'}).status_code == 200
+
+    video.unlink()
+    assert client.get("/media").status_code == 404
+
+
+def test_zerocopysend_extension_and_proxy_offload(tmp_path, monkeypatch):
+    monkeypatch.setenv("ALWRITY_MEDIA_DEDUP", "0")
+    video = tmp_path / "media" / "final.mp4"
+    video.parent.mkdir()
+    video.write_bytes(b"x" * 5000)
+
+    def run(scope_extra):
+        messages = []
+
+        async def receive():
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.zerocopysend":
+                message = dict(message, file=message["file"].name)
+            messages.append(message)
+
+        scope = {"type": "http", "method": "GET", "headers": [(b"range", b"bytes=1000-")], **scope_extra}
+        asyncio.run(MediaFileResponse(video, media_type="video/mp4")(scope, receive, send))
+        return messages
+
+    start, body = run({"extensions": {"http.response.zerocopysend": {}}})
+    assert start["status"] == 206
+    assert body == {
+        "type": "http.response.zerocopysend",
+        "file": str(video),
+        "offset": 1000,
+        "count": 4000,
+        "more_body": False,
+    }
+
+    monkeypatch.setenv("ALWRITY_MEDIA_OFFLOAD", "x-accel-redirect")
+    monkeypatch.setenv("ALWRITY_MEDIA_OFFLOAD_ROOT", str(tmp_path))
+    start, body = run({})
+    headers = dict(start["headers"])
+    assert headers[b"x-accel-redirect"] == b"/_protected_media/media/final.mp4"
+    assert b"content-length" not in headers and body["body"] == b""
+
+
+def test_cached_media_lookup_searches_once_until_the_file_disappears(tmp_path):
+    target = tmp_path / "clip.mp4"
+    target.write_bytes(b"clip")
+    searches = []
+
+    def finder():
+        searches.append(1)
+        return target if target.exists() else None
+
+    key = ("test", str(tmp_path))
+    assert cached_media_lookup(key, finder) == target.resolve()
+    assert cached_media_lookup(key, finder) == target.resolve()
+    assert len(searches) == 1
+
+    target.unlink()
+    assert cached_media_lookup(key, finder) is None and len(searches) == 2
+    assert key not in media_serving._path_cache
@@ -0,0 +1,80 @@
+"""Onboarding status snapshots: cached reads, write-through on step changes and versioned loads."""
+
+from datetime import datetime
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from services.onboarding.status_cache import OnboardingStatusCache, build_onboarding_status
+
+
+def test_a_load_started_before_a_write_is_not_cached():
+    cache = OnboardingStatusCache()
+    version = cache.version("user_1")
+    cache.write("user_1", build_onboarding_status(3, 40.0))
+
+    assert not cache.store_loaded("user_1", build_onboarding_status(2, 20.0), version)
+    assert cache.get("user_1")["current_step"] == 3
+
+    # a write through the unsanitized ID invalidates the sanitized one too
+    cache.store_loaded("user1", build_onboarding_status(3, 40.0), cache.version("user1"))
+    version = cache.version("user1")
+    cache.write("user.1", None)
+    assert cache.get("user1") is None and cache.get("user_1")["current_step"] == 3
+    assert not cache.store_loaded("user1", build_onboarding_status(3, 40.0), version)
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from models.onboarding import OnboardingSession
+    from services.onboarding import progress_service
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'user.db'}")
+    OnboardingSession.__table__.create(engine)
+    maker = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    queries = []
+    sqlalchemy.event.listen(engine, "before_cursor_execute", lambda *args: queries.append(args[2]))
+    db = maker()
+    db.add(OnboardingSession(user_id="user_1", current_step=2, progress=20.0,
+                             started_at=datetime(2026, 1, 1), updated_at=datetime(2026, 1, 2)))
+    db.commit()
+    db.close()
+
+    monkeypatch.setattr(progress_service, "get_session_for_user", lambda user_id: maker())
+    monkeypatch.setattr(progress_service, "onboarding_status_cache", OnboardingStatusCache())
+    svc = progress_service.OnboardingProgressService()
+    svc.queries = queries
+    return svc
+
+
+def test_status_is_read_once_and_kept_current_by_the_step_writers(service):
+    first = service.get_onboarding_status("user_1")
+    loaded = len(service.queries)
+    assert first["current_step"] == 2 and not first["is_completed"]
+    assert service.get_onboarding_status("user_1") == first
+    assert len(service.queries) == loaded
+
+    service.update_step("user_1", 4)
+    assert service.get_onboarding_status("user_1")["current_step"] == 4
+    service.complete_onboarding("user_1")
+    status = service.get_onboarding_status("user_1")
+    assert status["is_completed"] and status["completion_percentage"] == 100.0
+    service.reset_onboarding("user_1")
+    assert service.get_onboarding_status("user_1")["current_step"] == 1
+
+    writes = len(service.queries)
+    for _ in range(5):
+        service.get_onboarding_status("user_1")
+    assert len(service.queries) == writes
+
+
+def test_disabled_cache_reads_the_database(service, monkeypatch):
+    monkeypatch.setenv("ALWRITY_ONBOARDING_STATUS_CACHE_DISABLED", "true")
+    service.get_onboarding_status("user_1")
+    loaded = len(service.queries)
+    service.get_onboarding_status("user_1")
+    assert len(service.queries) > loaded
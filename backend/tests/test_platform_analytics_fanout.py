@@ -0,0 +1,71 @@
+"""Concurrency checks for PlatformAnalyticsService.get_comprehensive_analytics."""
+
+import asyncio
+import time
+
+from services.analytics.models.platform_types import PlatformType
+from services.analytics.platform_analytics_service import PlatformAnalyticsService
+
+
+class _SlowHandler:
+    """Blocking handler stub mirroring the real handlers' sync-inside-async behaviour."""
+
+    def __init__(self, platform, delay):
+        self.platform = platform
+        self.delay = delay
+        self.calls = 0
+
+    async def get_analytics(self, user_id, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        return PlatformAnalyticsService()._create_error_response(self.platform, "stub")
+
+
+def _make_service(monkeypatch, delays):
+    service = PlatformAnalyticsService(platform_timeouts={PlatformType.WIX: 0.2})
+    service.handlers = {
+        platform: _SlowHandler(platform.value, delay) for platform, delay in delays.items()
+    }
+
+    async def _no_target_url(user_id):
+        return None
+
+    monkeypatch.setattr(service, "_get_target_url", _no_target_url)
+    return service
+
+
+def test_platforms_are_fetched_concurrently_with_latency_metadata(monkeypatch):
+    service = _make_service(monkeypatch, {PlatformType.GSC: 0.3, PlatformType.BING: 0.3, PlatformType.WORDPRESS: 0.3})
+
+    started = time.perf_counter()
+    result = asyncio.run(service.get_comprehensive_analytics("user", ["gsc", "bing", "wordpress"]))
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.8
+    assert list(result) == ["gsc", "bing", "wordpress"]
+    assert all(data.metadata["latency_ms"] >= 250 for data in result.values())
+
+
+def test_timed_out_platform_returns_partial_results(monkeypatch):
+    service = _make_service(monkeypatch, {PlatformType.GSC: 0.0, PlatformType.WIX: 1.0})
+
+    result = asyncio.run(service.get_comprehensive_analytics("user", ["gsc", "wix"]))
+
+    assert result["wix"].metadata["timed_out"] is True
+    assert result["wix"].has_error()
+    assert result["gsc"].metadata["timed_out"] is False
+
+
+def test_identical_concurrent_requests_share_one_fetch(monkeypatch):
+    service = _make_service(monkeypatch, {PlatformType.GSC: 0.2})
+
+    async def _run():
+        return await asyncio.gather(*[
+            service.get_comprehensive_analytics("user", ["gsc"]) for _ in range(5)
+        ])
+
+    results = asyncio.run(_run())
+
+    assert service.handlers[PlatformType.GSC].calls == 1
+    assert len({id(r["gsc"]) for r in results}) == 1
+    assert service._inflight == {}
@@ -0,0 +1,123 @@
+"""Intent research fan-out: concurrent queries with per-provider limits, streamed merging, fallback and query dedup."""
+
+import asyncio
+import time
+
+import pytest
+
+from models.research_intent_models import ExpectedDeliverable, ResearchQuery
+from services.research.intent import research_executor as rx
+from services.research.intent.query_deduplicator import deduplicate_queries
+from utils.token_bucket import TokenBucket
+
+DELAY = 0.2
+
+
+def _query(text, provider="exa", priority=3, purpose=ExpectedDeliverable.KEY_STATISTICS, **links):
+    return ResearchQuery(query=text, purpose=purpose, provider=provider, priority=priority,
+                         expected_results=f"results for {text}", **links)
+
+
+class _FakeSearch:
+    def __init__(self, delays=None, failures=()):
+        self.delays = delays or {}
+        self.failures = set(failures)
+        self.active = {}
+        self.peak = {}
+        self.calls = []
+
+    async def __call__(self, provider, query):
+        self.calls.append((provider, query.query))
+        self.active[provider] = self.active.get(provider, 0) + 1
+        self.peak[provider] = max(self.peak.get(provider, 0), self.active[provider])
+        try:
+            await asyncio.sleep(self.delays.get(query.query, DELAY))
+            if query.query in self.failures:
+                raise RuntimeError("provider error")
+            return {
+                "content": f"{provider} content for {query.query}",
+                "sources": [{"title": query.query, "url": f"https://{query.query.split()[0]}.com/a"},
+                            {"title": "shared", "url": "https://shared.com/page/#top", "credibility_score": 0.5}],
+                "answer": f"answer to {query.query}",
+            }
+        finally:
+            self.active[provider] -= 1
+
+
+@pytest.fixture(autouse=True)
+def fast_buckets(monkeypatch):
+    bucket = TokenBucket(rate=1000, capacity=1000)
+    monkeypatch.setattr(rx, "get_token_bucket", lambda *a, **k: bucket)
+
+
+def test_all_queries_run_concurrently_within_provider_limits(monkeypatch):
+    monkeypatch.setenv("ALWRITY_RESEARCH_EXA_CONCURRENCY", "2")
+    search = _FakeSearch()
+    queries = [_query(f"exa{i} topic") for i in range(4)] + [_query(f"tav{i} topic", "tavily") for i in range(4)]
+    executor = rx.IntentResearchExecutor({"exa", "tavily", "google"}, search=search)
+
+    start = time.perf_counter()
+    merged = asyncio.run(executor.run(queries))
+    elapsed = time.perf_counter() - start
+
+    assert len(search.calls) == 8 and len(merged["queries_executed"]) == 8
+    assert search.peak == {"exa": 2, "tavily": 4}
+    assert elapsed < 3 * DELAY
+    # eight distinct sources plus one shared page found by every query
+    assert len(merged["sources"]) == 9
+    shared = next(s for s in merged["sources"] if s["title"] == "shared")
+    assert len(shared["found_by_queries"]) == 8
+    assert len(merged["content"]) <= 8000 + 8 * 2
+
+
+def test_outcomes_stream_as_they_complete_and_failures_are_isolated():
+    search = _FakeSearch(delays={"slow one": 0.3, "fast one": 0.05, "broken one": 0.1}, failures={"broken one"})
+    queries = [_query("slow one", priority=5), _query("fast one", priority=1), _query("broken one")]
+    executor = rx.IntentResearchExecutor({"exa"}, search=search)
+
+    async def collect():
+        accumulator, order = rx.ResearchResultAccumulator(), []
+        async for outcome in executor.stream(queries):
+            order.append(outcome.query.query)
+            accumulator.add(outcome)
+        return order, accumulator.raw_results()
+
+    order, merged = asyncio.run(collect())
+
+    assert order == ["fast one", "broken one", "slow one"]
+    assert [f["query"] for f in merged["failed_queries"]] == ["broken one"]
+    # the higher-priority query leads the merged content and sources
+    assert merged["content"].startswith("### key_statistics: slow one")
+    assert [s["title"] for s in merged["sources"]] == ["shared", "slow one", "fast one"]
+    assert merged["answer"].split("\n\n") == ["answer to slow one", "answer to fast one"]
+
+
+def test_unconfigured_providers_fall_back_in_order():
+    executor = rx.IntentResearchExecutor({"tavily", "google"}, search=_FakeSearch())
+
+    assert executor.resolve_provider("exa") == "tavily"
+    assert executor.resolve_provider("tavily") == "tavily"
+    assert rx.IntentResearchExecutor({"google"}).resolve_provider("tavily") == "google"
+    assert rx.IntentResearchExecutor({"exa"}).resolve_provider("google") == "exa"
+    assert rx.IntentResearchExecutor(set()).resolve_provider("exa") is None
+
+
+def test_deduplication_merges_only_near_identical_queries_with_the_same_targets():
+    base = "content marketing roi statistics for b2b saas companies in 2025"
+    queries = [_query(base, priority=5, addresses_primary_question=True)]
+    queries += [_query(base + " report", priority=4, addresses_secondary_questions=["q1"])]
+    queries += [_query(base + " survey", priority=4, targets_focus_areas=["enterprise"])]
+    queries += [_query(base + " data", priority=3, provider="tavily")]
+    queries += [_query(f"distinct query number {i} about seo", priority=2) for i in range(10)]
+    queries += [_query(base.upper(), priority=1)]
+
+    deduplicated = deduplicate_queries(list(queries), intent=None)
+
+    assert len(deduplicated) == 8
+    assert deduplicated[0].query == base
+    # 10 of 11 words shared: merged into the primary query unless provider or targets differ
+    assert deduplicated[0].addresses_secondary_questions == ["q1"]
+    texts = [q.query for q in deduplicated]
+    assert base + " report" not in texts
+    assert base + " survey" in texts and base + " data" in texts
+    assert base.upper() not in texts
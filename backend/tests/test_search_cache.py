@@ -0,0 +1,89 @@
+"""Shared search result cache: normalized keys, freshness TTLs, request coalescing, persistence and savings stats."""
+
+import asyncio
+
+import pytest
+
+from services.cache.search_cache import SearchResultCache, freshness_class
+from services.cache.tiered_cache import TieredCache
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TieredCache(str(tmp_path / "cache.db"), sweep_interval_seconds=0)
+
+
+class _Api:
+    def __init__(self, result=None, delay=0.05):
+        self.calls = 0
+        self.result = result if result is not None else {"success": True, "results": [{"url": "https://a.com"}]}
+        self.delay = delay
+
+    async def search(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.result
+
+
+def test_identical_searches_are_coalesced_then_served_from_the_persistent_tier(store):
+    cache, api = SearchResultCache(store), _Api()
+
+    async def burst():
+        return await asyncio.gather(*[
+            cache.get_or_fetch("tavily", "Content  Marketing", api.search,
+                               options={"max_results": 5, "include_domains": ["b.com", "A.com"]}, cost=0.002)
+            for _ in range(5)
+        ])
+
+    results = asyncio.run(burst())
+    assert api.calls == 1 and all(r == api.result for r in results)
+    results[1]["results"].clear()  # coalesced callers get their own copy
+
+    # A new process-level cache over the same store, a query differing only in case and spacing
+    fresh = SearchResultCache(TieredCache(store.db_path, sweep_interval_seconds=0))
+    again = asyncio.run(fresh.get_or_fetch(
+        "tavily", "content marketing", api.search,
+        options={"include_domains": ["a.com", "b.com"], "max_results": 5, "country": None}, cost=0.002))
+    assert api.calls == 1 and again == api.result
+
+    stats = cache.get_stats()["providers"]["tavily"]
+    assert (stats["api_calls"], stats["coalesced"], stats["hit_rate"]) == (1, 4, 0.8)
+    assert stats["dollars_saved"] == pytest.approx(0.008)
+    assert fresh.get_stats()["providers"]["tavily"]["hits"] == 1
+
+
+def test_options_and_providers_separate_entries_and_failures_are_not_cached(store):
+    cache, api = SearchResultCache(store), _Api()
+
+    async def run():
+        await cache.get_or_fetch("exa", "seo", api.search, options={"num_results": 5})
+        await cache.get_or_fetch("exa", "seo", api.search, options={"num_results": 10})
+        await cache.get_or_fetch("tavily", "seo", api.search, options={"num_results": 5})
+        failing = _Api({"success": False, "error": "boom"})
+        await cache.get_or_fetch("exa", "broken", failing.search)
+        await cache.get_or_fetch("exa", "broken", failing.search)
+        return failing.calls
+
+    assert asyncio.run(run()) == 2
+    assert api.calls == 3
+
+
+def test_freshness_classes_pick_the_ttl():
+    assert freshness_class("AI news", {"topic": "news"}) == "realtime"
+    assert freshness_class("latest iphone release") == "realtime"
+    assert freshness_class("seo", {"dateRestrict": "d7"}) == "realtime"
+    assert freshness_class("seo", {"dateRestrict": "m1"}) == "recent"
+    assert freshness_class("content marketing trends 2025") == "recent"
+    assert freshness_class("what is a canonical tag") == "evergreen"
+
+
+def test_realtime_results_expire_sooner(store, monkeypatch):
+    monkeypatch.setenv("ALWRITY_SEARCH_CACHE_TTL_REALTIME", "0")
+    cache, api = SearchResultCache(store), _Api()
+
+    async def run():
+        for query in ("breaking news on seo", "breaking news on seo", "how to write a title", "how to write a title"):
+            await cache.get_or_fetch("exa", query, api.search)
+
+    asyncio.run(run())
+    assert api.calls == 3
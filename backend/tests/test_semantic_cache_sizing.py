@@ -0,0 +1,57 @@
+"""Byte accounting, quota and disk-tier checks for SemanticCacheManager."""
+
+from services.intelligence.semantic_cache import CacheEntry, SemanticCacheManager
+
+
+def _manager(tmp_path, **kwargs):
+    kwargs.setdefault("max_memory_size_mb", 0.05)  # ~52KB
+    return SemanticCacheManager(cache_dir=str(tmp_path / "semantic"), **kwargs)
+
+
+def test_entries_use_slots_and_bytes_are_tracked_incrementally(tmp_path):
+    cache = _manager(tmp_path)
+    assert not hasattr(CacheEntry(None, 0, 1, "v", {}), "__dict__")
+
+    cache.set("a", {"text": "x" * 1000}, user_id="u1")
+    cache.set("b", {"text": "y" * 2000}, user_id="u2")
+    sizes = sum(entry.size_bytes for entry in cache.memory_cache.values())
+
+    assert cache.total_bytes == sizes and sizes > 3000
+    assert cache.get_user_usage("u2")["bytes"] == cache.memory_cache["b"].size_bytes
+
+    cache.set("a", {"text": "x"}, user_id="u1")  # overwrite releases the old bytes
+    assert cache.total_bytes == sum(entry.size_bytes for entry in cache.memory_cache.values())
+
+
+def test_per_user_quota_evicts_only_that_users_entries(tmp_path):
+    cache = _manager(tmp_path, per_user_quota_mb=0.01, enable_persistent_cache=False)  # ~10KB each
+    cache.set("quiet", {"text": "q" * 3000}, user_id="quiet")
+    for i in range(10):
+        cache.set(f"noisy-{i}", {"text": "n" * 3000}, user_id="noisy")
+
+    assert cache.get("quiet") == {"text": "q" * 3000}
+    assert cache.get_user_usage("noisy")["bytes"] <= cache.per_user_quota_bytes
+    stats = cache.get_cache_stats()
+    assert stats.quota_evictions == 7 and stats.total_evictions == 7
+    assert stats.memory_usage_bytes == cache.total_bytes
+
+
+def test_global_eviction_spills_to_disk_and_promotes_back(tmp_path):
+    cache = _manager(tmp_path, per_user_quota_mb=0.05)
+    for i in range(8):
+        cache.set(f"k{i}", {"text": str(i) * 8000}, user_id=f"user-{i}")
+
+    assert cache.total_bytes <= cache.max_memory_bytes
+    assert "k0" not in cache.memory_cache
+
+    assert cache.get("k0") == {"text": "0" * 8000}
+    stats = cache.get_cache_stats()
+    assert stats.disk_hits == 1 and stats.disk_writes >= 2
+    assert stats.total_hits == 1 and stats.hit_rate == 1.0
+
+    # A fresh manager rebuilds the disk index from cache_dir
+    fresh = _manager(tmp_path, per_user_quota_mb=0.05)
+    assert fresh.get("k1") == {"text": "1" * 8000}
+
+    fresh.invalidate_user_cache("user-2")
+    assert fresh.get("k2") is None
@@ -0,0 +1,105 @@
+"""SEO page model: one fetch and one parse shared by all analyzers, with the same findings as raw HTML."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("bs4")
+
+from services.seo_analyzer.analyzers import (
+    AccessibilityAnalyzer,
+    ContentAnalyzer,
+    KeywordAnalyzer,
+    MetaDataAnalyzer,
+    PerformanceAnalyzer,
+    SecurityHeadersAnalyzer,
+    TechnicalSEOAnalyzer,
+    UserExperienceAnalyzer,
+)
+from services.seo_analyzer.page import ParsedPage
+
+HTML = """<!DOCTYPE html>
+<html><head>
+  <meta charset="utf-8">
+  <title>Shared page model for the ALwrity SEO analyzer</title>
+  <meta name="description" content="Short description">
+  <meta property="og:title" content="OG">
+  <meta name="twitter:card" content="summary">
+  <link rel="stylesheet canonical" href="https://example.com/page">
+  <script type="application/ld+json">{"@type": "WebPage"}</script>
+  <style>body { color: #333 }</style>
+</head><body>
+  <nav><ul><li><a href="/">Home</a></li><li><a href="/blog">Blog</a></li></ul></nav>
+  <h1>Main</h1><h2>Sub</h2><h1>Second main</h1>
+  <p style="color:red">Contact us at hello@example.com or on twitter. Keyword research matters.</p>
+  <img src="a.png" alt="A"><img src="b.png">
+  <form><label for="email">Email</label><input id="email"><input id="name"><input type="hidden" id="csrf"></form>
+  <a href="https://elsewhere.com">External</a><a name="anchor">No href</a>
+</body></html>"""
+
+
+class _NoNetworkSession:
+    def get(self, *args, **kwargs):
+        raise AssertionError("analyzer re-fetched a page that was already fetched")
+
+
+def _no_fetch(analyzer):
+    analyzer.session = _NoNetworkSession()
+    return analyzer
+
+
+def test_indexes_are_built_in_one_pass():
+    page = ParsedPage.from_html(HTML, "https://example.com/page")
+
+    assert page.title.get_text() == "Shared page model for the ALwrity SEO analyzer"
+    assert page.meta("name", "description")["content"] == "Short description"
+    assert page.meta("property", "og:title") is not None and page.meta("property", "og:image") is None
+    assert page.meta_charset is not None
+    assert page.link_rel("canonical")["href"] == "https://example.com/page"
+    assert [h.name for h in page.headings] == ["h1", "h2", "h1"]
+    assert [a["href"] for a in page.links] == ["/", "/blog", "https://elsewhere.com"]
+    assert len(page.images) == 2 and page.label_targets == {"email"}
+    assert "hello@example.com" in page.text and page.text_lower == page.text.lower()
+    assert ParsedPage.coerce(page) is page
+
+
+def test_analyzers_report_the_same_findings_for_a_page_and_for_raw_html():
+    url = "https://example.com/page"
+    page = ParsedPage.from_html(HTML, url)
+
+    for analyzer, args in (
+        (MetaDataAnalyzer(), (url,)),
+        (ContentAnalyzer(), (url,)),
+        (UserExperienceAnalyzer(), (url,)),
+        (AccessibilityAnalyzer(), ()),
+        (KeywordAnalyzer(), (["keyword research", "missing"],)),
+    ):
+        assert analyzer.analyze(page, *args) == analyzer.analyze(HTML, *args), type(analyzer).__name__
+
+    accessibility = AccessibilityAnalyzer().analyze(page)
+    assert [w["current_value"] for w in accessibility["warnings"] if w["action"] == "add_form_label"] == ["Input ID: name"]
+    assert accessibility["headings_count"] == 3
+
+    technical = TechnicalSEOAnalyzer()
+    technical.session = SimpleNamespace(get=lambda *a, **k: SimpleNamespace(status_code=200))
+    result = technical.analyze(page, url)
+    assert result["has_canonical"] and result["has_structured_data"] and result["h1_count"] == 2
+
+
+def test_fetched_page_supplies_timing_and_headers_without_refetching():
+    response = SimpleNamespace(
+        text=HTML,
+        url="https://example.com/page/",
+        status_code=200,
+        headers={"Content-Encoding": "gzip", "ETag": '"abc"', "X-Frame-Options": "DENY", "x-content-type-options": "nosniff"},
+    )
+    page = ParsedPage.from_response(response, "https://example.com/page", load_time=2.5)
+    assert page.final_url == "https://example.com/page/" and page.header("etag") == '"abc"'
+
+    performance = _no_fetch(PerformanceAnalyzer()).analyze(page)
+    assert performance["load_time"] == 2.5 and performance["is_compressed"] and performance["has_cache"]
+    assert [w["action"] for w in performance["warnings"]] == ["improve_page_speed"]
+
+    security = _no_fetch(SecurityHeadersAnalyzer()).analyze(page)
+    assert security["present_headers"] == ["X-Frame-Options", "X-Content-Type-Options"]
+    assert security["total_headers"] == 2
@@ -0,0 +1,125 @@
+"""Bulk site audit: polite concurrent fetching, streamed page results, incremental persistence and the site rollup."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("aiohttp")
+
+from services.seo_analyzer.site_audit import SiteAuditEngine, normalize_url
+
+SITE = "https://example.com"
+
+
+def _html(title, links, description="A page of the example site used by the audit tests"):
+    anchors = "".join(f'<a href="{href}">{href}</a>' for href in links)
+    return (
+        f"<html><head><title>{title}</title><meta name='description' content='{description}'></head>"
+        f"<body><h1>{title}</h1><nav>{anchors}</nav><p>Contact: hello@example.com</p></body></html>"
+    )
+
+
+PAGES = {
+    f"{SITE}/": _html("Home", ["/a", "/b/", "/missing", "/gone", "https://other.com/x"]),
+    f"{SITE}/a": _html("Same title", ["/", "/b", "#top"]),
+    f"{SITE}/b": _html("Same title", ["/a", "/a#section"]),
+    f"{SITE}/orphan": _html("Orphan", ["/"], description="Unique"),
+}
+STATUS = {f"{SITE}/missing": 404, f"{SITE}/gone": 410}
+
+
+class _FakeSite:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.requests = []
+
+    async def fetch(self, url):
+        self.requests.append(url)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if url in STATUS:
+            return {"url": url, "status_code": STATUS[url], "error": f"HTTP {STATUS[url]}"}
+        return {"url": url, "final_url": url, "status_code": 200, "headers": {"ETag": "x"},
+                "load_time": 0.1, "html": PAGES[url]}
+
+
+class _Engine(SiteAuditEngine):
+    site_checks = 0
+
+    def site_file_warnings(self, root_url):
+        _Engine.site_checks += 1
+        return []
+
+
+class _FakeService:
+    def __init__(self):
+        self.stored = []
+        self.finished = None
+
+    def start_site_audit(self, url, user_id=None, input_context=None):
+        return SimpleNamespace(id=7)
+
+    def store_analysis_result(self, result, session_id=None):
+        self.stored.append((result.url, session_id))
+        return SimpleNamespace(id=len(self.stored))
+
+    def finish_site_audit(self, session_id, rollup, status="success"):
+        self.finished = (session_id, status, rollup)
+        return True
+
+
+def _collect(engine, urls, **kwargs):
+    async def scenario():
+        return [event async for event in engine.audit_urls(urls, **kwargs)]
+    return asyncio.run(scenario())
+
+
+def test_site_audit_streams_pages_persists_them_and_rolls_up_the_site():
+    site, service = _FakeSite(), _FakeService()
+    engine = _Engine(concurrency=8, host_concurrency=2, host_delay=0, fetch=site.fetch,
+                     executor=ThreadPoolExecutor(2))
+    urls = list(PAGES) + [f"{SITE}/missing", f"{SITE}/a#dup"]
+
+    events = _collect(engine, urls, service=service, site_url=SITE, user_id="u1")
+
+    assert events[0] == {"type": "started", "total": 5, "session_id": 7}
+    pages = [e["page"] for e in events if e["type"] == "page"]
+    assert len(pages) == 5 and events[-1]["type"] == "rollup"
+    assert all("html" not in page for page in pages)
+    assert site.peak <= 2 and _Engine.site_checks == 1
+
+    stored = {url for url, session_id in service.stored if session_id == 7}
+    assert stored == set(PAGES)
+    assert {p["url"]: p.get("analysis_id") is not None for p in pages}[f"{SITE}/missing"] is False
+
+    rollup = events[-1]["rollup"]
+    assert service.finished[:2] == (7, "success") and service.finished[2] == rollup
+    assert rollup["pages_audited"] == 4 and rollup["pages_failed"] == 1
+    assert [(d["value"], d["pages"]) for d in rollup["duplicate_titles"]] == [("Same title", 2)]
+    assert rollup["duplicate_meta_descriptions"][0]["pages"] == 3
+    assert rollup["orphan_pages"] == [normalize_url(f"{SITE}/orphan")]
+    broken = {b["url"]: (b["status_code"], b["inbound_links"]) for b in rollup["broken_links"]}
+    # /missing is in the URL list; /gone is only linked and is found by the link check
+    assert broken == {f"{SITE}/missing": (404, 1), f"{SITE}/gone": (410, 1)}
+
+
+def test_stopping_the_stream_closes_the_audit_session():
+    site, service = _FakeSite(), _FakeService()
+    engine = _Engine(concurrency=1, host_delay=0, fetch=site.fetch, executor=ThreadPoolExecutor(1))
+
+    async def scenario():
+        stream = engine.audit_urls(list(PAGES), service=service)
+        async for event in stream:
+            if event["type"] == "page":
+                break
+        await stream.aclose()
+
+    asyncio.run(scenario())
+    assert service.finished[1] == "cancelled"
+    assert len(site.requests) < len(PAGES) + 1
@@ -0,0 +1,117 @@
+"""Story Writer scene media engine: per-provider limits, narration dedup and aggregated progress."""
+
+import threading
+import time
+import uuid
+
+from services.story_writer.scene_media_engine import StorySceneMediaEngine
+
+
+class _FakeAudioService:
+    def __init__(self, audio_dir):
+        self.audio_dir = audio_dir
+        self.synthesized = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _get_user_audio_dir(self, user_id, db=None):
+        return self.audio_dir
+
+    def _synthesize(self, text, output_path, provider, lang="en", slow=False, rate=150):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.synthesized.append(text)
+        time.sleep(0.05)
+        output_path.write_bytes(text.encode())
+        with self.lock:
+            self.active -= 1
+        return True
+
+
+class _FakeImageService:
+    def generate_scene_image(self, scene, user_id, **options):
+        time.sleep(0.05)
+        if scene["scene_number"] == 2:
+            raise RuntimeError("provider rejected prompt")
+        return {"scene_number": scene["scene_number"], "image_path": f"/img/{scene['scene_number']}.png"}
+
+
+def _scenes(narrations):
+    return [
+        {"scene_number": i + 1, "title": f"Scene {i + 1}", "audio_narration": text, "image_prompt": "a prompt"}
+        for i, text in enumerate(narrations)
+    ]
+
+
+def test_identical_narration_is_synthesized_once_and_cached_across_batches(tmp_path, monkeypatch):
+    monkeypatch.setenv("ALWRITY_STORY_TTS_CONCURRENCY", "2")
+    provider = f"tts-{uuid.uuid4().hex[:6]}"
+    audio = _FakeAudioService(tmp_path)
+    engine = StorySceneMediaEngine(audio_service=audio)
+    progress = []
+
+    results = engine.generate_audio(
+        _scenes(["Once upon a time", "The end", "Once upon a time", "", "Meanwhile", "Later"]),
+        "user", provider=provider, progress_callback=lambda p, m: progress.append(p),
+    )
+
+    assert sorted(audio.synthesized) == ["Later", "Meanwhile", "Once upon a time", "The end"]
+    assert audio.peak == 2
+    assert results[0]["audio_path"] == results[2]["audio_path"]
+    assert results[3]["error"] and results[3]["audio_url"] == ""
+    assert [r["scene_number"] for r in results] == [1, 2, 3, 4, 5, 6]
+    assert progress == sorted(progress) and progress[-1] == 100.0
+
+    audio.synthesized.clear()
+    engine.generate_audio(_scenes(["The end"]), "user", provider=provider)
+    assert audio.synthesized == []
+
+
+def test_images_and_audio_run_together_with_one_progress_stream(tmp_path):
+    engine = StorySceneMediaEngine(audio_service=_FakeAudioService(tmp_path), image_service=_FakeImageService())
+    progress = []
+
+    start = time.monotonic()
+    images, narration = engine.generate_scene_assets(
+        _scenes(["one", "two", "three"]),
+        "user",
+        image_options={"provider": f"img-{uuid.uuid4().hex[:6]}"},
+        audio_options={"provider": f"tts-{uuid.uuid4().hex[:6]}"},
+        progress_callback=lambda p, m: progress.append(p),
+    )
+
+    assert time.monotonic() - start < 0.25  # six 50ms jobs, not run back to back
+    assert [i.get("error") for i in images] == [None, "provider rejected prompt", None]
+    assert all(not n.get("error") for n in narration)
+    assert len(progress) == 6 and progress[-1] == 100.0
+
+
+def test_video_workers_never_share_the_callers_session(monkeypatch):
+    from services.story_writer import scene_media_engine
+
+    class _Session:
+        def __init__(self):
+            self.closed = False
+
+        def close(self):
+            self.closed = True
+
+    opened = []
+    monkeypatch.setattr(scene_media_engine, "_open_worker_session", lambda user_id: opened.append(_Session()) or opened[-1])
+    used = []
+
+    class _FakeVideoService:
+        def generate_scene_video(self, scene, db=None, **kwargs):
+            used.append(db)
+            return {"scene_number": scene["scene_number"], "video_path": f"/video/{scene['scene_number']}.mp4"}
+
+    engine = StorySceneMediaEngine(video_service=_FakeVideoService())
+    caller_db = _Session()
+
+    videos = engine.generate_scene_videos(_scenes(["one", "two", "three"]), ["i"] * 3, ["a"] * 3, "user", db=caller_db)
+
+    assert [v.get("error") for v in videos] == [None, None, None]
+    assert len(opened) == 3 and all(db in opened for db in used)
+    assert caller_db not in used and all(s.closed for s in opened) and not caller_db.closed
@@ -0,0 +1,95 @@
+"""Task lease table: monotonic expiries, bulk sweeps, contention counters and the shared SQLite store."""
+
+import asyncio
+
+import pytest
+
+from services.scheduler.core.task_lease_table import SharedLeaseStore, TaskLeaseTable
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_leases_expire_on_the_monotonic_clock_and_are_swept_in_bulk():
+    clock = FakeClock()
+    leases = TaskLeaseTable(ttl_seconds=60, clock=clock)
+
+    assert leases.acquire("user_1:oauth_token_monitoring_1")
+    assert not leases.acquire("user_1:oauth_token_monitoring_1")
+    assert leases.acquire("user_2:oauth_token_monitoring_1")  # same task ID, other user
+    for i in range(100):
+        leases.acquire(f"user_1:advertools_intelligence_{i}")
+    clock.now += 30
+    assert leases.remaining("user_1:oauth_token_monitoring_1") == 30
+
+    clock.now += 31
+    assert not leases.is_leased("user_1:oauth_token_monitoring_1")
+    assert leases.sweep() == 102 and len(leases) == 0
+    assert leases.acquire("user_1:oauth_token_monitoring_1")
+
+    stats = leases.get_stats()
+    assert (stats["acquired"], stats["contended"], stats["expired"], stats["active"]) == (103, 1, 102, 1)
+
+
+def test_released_and_renewed_leases_do_not_grow_the_heap():
+    leases = TaskLeaseTable(ttl_seconds=60, clock=FakeClock())
+    for _ in range(10_000):
+        leases.acquire("task_1")
+        leases.release("task_1")
+    assert len(leases._heap) <= 66
+    assert leases.get_stats()["released"] == 10_000
+
+
+def test_workers_sharing_a_lease_table_never_both_run_a_task(tmp_path):
+    db_path = str(tmp_path / "leases.db")
+    worker_a = TaskLeaseTable(ttl_seconds=900, store=SharedLeaseStore(db_path, owner="host-1"))
+    worker_b = TaskLeaseTable(ttl_seconds=900, store=SharedLeaseStore(db_path, owner="host-2"))
+
+    assert worker_a.acquire("user_1:deep_website_crawl_7")
+    assert not worker_b.acquire("user_1:deep_website_crawl_7")
+    assert worker_b.is_leased("user_1:deep_website_crawl_7")  # remembered until the lease runs out
+    assert worker_b.remaining("user_1:deep_website_crawl_7") > 800
+    assert worker_b.get_stats()["shared_contended"] == 1
+
+    worker_a.release("user_1:deep_website_crawl_7")
+    worker_c = TaskLeaseTable(ttl_seconds=900, store=SharedLeaseStore(db_path, owner="host-3"))
+    assert worker_c.acquire("user_1:deep_website_crawl_7")
+    assert not worker_a.acquire("user_1:deep_website_crawl_7")
+
+    expired = TaskLeaseTable(ttl_seconds=-1, store=SharedLeaseStore(db_path, owner="host-4"))
+    assert expired.acquire("user_1:sif_indexing_1")  # already expired in the shared table
+    assert worker_a.acquire("user_1:sif_indexing_1")
+
+
+def test_stopping_the_scheduler_hands_back_the_leases_of_cancelled_executions(tmp_path, monkeypatch):
+    pytest.importorskip("apscheduler")
+    from services.scheduler.core.scheduler import TaskScheduler
+
+    db_path = str(tmp_path / "leases.db")
+    monkeypatch.setenv("SCHEDULER_TASK_LEASE_DB", db_path)
+    key = "user_1:deep_website_crawl_7"
+
+    async def scenario():
+        scheduler = TaskScheduler()
+        scheduler.scheduler.start()
+        scheduler._running = True
+        assert scheduler._acquire_task_lease(key)
+
+        async def execution():
+            try:
+                await asyncio.sleep(60)
+            finally:
+                del scheduler.active_executions[key]  # as execute_task_async does
+
+        scheduler.active_executions[key] = asyncio.create_task(execution())
+        await asyncio.sleep(0)
+        await scheduler.stop()
+
+    asyncio.run(scenario())
+    other_worker = TaskLeaseTable(ttl_seconds=900, store=SharedLeaseStore(db_path, owner="host-2"))
+    assert other_worker.acquire(key)
@@ -0,0 +1,91 @@
+"""Durable task state: shared across workers, versioned updates, long-poll wakeups and restart recovery."""
+
+import asyncio
+import os
+import socket
+import threading
+import time
+
+from utils.task_state_store import TaskStateStore, worker_id
+
+
+def test_state_is_shared_between_workers_and_versions_only_bump_on_change(tmp_path):
+    db = tmp_path / "tasks.db"
+    worker_a, worker_b = TaskStateStore(db), TaskStateStore(db)
+
+    task_id = worker_a.create("story", task_type="story_generation", metadata={"owner_user_id": "u1"})
+    assert worker_b.get(task_id)["status"] == "pending"
+
+    version = worker_a.update(task_id, status="processing", progress=10.0, message="Generating premise...")
+    assert version == 2
+    assert worker_a.update(task_id, status="processing", progress=10.0) == 2  # nothing changed
+
+    for i in range(25):
+        worker_a.update(task_id, message=f"step {i}")
+    worker_a.update(task_id, status="completed", result={"story": "Once upon a time"}, extra={"partial": [1]})
+
+    record = worker_b.get(task_id)
+    assert record["status"] == "completed" and record["result"] == {"story": "Once upon a time"}
+    assert len(record["messages"]) == 20 and record["messages"][-1] == "step 24"
+    assert record["metadata"] == {"owner_user_id": "u1"} and record["extra"] == {"partial": [1]}
+
+    worker_a.update(task_id, extra={"partial": None})
+    assert worker_b.get(task_id)["extra"] == {}
+    assert worker_a.update("missing", status="failed") is None
+
+
+def test_wait_for_change_wakes_on_update_and_times_out_when_unchanged(tmp_path):
+    db = tmp_path / "tasks.db"
+    store, other_worker = TaskStateStore(db), TaskStateStore(db)
+    task_id = store.create("blog_writer")
+    since = store.get(task_id)["version"]
+
+    async def scenario():
+        start = time.monotonic()
+        unchanged = await store.wait_for_change(task_id, since, timeout=0.2)
+        assert unchanged["version"] == since and time.monotonic() - start >= 0.2
+
+        threading.Timer(0.05, lambda: store.update(task_id, status="running")).start()
+        start = time.monotonic()
+        changed = await store.wait_for_change(task_id, since, timeout=5)
+        assert changed["status"] == "running" and time.monotonic() - start < 0.4
+
+        # A write from another worker is picked up on re-check
+        threading.Timer(0.05, lambda: other_worker.update(task_id, status="completed")).start()
+        changed = await store.wait_for_change(task_id, changed["version"], timeout=5)
+        assert changed["status"] == "completed"
+
+    asyncio.run(scenario())
+
+
+def test_tasks_of_dead_workers_are_interrupted_and_finished_ones_cleaned_up(tmp_path):
+    store = TaskStateStore(tmp_path / "tasks.db")
+    orphan = store.create("youtube")
+    mine = store.create("youtube")
+    done = store.create("youtube")
+    store.update(done, status="completed")
+    with store._db() as db:
+        db.execute("UPDATE tasks SET worker = ? WHERE task_id = ?", ("nohost-dead:999999999", orphan))
+        db.execute("UPDATE tasks SET worker = ? WHERE task_id = ?", (f"{socket.gethostname()}:999999999", done))
+
+    assert [t["task_id"] for t in store.interrupted_tasks("youtube", stale_after_seconds=0)] == [orphan]
+    assert store.mark_interrupted("youtube", stale_after_seconds=0) == 1
+    assert store.get(orphan)["status"] == "failed" and store.get(mine)["status"] == "pending"
+
+    assert store.cleanup(max_age_seconds=0, namespace="youtube") == 2
+    assert store.get(mine) is not None and store.count("youtube") == 1
+
+
+def test_tasks_from_before_a_restart_with_the_same_pid_are_interrupted(tmp_path):
+    store = TaskStateStore(tmp_path / "tasks.db")
+    before_restart = store.create("story")
+    legacy = store.create("story")
+    running = store.create("story")
+    with store._db() as db:
+        previous_boot = f"{socket.gethostname()}:{os.getpid()}:0123456789ab"
+        db.execute("UPDATE tasks SET worker = ? WHERE task_id = ?", (previous_boot, before_restart))
+        db.execute("UPDATE tasks SET worker = ? WHERE task_id = ?", (f"{socket.gethostname()}:{os.getpid()}", legacy))
+
+    # Not stale by age: only the boot nonce tells the previous container apart
+    assert {t["task_id"] for t in store.interrupted_tasks("story")} == {before_restart, legacy}
+    assert store.get(running)["worker"] == worker_id()
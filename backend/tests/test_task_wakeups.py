@@ -0,0 +1,145 @@
+"""Scheduler wakeup queue: earliest-due ordering, commit-driven wakeups and the start-up rebuild."""
+
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models.advertools_monitoring_models import AdvertoolsTask
+from services.scheduler.core.due_task_index import DueTaskIndex, DueTaskSource
+from services.scheduler.core.wakeup_queue import WakeupQueue
+from services.scheduler.utils.advertools_task_loader import ADVERTOOLS_DUE_SOURCE
+
+NOW = datetime.utcnow()
+
+
+def test_users_come_out_earliest_first_with_one_entry_each():
+    queue = WakeupQueue()
+    queue.schedule("user_b", NOW + timedelta(minutes=5))
+    queue.schedule("user_a", NOW + timedelta(minutes=10))
+    assert queue.schedule("user_a", NOW + timedelta(minutes=1))
+    assert not queue.schedule("user_a", NOW + timedelta(minutes=30))  # later than its wakeup
+
+    assert queue.next_due() == NOW + timedelta(minutes=1)
+    assert queue.pop_due(NOW) == []
+    assert queue.pop_due(NOW + timedelta(minutes=20)) == ["user_a", "user_b"]
+    assert len(queue) == 0 and queue.next_due() is None
+
+
+def test_a_sleeping_queue_is_woken_by_a_schedule_from_another_thread():
+    async def scenario():
+        queue = WakeupQueue()
+        queue.bind()
+        queue.schedule("user_late", datetime.utcnow() + timedelta(hours=1))
+        waiter = asyncio.ensure_future(queue.wait_until_due())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        threading.Thread(target=queue.schedule, args=("user_now",)).start()
+        return await asyncio.wait_for(waiter, timeout=2), queue
+
+    woken, queue = asyncio.run(scenario())
+    assert woken == ["user_now"]
+    assert len(queue) == 1
+
+
+@pytest.fixture
+def maker(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'user.db'}")
+    AdvertoolsTask.__table__.create(engine)
+    return sessionmaker(bind=engine, info={"user_id": "user_1"})
+
+
+def test_committed_task_writes_schedule_their_user(maker):
+    queue = WakeupQueue()
+    queue.watch(ADVERTOOLS_DUE_SOURCE)
+    due = NOW + timedelta(hours=2)
+
+    db = maker()
+    db.add(AdvertoolsTask(user_id="user_1", website_url="https://a.com", status="active", next_execution=due))
+    db.flush()
+    assert len(queue) == 0  # nothing until the commit
+    db.commit()
+    assert queue.next_due() == due
+
+    db.add(AdvertoolsTask(user_id="user_1", website_url="https://a.com", status="active", next_execution=NOW))
+    db.flush()
+    db.rollback()
+    assert queue.next_due() == due
+
+    task = db.query(AdvertoolsTask).first()
+    task.status = "paused"
+    task.next_execution = NOW
+    db.commit()
+    assert queue.next_due() == due  # paused tasks never wake anyone
+
+    task.status = "active"
+    db.commit()
+    assert queue.pop_due(NOW) == ["user_1"]
+    db.close()
+
+
+def test_next_due_is_the_earliest_runnable_task(maker):
+    index = DueTaskIndex()
+    index.register("advertools_intelligence", DueTaskSource(AdvertoolsTask))  # unscheduled tasks are due
+    db = maker()
+    assert index.next_due(db) is None
+
+    db.add(AdvertoolsTask(user_id="user_1", website_url="https://a.com", status="paused", next_execution=NOW))
+    db.add(AdvertoolsTask(user_id="user_1", website_url="https://a.com", status="active",
+                          next_execution=NOW + timedelta(hours=3)))
+    db.commit()
+    assert index.next_due(db) == NOW + timedelta(hours=3)
+
+    db.add(AdvertoolsTask(user_id="user_1", website_url="https://a.com", status="active", next_execution=None))
+    db.commit()
+    assert index.next_due(db, now=NOW) == NOW
+    db.close()
+
+
+def test_a_woken_check_queues_the_users_next_due_task(maker, monkeypatch):
+    from types import SimpleNamespace
+
+    from services.onboarding import progress_service
+    from services.scheduler.core import check_cycle_handler
+
+    index = DueTaskIndex()
+    index.register("advertools_intelligence", ADVERTOOLS_DUE_SOURCE)
+    later = NOW + timedelta(hours=2)
+    db = maker()
+    db.add(AdvertoolsTask(user_id="user_1", website_url="https://a.com", status="active",
+                          next_execution=NOW - timedelta(minutes=1)))
+    db.add(AdvertoolsTask(user_id="user_1", website_url="https://b.com", status="active", next_execution=later))
+    db.commit()
+    db.close()
+
+    processed = []
+
+    async def process_task_type(task_type, db, summary, user_id=None, tasks=None):
+        processed.append([task.website_url for task in tasks])
+
+    queue = WakeupQueue()
+    scheduler = SimpleNamespace(
+        stats={"total_checks": 0}, registry=SimpleNamespace(due_index=index, get_registered_types=lambda: []),
+        wakeups_enabled=True, wakeup_queue=queue, _process_task_type=process_task_type,
+        _dispatch_queued=lambda: None, active_executions={}, max_concurrent_executions=10,
+        min_check_interval_minutes=15, max_check_interval_minutes=60, current_check_interval_minutes=60,
+    )
+    monkeypatch.setattr(check_cycle_handler, "get_session_for_user", lambda user_id: maker())
+    monkeypatch.setattr(check_cycle_handler.semantic_dashboard_api, "evict_stale_monitors", lambda: None)
+    monkeypatch.setitem(check_cycle_handler.LAST_SEMANTIC_CHECKS, "user_1", datetime.utcnow())
+    monkeypatch.setattr(progress_service.OnboardingProgressService, "get_onboarding_status",
+                        lambda self, user_id: {"is_completed": False})
+
+    assert queue.schedule("user_1", NOW - timedelta(minutes=1))
+    users = queue.pop_due()
+    asyncio.run(check_cycle_handler.check_and_execute_due_tasks(scheduler, user_ids=users))
+
+    assert processed == [["https://a.com"]]
+    assert queue.next_due() == later  # not lost once the first wakeup was popped
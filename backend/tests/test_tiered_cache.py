@@ -0,0 +1,109 @@
+"""Behaviour checks for the shared tiered blog writer cache."""
+
+import sqlite3
+import time
+
+from services.cache.persistent_outline_cache import PersistentOutlineCache
+from services.cache.tiered_cache import TieredCache
+
+
+def _store(tmp_path, **kwargs):
+    kwargs.setdefault("sweep_interval_seconds", 0)
+    return TieredCache(str(tmp_path / "cache.db"), **kwargs)
+
+
+def test_memory_tier_serves_hits_and_returns_independent_copies(tmp_path):
+    ns = _store(tmp_path).namespace("research", ttl_seconds=60, max_entries=10)
+    ns.set("k", {"sources": [1, 2]})
+
+    first = ns.get("k")
+    first["sources"].append(3)
+
+    assert ns.get("k") == {"sources": [1, 2]}
+    metrics = ns.stats()["metrics"]
+    assert metrics["memory_hits"] == 2 and metrics["disk_hits"] == 0
+
+
+def test_persistent_tier_survives_new_instance_and_compresses(tmp_path):
+    payload = {"text": "x" * 5000}
+    _store(tmp_path).namespace("content", ttl_seconds=60, max_entries=10).set("k", payload)
+
+    fresh = _store(tmp_path).namespace("content", ttl_seconds=60, max_entries=10)
+    assert fresh.get("k") == payload
+    assert fresh.stats()["metrics"]["disk_hits"] == 1
+
+    conn = sqlite3.connect(str(tmp_path / "cache.db"))
+    compressed, size = conn.execute("SELECT compressed, size_bytes FROM cache_entries").fetchone()
+    conn.close()
+    assert compressed == 1 and size < 5000
+
+
+def test_eviction_is_by_last_access_not_creation(tmp_path):
+    store = _store(tmp_path, memory_max_entries=0)
+    ns = store.namespace("outline", ttl_seconds=60, max_entries=2)
+    ns.set("old", 1)
+    time.sleep(0.01)
+    ns.set("newer", 2)
+    time.sleep(0.01)
+    assert ns.get("old") == 1  # "old" is now the most recently used
+
+    ns.set("newest", 3)
+
+    assert ns.get("old") == 1
+    assert ns.get("newer") is None
+    assert ns.stats()["metrics"]["evictions"] == 1
+
+
+def test_expiry_happens_in_sweep_not_inline(tmp_path):
+    store = _store(tmp_path)
+    ns = store.namespace("research", ttl_seconds=0.01, max_entries=10)
+    ns.set("k", 1)
+    time.sleep(0.02)
+
+    assert ns.get("k") is None
+    assert ns.stats()["expired_entries"] == 1
+    assert store.sweep()["expired"] == 1
+    assert ns.stats()["total_entries"] == 0
+
+
+def test_outline_cache_invalidates_by_keywords(tmp_path):
+    cache = PersistentOutlineCache(db_path=str(tmp_path / "outline.db"))
+    cache.cache_outline(["SEO", "AI"], "tech", "devs", 1500, None, None, {"outline": []})
+
+    assert cache.get_cached_outline(["ai", "seo"], "tech", "devs", 1500)["outline"] == []
+    cache.invalidate_cache_for_keywords(["ai ", "Seo"])
+    assert cache.get_cached_outline(["ai", "seo"], "tech", "devs", 1500) is None
+
+
+def test_outline_cache_returns_near_match_with_score(tmp_path, monkeypatch):
+    monkeypatch.setenv("ALWRITY_CACHE_SIMILARITY_ENABLED", "true")
+    cache = PersistentOutlineCache(db_path=str(tmp_path / "outline.db"), similarity_threshold=0.7)
+    cache.cache_outline(["ai writing tools", "content"], "tech", "devs", 1500, None, None, {"outline": ["x"]})
+
+    exact = cache.get_cached_outline(["content", "AI writing tools"], "tech", "devs", 1500)
+    assert exact["cache_match"] == {"type": "exact", "score": 1.0}
+
+    near = cache.get_cached_outline(["AI writing tool", "content", "generator"], "tech", "devs", 1600)
+    assert near["outline"] == ["x"]
+    assert near["cache_match"]["type"] == "similar"
+    assert near["cache_match"]["score"] == 0.8
+
+    assert cache.get_cached_outline(["AI writing tool", "content", "generator"], "tech", "devs", 1600, allow_similar=False) is None
+    assert cache.get_cached_outline(["AI writing tool", "content"], "finance", "devs", 1500) is None
+
+
+def test_near_matches_are_opt_in_and_never_cross_personas(tmp_path, monkeypatch):
+    monkeypatch.delenv("ALWRITY_CACHE_SIMILARITY_ENABLED", raising=False)
+    cache = PersistentOutlineCache(db_path=str(tmp_path / "off.db"), similarity_threshold=0.7)
+    cache.cache_outline(["ai writing tools", "content"], "tech", "devs", 1500, None, None, {"outline": ["x"]})
+    assert cache.get_cached_outline(["AI writing tool", "content", "generator"], "tech", "devs", 1500) is None
+
+    monkeypatch.setenv("ALWRITY_CACHE_SIMILARITY_ENABLED", "true")
+    cache = PersistentOutlineCache(db_path=str(tmp_path / "on.db"), similarity_threshold=0.7)
+    persona_a, persona_b = {"name": "Ana", "tone": "witty"}, {"name": "Ben", "tone": "formal"}
+    cache.cache_outline(["ai writing tools", "content"], "tech", "devs", 1500, None, persona_a, {"outline": ["a"]})
+
+    near = ["AI writing tool", "content", "generator"]
+    assert cache.get_cached_outline(near, "tech", "devs", 1500, persona_data=persona_a)["outline"] == ["a"]
+    assert cache.get_cached_outline(near, "tech", "devs", 1500, persona_data=persona_b) is None
+    assert cache.get_cached_outline(near, "tech", "devs", 1500) is None
@@ -0,0 +1,47 @@
+"""ffmpeg scene concatenation: stream-copy fast path, parallel re-encode fallback, real progress."""
+
+import subprocess
+
+import pytest
+
+from utils.video_concat import clips_compatible, concat_videos, get_ffmpeg_exe, probe_clip
+
+FFMPEG = get_ffmpeg_exe()
+pytestmark = pytest.mark.skipif(FFMPEG is None, reason="ffmpeg is not available")
+
+
+def _make_clip(path, size="320x240", rate=24, seconds=1, audio=True):
+    cmd = [FFMPEG, "-loglevel", "error", "-y", "-f", "lavfi", "-i", f"testsrc=size={size}:rate={rate}"]
+    if audio:
+        cmd += ["-f", "lavfi", "-i", "sine=frequency=440:sample_rate=44100", "-c:a", "aac", "-ac", "2"]
+    cmd += ["-t", str(seconds), "-c:v", "libx264", "-pix_fmt", "yuv420p", str(path)]
+    subprocess.run(cmd, check=True)
+    return str(path)
+
+
+def test_compatible_clips_are_stream_copied_with_progress(tmp_path):
+    clips = [_make_clip(tmp_path / f"scene_{i}.mp4") for i in range(3)]
+    progress = []
+
+    result = concat_videos(clips, tmp_path / "final.mp4", progress_callback=lambda p, m: progress.append(p))
+
+    assert clips_compatible([probe_clip(c) for c in clips])
+    assert result["method"] == "stream_copy" and result["num_clips"] == 3
+    assert probe_clip(result["video_path"]).duration == pytest.approx(3.0, abs=0.2)
+    assert progress[-1] == 100.0 and progress == sorted(progress)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["final.mp4", "scene_0.mp4", "scene_1.mp4", "scene_2.mp4"]
+
+
+def test_mismatched_clips_are_normalized_before_joining(tmp_path):
+    clips = [
+        _make_clip(tmp_path / "a.mp4"),
+        _make_clip(tmp_path / "b.mp4", size="160x120", rate=30, audio=False),
+        _make_clip(tmp_path / "c.mp4"),
+    ]
+
+    result = concat_videos(clips, tmp_path / "final.mp4")
+    final = probe_clip(result["video_path"])
+
+    assert result["method"] == "reencode"
+    assert (final.width, final.height, final.has_audio) == (320, 240, True)
+    assert final.duration == pytest.approx(3.0, abs=0.2)
@@ -0,0 +1,107 @@
+"""Multiplexed WaveSpeed poller: shared schedule, adaptive intervals and resumable registry."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from services.wavespeed.job_registry import WaveSpeedJobRegistry
+from services.wavespeed.polling import WaveSpeedPollerService, next_poll_interval
+
+BASE_URL = "https://api.wavespeed.test/api/v3"
+
+
+class _FakeApi:
+    """Predictions complete after a fixed number of status checks."""
+
+    def __init__(self, checks_until_done):
+        self.checks_until_done = checks_until_done
+        self.calls = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        prediction_id = request.url.path.split("/")[-2]
+        with self.lock:
+            self.calls[prediction_id] = self.calls.get(prediction_id, 0) + 1
+            count = self.calls[prediction_id]
+        if prediction_id.startswith("missing"):
+            return httpx.Response(404, text="not found")
+        status = "completed" if count >= self.checks_until_done else "processing"
+        return httpx.Response(200, json={"data": {
+            "id": prediction_id, "model": "test/model", "status": status,
+            "outputs": [f"https://cdn/{prediction_id}.mp4"] if status == "completed" else [],
+        }})
+
+
+def _service(tmp_path, api, **kwargs):
+    return WaveSpeedPollerService(
+        registry=WaveSpeedJobRegistry(str(tmp_path / "jobs.db")),
+        transport=httpx.MockTransport(api),
+        api_key_resolver=lambda: "key",
+        **kwargs,
+    )
+
+
+def test_many_waiters_share_one_loop_and_one_schedule(tmp_path):
+    api = _FakeApi(checks_until_done=3)
+    service = _service(tmp_path, api)
+    try:
+        ids = [f"job-{i}" for i in range(20)]
+        with ThreadPoolExecutor(max_workers=25) as pool:
+            futures = [pool.submit(service.wait, pid, "key", BASE_URL, 10, 0.05) for pid in ids]
+            futures.append(pool.submit(service.wait, "job-0", "key", BASE_URL, 10, 0.05))
+            results = [f.result() for f in futures]
+
+        assert [r["id"] for r in results[:20]] == ids and results[20]["id"] == "job-0"
+        assert api.calls["job-0"] == 3  # the duplicate waiter did not double the polling
+        assert service.active_jobs() == 0
+        assert service.get_job("job-7")["status"] == "completed"
+        assert service.get_job("job-7")["result"]["outputs"] == ["https://cdn/job-7.mp4"]
+        assert sum(1 for t in threading.enumerate() if t.name == "wavespeed-poller") == 1
+    finally:
+        service.shutdown()
+
+
+def test_async_waiters_and_non_transient_errors(tmp_path):
+    service = _service(tmp_path, _FakeApi(checks_until_done=2))
+    service.MAX_CONSECUTIVE_ERRORS = 2
+    try:
+        async def _run():
+            ok = await service.wait_async("job-a", "key", BASE_URL, 10, 0.05)
+            with pytest.raises(HTTPException) as exc:
+                await service.wait_async("missing-1", "key", BASE_URL, 10, 0.05)
+            return ok, exc.value
+
+        ok, error = asyncio.run(_run())
+        assert ok["status"] == "completed"
+        assert error.detail["status_code"] == 404 and error.detail["resume_available"] is True
+        assert service.get_job("missing-1")["status"] == "failed"
+    finally:
+        service.shutdown()
+
+
+def test_timed_out_job_keeps_polling_and_resumes_after_restart(tmp_path):
+    registry = WaveSpeedJobRegistry(str(tmp_path / "jobs.db"))
+    registry.register("job-r", BASE_URL, submitted_at=time.time())
+
+    service = _service(tmp_path, _FakeApi(checks_until_done=2))
+    try:
+        deadline = time.time() + 5
+        while time.time() < deadline and (registry.get("job-r") or {}).get("status") != "completed":
+            service.wait("other", "key", BASE_URL, 5, 0.05)  # starts the loop, which resumes job-r
+            time.sleep(0.1)
+        assert registry.get("job-r")["status"] == "completed"
+    finally:
+        service.shutdown()
+
+
+def test_adaptive_interval_is_sparse_before_expected_completion():
+    assert next_poll_interval(0, 120, 1.0, 15.0) == 15.0
+    assert next_poll_interval(110, 120, 1.0, 15.0) == 5.0
+    assert next_poll_interval(119.5, 120, 1.0, 15.0) == 1.0
+    assert next_poll_interval(5, None, 1.0, 15.0) == pytest.approx(1.0833, rel=1e-3)
+    assert next_poll_interval(10_000, None, 1.0, 15.0) == 15.0
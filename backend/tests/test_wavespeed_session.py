@@ -0,0 +1,90 @@
+"""Pooled WaveSpeed session: streamed downloads, retries and per-class concurrency."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from fastapi import HTTPException
+
+from services.wavespeed.session import WaveSpeedSession
+
+
+class _Handler(BaseHTTPRequestHandler):
+    flaky_failures = 0
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        cls = type(self)
+        if self.path == "/flaky" and cls.flaky_failures > 0:
+            cls.flaky_failures -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/missing":
+            self.send_response(404)
+            self.send_header("Content-Length", "4")
+            self.end_headers()
+            self.wfile.write(b"gone")
+            return
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.1 if self.path == "/slow" else 0)
+        body = b"v" * (3 * 1024 * 1024 + 7)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with cls.lock:
+            cls.active -= 1
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+
+
+def test_download_streams_to_file_and_failed_download_leaves_nothing(server, tmp_path):
+    session = WaveSpeedSession()
+    dest = tmp_path / "workspace" / "scene_1.mp4"
+
+    assert session.download_to_file(f"{server}/video", dest, chunk_size=64 * 1024) == 3 * 1024 * 1024 + 7
+    assert dest.stat().st_size == 3 * 1024 * 1024 + 7
+
+    with pytest.raises(HTTPException) as exc:
+        session.download_to_file(f"{server}/missing", tmp_path / "workspace" / "scene_2.mp4")
+    assert exc.value.detail["status_code"] == 404
+    assert sorted(p.name for p in dest.parent.iterdir()) == ["scene_1.mp4"]
+
+
+def test_gets_retry_transient_errors(server):
+    _Handler.flaky_failures = 2
+    response = WaveSpeedSession(retries=3, backoff_factor=0).get(f"{server}/flaky", timeout=5)
+    assert response.status_code == 200 and _Handler.flaky_failures == 0
+
+
+def test_download_concurrency_is_bounded_per_endpoint_class(server, tmp_path):
+    _Handler.peak = 0
+    session = WaveSpeedSession(concurrency={"download": 2})
+    threads = [
+        threading.Thread(target=session.download_to_file, args=(f"{server}/slow", tmp_path / f"{i}.mp4"))
+        for i in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert _Handler.peak == 2
+    assert len(list(tmp_path.glob("*.mp4"))) == 6
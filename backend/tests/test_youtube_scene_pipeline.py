@@ -0,0 +1,128 @@
+"""YouTube scene pipeline: per-user concurrency, checkpoint reuse and in-order stitching."""
+
+import subprocess
+import threading
+import time
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from services.youtube.scene_pipeline import YouTubeScenePipeline
+from utils.video_concat import get_ffmpeg_exe, probe_clip
+
+FFMPEG = get_ffmpeg_exe()
+
+
+class _FakeRenderer:
+    """Writes a 1s clip per scene; scenes listed in fail_scenes raise a 502."""
+
+    def __init__(self, video_dir, fail_scenes=(), make_clips=False):
+        self.video_dir = video_dir
+        self.fail_scenes = set(fail_scenes)
+        self.make_clips = make_clips
+        self.rendered = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _get_user_video_dir(self, user_id, db=None):
+        self.video_dir.mkdir(parents=True, exist_ok=True)
+        return self.video_dir
+
+    def render_scene_video(self, scene, **kwargs):
+        number = scene["scene_number"]
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.rendered.append(number)
+        try:
+            # Later scenes finish first, so stitching has to wait for order
+            time.sleep(0.05 * (5 - number))
+            if number in self.fail_scenes:
+                raise HTTPException(status_code=502, detail={"error": "WaveSpeed request failed"})
+            path = self.video_dir / f"scene_{number}.mp4"
+            if self.make_clips:
+                subprocess.run(
+                    [FFMPEG, "-loglevel", "error", "-y", "-f", "lavfi", "-i", "testsrc=size=160x120:rate=24",
+                     "-t", "1", "-c:v", "libx264", "-pix_fmt", "yuv420p", str(path)],
+                    check=True,
+                )
+            else:
+                path.write_bytes(b"video")
+            return {"scene_number": number, "video_path": str(path), "video_url": f"/v/{path.name}", "cost": 0.5}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def _scenes(n):
+    return [{"scene_number": i + 1, "visual_prompt": f"scene {i + 1} visual prompt"} for i in range(n)]
+
+
+def test_scenes_run_within_user_budget_and_failed_scenes_rerender_alone(tmp_path, monkeypatch):
+    monkeypatch.setenv("ALWRITY_YOUTUBE_SCENE_CONCURRENCY", "2")
+    user_id = f"user-{uuid.uuid4().hex[:8]}"
+    renderer = _FakeRenderer(tmp_path, fail_scenes={3})
+
+    run = YouTubeScenePipeline(renderer, user_id, {}).run(_scenes(4), combine=False)
+
+    assert [o.ok for o in run["outcomes"]] == [True, True, False, True]
+    assert renderer.peak == 2
+
+    renderer.fail_scenes.clear()
+    renderer.rendered.clear()
+    retry = YouTubeScenePipeline(renderer, user_id, {}).run(_scenes(4), combine=False)
+
+    assert renderer.rendered == [3]
+    assert [o.from_checkpoint for o in retry["outcomes"]] == [True, True, False, True]
+    assert all(o.ok for o in retry["outcomes"])
+
+
+@pytest.mark.skipif(FFMPEG is None, reason="ffmpeg is not available")
+def test_successful_scenes_are_stitched_in_scene_order(tmp_path, monkeypatch):
+    monkeypatch.setenv("ALWRITY_YOUTUBE_SCENE_CONCURRENCY", "4")
+    renderer = _FakeRenderer(tmp_path, fail_scenes={2}, make_clips=True)
+    completion_order = []
+
+    run = YouTubeScenePipeline(renderer, f"user-{uuid.uuid4().hex[:8]}", {}).run(
+        _scenes(4),
+        title="Stitch",
+        on_scene_complete=lambda outcome, done, total: completion_order.append(outcome.scene_number),
+    )
+
+    assert completion_order[0] == 4
+    assert probe_clip(run["final_video"]["video_path"]).duration == pytest.approx(3.0, abs=0.2)
+    assert not list(tmp_path.glob(".stitch_*"))
+
+
+def test_render_workers_never_share_the_callers_session(tmp_path, monkeypatch):
+    from services.youtube import scene_pipeline
+
+    class _Session:
+        def __init__(self):
+            self.closed = False
+            self.thread = None
+
+        def close(self):
+            self.closed = True
+
+    opened = []
+
+    def open_session(user_id):
+        session = _Session()
+        opened.append(session)
+        return session
+
+    monkeypatch.setattr(scene_pipeline, "_open_worker_session", open_session)
+    renderer = _FakeRenderer(tmp_path)
+    used = []
+    render = renderer.render_scene_video
+    renderer.render_scene_video = lambda scene, **kwargs: used.append(kwargs["db"]) or render(scene, **kwargs)
+    caller_db = _Session()
+
+    run = YouTubeScenePipeline(renderer, f"user-{uuid.uuid4().hex[:8]}", {}, db=caller_db).run(_scenes(3), combine=False)
+
+    assert all(o.ok for o in run["outcomes"])
+    assert len(opened) == 3 and all(db in opened for db in used)
+    assert caller_db not in used and all(s.closed for s in opened)
@@ -7,7 +7,9 @@ from typing import Dict, Any, Optional
 from sqlalchemy.orm import Session
 from services.content_asset_service import ContentAssetService
 from models.content_asset_models import AssetType, AssetSource
+from utils.media_blob_store import dedup_enabled, get_media_blob_store
 import logging
+import os
 import re
 from urllib.parse import urlparse
 
@@ -37,6 +39,17 @@ def validate_file_url(file_url: str) -> bool:
         return False
 
 
+def _adopt_into_blob_store(file_path: str, mime_type: Optional[str]) -> Optional[str]:
+    """Content-address a saved media file (dedups it in place). Returns its SHA-256."""
+    if not dedup_enabled() or not os.path.isfile(file_path):
+        return None
+    try:
+        return get_media_blob_store().put_file(file_path, mime_type=mime_type).digest
+    except Exception as e:
+        logger.warning(f"Could not add {file_path} to the media blob store: {e}")
+        return None
+
+
 def save_asset_to_library(
     db: Session,
     user_id: str,
@@ -140,6 +153,10 @@ def save_asset_to_library(
             if len(title) > 200:
                 title = title[:197] + '...'
         
+        content_digest = _adopt_into_blob_store(file_path, mime_type) if file_path else None
+        if content_digest:
+            asset_metadata = {**(asset_metadata or {}), "content_sha256": content_digest}
+        
         service = ContentAssetService(db)
         asset = service.create_asset(
             user_id=user_id,
@@ -163,6 +180,12 @@ def save_asset_to_library(
         
         logger.info(f"✅ Asset saved to library: {asset.id} ({asset_type} from {source_module})")
         
+        if content_digest:
+            try:
+                get_media_blob_store().add_ref(content_digest, f"asset:{asset.id}", owner=user_id)
+            except Exception as e:
+                logger.warning(f"Failed to record blob reference for asset {asset.id}: {e}")
+        
         # Trigger SIF Indexing for all new assets (Text, Image, etc.)
         try:
             from models.website_analysis_monitoring_models import SIFIndexingTask
@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import Optional, Tuple
 import logging
 
+from utils.media_blob_store import dedup_enabled, get_media_blob_store
+
 logger = logging.getLogger(__name__)
 
 # Maximum filename length
@@ -120,6 +122,15 @@ def save_file_safely(
             safe_filename = f"{name}_{uuid.uuid4().hex[:8]}{ext}"
             file_path = directory / safe_filename
         
+        # Content-addressed write: identical bytes already stored become a hard link
+        if dedup_enabled():
+            try:
+                blob = get_media_blob_store().write_file(content, file_path)
+                logger.info(f"Successfully saved file: {file_path} ({len(content)} bytes, blob {blob.digest[:12]})")
+                return file_path, None
+            except Exception as blob_error:
+                logger.warning(f"Blob store write failed for {file_path}, writing directly: {blob_error}")
+        
         # Write file atomically (write to temp file first, then rename)
         temp_path = file_path.with_suffix(file_path.suffix + '.tmp')
         try:
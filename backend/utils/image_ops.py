@@ -0,0 +1,371 @@
+"""
+Image Encoding Operations
+
+Pure, picklable PIL functions used by the Image Studio compression and format
+conversion services. They take and return raw bytes so they can run in the
+image worker process pool (services.image_studio.image_worker_pool) without
+shipping PIL objects or base64 strings across the process boundary.
+
+This module deliberately imports nothing from the application so spawned
+worker processes start quickly.
+"""
+
+from __future__ import annotations
+
+import io
+import math
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from PIL import Image, ImageCms
+
+LOSSY_SEARCH_FORMATS = {"jpeg", "jpg", "webp"}
+
+# Longest side of the downscaled proxy used to estimate target-size quality.
+PROXY_MAX_SIDE = 640
+
+
+def decode_image(image_bytes: bytes) -> Tuple[Image.Image, str]:
+    """Open image bytes and return the PIL image and its lower-cased source format."""
+    image = Image.open(io.BytesIO(image_bytes))
+    image.load()
+    original_format = image.format.lower() if image.format else "unknown"
+    return image, original_format
+
+
+def has_transparency(image: Image.Image) -> bool:
+    return image.mode in ("RGBA", "LA", "P") and (
+        "transparency" in image.info or image.mode == "RGBA"
+    )
+
+
+def strip_metadata(image: Image.Image) -> Image.Image:
+    """Copy of the image without EXIF/XMP/ICC metadata (pixels and palette kept)."""
+    stripped = image.copy()
+    stripped.info = {k: v for k, v in image.info.items() if k == "transparency"}
+    return stripped
+
+
+def encode_compressed(
+    image: Image.Image,
+    format: str,
+    quality: int,
+    progressive: bool = True,
+    optimize: bool = True,
+) -> bytes:
+    """Encode with the Compression Studio settings for jpeg/png/webp."""
+    buffer = io.BytesIO()
+    save_kwargs: Dict[str, Any] = {}
+
+    format_lower = format.lower()
+    if format_lower in ["jpeg", "jpg"]:
+        # JPEG doesn't support alpha
+        if image.mode not in ("RGB", "L", "CMYK"):
+            image = image.convert("RGB")
+        save_kwargs["format"] = "JPEG"
+        save_kwargs["quality"] = quality
+        save_kwargs["optimize"] = optimize
+        if progressive:
+            save_kwargs["progressive"] = True
+    elif format_lower == "png":
+        save_kwargs["format"] = "PNG"
+        save_kwargs["optimize"] = optimize
+        # PNG uses compress_level (0-9) instead of quality
+        save_kwargs["compress_level"] = max(0, min(9, (100 - quality) // 11))
+    elif format_lower == "webp":
+        save_kwargs["format"] = "WEBP"
+        save_kwargs["quality"] = quality
+        save_kwargs["method"] = 6  # Best compression
+    else:
+        raise ValueError(f"Unsupported format: {format}")
+
+    image.save(buffer, **save_kwargs)
+    return buffer.getvalue()
+
+
+def _search_quality(
+    encode: Callable[[int], bytes],
+    target_bytes: int,
+    low: int,
+    high: int,
+) -> Optional[Tuple[bytes, int]]:
+    """Highest quality in [low, high] whose encoding fits target_bytes (binary search)."""
+    best = None
+    while low <= high:
+        mid = (low + high) // 2
+        data = encode(mid)
+        if len(data) <= target_bytes:
+            best = (data, mid)
+            low = mid + 1
+        else:
+            high = mid - 1
+    return best
+
+
+def _highest_quality_within(
+    size_of: Callable[[int], float],
+    target_bytes: int,
+    low: int,
+    high: int,
+) -> Optional[int]:
+    """Highest quality in [low, high] whose (predicted) size fits target_bytes."""
+    best = None
+    while low <= high:
+        mid = (low + high) // 2
+        if size_of(mid) <= target_bytes:
+            best = mid
+            low = mid + 1
+        else:
+            high = mid - 1
+    return best
+
+
+def _make_proxy(image: Image.Image) -> Tuple[Image.Image, float]:
+    """Downscaled copy for quality estimation and its pixel-area ratio to the original."""
+    proxy = image.copy()
+    proxy.thumbnail((PROXY_MAX_SIDE, PROXY_MAX_SIDE), Image.BILINEAR)
+    ratio = (proxy.width * proxy.height) / float(image.width * image.height)
+    return proxy, ratio
+
+
+def compress_to_target_size(
+    image: Image.Image,
+    target_size_kb: int,
+    format: str,
+    min_quality: int = 10,
+    max_quality: int = 95,
+) -> Tuple[bytes, int]:
+    """
+    Highest quality whose encoding fits target_size_kb.
+
+    Large lossy images use a downscaled proxy as a size model until the answer is
+    bracketed: the full size at quality q is predicted as proxy_size(q) times the
+    full-to-proxy ratio measured by the full-size encodes so far (interpolated, since
+    the ratio drifts with quality as downscaling smooths away detail). Once real encodes
+    sit on both sides of the target, the next quality is interpolated in log-size
+    between them. A bisection step is taken whenever predictions stop closing in, which
+    bounds the worst case. The result is the quality a full-range binary search finds,
+    usually with fewer full-size encodes.
+    """
+    target_bytes = target_size_kb * 1024
+    full_encodes: Dict[int, bytes] = {}
+
+    def encode(quality: int) -> bytes:
+        if quality not in full_encodes:
+            full_encodes[quality] = encode_compressed(image, format, quality, True, True)
+        return full_encodes[quality]
+
+    if format.lower() not in LOSSY_SEARCH_FORMATS or max(image.size) <= 2 * PROXY_MAX_SIDE:
+        best = _search_quality(encode, target_bytes, min_quality, max_quality)
+        if best is None:
+            # Even minimum quality exceeds target, return min quality result
+            return encode(min_quality), min_quality
+        return best
+
+    proxy, area_ratio = _make_proxy(image)
+    proxy_sizes: Dict[int, int] = {}
+
+    def proxy_size(quality: int) -> int:
+        if quality not in proxy_sizes:
+            proxy_sizes[quality] = len(encode_compressed(proxy, format, quality, True, True))
+        return proxy_sizes[quality]
+
+    def size_ratio(quality: int) -> float:
+        measured = sorted((q, len(data) / proxy_size(q)) for q, data in full_encodes.items())
+        if not measured:
+            return 1 / area_ratio
+        below = [m for m in measured if m[0] <= quality]
+        above = [m for m in measured if m[0] >= quality]
+        if not below or not above:
+            # Outside the measured range: hold the nearest measured ratio
+            return below[-1][1] if below else above[0][1]
+        (q0, r0), (q1, r1) = below[-1], above[0]
+        return r0 if q0 == q1 else r0 + (r1 - r0) * (quality - q0) / (q1 - q0)
+
+    # Highest quality known to fit and lowest known not to
+    fits, too_big = min_quality - 1, max_quality + 1
+    last_fit, streak = None, 0
+    previous_width = None
+    while too_big - fits > 1:
+        low, high = fits + 1, too_big - 1
+        bracketed = fits >= min_quality and too_big <= max_quality
+        width = too_big - fits
+        if streak >= 2 and (not bracketed or width > previous_width / 2):
+            # Predictions are not closing in (same side repeatedly, or the last
+            # step did not halve the bracket): bisect to bound the worst case
+            quality = (low + high) // 2
+        elif bracketed:
+            # Bracketed by real encodes: interpolate log-size between them
+            size_low, size_high = math.log(len(encode(fits))), math.log(len(encode(too_big)))
+            position = (math.log(target_bytes) - size_low) / max(size_high - size_low, 1e-9)
+            quality = min(high, max(low, fits + int(position * (too_big - fits))))
+        else:
+            predicted = _highest_quality_within(
+                lambda q: proxy_size(q) * size_ratio(q), target_bytes, low, high
+            )
+            quality = low if predicted is None else predicted
+        previous_width = width
+        fit = len(encode(quality)) <= target_bytes
+        if fit:
+            fits = quality
+        else:
+            too_big = quality
+        streak = streak + 1 if fit == last_fit else 1
+        last_fit = fit
+
+    if fits < min_quality:
+        # Even minimum quality exceeds target, return min quality result
+        return encode(min_quality), min_quality
+    return encode(fits), fits
+
+
+def compress_image_bytes(
+    image_bytes: bytes,
+    format: str,
+    quality: int = 85,
+    target_size_kb: Optional[int] = None,
+    strip: bool = True,
+    progressive: bool = True,
+    optimize: bool = True,
+) -> Dict[str, Any]:
+    """Decode, optionally strip metadata, and compress. Returns the bytes plus image facts."""
+    image, _ = decode_image(image_bytes)
+    if strip:
+        image = strip_metadata(image)
+
+    if target_size_kb:
+        data, quality_used = compress_to_target_size(image, target_size_kb, format)
+    else:
+        data = encode_compressed(image, format, quality, progressive, optimize)
+        quality_used = quality
+
+    return {
+        "data": data,
+        "width": image.width,
+        "height": image.height,
+        "quality_used": quality_used,
+    }
+
+
+def convert_color_space(image: Image.Image, target_color_space: str) -> Image.Image:
+    """Convert between ICC color spaces; images without a profile are assumed sRGB."""
+    icc_profile = image.info.get("icc_profile")
+    if not icc_profile:
+        return image
+    if target_color_space.lower() == "srgb":
+        dst_profile = ImageCms.createProfile("sRGB")
+    elif target_color_space.lower() == "adobe rgb":
+        dst_profile = ImageCms.createProfile("Adobe RGB")
+    else:
+        return image  # Unknown color space
+    src_profile = ImageCms.ImageCmsProfile(io.BytesIO(icc_profile))
+    transform = ImageCms.ImageCmsTransform(src_profile, dst_profile, image.mode, image.mode)
+    return ImageCms.applyTransform(image, transform)
+
+
+def _flatten_to_rgb(image: Image.Image) -> Image.Image:
+    """Composite transparent images onto white."""
+    if image.mode in ("RGBA", "LA"):
+        rgb_image = Image.new("RGB", image.size, (255, 255, 255))
+        rgb_image.paste(image, mask=image.split()[-1])  # Use alpha channel as mask
+        return rgb_image
+    return image.convert("RGB")
+
+
+def encode_converted(
+    image: Image.Image,
+    target_format: str,
+    quality: Optional[int],
+    preserve_transparency: bool,
+    optimize: bool,
+    progressive: bool,
+) -> bytes:
+    """Encode with the Format Converter settings for the target format."""
+    buffer = io.BytesIO()
+    format_lower = target_format.lower()
+    save_kwargs: Dict[str, Any] = {}
+    transparent = has_transparency(image)
+
+    if format_lower in ["jpeg", "jpg"]:
+        # JPEG doesn't support transparency
+        if transparent and preserve_transparency:
+            image = _flatten_to_rgb(image)
+        elif image.mode not in ("RGB", "L", "CMYK"):
+            image = image.convert("RGB")
+        save_kwargs["format"] = "JPEG"
+        save_kwargs["quality"] = quality or 95  # Default high quality
+        save_kwargs["optimize"] = optimize
+        if progressive:
+            save_kwargs["progressive"] = True
+
+    elif format_lower == "png":
+        save_kwargs["format"] = "PNG"
+        save_kwargs["optimize"] = optimize
+        # PNG compression level (0-9)
+        save_kwargs["compress_level"] = max(0, min(9, (100 - quality) // 11)) if quality else 6
+
+    elif format_lower == "webp":
+        save_kwargs["format"] = "WEBP"
+        save_kwargs["quality"] = quality or 80
+        save_kwargs["method"] = 6  # Best compression
+        if preserve_transparency and transparent and image.mode not in ("RGBA", "LA"):
+            image = image.convert("RGBA")
+
+    elif format_lower == "gif":
+        save_kwargs["format"] = "GIF"
+        if image.mode != "P":
+            # Convert to palette mode for GIF
+            image = image.convert("P", palette=Image.ADAPTIVE)
+        save_kwargs["optimize"] = optimize
+        if preserve_transparency and transparent:
+            save_kwargs["transparency"] = 255
+
+    elif format_lower == "bmp":
+        save_kwargs["format"] = "BMP"
+        if transparent:
+            # BMP doesn't support transparency
+            image = _flatten_to_rgb(image) if image.mode == "RGBA" else image.convert("RGB")
+
+    elif format_lower == "tiff":
+        save_kwargs["format"] = "TIFF"
+        save_kwargs["compression"] = "tiff_lzw"  # Lossless compression
+        if preserve_transparency and transparent and image.mode not in ("RGBA", "LA"):
+            image = image.convert("RGBA")
+    else:
+        raise ValueError(f"Unsupported target format: {target_format}")
+
+    image.save(buffer, **save_kwargs)
+    return buffer.getvalue()
+
+
+def convert_image_bytes(
+    image_bytes: bytes,
+    target_format: str,
+    quality: Optional[int] = None,
+    preserve_transparency: bool = True,
+    color_space: Optional[str] = None,
+    strip: bool = False,
+    optimize: bool = True,
+    progressive: bool = True,
+) -> Dict[str, Any]:
+    """Decode, optionally convert color space / strip metadata, and re-encode."""
+    image, original_format = decode_image(image_bytes)
+    transparent = has_transparency(image)
+
+    color_space_warning = None
+    if color_space:
+        try:
+            image = convert_color_space(image, color_space)
+        except Exception as e:
+            color_space_warning = str(e)
+    if strip:
+        image = strip_metadata(image)
+
+    data = encode_converted(image, target_format, quality, preserve_transparency, optimize, progressive)
+    return {
+        "data": data,
+        "original_format": original_format,
+        "has_transparency": transparent,
+        "width": image.width,
+        "height": image.height,
+        "color_space_warning": color_space_warning,
+    }
@@ -0,0 +1,437 @@
+"""
+Content-Addressed Media Blob Store
+
+Generated images, audio and video are stored once per distinct content, keyed by
+SHA-256. The files modules write under the per-user workspaces become hard links to
+the stored blob, so every existing path and URL keeps working. Identical bytes
+share one inode, whether they come from regenerated scenes, re-uploads or cached
+provider outputs.
+
+Sharing an inode means sharing its permissions and its bytes: an in-place write to
+one linked file shows up in every other one, across users. Deduplication is
+therefore opt-in (ALWRITY_MEDIA_DEDUP), and the store never changes the permissions
+of the files it links. A blob modified in place no longer matches its index entry
+and is stored afresh on the next write of that content.
+
+Layout (under ALWRITY_MEDIA_BLOB_DIR, default <workspace root>/_blobs):
+    objects/ab/<sha256>    blob content (user files link to it)
+    index.db               SQLite index: blobs, references, known paths
+
+References come from the asset library ("asset:<id>"). A blob is garbage once it has
+no references and no user file links to it any more (link count 1). Collecting it
+then frees the space. Removing a blob never breaks a user file: the file keeps its
+own link to the inode.
+
+Where hard links are unsupported (other filesystems, some platforms), files stay
+as written and no blob is stored for them: a copy would store the content twice.
+Their digests are still indexed for ETags.
+
+Configuration (environment):
+    ALWRITY_MEDIA_BLOB_DIR          blob store root
+    ALWRITY_MEDIA_DEDUP             "1" enables deduplication on write (default off)
+    ALWRITY_MEDIA_BLOB_GC_GRACE     seconds an unreferenced blob is kept (default 3600)
+"""
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+from loguru import logger
+
+from utils.storage_paths import get_workspace_root
+
+PathLike = Union[str, Path]
+
+_DEFAULT_GC_GRACE_SECONDS = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    mime_type TEXT,
+    touched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS refs (
+    ref_key TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    owner TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_refs_digest ON refs (digest);
+CREATE INDEX IF NOT EXISTS idx_refs_owner_digest ON refs (owner, digest);
+CREATE TABLE IF NOT EXISTS paths (
+    path TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+"""
+
+
+def dedup_enabled() -> bool:
+    return os.getenv("ALWRITY_MEDIA_DEDUP", "0").strip().lower() in ("1", "true", "yes", "on")
+
+
+def hash_file(path: PathLike, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def strong_etag(digest: str) -> str:
+    """Strong HTTP ETag for content with the given SHA-256."""
+    return f'"{digest}"'
+
+
+@dataclass(frozen=True)
+class BlobInfo:
+    """A stored blob."""
+
+    digest: str
+    size: int
+    path: Path
+    mime_type: Optional[str] = None
+
+    @property
+    def etag(self) -> str:
+        return strong_etag(self.digest)
+
+
+class MediaBlobStore:
+    """SHA-256 keyed blob store with hard-link dedup, asset references and GC."""
+
+    def __init__(self, root: PathLike):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------ index
+
+    @contextmanager
+    def _db(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            if self._conn is None:
+                self.root.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.root / "index.db"), check_same_thread=False, isolation_level=None)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(_SCHEMA)
+                self._conn = conn
+            yield self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ---------------------------------------------------------------- objects
+
+    def object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _intact(self, digest: str) -> Optional[os.stat_result]:
+        """Stat of the stored object if it still matches what was indexed (not modified in place)."""
+        with self._db() as db:
+            row = db.execute("SELECT size, mtime_ns FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        try:
+            st = self.object_path(digest).stat()
+        except FileNotFoundError:
+            return None
+        if row is None or (st.st_size, st.st_mtime_ns) != (row[0], row[1]):
+            return None
+        return st
+
+    def _register(self, digest: str, mime_type: Optional[str]) -> BlobInfo:
+        obj = self.object_path(digest)
+        st = obj.stat()
+        with self._db() as db:
+            db.execute(
+                "INSERT INTO blobs (digest, size, mtime_ns, mime_type, touched_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(digest) DO UPDATE SET size = excluded.size, mtime_ns = excluded.mtime_ns, "
+                "mime_type = COALESCE(blobs.mime_type, excluded.mime_type), touched_at = excluded.touched_at",
+                (digest, st.st_size, st.st_mtime_ns, mime_type, time.time()),
+            )
+        return BlobInfo(digest, st.st_size, obj, mime_type)
+
+    def _detach_object(self, digest: str):
+        """Drop a stored object from the store (its inode lives on in any linked user files)."""
+        try:
+            self.object_path(digest).unlink()
+        except FileNotFoundError:
+            pass
+
+    def get(self, digest: str) -> Optional[BlobInfo]:
+        """Stored blob for digest, or None if absent or no longer intact."""
+        st = self._intact(digest)
+        if st is None:
+            return None
+        with self._db() as db:
+            row = db.execute("SELECT mime_type FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        return BlobInfo(digest, st.st_size, self.object_path(digest), row[0] if row else None)
+
+    def put_bytes(self, content: bytes, mime_type: Optional[str] = None) -> BlobInfo:
+        """Store content (a no-op write if identical bytes are already stored)."""
+        digest = hashlib.sha256(content).hexdigest()
+        with self._lock:
+            if self._intact(digest) is None:
+                self._detach_object(digest)
+                obj = self.object_path(digest)
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                tmp = obj.with_name(f".{digest}.{uuid.uuid4().hex[:8]}.tmp")
+                try:
+                    with open(tmp, "wb") as f:
+                        f.write(content)
+                    os.replace(tmp, obj)
+                finally:
+                    if tmp.exists():
+                        tmp.unlink()
+            return self._register(digest, mime_type)
+
+    def put_file(self, path: PathLike, mime_type: Optional[str] = None) -> BlobInfo:
+        """
+        Adopt an existing file into the store.
+
+        If identical content is already stored, the file is atomically replaced by a hard
+        link to the stored blob (freeing its space); otherwise the file itself becomes
+        the stored blob. Without hard links the file is left alone and no blob is
+        stored; the returned info then points at the file itself.
+        """
+        path = Path(path)
+        digest = self.digest_for_path(path)
+        with self._lock:
+            if self._intact(digest) is not None:
+                if not self._same_inode(self.object_path(digest), path):
+                    # The file already holds the same bytes; without a link it stays as is
+                    self._link_over(self.object_path(digest), path, copy=False)
+            else:
+                self._detach_object(digest)
+                obj = self.object_path(digest)
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    os.link(path, obj)
+                except OSError:
+                    st = path.stat()
+                    return BlobInfo(digest, st.st_size, path, mime_type)
+            info = self._register(digest, mime_type)
+            self._remember_path(path, digest)
+            return info
+
+    def write_file(self, content: bytes, dest: PathLike, mime_type: Optional[str] = None) -> BlobInfo:
+        """Write content to dest and adopt it (see put_file): a link to stored identical bytes when possible."""
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                f.write(content)
+            os.replace(tmp, dest)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        self._remember_path(dest, hashlib.sha256(content).hexdigest())
+        return self.put_file(dest, mime_type)
+
+    def link_to(self, digest: str, dest: PathLike) -> Path:
+        """Materialize a stored blob at dest, replacing anything already there."""
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        self._link_over(self.object_path(digest), dest)
+        self._remember_path(dest, digest)
+        return dest
+
+    @staticmethod
+    def _same_inode(a: Path, b: Path) -> bool:
+        try:
+            return os.path.samefile(a, b)
+        except OSError:
+            return False
+
+    @staticmethod
+    def _link_over(source: Path, dest: Path, copy: bool = True) -> bool:
+        """Replace dest by a link to source (or, with `copy`, a copy). False if dest was left alone."""
+        tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex[:8]}.link")
+        try:
+            try:
+                os.link(source, tmp)
+            except OSError:
+                if not copy:
+                    return False
+                shutil.copyfile(source, tmp)
+            os.replace(tmp, dest)
+            return True
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+
+    # ------------------------------------------------------------------ paths
+
+    def _remember_path(self, path: Path, digest: str):
+        st = path.stat()
+        with self._db() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO paths (path, digest, size, mtime_ns) VALUES (?, ?, ?, ?)",
+                (str(path.resolve()), digest, st.st_size, st.st_mtime_ns),
+            )
+
+    def digest_for_path(self, path: PathLike) -> str:
+        """SHA-256 of a file, from the index when the file is unchanged since it was hashed."""
+        path = Path(path)
+        st = path.stat()
+        key = str(path.resolve())
+        with self._db() as db:
+            row = db.execute("SELECT digest, size, mtime_ns FROM paths WHERE path = ?", (key,)).fetchone()
+        if row and (row[1], row[2]) == (st.st_size, st.st_mtime_ns):
+            return row[0]
+        digest = hash_file(path)
+        with self._db() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO paths (path, digest, size, mtime_ns) VALUES (?, ?, ?, ?)",
+                (key, digest, st.st_size, st.st_mtime_ns),
+            )
+        return digest
+
+    def cached_digest(self, path: PathLike, st: Optional[os.stat_result] = None) -> Optional[str]:
+        """SHA-256 of a file if it is indexed and unchanged since; never hashes."""
+        path = Path(path)
+        st = st or path.stat()
+        with self._db() as db:
+            row = db.execute(
+                "SELECT digest, size, mtime_ns FROM paths WHERE path = ?", (str(path.resolve()),)
+            ).fetchone()
+        if row and (row[1], row[2]) == (st.st_size, st.st_mtime_ns):
+            return row[0]
+        return None
+
+    def etag_for_path(self, path: PathLike) -> str:
+        """Strong ETag for a file (cached by size and mtime)."""
+        return strong_etag(self.digest_for_path(path))
+
+    # ------------------------------------------------------------- references
+
+    def add_ref(self, digest: str, ref_key: str, owner: Optional[str] = None):
+        """Record that ref_key (e.g. "asset:42") uses the blob."""
+        with self._db() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO refs (ref_key, digest, owner, created_at) VALUES (?, ?, ?, ?)",
+                (ref_key, digest, owner, time.time()),
+            )
+
+    def release_ref(self, ref_key: str) -> Optional[str]:
+        """Drop a reference. Returns the digest it pointed to, if any."""
+        with self._db() as db:
+            row = db.execute("SELECT digest FROM refs WHERE ref_key = ?", (ref_key,)).fetchone()
+            if row is None:
+                return None
+            db.execute("DELETE FROM refs WHERE ref_key = ?", (ref_key,))
+            # Restart the GC grace period from the release
+            db.execute("UPDATE blobs SET touched_at = ? WHERE digest = ?", (time.time(), row[0]))
+        return row[0]
+
+    def refcount(self, digest: str) -> int:
+        with self._db() as db:
+            return db.execute("SELECT COUNT(*) FROM refs WHERE digest = ?", (digest,)).fetchone()[0]
+
+    def is_owned_by(self, digest: str, owner: str) -> bool:
+        with self._db() as db:
+            row = db.execute("SELECT 1 FROM refs WHERE owner = ? AND digest = ? LIMIT 1", (owner, digest)).fetchone()
+        return row is not None
+
+    # -------------------------------------------------------------------- GC
+
+    def collect_garbage(self, grace_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Delete blobs with no references that no user file links to any more.
+
+        Blobs written or released within the grace period are kept, so a write that
+        has not been registered with the asset library yet is never lost.
+        """
+        if grace_seconds is None:
+            grace_seconds = float(os.getenv("ALWRITY_MEDIA_BLOB_GC_GRACE", _DEFAULT_GC_GRACE_SECONDS))
+        cutoff = time.time() - grace_seconds
+        stats = {"scanned": 0, "deleted": 0, "bytes_freed": 0, "still_linked": 0, "orphans_deleted": 0}
+
+        with self._lock:
+            with self._db() as db:
+                candidates = db.execute(
+                    "SELECT b.digest FROM blobs b LEFT JOIN refs r ON r.digest = b.digest "
+                    "WHERE r.digest IS NULL AND b.touched_at < ?",
+                    (cutoff,),
+                ).fetchall()
+            for (digest,) in candidates:
+                stats["scanned"] += 1
+                obj = self.object_path(digest)
+                try:
+                    st = obj.stat()
+                except FileNotFoundError:
+                    st = None
+                if st is not None and st.st_nlink > 1:
+                    stats["still_linked"] += 1
+                    continue
+                if st is not None:
+                    obj.unlink()
+                    stats["deleted"] += 1
+                    stats["bytes_freed"] += st.st_size
+                with self._db() as db:
+                    db.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+                    db.execute("DELETE FROM paths WHERE digest = ?", (digest,))
+
+            # Objects left behind by interrupted writes
+            if self.objects_dir.exists():
+                with self._db() as db:
+                    known = {row[0] for row in db.execute("SELECT digest FROM blobs")}
+                for obj in self.objects_dir.glob("*/*"):
+                    try:
+                        st = obj.stat()
+                    except FileNotFoundError:
+                        continue
+                    if obj.name in known or st.st_mtime > cutoff or st.st_nlink > 1:
+                        continue
+                    obj.unlink()
+                    stats["orphans_deleted"] += 1
+                    stats["bytes_freed"] += st.st_size
+
+        logger.info(f"[MediaBlobStore] GC: {stats}")
+        return stats
+
+    def stats(self) -> Dict[str, Any]:
+        with self._db() as db:
+            blobs, stored_bytes = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM blobs").fetchone()
+            refs = db.execute("SELECT COUNT(*) FROM refs").fetchone()[0]
+            linked_paths, logical_bytes = db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM paths WHERE digest IN (SELECT digest FROM blobs)"
+            ).fetchone()
+        return {
+            "blobs": blobs,
+            "stored_bytes": stored_bytes,
+            "references": refs,
+            "linked_paths": linked_paths,
+            "logical_bytes": logical_bytes,
+        }
+
+
+_store: Optional[MediaBlobStore] = None
+_store_lock = threading.Lock()
+
+
+def get_media_blob_store() -> MediaBlobStore:
+    """Process-wide media blob store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                root = os.getenv("ALWRITY_MEDIA_BLOB_DIR") or str(get_workspace_root() / "_blobs")
+                _store = MediaBlobStore(root)
+    return _store
@@ -0,0 +1,262 @@
+"""
+Workspace Media Serving
+
+Shared response class for the media endpoints of the Image, Video, Story, Podcast
+and YouTube routers. One stat per request drives every header, and then:
+
+- Conditional requests: If-None-Match / If-Modified-Since answer 304, so repeat views
+  transfer no body. ETags are the content SHA-256 when the media blob store has
+  indexed the file (see utils.media_blob_store), otherwise inode/size/mtime.
+- Range requests (single and multi-range, If-Range), so players can seek without
+  re-downloading.
+- Zero-copy where the stack allows it:
+    * a reverse proxy serves the file itself (nginx X-Accel-Redirect or
+      Apache/lighttpd X-Sendfile) when ALWRITY_MEDIA_OFFLOAD is set;
+    * ASGI servers offering the zerocopysend / pathsend extensions get the open
+      file or path and call sendfile themselves;
+    * otherwise the file is streamed in 1 MiB chunks.
+
+Configuration (environment):
+    ALWRITY_MEDIA_OFFLOAD           "x-accel-redirect" or "x-sendfile" (default off)
+    ALWRITY_MEDIA_OFFLOAD_ROOT      filesystem root the proxy can serve (default: workspace root)
+    ALWRITY_MEDIA_OFFLOAD_PREFIX    nginx internal location for that root (default /_protected_media)
+"""
+
+import os
+import stat
+import threading
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Hashable, Mapping, Optional, Union
+from urllib.parse import quote
+
+import anyio
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, PlainTextResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from utils.media_blob_store import dedup_enabled, get_media_blob_store
+from utils.storage_paths import get_workspace_root
+
+PathLike = Union[str, Path]
+
+# Revalidate on every view; unchanged media costs a 304 and no body
+DEFAULT_CACHE_CONTROL = "private, no-cache"
+# For URLs whose content can never change (content-addressed)
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+_VALIDATOR_HEADERS = ("etag", "last-modified", "cache-control", "content-location", "vary")
+
+_PATH_CACHE_SIZE = 2048
+_path_cache: "OrderedDict[Hashable, Path]" = OrderedDict()
+_path_cache_lock = threading.Lock()
+
+
+def resolve_media_path(base_dir: PathLike, filename: str) -> Path:
+    """
+    Resolve a requested filename inside base_dir, rejecting traversal.
+
+    Raises HTTPException 404 if the name escapes base_dir.
+    """
+    base = Path(base_dir).resolve()
+    path = (base / os.path.basename(filename)).resolve()
+    if path.parent != base:
+        raise HTTPException(status_code=404, detail="File not found")
+    return path
+
+
+def cached_media_lookup(key: Hashable, finder: Callable[[], Optional[PathLike]]) -> Optional[Path]:
+    """
+    Resolve a media location once and reuse it for later requests.
+
+    Video players issue many Range requests for the same file; endpoints that locate
+    files by searching several directories call this instead of searching each time.
+    A cached path that no longer exists is looked up again.
+
+    Args:
+        key: Hashable lookup key, e.g. ("video_studio", filename)
+        finder: Returns the file path, or None if it does not exist
+
+    Returns:
+        Resolved path, or None if not found
+    """
+    with _path_cache_lock:
+        path = _path_cache.get(key)
+        if path is not None:
+            _path_cache.move_to_end(key)
+    if path is not None and path.is_file():
+        return path
+
+    found = finder()
+    with _path_cache_lock:
+        if found is None:
+            _path_cache.pop(key, None)
+            return None
+        path = Path(found).resolve()
+        _path_cache[key] = path
+        while len(_path_cache) > _PATH_CACHE_SIZE:
+            _path_cache.popitem(last=False)
+    return path
+
+
+def media_etag(path: PathLike, st: os.stat_result) -> str:
+    """Strong validator for a file: its content hash when indexed, else inode/size/mtime."""
+    if dedup_enabled():
+        try:
+            digest = get_media_blob_store().cached_digest(path, st)
+            if digest:
+                return f'"{digest}"'
+        except Exception:
+            pass
+    return f'"{st.st_ino:x}-{st.st_size:x}-{st.st_mtime_ns:x}"'
+
+
+def _offload_header(path: PathLike) -> Optional[tuple]:
+    mode = os.getenv("ALWRITY_MEDIA_OFFLOAD", "").strip().lower()
+    if mode not in ("x-accel-redirect", "x-sendfile"):
+        return None
+    resolved = Path(path).resolve()
+    root = Path(os.getenv("ALWRITY_MEDIA_OFFLOAD_ROOT") or get_workspace_root()).resolve()
+    if root not in resolved.parents:
+        return None
+    if mode == "x-sendfile":
+        return ("X-Sendfile", str(resolved))
+    prefix = os.getenv("ALWRITY_MEDIA_OFFLOAD_PREFIX", "/_protected_media").rstrip("/")
+    return ("X-Accel-Redirect", prefix + "/" + quote(resolved.relative_to(root).as_posix()))
+
+
+class MediaFileResponse(FileResponse):
+    """FileResponse with 304 handling, content ETags, cache headers and zero-copy sends."""
+
+    chunk_size = 1024 * 1024
+
+    def __init__(
+        self,
+        path: PathLike,
+        media_type: Optional[str] = None,
+        filename: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        cache_control: str = DEFAULT_CACHE_CONTROL,
+        etag: Optional[str] = None,
+        stat_result: Optional[os.stat_result] = None,
+        content_disposition_type: str = "attachment",
+        **kwargs,
+    ):
+        """
+        Args:
+            path: Resolved file path
+            media_type: MIME type (guessed from the name if omitted)
+            filename: Download name for Content-Disposition (omitted if None)
+            headers: Extra response headers
+            cache_control: Cache-Control header value
+            etag: Known strong ETag (e.g. a blob digest); computed from the file otherwise
+            stat_result: Already-taken stat of the file, to avoid another stat
+            content_disposition_type: "attachment" or "inline" when filename is given
+        """
+        self._etag = etag
+        super().__init__(
+            path,
+            headers=headers,
+            media_type=media_type,
+            filename=filename,
+            content_disposition_type=content_disposition_type,
+            **kwargs,
+        )
+        self.headers.setdefault("cache-control", cache_control)
+        if stat_result is not None:
+            self.stat_result = stat_result
+            self.set_stat_headers(stat_result)
+
+    def set_stat_headers(self, stat_result: os.stat_result) -> None:
+        self.headers.setdefault("etag", self._etag or media_etag(self.path, stat_result))
+        self.headers.setdefault("last-modified", formatdate(stat_result.st_mtime, usegmt=True))
+        super().set_stat_headers(stat_result)
+
+    def _not_modified(self, request_headers: Headers) -> bool:
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None:
+            if if_none_match.strip() == "*":
+                return True
+            # Weak comparison, as RFC 9110 prescribes for If-None-Match
+            etag = self.headers["etag"].removeprefix("W/")
+            return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+        if_modified_since = request_headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return int(self.stat_result.st_mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if self.stat_result is None:
+            try:
+                stat_result = await anyio.to_thread.run_sync(os.stat, self.path)
+            except FileNotFoundError:
+                stat_result = None
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                return await PlainTextResponse("File not found", status_code=404)(scope, receive, send)
+            self.stat_result = stat_result
+            self.set_stat_headers(stat_result)
+
+        request_headers = Headers(scope=scope)
+        method = scope["method"].upper()
+        if method in ("GET", "HEAD") and self._not_modified(request_headers):
+            validators = {k: v for k, v in self.headers.items() if k in _VALIDATOR_HEADERS}
+            return await Response(status_code=304, headers=validators)(scope, receive, send)
+
+        offload = _offload_header(self.path)
+        if offload is not None:
+            # The proxy serves the body (with its own Range and sendfile support)
+            self.headers[offload[0]] = offload[1]
+            del self.headers["content-length"]
+            await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif not await self._send_zero_copy(scope, request_headers, send, method == "HEAD"):
+            return await super().__call__(scope, receive, send)
+
+        if self.background is not None:
+            await self.background()
+
+    async def _send_zero_copy(self, scope: Scope, request_headers: Headers, send: Send, header_only: bool) -> bool:
+        """Hand the file to the server's sendfile support if it offers one. Returns False otherwise."""
+        extensions = scope.get("extensions") or {}
+        zerocopy = "http.response.zerocopysend" in extensions
+        pathsend = "http.response.pathsend" in extensions
+        if header_only or not (zerocopy or pathsend):
+            return False
+
+        size = self.stat_result.st_size
+        http_range = request_headers.get("range")
+        http_if_range = request_headers.get("if-range")
+        if http_range is not None and (http_if_range is None or self._should_use_range(http_if_range)):
+            if not zerocopy:
+                return False
+            try:
+                ranges = self._parse_range_header(http_range, size)
+            except Exception:
+                return False  # Let FileResponse produce the 400/416
+            if len(ranges) != 1:
+                return False
+            start, end = ranges[0]
+            self.headers["content-range"] = f"bytes {start}-{end - 1}/{size}"
+            self.headers["content-length"] = str(end - start)
+            status_code = 206
+        else:
+            start, end, status_code = 0, size, self.status_code
+
+        await send({"type": "http.response.start", "status": status_code, "headers": self.raw_headers})
+        if zerocopy:
+            with open(self.path, "rb") as file:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": file,
+                    "offset": start,
+                    "count": end - start,
+                    "more_body": False,
+                })
+        else:
+            await send({"type": "http.response.pathsend", "path": str(Path(self.path).resolve())})
+        return True
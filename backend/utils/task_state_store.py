@@ -0,0 +1,382 @@
+"""
+Durable Task State Store
+
+Shared state for long-running background jobs (blog, story, podcast, video studio and
+YouTube tasks). Task managers used to keep this in per-process dictionaries, so a
+worker restart, or a status poll routed to another gunicorn worker, lost the job.
+Here every worker reads and writes one SQLite database in WAL mode: readers never
+block the writer, and a progress update is a single-row UPDATE.
+
+Each task row carries a version that increases on every change. Status endpoints
+return it, and clients long-poll with `wait_for_change(task_id, since=version)`.
+The call returns as soon as the task changes instead of the client re-polling
+unchanged state. Writers in the same process wake waiters immediately; changes made
+by other workers are noticed on a short re-check interval.
+
+Tasks that were running in a worker that has since died are reported by
+`interrupted_tasks` and can be marked failed (or resumed by the caller) with
+`mark_interrupted`.
+
+Configuration (environment):
+    ALWRITY_TASK_STATE_DB           database path (default <workspace root>/_tasks/task_state.db)
+    ALWRITY_TASK_STATE_TTL          seconds finished tasks are kept (default 86400)
+"""
+
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from loguru import logger
+
+from utils.storage_paths import get_workspace_root
+
+PathLike = Union[str, Path]
+
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+_MAX_MESSAGES = 20
+_DEFAULT_TTL_SECONDS = 86400
+_CROSS_WORKER_RECHECK_SECONDS = 0.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    task_type TEXT,
+    owner TEXT,
+    status TEXT NOT NULL,
+    progress REAL,
+    messages TEXT NOT NULL DEFAULT '[]',
+    result TEXT,
+    error TEXT,
+    error_status INTEGER,
+    error_data TEXT,
+    metadata TEXT NOT NULL DEFAULT '{}',
+    extra TEXT NOT NULL DEFAULT '{}',
+    version INTEGER NOT NULL DEFAULT 1,
+    worker TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_namespace_status ON tasks (namespace, status);
+CREATE INDEX IF NOT EXISTS idx_tasks_updated ON tasks (updated_at);
+"""
+
+_JSON_COLUMNS = ("messages", "result", "error_data", "metadata", "extra")
+
+_UNSET = object()
+
+
+def _dumps(value: Any) -> str:
+    # Results may carry Paths or datetimes; store them as strings
+    return json.dumps(value, default=str)
+
+
+# Host and pid repeat across container restarts (the app is often pid 1 again), so a
+# per-boot nonce tells this process apart from the one that wrote a task before a restart
+_BOOT_NONCE = uuid.uuid4().hex[:12]
+
+
+def worker_id() -> str:
+    """Identifies this process: host, pid and boot nonce."""
+    return f"{socket.gethostname()}:{os.getpid()}:{_BOOT_NONCE}"
+
+
+def _worker_alive(worker: Optional[str]) -> bool:
+    if not worker:
+        return False
+    parts = worker.split(":")
+    if len(parts) < 3:
+        parts.append("")  # Written before worker IDs carried a nonce
+    host, pid, nonce = ":".join(parts[:-2]), parts[-2], parts[-1]
+    if host != socket.gethostname():
+        return True  # Cannot tell for other hosts; rely on age instead
+    if pid == str(os.getpid()):
+        return nonce == _BOOT_NONCE  # Same pid, earlier boot: that process is gone
+    try:
+        os.kill(int(pid), 0)
+    except (ValueError, ProcessLookupError):
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def iso_timestamp(ts: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat() if ts else None
+
+
+class TaskStateStore:
+    """SQLite (WAL) task state shared by all workers, with versioned change notification."""
+
+    def __init__(self, path: PathLike):
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._waiters: Dict[str, List[tuple]] = {}
+        self._waiters_lock = threading.Lock()
+
+    # ------------------------------------------------------------ connection
+
+    @contextmanager
+    def _db(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            if self._conn is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None, timeout=30)
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(_SCHEMA)
+                self._conn = conn
+            yield self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ----------------------------------------------------------------- tasks
+
+    def create(
+        self,
+        namespace: str,
+        task_type: Optional[str] = None,
+        owner: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        status: str = "pending",
+        task_id: Optional[str] = None,
+    ) -> str:
+        """Create a task and return its ID."""
+        task_id = task_id or str(uuid.uuid4())
+        now = time.time()
+        with self._db() as db:
+            db.execute(
+                "INSERT INTO tasks (task_id, namespace, task_type, owner, status, progress, metadata, worker, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, 0.0, ?, ?, ?, ?)",
+                (task_id, namespace, task_type, owner, status, _dumps(metadata or {}), worker_id(), now, now),
+            )
+        return task_id
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        """Task record as a dict (JSON columns decoded), or None."""
+        with self._db() as db:
+            row = db.execute("SELECT * FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return self._decode(row) if row else None
+
+    def version(self, task_id: str) -> Optional[int]:
+        with self._db() as db:
+            row = db.execute("SELECT version FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+        return row[0] if row else None
+
+    def update(
+        self,
+        task_id: str,
+        status: Optional[str] = None,
+        progress: Optional[float] = None,
+        message: Optional[Any] = None,
+        result: Any = _UNSET,
+        error: Any = _UNSET,
+        error_status: Any = _UNSET,
+        error_data: Any = _UNSET,
+        extra: Optional[Dict[str, Any]] = None,
+        max_messages: int = _MAX_MESSAGES,
+    ) -> Optional[int]:
+        """
+        Apply a change to a task and return its new version (None if the task is unknown).
+
+        Only the given fields change. `message` is appended to the message list (the
+        last `max_messages` are kept). `extra` is merged into the free-form extra dict;
+        a key set to None is removed. An update that changes nothing does not bump the
+        version, so waiting clients are not woken for it.
+        """
+        with self._db() as db:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                row = db.execute("SELECT * FROM tasks WHERE task_id = ?", (task_id,)).fetchone()
+                if row is None:
+                    db.execute("ROLLBACK")
+                    return None
+                current = self._decode(row)
+                changes: Dict[str, Any] = {}
+                if status is not None and status != current["status"]:
+                    changes["status"] = status
+                if progress is not None and progress != current["progress"]:
+                    changes["progress"] = progress
+                if message is not None:
+                    changes["messages"] = _dumps((current["messages"] + [message])[-max_messages:])
+                for column, value in (("result", result), ("error_data", error_data)):
+                    if value is not _UNSET and value != current[column]:
+                        changes[column] = _dumps(value) if value is not None else None
+                for column, value in (("error", error), ("error_status", error_status)):
+                    if value is not _UNSET and value != current[column]:
+                        changes[column] = value
+                if extra:
+                    merged = dict(current["extra"])
+                    for key, value in extra.items():
+                        if value is None:
+                            merged.pop(key, None)
+                        else:
+                            merged[key] = value
+                    if merged != current["extra"]:
+                        changes["extra"] = _dumps(merged)
+                if not changes:
+                    db.execute("COMMIT")
+                    return current["version"]
+
+                changes["updated_at"] = time.time()
+                changes["worker"] = worker_id()
+                assignments = ", ".join(f"{column} = ?" for column in changes)
+                db.execute(
+                    f"UPDATE tasks SET {assignments}, version = version + 1 WHERE task_id = ?",
+                    (*changes.values(), task_id),
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        self._notify(task_id)
+        return current["version"] + 1
+
+    def delete(self, task_id: str):
+        with self._db() as db:
+            db.execute("DELETE FROM tasks WHERE task_id = ?", (task_id,))
+        self._notify(task_id)
+
+    def count(self, namespace: Optional[str] = None) -> int:
+        with self._db() as db:
+            if namespace is None:
+                return db.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+            return db.execute("SELECT COUNT(*) FROM tasks WHERE namespace = ?", (namespace,)).fetchone()[0]
+
+    def cleanup(self, max_age_seconds: Optional[float] = None, namespace: Optional[str] = None) -> int:
+        """Delete finished tasks not updated for max_age_seconds (default ALWRITY_TASK_STATE_TTL)."""
+        if max_age_seconds is None:
+            max_age_seconds = float(os.getenv("ALWRITY_TASK_STATE_TTL", _DEFAULT_TTL_SECONDS))
+        cutoff = time.time() - max_age_seconds
+        placeholders = ", ".join("?" for _ in FINISHED_STATUSES)
+        query = f"DELETE FROM tasks WHERE updated_at < ? AND status IN ({placeholders})"
+        params: List[Any] = [cutoff, *FINISHED_STATUSES]
+        if namespace is not None:
+            query += " AND namespace = ?"
+            params.append(namespace)
+        with self._db() as db:
+            return db.execute(query, params).rowcount
+
+    # ------------------------------------------------------ restart recovery
+
+    def is_interrupted(self, record: Dict[str, Any], stale_after_seconds: float = 3600) -> bool:
+        """
+        Whether an unfinished task's worker is gone: a dead process on this host, or
+        no update for stale_after_seconds from another host.
+        """
+        if record["status"] in FINISHED_STATUSES or record["worker"] == worker_id():
+            return False
+        return not _worker_alive(record["worker"]) or time.time() - record["updated_at"] > stale_after_seconds
+
+    def interrupted_tasks(self, namespace: str, stale_after_seconds: float = 3600) -> List[Dict[str, Any]]:
+        """Unfinished tasks of a namespace whose worker is gone (see is_interrupted)."""
+        placeholders = ", ".join("?" for _ in FINISHED_STATUSES)
+        with self._db() as db:
+            rows = db.execute(
+                f"SELECT * FROM tasks WHERE namespace = ? AND status NOT IN ({placeholders})",
+                (namespace, *FINISHED_STATUSES),
+            ).fetchall()
+        records = [self._decode(row) for row in rows]
+        return [record for record in records if self.is_interrupted(record, stale_after_seconds)]
+
+    def mark_interrupted(self, namespace: str, stale_after_seconds: float = 3600) -> int:
+        """Fail every interrupted task of a namespace so clients stop waiting on it."""
+        count = 0
+        for record in self.interrupted_tasks(namespace, stale_after_seconds):
+            self.update(
+                record["task_id"],
+                status="failed",
+                error="Task interrupted by server restart",
+                message="Task interrupted by server restart",
+            )
+            count += 1
+        if count:
+            logger.info(f"[TaskStateStore] Marked {count} interrupted {namespace} tasks as failed")
+        return count
+
+    # -------------------------------------------------------- notification
+
+    def _notify(self, task_id: str):
+        with self._waiters_lock:
+            waiters = self._waiters.pop(task_id, [])
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    async def wait_for_change(self, task_id: str, since: Optional[int], timeout: float = 25.0) -> Optional[Dict[str, Any]]:
+        """
+        Return the task once its version exceeds `since`, or after `timeout` seconds.
+
+        Returns the current record either way (None if the task does not exist); a
+        client compares the returned version with `since` to tell the two apart.
+        """
+        deadline = time.monotonic() + max(0.0, timeout)
+        loop = asyncio.get_running_loop()
+        while True:
+            event = asyncio.Event()
+            with self._waiters_lock:
+                self._waiters.setdefault(task_id, []).append((loop, event))
+            record = await asyncio.to_thread(self.get, task_id)
+            remaining = deadline - time.monotonic()
+            if record is None or since is None or record["version"] > since or remaining <= 0:
+                self._discard_waiter(task_id, event)
+                return record
+            try:
+                # Same-process writers set the event; other workers are seen on re-check
+                await asyncio.wait_for(event.wait(), timeout=min(remaining, _CROSS_WORKER_RECHECK_SECONDS))
+            except asyncio.TimeoutError:
+                self._discard_waiter(task_id, event)
+
+    def _discard_waiter(self, task_id: str, event: asyncio.Event):
+        with self._waiters_lock:
+            waiters = self._waiters.get(task_id)
+            if waiters:
+                waiters[:] = [w for w in waiters if w[1] is not event]
+                if not waiters:
+                    del self._waiters[task_id]
+
+    # --------------------------------------------------------------- helpers
+
+    @staticmethod
+    def _decode(row: sqlite3.Row) -> Dict[str, Any]:
+        record = dict(row)
+        for column in _JSON_COLUMNS:
+            if record.get(column) is not None:
+                record[column] = json.loads(record[column])
+        record["messages"] = record.get("messages") or []
+        record["metadata"] = record.get("metadata") or {}
+        record["extra"] = record.get("extra") or {}
+        return record
+
+
+_store: Optional[TaskStateStore] = None
+_store_lock = threading.Lock()
+
+
+def get_task_state_store() -> TaskStateStore:
+    """Process-wide task state store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                path = os.getenv("ALWRITY_TASK_STATE_DB") or str(get_workspace_root() / "_tasks" / "task_state.db")
+                _store = TaskStateStore(path)
+    return _store
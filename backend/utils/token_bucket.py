@@ -0,0 +1,88 @@
+"""
+Token buckets for rate-limited external APIs.
+
+A bucket refills at `rate` tokens per second up to `capacity` (the burst size). Each
+call takes one token; when none are left the caller waits for its reserved slot
+instead of failing, so concurrent callers are spread out at the provider's rate.
+When a provider answers 429, `penalize()` pauses the bucket for the back-off period
+(e.g. its Retry-After), so every caller backs off, not just the one that was rejected.
+
+Reservations are made under a threading lock and the waiting happens outside it, so
+one bucket can be shared by coroutines on different event loops and by plain threads.
+
+Configuration (environment):
+    ALWRITY_<NAME>_RATE    tokens per second for get_token_bucket(NAME)
+    ALWRITY_<NAME>_BURST   bucket capacity for get_token_bucket(NAME)
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """Waiting token bucket with 429 back-off."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = max(0.001, float(rate))
+        self.capacity = max(1.0, float(capacity if capacity is not None else rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token (possibly on credit) and return how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+            self._tokens -= 1
+            # While paused, _updated lies in the future: refilling resumes from there
+            debt = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return (self._updated - now) + debt
+
+    async def acquire(self) -> float:
+        """Wait for a token; returns the seconds waited."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def acquire_sync(self) -> float:
+        """Blocking acquire for code running in threads."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, seconds: float) -> None:
+        """Pause the bucket after a 429 and drop the burst, so calls resume one at a time at the base rate."""
+        with self._lock:
+            now = time.monotonic()
+            if now > self._updated:
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = max(self._updated, now + max(0.0, seconds))
+            self._tokens = min(self._tokens, 1.0)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_token_bucket(name: str, rate: float, capacity: Optional[float] = None) -> TokenBucket:
+    """Process-wide bucket for an API, overridable via ALWRITY_<NAME>_RATE / _BURST."""
+    key = name.upper()
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            try:
+                rate = float(os.getenv(f"ALWRITY_{key}_RATE", rate))
+                capacity = float(os.getenv(f"ALWRITY_{key}_BURST", capacity if capacity is not None else rate))
+            except ValueError:
+                pass
+            bucket = TokenBucket(rate, capacity)
+            _buckets[key] = bucket
+        return bucket
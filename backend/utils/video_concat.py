@@ -0,0 +1,378 @@
+"""
+FFmpeg-based scene video concatenation.
+
+Scene clips produced by the same WaveSpeed model share codec, resolution, frame rate
+and audio layout, so they can be joined with the concat demuxer and ``-c copy``: no
+decode, no re-encode, and the final file is ready in seconds. When the clips differ
+(mixed models, uploaded footage, clips without audio) each segment is re-encoded in
+parallel to one common profile and the normalized segments are then stream-copied
+together. Progress is reported from ffmpeg's ``-progress`` output, not estimated.
+
+MoviePy remains the fallback for callers when no ffmpeg binary is available.
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from loguru import logger
+
+ProgressCallback = Callable[[float, str], None]
+
+_PROGRESS_INTERVAL_SECONDS = 0.5
+_DEFAULT_SAMPLE_RATE = 44100
+
+
+class VideoConcatError(RuntimeError):
+    """Raised when ffmpeg is unavailable or a probe/concat step fails."""
+
+
+@dataclass(frozen=True)
+class ClipInfo:
+    """Stream parameters of a clip that decide whether it can be stream-copied."""
+
+    path: str
+    duration: float
+    video_codec: Optional[str]
+    width: int
+    height: int
+    fps: float
+    pix_fmt: Optional[str]
+    audio_codec: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+
+    @property
+    def has_audio(self) -> bool:
+        return self.audio_codec is not None
+
+    def signature(self) -> tuple:
+        return (
+            self.video_codec, self.width, self.height, round(self.fps, 2), self.pix_fmt,
+            self.audio_codec, self.sample_rate, self.channels,
+        )
+
+
+def get_ffmpeg_exe() -> Optional[str]:
+    """System ffmpeg if on PATH, otherwise the binary bundled with imageio-ffmpeg."""
+    exe = shutil.which("ffmpeg")
+    if exe:
+        return exe
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return None
+
+
+def _get_ffprobe_exe(ffmpeg_exe: str) -> Optional[str]:
+    sibling = Path(ffmpeg_exe).with_name("ffprobe" + Path(ffmpeg_exe).suffix)
+    if sibling.exists():
+        return str(sibling)
+    return shutil.which("ffprobe")
+
+
+def _parse_rate(value: Optional[str]) -> float:
+    if not value:
+        return 0.0
+    if "/" in value:
+        num, den = value.split("/", 1)
+        return float(num) / float(den) if float(den) else 0.0
+    return float(value)
+
+
+def _probe_with_ffprobe(ffprobe_exe: str, path: str) -> ClipInfo:
+    result = subprocess.run(
+        [
+            ffprobe_exe, "-v", "error",
+            "-show_entries",
+            "stream=codec_type,codec_name,width,height,pix_fmt,avg_frame_rate,r_frame_rate,sample_rate,channels"
+            ":format=duration",
+            "-of", "json", path,
+        ],
+        capture_output=True, text=True, timeout=60,
+    )
+    if result.returncode != 0:
+        raise VideoConcatError(f"ffprobe failed for {path}: {result.stderr.strip()[:300]}")
+    data = json.loads(result.stdout or "{}")
+    streams = data.get("streams", [])
+    video = next((s for s in streams if s.get("codec_type") == "video"), None)
+    audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+    if video is None:
+        raise VideoConcatError(f"No video stream in {path}")
+    return ClipInfo(
+        path=path,
+        duration=float(data.get("format", {}).get("duration") or 0.0),
+        video_codec=video.get("codec_name"),
+        width=int(video.get("width") or 0),
+        height=int(video.get("height") or 0),
+        fps=_parse_rate(video.get("avg_frame_rate")) or _parse_rate(video.get("r_frame_rate")),
+        pix_fmt=video.get("pix_fmt"),
+        audio_codec=audio.get("codec_name") if audio else None,
+        sample_rate=int(audio["sample_rate"]) if audio and audio.get("sample_rate") else None,
+        channels=int(audio["channels"]) if audio and audio.get("channels") else None,
+    )
+
+
+_DURATION_RE = re.compile(r"Duration: (\d+):(\d+):(\d+(?:\.\d+)?)")
+_VIDEO_RE = re.compile(
+    r"Stream #\d+:\d+.*?: Video: (?P<codec>\w+).*?, (?P<pix>[a-z0-9_]+)(?:\([^)]*\))?, (?P<w>\d+)x(?P<h>\d+)"
+)
+_FPS_RE = re.compile(r"(\d+(?:\.\d+)?) (?:fps|tbr)")
+_AUDIO_RE = re.compile(r"Stream #\d+:\d+.*?: Audio: (?P<codec>\w+).*?, (?P<rate>\d+) Hz, (?P<layout>[^,]+)")
+
+
+def _parse_channels(layout: str) -> Optional[int]:
+    layout = layout.strip()
+    if layout == "mono":
+        return 1
+    if layout == "stereo":
+        return 2
+    match = re.match(r"(\d+)(?:\.(\d+))?", layout)
+    if not match:
+        return None
+    return int(match.group(1)) + int(match.group(2) or 0)
+
+
+def _probe_with_ffmpeg(ffmpeg_exe: str, path: str) -> ClipInfo:
+    """Parse the stream banner ffmpeg prints for ``-i`` (used when ffprobe is not shipped)."""
+    result = subprocess.run(
+        [ffmpeg_exe, "-hide_banner", "-i", path],
+        capture_output=True, text=True, timeout=60,
+    )
+    output = result.stderr
+    video_line = next((line for line in output.splitlines() if ": Video: " in line), None)
+    video = _VIDEO_RE.search(video_line or "")
+    if video is None:
+        raise VideoConcatError(f"No video stream in {path}: {output.strip()[-300:]}")
+    fps = _FPS_RE.search(video_line)
+    audio_line = next((line for line in output.splitlines() if ": Audio: " in line), None)
+    audio = _AUDIO_RE.search(audio_line or "")
+    duration = _DURATION_RE.search(output)
+    return ClipInfo(
+        path=path,
+        duration=(
+            int(duration.group(1)) * 3600 + int(duration.group(2)) * 60 + float(duration.group(3))
+            if duration else 0.0
+        ),
+        video_codec=video.group("codec"),
+        width=int(video.group("w")),
+        height=int(video.group("h")),
+        fps=float(fps.group(1)) if fps else 0.0,
+        pix_fmt=video.group("pix"),
+        audio_codec=audio.group("codec") if audio else None,
+        sample_rate=int(audio.group("rate")) if audio else None,
+        channels=_parse_channels(audio.group("layout")) if audio else None,
+    )
+
+
+def probe_clip(path: Union[str, Path], ffmpeg_exe: Optional[str] = None) -> ClipInfo:
+    """Read codec, resolution, frame rate, audio layout and duration of a clip."""
+    ffmpeg_exe = ffmpeg_exe or get_ffmpeg_exe()
+    if not ffmpeg_exe:
+        raise VideoConcatError("ffmpeg is not available")
+    ffprobe_exe = _get_ffprobe_exe(ffmpeg_exe)
+    if ffprobe_exe:
+        return _probe_with_ffprobe(ffprobe_exe, str(path))
+    return _probe_with_ffmpeg(ffmpeg_exe, str(path))
+
+
+def clips_compatible(clips: Sequence[ClipInfo]) -> bool:
+    """True when every clip can be joined by the concat demuxer without re-encoding."""
+    return len({clip.signature() for clip in clips}) == 1
+
+
+class _ProgressTracker:
+    """Aggregates ffmpeg out_time across concurrently running jobs into one percentage."""
+
+    def __init__(self, total_seconds: float, callback: Optional[ProgressCallback], start: float, end: float):
+        self.total = max(total_seconds, 0.001)
+        self.callback = callback
+        self.start = start
+        self.end = end
+        self._done: Dict[Any, float] = {}
+        self._lock = threading.Lock()
+        self._last_emit = 0.0
+
+    def update(self, job: Any, seconds: float, message: str, force: bool = False):
+        if not self.callback:
+            return
+        with self._lock:
+            self._done[job] = seconds
+            now = time.monotonic()
+            if not force and now - self._last_emit < _PROGRESS_INTERVAL_SECONDS:
+                return
+            self._last_emit = now
+            fraction = min(1.0, sum(self._done.values()) / self.total)
+        try:
+            self.callback(self.start + (self.end - self.start) * fraction, message)
+        except Exception as e:
+            logger.warning(f"[VideoConcat] Progress callback failed: {e}")
+
+
+def _run_ffmpeg(cmd: List[str], job: Any, tracker: _ProgressTracker, duration: float, message: str):
+    """Run ffmpeg with ``-progress pipe:1`` and feed its out_time into the tracker."""
+    full_cmd = [cmd[0], "-hide_banner", "-nostdin", "-y", "-loglevel", "error", "-progress", "pipe:1", "-nostats"] + cmd[1:]
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(full_cmd, stdout=subprocess.PIPE, stderr=stderr, text=True)
+        for line in process.stdout:
+            key, _, value = line.strip().partition("=")
+            # out_time_ms is in microseconds despite its name; prefer out_time_us where present
+            if key in ("out_time_us", "out_time_ms") and value.isdigit():
+                tracker.update(job, min(duration, int(value) / 1_000_000), message)
+            elif key == "progress" and value == "end":
+                tracker.update(job, duration, message, force=True)
+        returncode = process.wait()
+        if returncode != 0:
+            stderr.seek(0)
+            error = stderr.read().decode("utf-8", errors="replace").strip()
+            raise VideoConcatError(f"ffmpeg exited with {returncode}: {error[-500:]}")
+
+
+def _concat_list_entry(path: str) -> str:
+    escaped = str(Path(path).resolve()).replace("'", "'\\''")
+    return f"file '{escaped}'\n"
+
+
+def _target_profile(clips: Sequence[ClipInfo], fps: Optional[float]) -> Dict[str, Any]:
+    """Most common resolution/frame rate among the clips, so the fewest clips get scaled."""
+    size = Counter((c.width, c.height) for c in clips).most_common(1)[0][0]
+    common_fps = Counter(round(c.fps, 2) for c in clips if c.fps).most_common(1)
+    rates = [c.sample_rate for c in clips if c.sample_rate]
+    return {
+        "width": size[0] - size[0] % 2,
+        "height": size[1] - size[1] % 2,
+        "fps": fps or (common_fps[0][0] if common_fps else 24),
+        "audio": any(c.has_audio for c in clips),
+        "sample_rate": Counter(rates).most_common(1)[0][0] if rates else _DEFAULT_SAMPLE_RATE,
+    }
+
+
+def _reencode_cmd(ffmpeg_exe: str, clip: ClipInfo, dest: str, profile: Dict[str, Any], threads: int) -> List[str]:
+    w, h = profile["width"], profile["height"]
+    vf = (
+        f"scale={w}:{h}:force_original_aspect_ratio=decrease,"
+        f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={profile['fps']},format=yuv420p"
+    )
+    cmd = [ffmpeg_exe, "-i", clip.path]
+    if profile["audio"] and not clip.has_audio:
+        # Silent track keeps every segment's stream layout identical for the final copy
+        cmd += ["-f", "lavfi", "-t", f"{clip.duration:.3f}",
+                "-i", f"anullsrc=r={profile['sample_rate']}:cl=stereo",
+                "-map", "0:v:0", "-map", "1:a:0"]
+    else:
+        cmd += ["-map", "0:v:0"] + (["-map", "0:a:0"] if profile["audio"] else [])
+    cmd += ["-vf", vf, "-c:v", "libx264", "-preset", "veryfast", "-crf", "20", "-threads", str(threads)]
+    if profile["audio"]:
+        cmd += ["-c:a", "aac", "-b:a", "192k", "-ar", str(profile["sample_rate"]), "-ac", "2"]
+    else:
+        cmd += ["-an"]
+    return cmd + ["-f", "mp4", dest]
+
+
+def concat_videos(
+    video_paths: Sequence[Union[str, Path]],
+    output_path: Union[str, Path],
+    progress_callback: Optional[ProgressCallback] = None,
+    fps: Optional[float] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Join scene clips into output_path, stream-copying when the clips allow it.
+
+    Args:
+        video_paths: Clips in playback order
+        output_path: Destination .mp4 (written via a temporary sibling, then renamed)
+        progress_callback: Called as callback(percent, message) with percent in 0-100
+        fps: Frame rate for the re-encode fallback (defaults to the clips' most common rate)
+        max_workers: Parallel segment re-encodes (defaults to min(clips, cpu count))
+
+    Returns:
+        Dict with video_path, duration, file_size, fps, num_clips and method
+        ('stream_copy' or 'reencode')
+
+    Raises:
+        VideoConcatError: If ffmpeg is missing or any step fails
+    """
+    ffmpeg_exe = get_ffmpeg_exe()
+    if not ffmpeg_exe:
+        raise VideoConcatError("ffmpeg is not available")
+    if not video_paths:
+        raise VideoConcatError("No video paths provided")
+
+    started = time.time()
+    clips = [probe_clip(p, ffmpeg_exe) for p in video_paths]
+    total_duration = sum(c.duration for c in clips)
+    stream_copy = clips_compatible(clips)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_output = output_path.with_name(f".{output_path.name}.{os.getpid()}.{threading.get_ident()}.part")
+
+    with tempfile.TemporaryDirectory(prefix="alwrity_concat_") as work_dir:
+        if stream_copy:
+            segments = clips
+        else:
+            profile = _target_profile(clips, fps)
+            workers = max_workers or min(len(clips), os.cpu_count() or 2)
+            threads = max(1, (os.cpu_count() or 2) // workers)
+            logger.info(
+                f"[VideoConcat] Clips differ in stream parameters; re-encoding {len(clips)} segments "
+                f"to {profile['width']}x{profile['height']}@{profile['fps']} with {workers} workers"
+            )
+            tracker = _ProgressTracker(total_duration, progress_callback, 0.0, 90.0)
+            segment_paths = [str(Path(work_dir) / f"segment_{i:04d}.mp4") for i in range(len(clips))]
+
+            def _encode(index: int):
+                _run_ffmpeg(
+                    _reencode_cmd(ffmpeg_exe, clips[index], segment_paths[index], profile, threads),
+                    index, tracker, clips[index].duration,
+                    f"Re-encoding scene clips ({len(clips)} segments)...",
+                )
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="video-concat") as pool:
+                for future in [pool.submit(_encode, i) for i in range(len(clips))]:
+                    future.result()
+            segments = [
+                ClipInfo(path=p, duration=c.duration, video_codec="h264", width=profile["width"],
+                         height=profile["height"], fps=profile["fps"], pix_fmt="yuv420p")
+                for p, c in zip(segment_paths, clips)
+            ]
+
+        list_file = Path(work_dir) / "concat.txt"
+        list_file.write_text("".join(_concat_list_entry(s.path) for s in segments), encoding="utf-8")
+        tracker = _ProgressTracker(total_duration, progress_callback, 0.0 if stream_copy else 90.0, 100.0)
+        try:
+            _run_ffmpeg(
+                [ffmpeg_exe, "-f", "concat", "-safe", "0", "-i", str(list_file),
+                 "-map", "0", "-c", "copy", "-movflags", "+faststart", "-f", "mp4", str(tmp_output)],
+                "concat", tracker, total_duration, "Joining scene clips...",
+            )
+            os.replace(tmp_output, output_path)
+        finally:
+            if tmp_output.exists():
+                tmp_output.unlink()
+
+    file_size = output_path.stat().st_size
+    method = "stream_copy" if stream_copy else "reencode"
+    logger.info(
+        f"[VideoConcat] Joined {len(clips)} clips ({total_duration:.1f}s) into {output_path.name} "
+        f"via {method} in {time.time() - started:.1f}s ({file_size} bytes)"
+    )
+    return {
+        "video_path": str(output_path),
+        "duration": total_duration,
+        "file_size": file_size,
+        "fps": clips[0].fps if stream_copy else profile["fps"],
+        "num_clips": len(clips),
+        "method": method,
+    }
@@ -23,6 +23,8 @@ export interface SchedulerStats {
   active_strategies_count: number;
   last_interval_adjustment: string | null;
   registered_types: string[];
+  task_leases?: TaskLeaseStats;
+  dispatch_queue?: DispatchQueueStats;
   // Cumulative/historical values from database
   cumulative_total_check_cycles: number;
   cumulative_tasks_found: number;
@@ -30,6 +32,41 @@ export interface SchedulerStats {
   cumulative_tasks_failed: number;
 }
 
+export interface TaskLeaseStats {
+  acquired: number;
+  contended: number; // refused: still leased by this process
+  shared_contended: number; // refused: leased by another worker
+  shared_errors: number;
+  released: number;
+  expired: number;
+  active: number;
+  held_by_other_workers: number;
+  shared: boolean;
+}
+
+export interface WaitHistogram {
+  counts: number[]; // one count per bucket label
+  count: number;
+  mean_seconds: number;
+  max_seconds: number;
+}
+
+export interface DispatchQueueStats {
+  queue_length: number;
+  queued_by_type: Record<string, number>;
+  running: number;
+  running_by_type: Record<string, number>;
+  running_by_priority: Record<string, number>;
+  max_concurrent: number;
+  max_per_user: number;
+  max_bulk: number;
+  wait_seconds: {
+    buckets: string[];
+    by_task_type: Record<string, WaitHistogram>;
+    by_priority: Record<string, WaitHistogram>;
+  };
+}
+
 export interface SchedulerJob {
   id: string;
   trigger_type: string;
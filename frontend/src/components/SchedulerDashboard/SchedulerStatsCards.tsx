@@ -142,7 +142,17 @@ const SchedulerStatsCards: React.FC<SchedulerStatsCardsProps> = ({ stats }) => {
       subtitle: stats.active_strategies_count > 0 
         ? 'With monitoring tasks' 
         : 'No active strategies'
-    }
+    },
+    ...(stats.dispatch_queue ? [{
+      title: 'Dispatch Queue',
+      value: stats.dispatch_queue.queue_length.toString(),
+      icon: <ScheduleIcon />,
+      color: stats.dispatch_queue.queue_length > 0 ? 'info' : 'default' as const,
+      subtitle: `${stats.dispatch_queue.running}/${stats.dispatch_queue.max_concurrent} running · avg wait ` +
+        ['urgent', 'normal', 'bulk']
+          .map((priority) => `${priority} ${(stats.dispatch_queue!.wait_seconds.by_priority[priority]?.mean_seconds ?? 0).toFixed(1)}s`)
+          .join(', ')
+    }] : [])
   ];
 
   const getCardIconColor = (cardColor: string) => {